@@ -0,0 +1,397 @@
+"""
+Price alert engine for TerminalCoin.
+
+Alerts are one-shot rules on a coin's price or one of its technical
+indicators:
+
+- ``above`` / ``below`` fire when the value crosses the threshold.
+- ``move`` fires when the price moves ``threshold`` percent away from the
+  reference price in either direction; it is stored as a pair of absolute
+  thresholds, so it shares the crossing index.
+
+Active alerts are indexed per (coin, metric) in two sorted threshold lists,
+one for rising and one for falling crossings. A refresh only bisects each
+list between the previous and the current value and touches the alerts
+inside that range, independent of how many alerts exist in total.
+"""
+
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from database import Database
+from exceptions import ValidationException
+from logger import get_logger
+
+if TYPE_CHECKING:
+    from models import CoinMarketData
+
+logger = get_logger(__name__)
+
+PRICE = "price"
+# Values of analysis_engine.TechnicalIndicators that alerts can watch
+INDICATOR_METRICS = (
+    "rsi",
+    "macd",
+    "macd_signal",
+    "macd_hist",
+    "ema_20",
+    "sma_50",
+    "bb_upper",
+    "bb_lower",
+)
+METRICS = (PRICE,) + INDICATOR_METRICS
+
+ABOVE = "above"
+BELOW = "below"
+MOVE = "move"
+CONDITIONS = (ABOVE, BELOW, MOVE)
+
+
+@dataclass
+class Alert:
+    """A stored alert rule."""
+    id: int
+    coin_id: str
+    metric: str                        # 'price' or an indicator name
+    condition: str                     # 'above', 'below' or 'move'
+    threshold: float                   # value, or percent for 'move'
+    reference: Optional[float] = None  # price the 'move' percentage is measured from
+    note: Optional[str] = None
+
+    def triggers(self) -> List[Tuple[bool, float]]:
+        """(rising, level) pairs at which the alert fires."""
+        if self.condition == ABOVE:
+            return [(True, self.threshold)]
+        if self.condition == BELOW:
+            return [(False, self.threshold)]
+        move = abs(self.threshold) / 100.0
+        return [(True, self.reference * (1.0 + move)), (False, self.reference * (1.0 - move))]
+
+    def describe(self) -> str:
+        """Human readable rule, e.g. 'bitcoin price above 70000'."""
+        if self.condition == MOVE:
+            return (
+                f"{self.coin_id} {self.metric} moves {abs(self.threshold):g}% "
+                f"from {self.reference:g}"
+            )
+        return f"{self.coin_id} {self.metric} {self.condition} {self.threshold:g}"
+
+
+@dataclass
+class AlertHit:
+    """An alert that fired."""
+    alert: Alert
+    value: float
+    previous: Optional[float]  # None on the first observation of the coin
+    triggered_at: datetime = field(default_factory=datetime.utcnow)
+
+    @property
+    def message(self) -> str:
+        """Notification text."""
+        text = f"{self.alert.describe()} (now {self.value:g})"
+        return f"{text}: {self.alert.note}" if self.alert.note else text
+
+
+def validate_alert(
+    metric: str, condition: str, threshold: float, reference: Optional[float]
+) -> None:
+    """
+    Check an alert rule before it is stored.
+
+    Raises:
+        ValidationException: If the rule is incomplete or inconsistent
+    """
+    if metric not in METRICS:
+        raise ValidationException("Unknown alert metric", details={"metric": metric})
+    if condition not in CONDITIONS:
+        raise ValidationException("Unknown alert condition", details={"condition": condition})
+    if condition == MOVE:
+        if metric != PRICE:
+            raise ValidationException(
+                "Percent-move alerts only apply to price", details={"metric": metric}
+            )
+        if not threshold or reference is None or reference <= 0:
+            raise ValidationException(
+                "Percent-move alerts need a non-zero percentage and a positive reference price",
+                details={"threshold": threshold, "reference": reference}
+            )
+
+
+class _Thresholds:
+    """Sorted trigger levels with the alert id at each position."""
+
+    __slots__ = ("levels", "ids")
+
+    def __init__(self):
+        self.levels: List[float] = []
+        self.ids: List[int] = []
+
+    def add(self, level: float, alert_id: int) -> None:
+        i = bisect_right(self.levels, level)
+        self.levels.insert(i, level)
+        self.ids.insert(i, alert_id)
+
+    def remove(self, level: float, alert_id: int) -> None:
+        i = bisect_left(self.levels, level)
+        while i < len(self.levels) and self.levels[i] == level:
+            if self.ids[i] == alert_id:
+                del self.levels[i]
+                del self.ids[i]
+                return
+            i += 1
+
+    def take(self, lo: int, hi: int) -> List[Tuple[float, int]]:
+        """Remove and return the entries in positions [lo, hi)."""
+        taken = list(zip(self.levels[lo:hi], self.ids[lo:hi]))
+        del self.levels[lo:hi]
+        del self.ids[lo:hi]
+        return taken
+
+
+class AlertIndex:
+    """In-memory index of active alerts, evaluated by crossing ranges."""
+
+    def __init__(self, alerts: Iterable[Alert] = ()):
+        """
+        Initialize the index.
+
+        Args:
+            alerts: Active alerts to index
+        """
+        self._alerts: Dict[int, Alert] = {}
+        # (coin_id, metric) -> (rising, falling) thresholds
+        self._series: Dict[Tuple[str, str], Tuple[_Thresholds, _Thresholds]] = {}
+        # Last value seen per (coin_id, metric)
+        self._last: Dict[Tuple[str, str], float] = {}
+        self.load(alerts)
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    def load(self, alerts: Iterable[Alert]) -> None:
+        """Replace all alerts (last seen values are kept)."""
+        self._alerts = {}
+        self._series = {}
+        grouped: Dict[Tuple[str, str], Tuple[List[Tuple[float, int]], List[Tuple[float, int]]]] = {}
+        for alert in alerts:
+            self._alerts[alert.id] = alert
+            rising, falling = grouped.setdefault((alert.coin_id, alert.metric), ([], []))
+            for up, level in alert.triggers():
+                (rising if up else falling).append((level, alert.id))
+
+        # Sort each list once instead of inserting one by one
+        for key, lists in grouped.items():
+            series = (_Thresholds(), _Thresholds())
+            for entries, thresholds in zip(lists, series):
+                entries.sort()
+                thresholds.levels = [level for level, _ in entries]
+                thresholds.ids = [alert_id for _, alert_id in entries]
+            self._series[key] = series
+
+    def add(self, alert: Alert) -> None:
+        """Index a new alert."""
+        self._alerts[alert.id] = alert
+        series = self._series.setdefault(
+            (alert.coin_id, alert.metric), (_Thresholds(), _Thresholds())
+        )
+        for up, level in alert.triggers():
+            series[0 if up else 1].add(level, alert.id)
+
+    def remove(self, alert_id: int) -> Optional[Alert]:
+        """Drop an alert from the index."""
+        alert = self._alerts.pop(alert_id, None)
+        if alert is None:
+            return None
+        series = self._series.get((alert.coin_id, alert.metric))
+        if series is not None:
+            for up, level in alert.triggers():
+                series[0 if up else 1].remove(level, alert_id)
+        return alert
+
+    def coins(self, metric: str) -> List[str]:
+        """Coins with at least one alert on ``metric``."""
+        return [coin_id for (coin_id, m), series in self._series.items()
+                if m == metric and (series[0].levels or series[1].levels)]
+
+    def evaluate(self, values: Dict[str, float], metric: str = PRICE) -> List[AlertHit]:
+        """
+        Feed new values and return the alerts they crossed.
+
+        Fired alerts are removed from the index. On the first value of a
+        coin, alerts whose condition already holds fire.
+
+        Args:
+            values: Dictionary mapping coin_id to the current value of ``metric``
+            metric: 'price' or an indicator name
+
+        Returns:
+            AlertHit objects in the order their levels were crossed
+        """
+        hits: List[AlertHit] = []
+        for coin_id, value in values.items():
+            if value is None:
+                continue
+            key = (coin_id, metric)
+            previous = self._last.get(key)
+            self._last[key] = value
+            series = self._series.get(key)
+            if series is None or value == previous:
+                continue
+
+            rising, falling = series
+            if previous is None or value > previous:
+                # Rising through levels in (previous, value]
+                lo = 0 if previous is None else bisect_right(rising.levels, previous)
+                crossed = rising.take(lo, bisect_right(rising.levels, value))
+                hits.extend(self._fire(crossed, value, previous))
+            if previous is None or value < previous:
+                # Falling through levels in [value, previous)
+                hi = (
+                    len(falling.levels)
+                    if previous is None
+                    else bisect_left(falling.levels, previous)
+                )
+                crossed = falling.take(bisect_left(falling.levels, value), hi)
+                crossed.reverse()  # nearest level first
+                hits.extend(self._fire(crossed, value, previous))
+        return hits
+
+    def _fire(
+        self, crossed: List[Tuple[float, int]], value: float, previous: Optional[float]
+    ) -> List[AlertHit]:
+        """Retire crossed alerts (including the other side of 'move' alerts)."""
+        hits = []
+        for _, alert_id in crossed:
+            alert = self._alerts.get(alert_id)
+            if alert is None:
+                continue  # the other level of this alert already fired
+            self.remove(alert_id)
+            hits.append(AlertHit(alert, value, previous))
+        return hits
+
+
+class AlertEngine:
+    """Keeps the alert index in sync with the database and records hits."""
+
+    def __init__(self, db: Database):
+        """
+        Initialize the engine.
+
+        Args:
+            db: Database holding the alerts
+        """
+        self.db = db
+        self.index = AlertIndex()
+        self._lock = threading.Lock()
+        self._version: Optional[Tuple[int, int]] = None
+        self._analysis = None  # created on first indicator alert (imports pandas)
+
+    def add_alert(
+        self,
+        coin_id: str,
+        condition: str,
+        threshold: float,
+        metric: str = PRICE,
+        reference: Optional[float] = None,
+        note: Optional[str] = None
+    ) -> Alert:
+        """Store a new alert and start watching it."""
+        alert_id = self.db.add_alert(coin_id, metric, condition, threshold, reference, note)
+        alert = Alert(alert_id, coin_id, metric, condition, threshold, reference, note)
+        with self._lock:
+            self.index.add(alert)
+        return alert
+
+    def sync(self) -> None:
+        """Reload the index if alerts were added or removed elsewhere (e.g. the CLI)."""
+        version = self.db.get_alerts_version()
+        with self._lock:
+            if version == self._version:
+                return
+            self.index.load(Alert(**row) for row in self.db.get_alerts())
+            self._version = version
+        logger.debug(f"Loaded {len(self.index)} active alerts")
+
+    def check(
+        self,
+        prices: Dict[str, float],
+        indicators: Optional[Dict[str, Dict[str, Optional[float]]]] = None
+    ) -> List[AlertHit]:
+        """
+        Evaluate a market refresh and mark fired alerts as triggered.
+
+        Args:
+            prices: Dictionary mapping coin_id to current price
+            indicators: Optional coin_id -> {indicator: value} for indicator alerts
+
+        Returns:
+            Fired alerts
+        """
+        self.sync()
+        return self._evaluate(prices, indicators)
+
+    def _evaluate(
+        self,
+        prices: Dict[str, float],
+        indicators: Optional[Dict[str, Dict[str, Optional[float]]]] = None
+    ) -> List[AlertHit]:
+        """Evaluate values against the synced index and record the hits."""
+        with self._lock:
+            hits = self.index.evaluate(prices)
+            for metric in INDICATOR_METRICS:
+                values = {
+                    coin_id: values.get(metric) for coin_id, values in (indicators or {}).items()
+                }
+                if values:
+                    hits.extend(self.index.evaluate(values, metric))
+            if not hits:
+                return hits
+            self.db.mark_alerts_triggered(
+                (hit.alert.id, hit.value, hit.triggered_at.strftime("%Y-%m-%d %H:%M:%S"))
+                for hit in hits
+            )
+            # Our own update shouldn't force a reload
+            self._version = self.db.get_alerts_version()
+
+        for hit in hits:
+            logger.info(f"Alert {hit.alert.id} triggered: {hit.message}")
+        return hits
+
+    def check_market(self, coins: Sequence["CoinMarketData"]) -> List[AlertHit]:
+        """
+        Evaluate a market refresh from the coin list.
+
+        Indicators are computed from the 7-day sparkline, and only for
+        coins that have indicator alerts.
+
+        Args:
+            coins: Latest market data
+
+        Returns:
+            Fired alerts
+        """
+        self.sync()
+        prices = {coin.id: coin.current_price for coin in coins}
+        indicators: Dict[str, Dict[str, Optional[float]]] = {}
+        wanted = set(self.indicator_coins())
+        if wanted:
+            if self._analysis is None:
+                from analysis_engine import AnalysisEngine  # deferred: pulls in pandas
+                self._analysis = AnalysisEngine()
+            for coin in coins:
+                if coin.id in wanted and coin.sparkline_7d:
+                    values = self._analysis.calculate_indicators(coin.sparkline_7d)
+                    indicators[coin.id] = {
+                        metric: getattr(values, metric) for metric in INDICATOR_METRICS
+                    }
+        return self._evaluate(prices, indicators)
+
+    def indicator_coins(self) -> List[str]:
+        """Coins that have alerts on technical indicators."""
+        with self._lock:
+            return sorted(
+                {coin_id for metric in INDICATOR_METRICS for coin_id in self.index.coins(metric)}
+            )
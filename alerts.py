@@ -0,0 +1,89 @@
+"""
+Price Alerts Script.
+
+Manages the alerts that the TUI evaluates on every market refresh.
+
+Usage:
+    python alerts.py add bitcoin above 70000 [--note "take profit"]
+    python alerts.py add ethereum move 10 [--reference 3200]
+    python alerts.py add solana below 30 --metric rsi
+    python alerts.py list [--all]
+    python alerts.py remove 12
+"""
+
+import argparse
+import logging
+import sys
+
+from alert_engine import CONDITIONS, METRICS, MOVE, PRICE
+from database import Database
+from exceptions import ValidationException
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def latest_price(db: Database, coin_id: str):
+    """Most recent recorded daily close of a coin, or None."""
+    rows = db.get_price_history(coin_ids=[coin_id])
+    return rows[-1][2] if rows else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage price alerts")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="add an alert")
+    add.add_argument("coin_id", help="CoinGecko coin id, e.g. bitcoin")
+    add.add_argument("condition", choices=CONDITIONS, help="'move' takes a percentage")
+    add.add_argument("threshold", type=float, help="level, or percent for 'move'")
+    add.add_argument(
+        "--metric", choices=METRICS, default=PRICE, help="price (default) or an indicator"
+    )
+    add.add_argument(
+        "--reference", type=float, help="'move' base price (default: last recorded close)"
+    )
+    add.add_argument("--note", help="text shown when the alert fires")
+
+    listing = commands.add_parser("list", help="list alerts")
+    listing.add_argument("--all", action="store_true", help="include alerts that already fired")
+
+    remove = commands.add_parser("remove", help="delete an alert")
+    remove.add_argument("alert_id", type=int)
+    args = parser.parse_args()
+
+    db = Database()
+    try:
+        if args.command == "add":
+            reference = args.reference
+            if args.condition == MOVE and reference is None:
+                reference = latest_price(db, args.coin_id)
+            db.add_alert(
+                args.coin_id, args.metric, args.condition, args.threshold, reference, args.note
+            )
+        elif args.command == "list":
+            for alert in db.get_alerts(active_only=not args.all):
+                rule = (
+                    f"{alert['coin_id']} {alert['metric']} {alert['condition']} "
+                    f"{alert['threshold']:g}"
+                )
+                if alert["reference"] is not None:
+                    rule += f" from {alert['reference']:g}"
+                status = ""
+                if alert.get("triggered_at"):
+                    status = f"  [fired {alert['triggered_at']} at {alert['triggered_value']:g}]"
+                note = f"  ({alert['note']})" if alert["note"] else ""
+                print(f"{alert['id']:>6}  {rule}{note}{status}")
+        elif not db.delete_alert(args.alert_id):
+            logger.error(f"No alert {args.alert_id}")
+            sys.exit(1)
+    except ValidationException as e:
+        logger.error(str(e))
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,14 +5,19 @@ Handles technical analysis calculations using Pandas and Pandas TA.
 Responsible for processing raw price data into actionable indicators.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, Sequence
 import pandas as pd
 import pandas_ta as ta
 from dataclasses import dataclass
 
+from config import news_config, SENTIMENT_THRESHOLDS
 from logger import get_logger
 from exceptions import ParsingException
 
+if TYPE_CHECKING:
+    from price_archive import PriceArchive
+    from sentiment_aggregates import AssetSentiment
+
 logger = get_logger(__name__)
 
 
@@ -40,23 +45,25 @@ class AnalysisEngine:
         """Initialize the analysis engine."""
         logger.info("Analysis Engine initialized")
 
-    def prepare_dataframe(self, prices: List[float], dates: List[int] = None) -> pd.DataFrame:
+    def prepare_dataframe(
+        self, prices: Sequence[float], dates: Sequence[int] = None
+    ) -> pd.DataFrame:
         """
-        Convert raw price list to Pandas DataFrame.
+        Convert raw prices to Pandas DataFrame.
 
         Args:
-            prices: List of closing prices
-            dates: Optional list of timestamps
+            prices: Closing prices (list or NumPy array)
+            dates: Optional timestamps (epoch ms)
 
         Returns:
             DataFrame with 'close' column
         """
         try:
-            if not prices:
+            if len(prices) == 0:
                 return pd.DataFrame()
 
             data = {"close": prices}
-            if dates and len(dates) == len(prices):
+            if dates is not None and len(dates) == len(prices):
                 data["date"] = pd.to_datetime(dates, unit='ms')
 
             df = pd.DataFrame(data)
@@ -68,17 +75,17 @@ class AnalysisEngine:
             logger.error(f"Error preparing dataframe: {e}")
             raise ParsingException("Failed to prepare data for analysis", details={"error": str(e)})
 
-    def calculate_indicators(self, prices: List[float]) -> TechnicalIndicators:
+    def calculate_indicators(self, prices: Sequence[float]) -> TechnicalIndicators:
         """
         Calculate technical indicators for a given price series.
 
         Args:
-            prices: List of historical prices (ordered oldest to newest)
+            prices: Historical prices, list or NumPy array (ordered oldest to newest)
 
         Returns:
             TechnicalIndicators object with latest values
         """
-        if not prices or len(prices) < 50:
+        if prices is None or len(prices) < 50:
             logger.warning("Insufficient data for technical analysis (need 50+ points)")
             return TechnicalIndicators()
 
@@ -124,6 +131,29 @@ class AnalysisEngine:
             logger.error(f"Error calculating indicators: {e}")
             return TechnicalIndicators()
 
+    def calculate_indicators_for_range(
+        self,
+        archive: "PriceArchive",
+        coin_id: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> TechnicalIndicators:
+        """
+        Calculate indicators over an archived time range.
+
+        The range is sliced from the memory-mapped archive without copying.
+
+        Args:
+            archive: Price archive to read from
+            coin_id: Coin identifier
+            start: First timestamp (epoch ms), unbounded if None
+            end: Timestamp (epoch ms) to stop before, unbounded if None
+
+        Returns:
+            TechnicalIndicators object with latest values
+        """
+        return self.calculate_indicators(archive.get_series(coin_id, start, end).prices)
+
     def _safe_float(self, value: Any) -> Optional[float]:
         """Convert numpy/pandas types to standard float safely."""
         try:
@@ -133,10 +163,17 @@ class AnalysisEngine:
         except (ValueError, TypeError):
             return None
 
-    def get_signal(self, indicators: TechnicalIndicators) -> str:
+    def get_signal(
+        self, indicators: TechnicalIndicators, sentiment: Optional["AssetSentiment"] = None
+    ) -> str:
         """
         Generate a simple trading signal based on indicators.
 
+        Args:
+            indicators: Technical indicators of the coin
+            sentiment: Rolling news sentiment of the coin (optional); counts
+                once it covers at least SIGNAL_MIN_STORIES stories
+
         Returns:
             "BUY", "SELL", or "NEUTRAL"
         """
@@ -155,6 +192,11 @@ class AnalysisEngine:
         # EMA Trend Logic
         # (Requires current price comparison, implemented in UI logic usually)
 
+        # News Sentiment Logic
+        if sentiment and sentiment.count >= news_config.SIGNAL_MIN_STORIES:
+            if sentiment.mean >= SENTIMENT_THRESHOLDS["bullish"]: score += 1
+            elif sentiment.mean <= SENTIMENT_THRESHOLDS["bearish"]: score -= 1
+
         if score >= 1: return "BUY"
         if score <= -1: return "SELL"
         return "NEUTRAL"
@@ -0,0 +1,214 @@
+"""
+Streaming anomaly detector for TerminalCoin.
+
+Tracks per-coin rolling statistics of price and volume changes between
+market refreshes and flags unusual moves using z-scores.
+"""
+
+import math
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from config import anomaly_config
+from models import CoinMarketData
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RunningStats:
+    """
+    Welford-style running mean and variance with constant memory.
+
+    Behaves like classic Welford for the first ``window`` samples and then
+    switches to exponential forgetting with weight ``1 / window``, so the
+    statistics follow recent market regimes instead of the whole history.
+    """
+
+    __slots__ = ("window", "count", "mean", "variance")
+
+    def __init__(self, window: int = anomaly_config.WINDOW):
+        """
+        Initialize empty statistics.
+
+        Args:
+            window: Number of samples after which older data decays
+        """
+        self.window = max(1, window)
+        self.count = 0
+        self.mean = 0.0
+        self.variance = 0.0
+
+    @property
+    def std(self) -> float:
+        """Standard deviation of the observed samples."""
+        return math.sqrt(self.variance)
+
+    def zscore(self, value: float) -> Optional[float]:
+        """
+        Compute the z-score of a value against the current statistics.
+
+        Args:
+            value: Observation to score
+
+        Returns:
+            Z-score, or None if the variance is still zero
+        """
+        std = self.std
+        if std <= 0:
+            return None
+        return (value - self.mean) / std
+
+    def update(self, value: float) -> None:
+        """
+        Add an observation in O(1).
+
+        Args:
+            value: New observation
+        """
+        self.count += 1
+        alpha = 1.0 / min(self.count, self.window)
+        delta = value - self.mean
+        self.mean += alpha * delta
+        self.variance = (1.0 - alpha) * (self.variance + alpha * delta * delta)
+
+
+@dataclass
+class MoverEvent:
+    """A flagged price or volume move for a single coin."""
+    coin_id: str
+    symbol: str
+    metric: str  # "price" or "volume"
+    change_pct: float
+    zscore: float
+    price: float
+    detected_at: datetime = field(default_factory=datetime.utcnow)
+
+    @property
+    def direction(self) -> str:
+        """Return 'up' or 'down' depending on the sign of the move."""
+        return "up" if self.change_pct >= 0 else "down"
+
+
+@dataclass
+class _CoinState:
+    """Per-coin state: last observation plus running stats of deltas."""
+    last_price: float
+    last_volume: Optional[float]
+    price_stats: RunningStats
+    volume_stats: RunningStats
+
+
+class AnomalyDetector:
+    """
+    Detects unusual price and volume moves across market refreshes.
+
+    Memory is constant per coin and each refresh costs O(1) per coin.
+    """
+
+    def __init__(
+        self,
+        window: int = anomaly_config.WINDOW,
+        min_samples: int = anomaly_config.MIN_SAMPLES,
+        price_threshold: float = anomaly_config.PRICE_Z_THRESHOLD,
+        volume_threshold: float = anomaly_config.VOLUME_Z_THRESHOLD,
+    ):
+        """
+        Initialize the detector.
+
+        Args:
+            window: Rolling window (in refreshes) for the statistics
+            min_samples: Deltas required before a coin can be flagged
+            price_threshold: Absolute z-score flagging a price move
+            volume_threshold: Absolute z-score flagging a volume move
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self.price_threshold = price_threshold
+        self.volume_threshold = volume_threshold
+        self._states: Dict[str, _CoinState] = {}
+
+    def __len__(self) -> int:
+        """Return the number of tracked coins."""
+        return len(self._states)
+
+    def reset(self) -> None:
+        """Forget all tracked coins."""
+        self._states.clear()
+
+    def _check(
+        self,
+        stats: RunningStats,
+        change: float,
+        threshold: float,
+    ) -> Optional[float]:
+        """Score a change, update the stats and return the z-score if flagged."""
+        flagged = None
+        if stats.count >= self.min_samples:
+            z = stats.zscore(change)
+            if z is not None and abs(z) >= threshold:
+                flagged = z
+        stats.update(change)
+        return flagged
+
+    def update(self, coins: List[CoinMarketData]) -> List[MoverEvent]:
+        """
+        Feed a market refresh into the detector.
+
+        Args:
+            coins: Latest market snapshot
+
+        Returns:
+            List of MoverEvent objects flagged in this refresh, strongest first
+        """
+        events: List[MoverEvent] = []
+
+        for coin in coins:
+            state = self._states.get(coin.id)
+            if state is None:
+                self._states[coin.id] = _CoinState(
+                    last_price=coin.current_price,
+                    last_volume=coin.total_volume,
+                    price_stats=RunningStats(self.window),
+                    volume_stats=RunningStats(self.window),
+                )
+                continue
+
+            # Price delta (percent) since the previous refresh
+            if state.last_price > 0:
+                price_change = (coin.current_price / state.last_price - 1.0) * 100
+                z = self._check(state.price_stats, price_change, self.price_threshold)
+                if z is not None:
+                    events.append(MoverEvent(
+                        coin_id=coin.id,
+                        symbol=coin.symbol,
+                        metric="price",
+                        change_pct=price_change,
+                        zscore=z,
+                        price=coin.current_price,
+                    ))
+
+            # Volume delta (percent) since the previous refresh
+            volume = coin.total_volume
+            if volume and state.last_volume:
+                volume_change = (volume / state.last_volume - 1.0) * 100
+                z = self._check(state.volume_stats, volume_change, self.volume_threshold)
+                if z is not None:
+                    events.append(MoverEvent(
+                        coin_id=coin.id,
+                        symbol=coin.symbol,
+                        metric="volume",
+                        change_pct=volume_change,
+                        zscore=z,
+                        price=coin.current_price,
+                    ))
+
+            state.last_price = coin.current_price
+            if volume:
+                state.last_volume = volume
+
+        events.sort(key=lambda e: abs(e.zscore), reverse=True)
+        if events:
+            logger.info(f"Detected {len(events)} unusual moves across {len(coins)} coins")
+        return events
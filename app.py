@@ -8,28 +8,43 @@ Author: il1v3y
 Version: 2.0.0
 """
 
+# Must stay the first import: it starts the startup clock and import timing
+from startup_profiler import get_startup_profiler
+
+import argparse
 import asyncio
+import importlib
+import sys
 from typing import Optional
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
-from textual.widgets import Header, Footer, Static, DataTable, Label, Button, Input, TabbedContent, TabPane
+from textual.widgets import (
+    Header, Footer, Static, DataTable, Label, Button, Input, Select, TabbedContent, TabPane
+)
 from textual.reactive import reactive
+from textual.message import Message
 from textual.theme import Theme
 from rich.markup import escape
+from rich.text import Text
 from datetime import datetime
 
 from api_client import CoinGeckoClient
-from news_client import get_news_client
 from models import CoinMarketData, CoinDetailData, NewsItem, SentimentType
-from config import app_config
+from config import app_config, archive_config, news_config, SENTIMENT_THRESHOLDS
 from logger import get_logger
 from utils import generate_sparkline, format_currency, format_percentage
 from exceptions import TerminalCoinException
-from widgets.chart import CryptoChart
 from widgets.portfolio import PortfolioTable
+from widgets.movers import MoversPanel
+from widgets.transactions import TransactionHistory
 from portfolio_manager import PortfolioManager
+from anomaly_detector import AnomalyDetector
+from alert_engine import AlertEngine
+from snapshot_store import SnapshotStore
+from sentiment_aggregates import AssetSentiment, SentimentAggregator, window_label
 
 logger = get_logger(__name__)
+startup_profiler = get_startup_profiler()
 
 
 # =============================================================================
@@ -177,6 +192,18 @@ class CoinList(Static):
     filtered_coins: reactive[list[CoinMarketData]] = reactive([])
     current_sort: reactive[str] = reactive("market_cap")  # market_cap, gainers, losers
 
+    class CoinsUpdated(Message):
+        """Posted after a successful market refresh."""
+
+        def __init__(self, coins: list[CoinMarketData]) -> None:
+            super().__init__()
+            self.coins = coins
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Rolling news sentiment by symbol over SENTIMENT_COLUMN_WINDOW
+        self.news_sentiment: dict[str, AssetSentiment] = {}
+
     def compose(self) -> ComposeResult:
         """Compose the coin list widget."""
         yield Container(
@@ -197,6 +224,7 @@ class CoinList(Static):
         table = self.query_one(DataTable)
         table.cursor_type = "row"
         table.add_columns("Rank", "Symbol", "Price", "24h %", "Trend (7d)")
+        table.add_column(f"News {window_label(news_config.SENTIMENT_COLUMN_WINDOW)}", key="news")
         logger.debug("CoinList widget mounted")
 
     def watch_coins(self, coins: list[CoinMarketData]) -> None:
@@ -268,6 +296,7 @@ class CoinList(Static):
                     price,
                     change,
                     sparkline,
+                    self._news_cell(coin.symbol),
                     key=coin.id
                 )
             except Exception as e:
@@ -275,6 +304,28 @@ class CoinList(Static):
                 continue
         logger.info(f"Displayed {len(coins)} coins in CoinList")
 
+    def _news_cell(self, symbol: str) -> Text:
+        """Mean news sentiment and story count of a coin, colored by its bucket."""
+        sentiment = self.news_sentiment.get(symbol.upper())
+        if sentiment is None:
+            return Text("")
+        style = "dim"
+        if sentiment.mean >= SENTIMENT_THRESHOLDS["bullish"]:
+            style = "green"
+        elif sentiment.mean <= SENTIMENT_THRESHOLDS["bearish"]:
+            style = "red"
+        return Text(f"{sentiment.mean:+.2f} ({sentiment.count})", style=style)
+
+    def set_news_sentiment(self, sentiment: dict[str, AssetSentiment]) -> None:
+        """Show new sentiment aggregates in the listed rows."""
+        self.news_sentiment = sentiment
+        table = self.query_one(DataTable)
+        for coin in self.filtered_coins:
+            try:
+                table.update_cell(coin.id, "news", self._news_cell(coin.symbol))
+            except Exception as e:
+                logger.debug(f"Error updating news sentiment of {coin.id}: {e}")
+
     async def fetch_coins(self, client: CoinGeckoClient) -> None:
         """Fetch top cryptocurrencies and update the widget asynchronously."""
         try:
@@ -282,6 +333,8 @@ class CoinList(Static):
             # Use asyncio.to_thread to run the blocking API call in a separate thread
             self.coins = await asyncio.to_thread(client.get_top_coins, limit=100)
             logger.info(f"Fetched {len(self.coins)} coins for CoinList")
+            if self.coins:
+                self.post_message(self.CoinsUpdated(self.coins))
         except TerminalCoinException as e:
             logger.error(f"Error loading coins: {e.message}")
             self.app.notify(f"Error loading coins: {e.message}", severity="warning")
@@ -295,17 +348,41 @@ class CoinDetail(Static):
 
     coin_data: reactive[Optional[CoinDetailData]] = reactive(None)
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._chart = None
+        self._pending_chart: Optional[tuple] = None
+
     def compose(self) -> ComposeResult:
         """Compose the coin detail widget."""
         yield Container(
             Label("Select a coin to view details", id="coin-name"),
             Label("", id="coin-price"),
-            # Chart replaces the sparkline label
-            CryptoChart(id="price-chart"),
+            # Placeholder until the chart widget is loaded by the warmup task
+            Label("Loading chart...", id="price-chart"),
             Label("", id="coin-stats"),
             id="detail-container"
         )
 
+    async def install_chart(self, chart_cls: type) -> None:
+        """
+        Replace the chart placeholder with a real chart widget.
+
+        Args:
+            chart_cls: CryptoChart class (imported lazily after first paint)
+        """
+        placeholder = self.query_one("#price-chart")
+        await placeholder.remove()
+
+        chart = chart_cls(id="price-chart")
+        await self.query_one("#detail-container").mount(chart, before="#coin-stats")
+        self._chart = chart
+
+        if self._pending_chart:
+            prices, dates = self._pending_chart
+            self._pending_chart = None
+            self.update_chart(prices, dates)
+
     def watch_coin_data(self, data: Optional[CoinDetailData]) -> None:
         """
         Update display when coin data changes.
@@ -348,9 +425,27 @@ class CoinDetail(Static):
 
     def update_chart(self, prices: list, dates: list):
         """Update the chart with new data."""
+        if self._chart is None:
+            # Chart not loaded yet; draw it as soon as it is installed
+            self._pending_chart = (prices, dates)
+            return
+
         try:
-            chart = self.query_one("#price-chart", CryptoChart)
-            chart.update_data(prices, dates, title="30 Day History")
+            self._chart.update_data(prices, dates, title="30 Day History")
+        except Exception as e:
+            logger.error(f"Error updating chart: {e}")
+
+    def update_chart_series(self, series) -> None:
+        """Update the chart from an archived PriceSeries (memory-mapped view)."""
+        if self._chart is None:
+            series = series.downsample(archive_config.MAX_CHART_POINTS)
+            self.update_chart(series.prices.tolist(), series.dates())
+            return
+
+        try:
+            self._chart.update_series(
+                series, title="30 Day History", max_points=archive_config.MAX_CHART_POINTS
+            )
         except Exception as e:
             logger.error(f"Error updating chart: {e}")
 
@@ -360,9 +455,29 @@ class NewsPanel(Static):
 
     news_data: reactive[list] = reactive([])
 
+    class NewsUpdated(Message):
+        """Posted after a successful news refresh."""
+
+        def __init__(self, items: list[NewsItem]) -> None:
+            super().__init__()
+            self.items = items
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.store = None  # NewsStore to search, set once news is loaded
+        self.latest: list[NewsItem] = []
+        self.polling = False  # a fetch is running; timer ticks skip meanwhile
+        self.search_text = ""
+        self.asset_filter: Optional[str] = None
+
     def compose(self) -> ComposeResult:
         """Compose the news panel widget."""
-        yield Label("Latest Crypto News", classes="news-header")
+        yield Label("Latest Crypto News", classes="news-header", id="news-title")
+        yield Horizontal(
+            Input(placeholder="Search stored news...", id="news-search"),
+            Select([], prompt="All assets", id="news-asset"),
+            id="news-controls"
+        )
         yield VerticalScroll(id="news-list")
 
     def watch_news_data(self, news_items: list) -> None:
@@ -389,6 +504,9 @@ class NewsPanel(Static):
                 asset_tags = " ".join([f"[$accent][{asset}][/]" for asset in safe_assets])
                 safe_title = escape(item.title)
                 safe_source = escape(item.source)
+                if item.related_sources:
+                    # Same story from other feeds
+                    safe_source += f" +{len(item.related_sources)}"
 
                 # Create news item label
                 news_list_container.mount(
@@ -404,14 +522,88 @@ class NewsPanel(Static):
 
         logger.debug(f"Updated news panel with {len(news_items)} items")
 
+    @property
+    def filtering(self) -> bool:
+        """Whether a search or asset filter is active."""
+        return bool(self.search_text or self.asset_filter)
+
     async def fetch_news(self, client) -> None:
         """Fetch cryptocurrency news and update the widget asynchronously."""
+        self.polling = True
         try:
-            self.news_data = await asyncio.to_thread(client.fetch_news, limit=5)
-            logger.info(f"Fetched {len(self.news_data)} news items")
+            await self._show(await client.fetch_news_async(limit=5))
         except Exception as e:
             logger.error(f"Error loading news: {e}")
             # Don't notify user for news errors, fail silently
+        finally:
+            self.polling = False
+
+    async def poll_news(self, client) -> None:
+        """Poll the feeds that are due and update the widget if any were."""
+        self.polling = True
+        try:
+            items = await client.poll_news_async(limit=5)
+            if items is not None:
+                await self._show(items)
+        except Exception as e:
+            logger.error(f"Error polling news: {e}")
+        finally:
+            self.polling = False
+
+    async def _show(self, items: list[NewsItem]) -> None:
+        """Show freshly fetched items."""
+        self.latest = items
+        logger.info(f"Fetched {len(self.latest)} news items")
+        if self.latest:
+            self.post_message(self.NewsUpdated(self.latest))
+        if self.filtering:
+            await self.search()  # new items may match
+        else:
+            self.news_data = self.latest
+        await self.load_assets()
+
+    async def load_assets(self) -> None:
+        """Offer the most mentioned assets of the store in the filter."""
+        if self.store is None:
+            return
+        assets = await asyncio.to_thread(self.store.top_assets)
+        options = [(f"{symbol} ({count})", symbol) for symbol, count in assets]
+        select = self.query_one("#news-asset", Select)
+        if self.asset_filter and self.asset_filter not in {symbol for symbol, _ in assets}:
+            options.append((self.asset_filter, self.asset_filter))
+        with select.prevent(Select.Changed):
+            select.set_options(options)
+            if self.asset_filter:
+                select.value = self.asset_filter
+
+    async def search(self) -> None:
+        """Show the stored items matching the search box and asset filter."""
+        title = self.query_one("#news-title", Label)
+        if not self.filtering:
+            title.update("Latest Crypto News")
+            self.news_data = self.latest
+            return
+        if self.store is None:
+            return
+        try:
+            items = await asyncio.to_thread(self.store.search, self.search_text, self.asset_filter)
+            label = " ".join(part for part in (self.asset_filter, self.search_text) if part)
+            title.update(f"{len(items)} stored items matching {escape(label)}")
+            self.news_data = items
+        except Exception as e:
+            logger.error(f"Error searching news: {e}")
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Search as the query is typed."""
+        event.stop()
+        self.search_text = event.value.strip()
+        self.run_worker(self.search, group="news-search", exclusive=True)
+
+    def on_select_changed(self, event: Select.Changed) -> None:
+        """Filter by the chosen asset."""
+        event.stop()
+        self.asset_filter = None if event.value is Select.NULL else event.value
+        self.run_worker(self.search, group="news-search", exclusive=True)
 
 
 # =============================================================================
@@ -545,7 +737,7 @@ class TerminalCoinApp(App):
         background: $surface-darken-1;
     }
 
-    #price-chart {
+    #price-chart, #nav-chart {
         height: 1fr;
         width: 100%;
         border: solid $accent;
@@ -553,6 +745,12 @@ class TerminalCoinApp(App):
         background: $surface-darken-1;
     }
 
+    #portfolio-books {
+        height: auto;
+        max-height: 12;
+        margin-bottom: 1;
+    }
+
     #coin-stats {
         text-align: left;
         width: 100%;
@@ -581,6 +779,22 @@ class TerminalCoinApp(App):
         margin-bottom: 1;
     }
 
+    #news-controls {
+        height: auto;
+        width: 100%;
+        margin-bottom: 1;
+    }
+
+    #news-search {
+        width: 2fr;
+        background: $surface;
+        border: solid $secondary;
+    }
+
+    #news-asset {
+        width: 1fr;
+    }
+
     .news-scroll {
         height: 1fr;
         width: 100%;
@@ -598,21 +812,36 @@ class TerminalCoinApp(App):
     BINDINGS = [
         ("q", "quit", "Quit"),
         ("r", "refresh", "Refresh"),
+        ("m", "simulate", "Simulate"),
         ("p", "command_palette", "Palette"),
     ]
 
-    def __init__(self):
-        """Initialize the application."""
+    def __init__(self, offline: bool = False):
+        """
+        Initialize the application.
+
+        Args:
+            offline: Show the last saved snapshot without contacting any API
+        """
         super().__init__()
+        self.offline = offline
 
         # Register all custom themes
-        for theme in CUSTOM_THEMES.values():
-            self.register_theme(theme)
+        with startup_profiler.step("register themes"):
+            for theme in CUSTOM_THEMES.values():
+                self.register_theme(theme)
 
-        # Initialize API clients
+        # Initialize API clients (news client is created by the warmup task)
         self.coin_client: Optional[CoinGeckoClient] = None
-        self.news_client = get_news_client()
-        self.portfolio_manager = PortfolioManager()
+        self.news_client = None
+        self.news_store = None  # offline only; online the news client owns the store
+        self.price_archive = None  # created by the warmup task (imports NumPy)
+        with startup_profiler.step("init portfolio manager"):
+            self.portfolio_manager = PortfolioManager()
+        self.anomaly_detector = AnomalyDetector()
+        self.alert_engine = AlertEngine(self.portfolio_manager.db)
+        with startup_profiler.step("open snapshot store"):
+            self.snapshot_store = SnapshotStore()
 
         logger.info(f"TerminalCoin v{app_config.VERSION} initialized")
 
@@ -633,6 +862,12 @@ class TerminalCoinApp(App):
             with TabPane("Portfolio", id="portfolio"):
                 yield PortfolioTable()
 
+            with TabPane("History", id="history"):
+                yield TransactionHistory(self.portfolio_manager.async_db)
+
+            with TabPane("Movers", id="movers"):
+                yield MoversPanel()
+
         yield Footer()
 
     def on_mount(self) -> None:
@@ -641,14 +876,22 @@ class TerminalCoinApp(App):
             # Set default theme
             self.theme = app_config.DEFAULT_THEME
 
+            # Render the last known state immediately; fresh data replaces it
+            with startup_profiler.step("restore snapshot"):
+                self._restore_snapshot()
+
             # Initialize coin client
-            self.coin_client = CoinGeckoClient()
+            if not self.offline:
+                with startup_profiler.step("init coin client"):
+                    self.coin_client = CoinGeckoClient()
 
             # Load initial data
-            self.refresh_data()
+            with startup_profiler.step("initial refresh"):
+                self.refresh_data()
 
-            # Set up auto-refresh
+            # Set up auto-refresh; each news feed is polled on its own schedule
             self.set_interval(app_config.REFRESH_INTERVAL, self.refresh_data)
+            self.set_interval(news_config.POLL_TICK, self.poll_news)
 
             # Show welcome notification
             self.notify(
@@ -666,21 +909,104 @@ class TerminalCoinApp(App):
             logger.error(f"Error during mount: {e}")
             self.notify(f"Error initializing app: {e}", severity="error")
 
+    def _restore_snapshot(self) -> None:
+        """Show the market list and news saved by the previous session."""
+        market = self.snapshot_store.load_market()
+        if market:
+            self.query_one(CoinList).coins = market.data
+            self._set_stale_marker(market.fetched_at)
+            logger.info(f"Restored {len(market.data)} coins from snapshot ({market.age:.0f}s old)")
+        elif self.offline:
+            self.notify("No saved market data available offline", severity="warning")
+
+        news = self.snapshot_store.load_news()
+        if news:
+            self.query_one(NewsPanel).news_data = news.data
+
+    def _set_stale_marker(self, fetched_at: Optional[float]) -> None:
+        """Flag the screen as showing saved data (None clears the marker)."""
+        if fetched_at is None:
+            self.sub_title = ""
+            return
+        saved = datetime.fromtimestamp(fetched_at).strftime("%Y-%m-%d %H:%M")
+        state = "OFFLINE" if self.offline else "STALE"
+        self.sub_title = f"{state} · showing data from {saved}"
+
+    def on_ready(self) -> None:
+        """Called once the first frame has been displayed."""
+        startup_profiler.mark("first frame rendered")
+        self.run_worker(self._warmup(), group="warmup")
+
+    async def _warmup(self) -> None:
+        """Load heavy subsystems in the background after first paint."""
+        # 1. Chart widget (plotext)
+        try:
+            with startup_profiler.step("warmup: import chart widget"):
+                chart_module = await asyncio.to_thread(importlib.import_module, "widgets.chart")
+            await self.query_one(CoinDetail).install_chart(chart_module.CryptoChart)
+            await self.query_one(PortfolioTable).install_chart(chart_module.CryptoChart)
+        except Exception as e:
+            logger.error(f"Error loading chart widget: {e}")
+
+        # 2. Price archive (NumPy)
+        try:
+            with startup_profiler.step("warmup: open price archive"):
+                archive_module = await asyncio.to_thread(importlib.import_module, "price_archive")
+                self.price_archive = archive_module.PriceArchive()
+        except Exception as e:
+            logger.error(f"Error opening price archive: {e}")
+
+        # 3. News client (feedparser, httpx, VADER lexicon)
+        if self.offline:
+            # Stored news stays searchable offline
+            try:
+                panel = self.query_one(NewsPanel)
+                store_module = await asyncio.to_thread(importlib.import_module, "news_store")
+                self.news_store = await asyncio.to_thread(store_module.NewsStore)
+                panel.store = self.news_store
+                await panel.load_assets()
+                aggregates = await asyncio.to_thread(
+                    SentimentAggregator.from_store, self.news_store
+                )
+                self.query_one(CoinList).set_news_sentiment(
+                    aggregates.snapshot(news_config.SENTIMENT_COLUMN_WINDOW)
+                )
+            except Exception as e:
+                logger.error(f"Error opening news store: {e}")
+            startup_profiler.mark("warmup complete")
+            startup_profiler.disable_import_timing()
+            return
+        try:
+            with startup_profiler.step("warmup: init news client"):
+                news_module = await asyncio.to_thread(importlib.import_module, "news_client")
+                self.news_client = await asyncio.to_thread(news_module.get_news_client)
+            self.query_one(NewsPanel).store = self.news_client.store
+            self.run_worker(self.query_one(NewsPanel).fetch_news(self.news_client), group="refresh")
+        except Exception as e:
+            logger.error(f"Error initializing news client: {e}")
+
+        startup_profiler.mark("warmup complete")
+        startup_profiler.disable_import_timing()
+
     def refresh_data(self) -> None:
         """Refresh all data sources."""
-        self.notify("Refreshing data...", severity="information")
+        if not self.offline:
+            self.notify("Refreshing data...", severity="information")
 
         # 1. Refresh Market Data
         if self.coin_client:
             self.run_worker(self.query_one(CoinList).fetch_coins(self.coin_client), group="refresh")
 
-        # 2. Refresh News
-        self.run_worker(self.query_one(NewsPanel).fetch_news(self.news_client), group="refresh")
+        # 2. Refresh Portfolio (news feeds are polled on their own schedule, see poll_news)
+        self.run_worker(self._refresh_portfolio(), group="portfolio", exclusive=True)
 
-        # 3. Refresh Portfolio
-        self._refresh_portfolio()
+    def poll_news(self) -> None:
+        """Poll the news feeds that are due (once the warmup task has created the client)."""
+        panel = self.query_one(NewsPanel)
+        if self.news_client and not panel.polling:
+            self.run_worker(panel.poll_news(self.news_client), group="news")
 
-    def _refresh_portfolio(self) -> None:
+    async def _refresh_portfolio(self) -> None:
         """Update portfolio view with current prices."""
         try:
             # Create a map of current prices from the coin list
@@ -692,14 +1018,123 @@ class TerminalCoinApp(App):
                 for coin in coin_list_widget.coins:
                     current_prices[coin.id] = coin.current_price
 
-            # Update portfolio table
-            items = self.portfolio_manager.get_portfolio_summary(current_prices)
-            self.query_one(PortfolioTable).items = items
+            # Update the changed holdings and the per-portfolio aggregates
+            table = self.query_one(PortfolioTable)
+            table.apply_changes(
+                await self.portfolio_manager.get_portfolio_changes_async(
+                    current_prices, table.portfolio_id, table.tick
+                )
+            )
+            table.books = await self.portfolio_manager.get_portfolio_valuations_async(
+                current_prices
+            )
+            table.update_risk(
+                await self.portfolio_manager.get_risk_report_async(
+                    current_prices, table.portfolio_id
+                )
+            )
+
+            # Pick up trades recorded since (e.g. by import_transactions.py)
+            self.query_one(TransactionHistory).reload_if_changed()
 
         except Exception as e:
             logger.error(f"Error refreshing portfolio: {e}")
             self.notify("Error refreshing portfolio", severity="error")
 
+    async def _check_alerts(self, coins: list) -> None:
+        """Evaluate price alerts against a market refresh and notify hits."""
+        try:
+            hits = await self.portfolio_manager.async_db.run(
+                self.alert_engine.check_market, coins
+            )
+        except Exception as e:
+            logger.error(f"Error checking price alerts: {e}")
+            return
+
+        # Every hit is logged; only the first few are shown
+        for hit in hits[:5]:
+            self.notify(hit.message, title="Price Alert", severity="warning", timeout=10)
+        if len(hits) > 5:
+            self.notify(f"{len(hits) - 5} more alerts triggered (see log)", title="Price Alert")
+
+    async def _refresh_nav(self, current_prices: dict) -> None:
+        """Record today's prices and extend the portfolio value history."""
+        try:
+            await self.portfolio_manager.async_db.run(
+                self.portfolio_manager.record_prices, current_prices
+            )
+            table = self.query_one(PortfolioTable)
+            portfolio_id = table.portfolio_id
+            snapshots = await self.portfolio_manager.update_nav_history_async(portfolio_id)
+            if table.portfolio_id == portfolio_id:
+                table.update_nav(snapshots)
+        except Exception as e:
+            logger.error(f"Error updating portfolio value history: {e}")
+
+    async def _show_nav(self) -> None:
+        """Chart the value history of the selected portfolio."""
+        table = self.query_one(PortfolioTable)
+        portfolio_id = table.portfolio_id
+        try:
+            snapshots = await self.portfolio_manager.get_nav_history_async(portfolio_id)
+        except Exception as e:
+            logger.error(f"Error loading portfolio value history: {e}")
+            return
+        if table.portfolio_id == portfolio_id:
+            table.update_nav(snapshots)
+
+    def on_portfolio_table_portfolio_selected(
+        self, message: PortfolioTable.PortfolioSelected
+    ) -> None:
+        """Show the newly selected portfolio right away."""
+        self.run_worker(self._refresh_portfolio(), group="portfolio", exclusive=True)
+        self.run_worker(self._show_nav(), group="nav-chart", exclusive=True)
+
+    def on_coin_list_coins_updated(self, message: CoinList.CoinsUpdated) -> None:
+        """Feed each market refresh into the snapshot, price history and anomaly detector."""
+        self._set_stale_marker(None)
+        self.run_worker(
+            asyncio.to_thread(self.snapshot_store.save_market, message.coins), group="snapshot"
+        )
+
+        current_prices = {coin.id: coin.current_price for coin in message.coins}
+        self.run_worker(self._refresh_nav(current_prices), group="nav", exclusive=True)
+        self.run_worker(self._check_alerts(message.coins), group="alerts", exclusive=True)
+        if self.news_client:
+            # Detect the listed coins in news; a no-op unless the universe changed
+            detector = self.news_client.asset_detector
+            self.run_worker(
+                asyncio.to_thread(detector.update_universe, message.coins), group="assets"
+            )
+
+        try:
+            events = self.anomaly_detector.update(message.coins)
+            if not events:
+                return
+
+            self.query_one(MoversPanel).add_events(events)
+
+            # Only notify the strongest moves to avoid flooding the screen
+            for event in events[:3]:
+                arrow = "▲" if event.direction == "up" else "▼"
+                self.notify(
+                    f"{arrow} {event.symbol} {event.metric} {format_percentage(event.change_pct)} "
+                    f"(z={event.zscore:+.1f})",
+                    title="Unusual Move",
+                    severity="warning",
+                )
+        except Exception as e:
+            logger.error(f"Error detecting market anomalies: {e}")
+
+    def on_news_panel_news_updated(self, message: NewsPanel.NewsUpdated) -> None:
+        """Save each news refresh for the next launch and update the sentiment column."""
+        self.run_worker(
+            asyncio.to_thread(self.snapshot_store.save_news, message.items), group="snapshot"
+        )
+        if self.news_client:
+            sentiment = self.news_client.aggregates.snapshot(news_config.SENTIMENT_COLUMN_WINDOW)
+            self.query_one(CoinList).set_news_sentiment(sentiment)
+
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """
         Handle row selection in the coin list.
@@ -724,7 +1159,12 @@ class TerminalCoinApp(App):
             coin_id: Coin identifier
         """
         if not self.coin_client:
-            logger.warning("Coin client not initialized")
+            # Offline: fall back to whatever was saved for this coin
+            self.run_worker(
+                self._show_saved_details(coin_id, notify_missing=True),
+                exclusive=True,
+                group="coin_fetch",
+            )
             return
 
         # Check cache first
@@ -758,43 +1198,154 @@ class TerminalCoinApp(App):
             if data:
                 # 2. Get Historical Data for Chart (30 days)
                 history = await asyncio.to_thread(self.coin_client.get_historical_data, coin_id, days=30)
+                if history.get("prices"):
+                    await self.portfolio_manager.async_db.run(
+                        self.portfolio_manager.record_price_history, coin_id, history["prices"]
+                    )
 
                 # Update Cache
                 self._coin_details_cache[coin_id] = (datetime.utcnow().timestamp(), data, history)
+                self.run_worker(
+                    asyncio.to_thread(self.snapshot_store.save_detail, data, history),
+                    group="snapshot",
+                )
 
-                # Update UI
-                self._update_detail_ui(data, history)
-            else:
+                # Update UI (chart from the archive once it is available)
+                if self.price_archive is not None and history.get("prices"):
+                    self.query_one(CoinDetail).coin_data = data
+                    if not await self._chart_from_archive(coin_id, history["prices"]):
+                        self._update_detail_ui(data, history)
+                else:
+                    self._update_detail_ui(data, history)
+            elif not await self._show_saved_details(coin_id):
                 self.notify(f"Could not load details for {coin_id}", severity="warning")
 
         except TerminalCoinException as e:
             logger.error(f"Error fetching coin details: {e.message}")
-            self.notify(f"Error: {e.message}", severity="error")
+            if not await self._show_saved_details(coin_id):
+                self.notify(f"Error: {e.message}", severity="error")
         except Exception as e:
             logger.error(f"Unexpected error fetching coin details: {e}")
-            self.notify("Error loading coin details", severity="error")
+            if not await self._show_saved_details(coin_id):
+                self.notify("Error loading coin details", severity="error")
+
+    async def _chart_from_archive(self, coin_id: str, points: list) -> bool:
+        """
+        Append fetched history to the archive and chart the last 30 days from it.
+
+        Returns:
+            True if the chart was drawn from the archive
+        """
+        try:
+            await asyncio.to_thread(self.price_archive.append_market_chart, coin_id, points)
+            since = int((datetime.utcnow().timestamp() - 30 * 86400) * 1000)
+            series = self.price_archive.get_series(coin_id, start=since)
+            if not len(series):
+                return False
+            self.query_one(CoinDetail).update_chart_series(series)
+            return True
+        except Exception as e:
+            logger.error(f"Error archiving price history for {coin_id}: {e}")
+            return False
+
+    async def _show_saved_details(self, coin_id: str, notify_missing: bool = False) -> bool:
+        """
+        Show the last saved details for a coin.
+
+        Args:
+            coin_id: Coin identifier
+            notify_missing: Tell the user when nothing was saved for the coin
+
+        Returns:
+            True if a snapshot was found and displayed
+        """
+        snapshot = await asyncio.to_thread(self.snapshot_store.load_detail, coin_id)
+        if snapshot is None:
+            if notify_missing:
+                self.notify(f"No saved details for {coin_id}", severity="warning")
+            return False
+
+        data, history = snapshot.data
+        self._update_detail_ui(data, history)
+        saved = datetime.fromtimestamp(snapshot.fetched_at).strftime("%Y-%m-%d %H:%M")
+        self.notify(f"Showing saved details from {saved}", severity="warning")
+        return True
 
     def action_refresh(self) -> None:
-        """Refresh all data."""
+        """Refresh all data, polling every news feed regardless of its schedule."""
         self.refresh_data()
+        panel = self.query_one(NewsPanel)
+        if self.news_client and not panel.polling:
+            self.run_worker(panel.fetch_news(self.news_client), group="news")
+
+    def action_simulate(self) -> None:
+        """Run a Monte Carlo simulation of the displayed portfolio."""
+        self.notify("Simulating portfolio...")
+        self.run_worker(self._simulate_portfolio(), group="simulation", exclusive=True)
+
+    async def _simulate_portfolio(self) -> None:
+        """Simulate the displayed portfolio off the event loop and show the outcome."""
+        try:
+            coins = self.query_one(CoinList).coins or []
+            current_prices = {coin.id: coin.current_price for coin in coins}
+            table = self.query_one(PortfolioTable)
+            result = await self.portfolio_manager.simulate_portfolio_async(
+                current_prices, table.portfolio_id
+            )
+            table.update_simulation(result)
+            if result is None:
+                self.notify("Nothing to simulate: no holdings or price history", severity="warning")
+        except Exception as e:
+            logger.error(f"Error simulating portfolio: {e}")
+            self.notify("Error simulating portfolio", severity="error")
 
     def on_unmount(self) -> None:
         """Clean up when app is unmounted."""
         if self.coin_client:
             self.coin_client.close()
+        if self.news_client:
+            self.news_client.close()
+        if self.news_store:
+            self.news_store.close()
+        self.portfolio_manager.close()
+        self.snapshot_store.close()
         logger.info("Application unmounted")
 
 
+def parse_args(argv: Optional[list] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(prog="terminalcoin", description=app_config.APP_NAME)
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print time spent per import and init step after exit",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="show the last saved market snapshot without contacting any API",
+    )
+    return parser.parse_args(argv)
+
+
 def main() -> None:
     """Main entry point for the application."""
+    args = parse_args()
+    startup_profiler.mark("imports done")
     try:
-        app = TerminalCoinApp()
+        with startup_profiler.step("create app"):
+            app = TerminalCoinApp(offline=args.offline)
         app.run()
     except KeyboardInterrupt:
         logger.info("Application interrupted by user")
     except Exception as e:
         logger.critical(f"Fatal error: {e}", exc_info=True)
         raise
+    finally:
+        if args.profile_startup:
+            report = startup_profiler.report()
+            logger.info(report)
+            print(report, file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,55 @@
+"""
+Archive Prices Script.
+
+Back-fills the memory-mapped price archive with daily history from
+CoinGecko. Only points newer than what is already archived are appended,
+so the script can be re-run to top the archive up.
+
+Usage:
+    python archive_prices.py bitcoin ethereum [--days 365]
+"""
+
+import argparse
+import logging
+import time
+
+from api_client import CoinGeckoClient
+from price_archive import PriceArchive
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def archive_prices():
+    parser = argparse.ArgumentParser(description="Back-fill the local price archive")
+    parser.add_argument("coins", nargs="+", help="CoinGecko coin ids")
+    parser.add_argument(
+        "--days", type=int, default=365, help="days of daily history to fetch (default: 365)"
+    )
+    args = parser.parse_args()
+
+    client = CoinGeckoClient()
+    archive = PriceArchive()
+
+    start = time.perf_counter()
+    total = 0
+    for coin_id in args.coins:
+        try:
+            history = client.get_historical_data(coin_id, days=args.days)
+            added = archive.append_market_chart(coin_id, history.get("prices", []))
+            total += added
+            logger.info(
+                f"{coin_id}: archived {added} new points ({len(archive.get_series(coin_id))} total)"
+            )
+        except Exception as e:
+            logger.error(f"{coin_id}: {e}")
+
+    logger.info(
+        f"Archived {total} points for {len(args.coins)} coins in {time.perf_counter() - start:.2f}s"
+    )
+    client.close()
+
+
+if __name__ == "__main__":
+    archive_prices()
@@ -0,0 +1,210 @@
+"""
+Async database facade for TerminalCoin.
+
+Runs every database call on a single dedicated thread so the Textual event
+loop never blocks on SQLite, and coalesces writes into batched commits.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from database import Database, DEFAULT_PORTFOLIO_ID, TRANSACTION_PAGE_SIZE
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Writes are committed when this many are queued...
+WRITE_BATCH_SIZE = 500
+# ...or after this many seconds, whichever comes first
+WRITE_BATCH_DELAY = 0.05
+
+
+class AsyncDatabase:
+    """
+    Awaitable wrapper around Database.
+
+    All calls execute in FIFO order on one worker thread (which therefore
+    owns a single long-lived connection). Pending writes are flushed before
+    any read is queued, so reads always observe earlier writes.
+    """
+
+    def __init__(self, db: Database):
+        """
+        Initialize the facade.
+
+        Args:
+            db: Underlying synchronous database
+        """
+        self.db = db
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="terminalcoin-db")
+        self._pending: List[Tuple[Tuple[str, str, str, float, float, int], asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._closed = False
+
+    async def _call(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a database function on the DB thread after pending writes."""
+        self._flush_pending()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def _flush_pending(self) -> None:
+        """Submit queued writes to the DB thread as one transaction."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        loop = asyncio.get_running_loop()
+        submitted = loop.run_in_executor(
+            self._executor, self._write_batch, [args for args, _ in batch]
+        )
+
+        def resolve(done: asyncio.Future) -> None:
+            if done.cancelled():
+                for _, waiter in batch:
+                    waiter.cancel()
+                return
+            error = done.exception()
+            errors = [error] * len(batch) if error else done.result()
+            for (_, waiter), error in zip(batch, errors):
+                if waiter.done():
+                    continue
+                if error:
+                    waiter.set_exception(error)
+                else:
+                    waiter.set_result(None)
+
+        submitted.add_done_callback(resolve)
+
+    def _write_batch(self, transactions: List[Tuple]) -> List[Optional[Exception]]:
+        """
+        Commit queued transactions, isolating failures to the rows that caused them.
+
+        The batch is written in one transaction; if that fails, every row is
+        retried in its own transaction so unrelated callers still succeed.
+
+        Returns:
+            One entry per transaction: None if it was recorded, else its error
+        """
+        try:
+            self.db.add_transactions(transactions)
+            return [None] * len(transactions)
+        except Exception as e:
+            if len(transactions) == 1:
+                return [e]
+            logger.warning(f"Batch of {len(transactions)} transactions failed, retrying one by one")
+
+        errors: List[Optional[Exception]] = []
+        for transaction in transactions:
+            try:
+                self.db.add_transactions([transaction])
+                errors.append(None)
+            except Exception as e:
+                errors.append(e)
+        return errors
+
+    async def add_transaction(
+        self,
+        coin_id: str,
+        symbol: str,
+        type: str,
+        amount: float,
+        price: float,
+        portfolio_id: int = DEFAULT_PORTFOLIO_ID
+    ) -> None:
+        """
+        Queue a transaction; returns once its batch has been committed.
+
+        Raises:
+            Exception: If this transaction could not be recorded
+        """
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._pending.append(((coin_id, symbol, type, amount, price, portfolio_id), waiter))
+
+        if len(self._pending) >= WRITE_BATCH_SIZE:
+            self._flush_pending()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(WRITE_BATCH_DELAY, self._flush_pending)
+
+        await waiter
+
+    async def flush(self) -> None:
+        """Commit queued writes now and wait for them."""
+        await self._call(lambda: None)
+
+    async def get_holdings(
+        self, portfolio_id: Optional[int] = DEFAULT_PORTFOLIO_ID
+    ) -> List[Dict[str, Any]]:
+        """Get current holdings of one portfolio (every portfolio if None)."""
+        return await self._call(self.db.get_holdings, portfolio_id)
+
+    async def get_transactions_page(
+        self,
+        coin_id: Optional[str] = None,
+        before: Optional[Tuple[str, int]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        page_size: int = TRANSACTION_PAGE_SIZE
+    ) -> List[Dict[str, Any]]:
+        """Get one keyset-paginated page of transaction history."""
+        return await self._call(
+            self.db.get_transactions_page, coin_id, before, start, end, page_size
+        )
+
+    async def get_latest_transaction_id(self) -> int:
+        """Get the id of the newest transaction (0 if there are none)."""
+        return await self._call(self.db.get_latest_transaction_id)
+
+    async def get_transaction_aggregates(
+        self,
+        period: str = "day",
+        coin_id: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """Aggregate volume and cost per coin per period."""
+        return await self._call(self.db.get_transaction_aggregates, period, coin_id, start, end)
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run any callable on the DB thread (e.g. ``db.bulk_import_transactions``).
+
+        Args:
+            func: Callable using the underlying Database
+        """
+        return await self._call(func, *args, **kwargs)
+
+    def close(self) -> None:
+        """
+        Write any queued transactions, close connections and stop the DB thread.
+
+        Safe to call from synchronous shutdown code.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            errors = self._executor.submit(
+                self._write_batch, [args for args, _ in batch]
+            ).result()
+            failed = [error for error in errors if error]
+            if failed:
+                logger.error(
+                    f"Failed to write {len(failed)} queued transactions on close: {failed[0]}"
+                )
+
+        self._executor.submit(self.db.close).result()
+        self._executor.shutdown(wait=True)
+        logger.info("Async database closed")
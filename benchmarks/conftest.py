@@ -0,0 +1,17 @@
+"""
+Shared fixtures for TerminalCoin benchmarks.
+
+Run with: python scripts/run_benchmarks.py
+"""
+
+import pytest
+
+from database import Database
+
+
+@pytest.fixture
+def db_path(tmp_path) -> str:
+    """Path to a fresh, schema-initialized database file."""
+    path = str(tmp_path / "bench.db")
+    Database(path)
+    return path
@@ -0,0 +1,144 @@
+"""
+Synthetic data generators for TerminalCoin benchmarks.
+
+All generators are deterministic (seeded) so runs are comparable
+against stored baselines.
+"""
+
+import os
+import random
+import sqlite3
+from typing import Any, Dict, List, Tuple
+
+from models import CoinMarketData
+
+# Problem sizes exercised by every parametrized benchmark.
+# Lower the ceiling with TERMINALCOIN_BENCH_MAX_SIZE for quick local runs.
+ALL_SIZES: List[int] = [10, 100, 1_000, 10_000, 100_000]
+MAX_SIZE: int = int(os.getenv("TERMINALCOIN_BENCH_MAX_SIZE", "100000"))
+SIZES: List[int] = [n for n in ALL_SIZES if n <= MAX_SIZE]
+
+SEED = 1337
+
+
+def make_prices(n: int, start: float = 30_000.0, seed: int = SEED) -> List[float]:
+    """
+    Generate a geometric random-walk price series.
+
+    Args:
+        n: Number of points
+        start: Starting price
+        seed: Random seed
+
+    Returns:
+        List of positive prices
+    """
+    rng = random.Random(seed)
+    prices = []
+    price = start
+    for _ in range(n):
+        price *= 1.0 + rng.gauss(0.0, 0.02)
+        price = max(price, 0.0001)
+        prices.append(price)
+    return prices
+
+
+def make_market_payload(
+    n: int, sparkline_points: int = 168, seed: int = SEED
+) -> List[Dict[str, Any]]:
+    """
+    Generate a CoinGecko ``coins/markets`` style JSON payload.
+
+    Args:
+        n: Number of coins
+        sparkline_points: Points in each 7d sparkline (hourly = 168)
+        seed: Random seed
+
+    Returns:
+        List of raw coin dictionaries
+    """
+    rng = random.Random(seed)
+    # A small shared pool of shapes keeps generation cheap at 100k coins;
+    # sparklines are min/max normalized so absolute levels do not matter.
+    shapes = [make_prices(sparkline_points, seed=seed + k) for k in range(64)]
+    payload = []
+    for i in range(n):
+        price = rng.uniform(0.001, 50_000.0)
+        payload.append({
+            "id": f"coin-{i}",
+            "symbol": f"c{i}",
+            "name": f"Coin {i}",
+            "image": f"https://example.com/{i}.png",
+            "current_price": price,
+            "market_cap": price * rng.uniform(1e6, 1e9),
+            "market_cap_rank": i + 1,
+            "total_volume": rng.uniform(1e4, 1e9),
+            "high_24h": price * 1.05,
+            "low_24h": price * 0.95,
+            "price_change_percentage_24h": rng.uniform(-25.0, 25.0),
+            "sparkline_in_7d": {
+                "price": shapes[i % len(shapes)]
+            },
+        })
+    return payload
+
+
+def make_coins(n: int, sparkline_points: int = 168, seed: int = SEED) -> List[CoinMarketData]:
+    """Generate validated CoinMarketData objects."""
+    return [CoinMarketData(**raw) for raw in make_market_payload(n, sparkline_points, seed)]
+
+
+def make_holdings(n: int, seed: int = SEED) -> List[Tuple[str, str, float, float]]:
+    """
+    Generate holdings rows as (coin_id, symbol, amount, average_buy_price).
+
+    Args:
+        n: Number of holdings
+        seed: Random seed
+    """
+    rng = random.Random(seed)
+    return [
+        (f"coin-{i}", f"C{i}", rng.uniform(0.01, 1_000.0), rng.uniform(0.001, 50_000.0))
+        for i in range(n)
+    ]
+
+
+def make_current_prices(
+    holdings: List[Tuple[str, str, float, float]], seed: int = SEED
+) -> Dict[str, float]:
+    """Generate a current price map roughly around each holding's buy price."""
+    rng = random.Random(seed)
+    return {coin_id: avg * rng.uniform(0.5, 2.0) for coin_id, _, _, avg in holdings}
+
+
+def make_transactions(
+    n: int, coins: int = 50, seed: int = SEED
+) -> List[Tuple[str, str, str, float, float]]:
+    """
+    Generate trades as (coin_id, symbol, type, amount, price).
+
+    Roughly one in four trades is a partial SELL of an existing position.
+    """
+    rng = random.Random(seed)
+    trades = []
+    for _ in range(n):
+        i = rng.randrange(coins)
+        trade_type = "SELL" if rng.random() < 0.25 else "BUY"
+        trades.append(
+            (f"coin-{i}", f"C{i}", trade_type, rng.uniform(0.01, 10.0), rng.uniform(1.0, 50_000.0))
+        )
+    return trades
+
+
+def seed_holdings(db_path: str, holdings: List[Tuple[str, str, float, float]]) -> None:
+    """Bulk insert holdings directly into an initialized database file."""
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT INTO holdings (coin_id, symbol, amount, average_buy_price) "
+                "VALUES (?, ?, ?, ?)",
+                holdings,
+            )
+    finally:
+        conn.close()
@@ -0,0 +1,44 @@
+"""
+Benchmarks for price alert evaluation.
+"""
+
+import random
+
+from alert_engine import Alert, AlertIndex
+
+ALERTS = 50_000
+COINS = 100
+
+
+def make_index(rng: random.Random) -> AlertIndex:
+    """Alerts spread over every coin, half above and half below the price."""
+    alerts = [
+        Alert(i, f"coin-{i % COINS}", "price", "above" if i % 2 else "below",
+              100.0 * (1.0 + rng.uniform(0.02, 0.5) * (1 if i % 2 else -1)))
+        for i in range(ALERTS)
+    ]
+    return AlertIndex(alerts)
+
+
+def test_evaluate_refresh(benchmark):
+    """Benchmark one market refresh of small moves against 50k alerts."""
+    rng = random.Random(7)
+    index = make_index(rng)
+    index.evaluate({f"coin-{i}": 100.0 for i in range(COINS)})
+    ticks = iter(range(10**9))
+
+    def run():
+        # Oscillate within +-1% so alerts keep being checked but rarely fire
+        step = 1.0 + (0.01 if next(ticks) % 2 else -0.01)
+        return index.evaluate({f"coin-{i}": 100.0 * step for i in range(COINS)})
+
+    benchmark(run)
+    assert len(index) == ALERTS
+
+
+def test_load_index(benchmark):
+    """Benchmark building the index from 50k stored alerts."""
+    rng = random.Random(7)
+    alerts = list(make_index(rng)._alerts.values())
+    index = benchmark(AlertIndex, alerts)
+    assert len(index) == ALERTS
@@ -0,0 +1,26 @@
+"""
+Benchmarks for technical analysis and sparkline rendering.
+"""
+
+import pytest
+
+from analysis_engine import AnalysisEngine
+from utils import generate_sparkline
+from benchmarks.generators import SIZES, make_prices
+
+
+@pytest.mark.parametrize("size", [n for n in SIZES if n >= 50] or [50])
+def test_calculate_indicators(benchmark, size):
+    """Benchmark RSI/MACD/EMA/SMA/BBands over a price series."""
+    engine = AnalysisEngine()
+    prices = make_prices(size)
+    result = benchmark(engine.calculate_indicators, prices)
+    assert result is not None
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_generate_sparkline(benchmark, size):
+    """Benchmark sparkline generation from a raw series."""
+    prices = make_prices(size)
+    result = benchmark(generate_sparkline, prices, 15)
+    assert len(result) <= 15
@@ -0,0 +1,35 @@
+"""
+Benchmarks for the memory-mapped price archive.
+"""
+
+import pytest
+
+from price_archive import PriceArchive
+from benchmarks.generators import make_prices
+
+DAY_MS = 86_400_000
+YEARS_OF_DAYS = 5 * 365
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """Archive holding five years of daily prices for 500 coins."""
+    archive = PriceArchive(str(tmp_path / "archive"))
+    prices = make_prices(YEARS_OF_DAYS)
+    timestamps = [i * DAY_MS for i in range(YEARS_OF_DAYS)]
+    for i in range(500):
+        archive.append(f"coin-{i}", timestamps, prices)
+    return archive
+
+
+def test_range_read_all_coins(benchmark, archive):
+    """Benchmark slicing one year out of every coin's history."""
+    coins = archive.coins()
+    start, end = 1000 * DAY_MS, 1365 * DAY_MS
+
+    def read():
+        return [archive.get_series(coin_id, start, end) for coin_id in coins]
+
+    series = benchmark(read)
+    assert len(series) == 500
+    assert all(len(s) == 365 for s in series)
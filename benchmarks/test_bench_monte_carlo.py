@@ -0,0 +1,40 @@
+"""
+Benchmarks for Monte Carlo portfolio simulation.
+"""
+
+import numpy as np
+
+from monte_carlo import MonteCarloSimulator
+
+HOLDINGS = 200
+DAYS = 2 * 365
+PATHS = 20_000
+
+
+def make_simulator() -> MonteCarloSimulator:
+    """Simulator over two years of daily returns for every holding."""
+    rng = np.random.default_rng(42)
+    return MonteCarloSimulator(rng.normal(0.0005, 0.04, (DAYS, HOLDINGS)))
+
+
+def test_simulate_bootstrap(benchmark):
+    """Benchmark bootstrapped paths at the default horizons."""
+    simulator = make_simulator()
+    values = np.full(HOLDINGS, 100.0)
+    result = benchmark.pedantic(
+        simulator.simulate, args=(values,), kwargs={"paths": PATHS, "seed": 1}, rounds=3
+    )
+    assert result.paths == PATHS
+
+
+def test_simulate_normal(benchmark):
+    """Benchmark multivariate normal paths at the default horizons."""
+    simulator = make_simulator()
+    values = np.full(HOLDINGS, 100.0)
+    result = benchmark.pedantic(
+        simulator.simulate,
+        args=(values,),
+        kwargs={"paths": PATHS, "method": "normal", "seed": 1},
+        rounds=3,
+    )
+    assert len(result.outcomes) == 5
@@ -0,0 +1,185 @@
+"""
+Benchmarks for news processing.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import feedparser
+import pytest
+
+from benchmarks.generators import make_coins
+from feed_stream import FeedStreamParser
+from models import NewsItem
+from news_client import AssetDetector
+from news_dedup import Fingerprint, StoryClusterer
+from news_store import NewsStore
+from sentiment_aggregates import SentimentAggregator
+from sentiment_service import SentimentService
+
+ARTICLE = (
+    "Markets opened higher as Coin 17 and C42 led a broad rally, while analysts warned that "
+    "the solution to liquidity problems is not yet in sight. "
+) * 20
+
+
+@pytest.mark.parametrize("universe", [100, 1000, 5000])
+def test_detect_assets(benchmark, universe):
+    """Benchmark scanning an article against a large coin universe."""
+    detector = AssetDetector()
+    detector.update_universe(make_coins(universe, sparkline_points=0))
+    assets = benchmark(detector.detect, ARTICLE)
+    assert "C17" in assets and "C42" in assets
+
+
+def test_rebuild_universe(benchmark):
+    """Benchmark compiling the matcher for 5000 coins."""
+    coins = make_coins(5000, sparkline_points=0)
+
+    def run():
+        detector = AssetDetector()
+        detector.update_universe(coins)
+        return detector
+
+    benchmark.pedantic(run, rounds=3)
+
+
+def _headlines(n: int):
+    return [f"Headline {i}: Coin {i % 97} surges as traders cheer strong gains" for i in range(n)]
+
+
+def test_score_sentiment_uncached(benchmark):
+    """Benchmark scoring 500 new headlines."""
+    texts = _headlines(500)
+    benchmark.pedantic(lambda: SentimentService().score_many(texts), rounds=3)
+
+
+def test_score_sentiment_cached(benchmark):
+    """Benchmark a batch of 500 headlines that were all scored before."""
+    texts = _headlines(500)
+    service = SentimentService()
+    service.score_many(texts)
+    scores = benchmark(service.score_many, texts)
+    assert len(scores) == 500
+
+
+@pytest.fixture(scope="module")
+def news_store(tmp_path_factory):
+    """Store holding 50k headlines (about a year of a busy feed set)."""
+    store = NewsStore(str(tmp_path_factory.mktemp("news") / "news.db"))
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    words = ["rally", "hack", "upgrade", "ETF", "lawsuit", "listing", "halving", "airdrop"]
+    items = [
+        (
+            f"id-{i}",
+            NewsItem(
+                source="Feed",
+                title=f"Coin {i % 300} {words[i % 8]} headline {i}",
+                link=f"https://feed.test/{i}",
+                summary=f"Story {i} about {words[(i * 7) % 8]}",
+                assets=[f"C{i % 300}", "BTC"] if i % 5 == 0 else [],
+                published_at=start + timedelta(minutes=10 * i),
+            ),
+        )
+        for i in range(50_000)
+    ]
+    store.save_items("https://feed.test/rss", items)
+    yield store
+    store.close()
+
+
+@pytest.mark.parametrize("query,asset", [("halving", None), ("hal", "BTC"), ("", "C40")])
+def test_search_news(benchmark, news_store, query, asset):
+    """Benchmark a full-text / per-asset search over 50k stored items."""
+    items = benchmark(news_store.search, query, asset)
+    assert items
+
+
+@pytest.fixture(scope="module")
+def fingerprinted_store(tmp_path_factory):
+    """Store holding 20k distinct stories with MinHash fingerprints."""
+    store = NewsStore(str(tmp_path_factory.mktemp("dedup") / "news.db"))
+    clusterer = StoryClusterer()
+    items, fingerprints = [], {}
+    for i in range(20_000):
+        text = (
+            f"Story {i}: coin {i % 300} sees {i % 17} percent move "
+            f"as desk {i * 7 % 1000} reports flows"
+        )
+        signature = clusterer.signature(text)
+        entry_id = f"id-{i}"
+        fingerprints[entry_id] = Fingerprint(
+            entry_id, signature, clusterer.band_keys(signature), entry_id
+        )
+        item = NewsItem(
+            source="Feed", title=text, link=f"https://feed.test/{i}", cluster_id=entry_id
+        )
+        items.append((entry_id, item))
+    store.save_items("https://feed.test/rss", items, fingerprints)
+    yield store
+    store.close()
+
+
+def test_cluster_new_item(benchmark, fingerprinted_store):
+    """Benchmark clustering one new item against 20k stored fingerprints."""
+    clusterer = StoryClusterer(fingerprinted_store)
+    text = "Story 4242: coin 42 sees 9 percent move as desk 694 reports flows today"
+    fingerprint = benchmark(clusterer.cluster, ["new"], [text])[0]
+    assert fingerprint.cluster_id == "id-4242"
+
+
+def test_aggregate_sentiment(benchmark):
+    """Benchmark adding a refresh of 50 stories to a week of 100k and reading the 24h column."""
+    now = datetime(2025, 6, 1, tzinfo=timezone.utc).timestamp()
+
+    def make(i: int, age: float) -> NewsItem:
+        return NewsItem(
+            source="Feed",
+            title=f"Story {i}",
+            link=f"https://feed.test/{i}",
+            assets=[f"C{i % 300}"],
+            sentiment_score=((i * 37) % 200 - 100) / 100,
+            published_at=datetime.fromtimestamp(now - age, timezone.utc),
+        )
+
+    aggregator = SentimentAggregator()
+    aggregator.add_items((make(i, i * 6.0) for i in range(100_000)), now=now)
+    refresh = [make(i, 0.0) for i in range(50)]
+    ticks = iter(range(1, 10**9))
+
+    def run():
+        moment = now + next(ticks) * 60.0  # a minute later each round, crossing hours
+        aggregator.add_items(refresh, now=moment)
+        return aggregator.snapshot(24, now=moment)
+
+    assert len(benchmark(run)) == 300
+
+
+@pytest.fixture(scope="module")
+def large_feed():
+    """RSS document of 10k items (about 5 MB, like a busy aggregator feed)."""
+    items = "".join(
+        f"<item><title>Story {i}</title><link>https://feed.test/{i}</link><guid>id-{i}</guid>"
+        f"<description>{'Coin markets moved today as traders repositioned. ' * 6}</description>"
+        f"<pubDate>Tue, 10 Jun 2025 04:00:00 +0000</pubDate></item>"
+        for i in range(10_000)
+    )
+    head = "<?xml version='1.0'?><rss version='2.0'><channel><title>Big</title>"
+    return f"{head}{items}</channel></rss>".encode()
+
+
+def test_parse_large_feed_full(benchmark, large_feed):
+    """Benchmark parsing a whole 5 MB feed with feedparser (the previous path)."""
+    entries = benchmark.pedantic(lambda: feedparser.parse(large_feed).entries[:10], rounds=1)
+    assert len(entries) == 10
+
+
+def test_parse_large_feed_streaming(benchmark, large_feed):
+    """Benchmark streaming the same feed in 64 KiB chunks until 10 entries are parsed."""
+    def run():
+        parser = FeedStreamParser(10)
+        for i in range(0, len(large_feed), 65536):
+            if parser.feed(large_feed[i:i + 65536]):
+                break
+        return parser.close()
+
+    assert len(benchmark(run)) == 10
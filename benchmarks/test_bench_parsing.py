@@ -0,0 +1,25 @@
+"""
+Benchmarks for API response parsing.
+"""
+
+import pytest
+
+from api_client import CoinGeckoClient
+from benchmarks.generators import SIZES, make_market_payload
+from config import api_config
+
+# get_top_coins requests one page, which holds at most MAX_COINS_LIMIT coins
+PAGE_SIZES = sorted({min(n, api_config.MAX_COINS_LIMIT) for n in SIZES})
+
+
+@pytest.mark.parametrize("size", PAGE_SIZES)
+def test_get_top_coins_parsing(benchmark, size):
+    """Benchmark validating a coins/markets page into models (no network)."""
+    payload = make_market_payload(size)
+    client = CoinGeckoClient()
+    client._make_request = lambda endpoint, params=None: payload[:params["per_page"]]
+    try:
+        coins = benchmark(client.get_top_coins, limit=size)
+    finally:
+        client.close()
+    assert len(coins) == size
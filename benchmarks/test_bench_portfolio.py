@@ -0,0 +1,63 @@
+"""
+Benchmarks for portfolio valuation and transaction recording.
+"""
+
+import pytest
+
+from database import Database
+from portfolio_manager import PortfolioManager
+from benchmarks.generators import (
+    SIZES,
+    make_holdings,
+    make_current_prices,
+    make_transactions,
+    seed_holdings,
+)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_get_portfolio_summary(benchmark, db_path, size):
+    """Benchmark P&L computation over N holdings."""
+    holdings = make_holdings(size)
+    seed_holdings(db_path, holdings)
+    prices = make_current_prices(holdings)
+    manager = PortfolioManager(Database(db_path))
+
+    items = benchmark(manager.get_portfolio_summary, prices)
+    assert len(items) == size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_get_portfolio_changes(benchmark, db_path, size):
+    """Benchmark a price tick that moves a handful of the N holdings."""
+    holdings = make_holdings(size)
+    seed_holdings(db_path, holdings)
+    prices = make_current_prices(holdings)
+    manager = PortfolioManager(Database(db_path))
+    tick = manager.get_portfolio_changes(prices).tick
+    moving = list(prices)[:5]
+    counter = iter(range(1, 10**9))
+
+    def run():
+        step = next(counter)
+        for coin_id in moving:
+            prices[coin_id] = 100.0 + step
+        return manager.get_portfolio_changes(prices, since=tick)
+
+    changes = benchmark(run)
+    assert len(changes.items) == min(size, 5)
+@pytest.mark.parametrize("size", SIZES)
+def test_database_add_transaction(benchmark, tmp_path, size):
+    """Benchmark recording N trades one by one into a fresh database."""
+    trades = make_transactions(size)
+    counter = iter(range(10**9))
+
+    def setup():
+        db = Database(str(tmp_path / f"bench-{next(counter)}.db"))
+        return (db,), {}
+
+    def run(db):
+        for coin_id, symbol, trade_type, amount, price in trades:
+            db.add_transaction(coin_id, symbol, trade_type, amount, price)
+
+    benchmark.pedantic(run, setup=setup, rounds=3, iterations=1)
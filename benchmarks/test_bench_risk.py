@@ -0,0 +1,50 @@
+"""
+Benchmarks for portfolio risk analytics.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+
+from database import Database
+from risk_analytics import RiskModel
+
+HOLDINGS = 200
+DAYS = 2 * 365
+END = date(2024, 12, 31)
+
+
+def seed_history(db_path: str) -> None:
+    """Store two years of daily closes for every holding and the benchmark."""
+    rng = np.random.default_rng(42)
+    db = Database(db_path)
+    days = [(END - timedelta(days=DAYS - i)).isoformat() for i in range(DAYS + 1)]
+    for coin_id in ["bitcoin"] + [f"coin-{i}" for i in range(HOLDINGS)]:
+        closes = 100.0 * np.cumprod(1.0 + rng.normal(0.0005, 0.04, len(days)))
+        db.upsert_prices(zip([coin_id] * len(days), days, closes.tolist()))
+    db.close()
+
+
+def test_risk_report_cold(benchmark, db_path):
+    """Benchmark a risk report including loading prices and the covariance."""
+    seed_history(db_path)
+    db = Database(db_path)
+    values = {f"coin-{i}": float(i + 1) for i in range(HOLDINGS)}
+
+    def run():
+        model = RiskModel(db)
+        return model.report(values, END)
+
+    report = benchmark(run)
+    assert report.observations == DAYS
+
+
+def test_risk_report_cached(benchmark, db_path):
+    """Benchmark a refresh with new weights and a cached returns panel."""
+    seed_history(db_path)
+    model = RiskModel(Database(db_path))
+    values = {f"coin-{i}": float(i + 1) for i in range(HOLDINGS)}
+    model.report(values, END)
+
+    report = benchmark(model.report, values, END)
+    assert report.beta is not None
@@ -0,0 +1,55 @@
+"""
+Benchmarks for CoinList filtering and table rendering.
+
+Widgets are mounted in a headless Textual app so the real DataTable is used.
+"""
+
+import asyncio
+
+import pytest
+from textual.app import App
+
+from app import CoinList
+from benchmarks.generators import SIZES, make_coins
+
+
+class CoinListBenchApp(App):
+    """Minimal app hosting a single CoinList."""
+
+    def compose(self):
+        yield CoinList()
+
+
+def run_mounted(callback) -> None:
+    """Run callback(coin_list) inside a headless app."""
+    async def runner():
+        app = CoinListBenchApp()
+        async with app.run_test(size=(120, 40)):
+            callback(app.query_one(CoinList))
+
+    asyncio.run(runner())
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_coin_list_apply_filters(benchmark, size):
+    """Benchmark search filter + sort + table rebuild."""
+    coins = make_coins(size)
+
+    def bench(widget):
+        widget.set_reactive(CoinList.coins, coins)
+        widget.current_sort = "gainers"
+        benchmark(widget._apply_filters)
+        assert len(widget.filtered_coins) == size
+
+    run_mounted(bench)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_coin_list_update_table(benchmark, size):
+    """Benchmark DataTable rebuild including sparkline rendering."""
+    coins = make_coins(size)
+
+    def bench(widget):
+        benchmark(widget._update_table, coins)
+
+    run_mounted(bench)
@@ -6,7 +6,7 @@ and application constants following security best practices.
 """
 
 import os
-from typing import Final
+from typing import Final, Optional
 from dataclasses import dataclass
 
 
@@ -38,6 +38,52 @@ class NewsConfig:
     RSS_FEEDS: dict = None
     REQUEST_TIMEOUT: int = 10
     MAX_RETRIES: int = 2
+    # Async refresh: feeds still loading after this many seconds are dropped
+    FETCH_DEADLINE: float = 15.0
+    # Simultaneous connections of the shared async HTTP client
+    MAX_CONNECTIONS: int = 20
+    # Processed news items and per-feed ETag/Last-Modified validators
+    STORE_FILE: str = os.getenv("NEWS_STORE_FILE", "terminalcoin_news.db")
+    # Sentiment scores remembered by text hash (in memory and in the store)
+    SENTIMENT_CACHE_SIZE: int = 50_000
+    # Worker processes for sentiment scoring (default: all cores but one;
+    # 0 = score in the calling thread)
+    SENTIMENT_PROCESSES: int = int(
+        os.getenv("SENTIMENT_PROCESSES", str(max((os.cpu_count() or 1) - 1, 0)))
+    )
+    # Smaller batches are scored in-process; at roughly 0.4 ms of VADER per
+    # text, shipping them to workers costs more than it saves
+    SENTIMENT_PARALLEL_MIN: int = 32
+    # Stored news older than this is deleted when the store is compacted
+    RETENTION_DAYS: int = int(os.getenv("NEWS_RETENTION_DAYS", "365"))
+    # Maximum results of a news search
+    SEARCH_LIMIT: int = 100
+    # Near-duplicate stories: MinHash signature length, LSH bands and the
+    # estimated Jaccard similarity above which two items are one story
+    DEDUP_PERMUTATIONS: int = 64
+    DEDUP_BANDS: int = 16
+    DEDUP_THRESHOLD: float = 0.5
+    # Rolling per-asset sentiment windows (hours); the coin list shows one of them
+    SENTIMENT_WINDOWS: tuple = tuple(
+        int(hours) for hours in os.getenv("NEWS_SENTIMENT_WINDOWS", "1,24,168").split(",")
+    )
+    SENTIMENT_COLUMN_WINDOW: int = int(os.getenv("NEWS_SENTIMENT_COLUMN_WINDOW", "24"))
+    # Stories an asset needs in the column window before news sways its signal
+    SIGNAL_MIN_STORIES: int = 3
+    # Feed list (OPML or TOML file); the built-in RSS_FEEDS are used if unset
+    FEEDS_FILE: Optional[str] = os.getenv("NEWS_FEEDS_FILE")
+    # Per-feed polling: the interval follows each feed's publishing rate
+    # within these bounds, failures back off exponentially up to MAX_BACKOFF
+    MIN_POLL_INTERVAL: float = 120.0
+    MAX_POLL_INTERVAL: float = 3600.0
+    MAX_BACKOFF: float = 6 * 3600.0
+    POLL_JITTER: float = 0.1  # +/- share of every delay, spreads polls apart
+    POLL_TICK: float = 15.0  # how often the app looks for due feeds
+    MAX_CONCURRENT_FEEDS: int = 8
+    # Feed bodies are parsed while downloading and never read past this size
+    MAX_FEED_BYTES: int = int(os.getenv("NEWS_MAX_FEED_BYTES", str(8 * 1024 * 1024)))
+    # Most recent items shown when many feeds are combined
+    DISPLAY_LIMIT: int = 60
 
     def __post_init__(self):
         """Initialize RSS feeds after dataclass creation."""
@@ -69,6 +115,76 @@ class AppConfig:
     ENABLE_CACHE: bool = True
 
 
+@dataclass(frozen=True)
+class AnomalyConfig:
+    """Streaming mover/anomaly detection configuration."""
+
+    # Number of refreshes after which statistics start decaying (rolling window)
+    WINDOW: int = 60
+    # Minimum number of observed deltas before a coin can be flagged
+    MIN_SAMPLES: int = 10
+    # Absolute z-score needed to flag a price or volume move
+    PRICE_Z_THRESHOLD: float = 3.0
+    VOLUME_Z_THRESHOLD: float = 4.0
+    # Maximum number of movers kept for the Movers panel
+    MAX_MOVERS: int = 50
+
+
+@dataclass(frozen=True)
+class SnapshotConfig:
+    """On-disk snapshot of the last fetched data (warm start / offline mode)."""
+
+    FILE: str = os.getenv("SNAPSHOT_FILE", "terminalcoin_snapshot.db")
+    # Coin detail/history entries kept (least recently fetched are dropped)
+    MAX_DETAILS: int = 50
+    # zlib level for stored payloads (1 = fastest)
+    COMPRESSION_LEVEL: int = 6
+
+
+@dataclass(frozen=True)
+class ArchiveConfig:
+    """Memory-mapped columnar price archive."""
+
+    DIRECTORY: str = os.getenv("PRICE_ARCHIVE_DIR", "price_archive")
+    # Chart series longer than this are strided down before plotting
+    MAX_CHART_POINTS: int = 500
+
+
+@dataclass(frozen=True)
+class RiskConfig:
+    """Portfolio risk analytics."""
+
+    # Days of daily closes used for returns
+    LOOKBACK_DAYS: int = 730
+    # Confidence level of VaR/CVaR (one-day horizon)
+    CONFIDENCE: float = 0.95
+    # Annual risk-free rate for Sharpe/Sortino
+    RISK_FREE_RATE: float = 0.0
+    # Crypto trades every day
+    PERIODS_PER_YEAR: int = 365
+    # Coin that beta is measured against
+    BENCHMARK_COIN: str = "bitcoin"
+    # Fewer daily returns than this and no report is produced
+    MIN_OBSERVATIONS: int = 30
+
+
+@dataclass(frozen=True)
+class MonteCarloConfig:
+    """Monte Carlo portfolio simulation."""
+
+    PATHS: int = 20_000
+    # Days ahead reported on
+    HORIZONS: tuple = (1, 7, 30, 90, 365)
+    # 'bootstrap' (resample historical days) or 'normal' (multivariate normal)
+    METHOD: str = "bootstrap"
+    # Paths generated at once; bounds memory to a few MB per chunk
+    CHUNK_SIZE: int = 2_000
+    # Worker processes (0 = simulate in the calling process)
+    PROCESSES: int = int(os.getenv("MC_PROCESSES", "0"))
+    CONFIDENCE: float = 0.95
+    PERCENTILES: tuple = (5, 25, 50, 75, 95)
+
+
 # Sentiment Analysis Configuration
 SENTIMENT_THRESHOLDS: Final[dict] = {
     "bullish": 0.05,
@@ -97,3 +213,8 @@ SPARKLINE_DEFAULT_WIDTH: Final[int] = 40
 api_config = APIConfig()
 news_config = NewsConfig()
 app_config = AppConfig()
+anomaly_config = AnomalyConfig()
+snapshot_config = SnapshotConfig()
+archive_config = ArchiveConfig()
+risk_config = RiskConfig()
+monte_carlo_config = MonteCarloConfig()
@@ -5,45 +5,212 @@ Handles SQLite connection and schema management for portfolio tracking.
 """
 
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from logger import get_logger
 from config import app_config
+from exceptions import ValidationException
+from utils import validate_coin_id
 
 logger = get_logger(__name__)
 
 DB_FILE = "terminalcoin.db"
 
+# Portfolio that holds transactions recorded without an explicit portfolio
+# (and everything recorded before sub-accounts existed)
+DEFAULT_PORTFOLIO_ID = 1
+DEFAULT_PORTFOLIO_NAME = "Main"
+
+# Default page size for keyset-paginated transaction queries
+TRANSACTION_PAGE_SIZE = 200
+
+# strftime() formats for aggregate periods
+AGGREGATE_PERIODS = {
+    "day": "%Y-%m-%d",
+    "week": "%Y-W%W",
+    "month": "%Y-%m",
+    "year": "%Y",
+}
+
+# Frequently executed statements. Keeping the SQL text identical lets the
+# per-connection statement cache reuse the prepared statements.
+SQL_INSERT_TRANSACTION = """
+    INSERT INTO transactions
+        (coin_id, symbol, type, amount, price_per_coin, total_value, timestamp, portfolio_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_SELECT_HOLDING = "SELECT * FROM holdings WHERE portfolio_id = ? AND coin_id = ?"
+SQL_UPDATE_HOLDING_BUY = """
+    UPDATE holdings
+    SET amount = ?, average_buy_price = ?, updated_at = ?
+    WHERE portfolio_id = ? AND coin_id = ?
+"""
+SQL_INSERT_HOLDING = """
+    INSERT INTO holdings (portfolio_id, coin_id, symbol, amount, average_buy_price)
+    VALUES (?, ?, ?, ?, ?)
+"""
+SQL_UPDATE_HOLDING_SELL = """
+    UPDATE holdings
+    SET amount = ?, updated_at = ?
+    WHERE portfolio_id = ? AND coin_id = ?
+"""
+SQL_DELETE_HOLDING = "DELETE FROM holdings WHERE portfolio_id = ? AND coin_id = ?"
+SQL_UPSERT_PRICE = "INSERT OR REPLACE INTO price_history (coin_id, date, price) VALUES (?, ?, ?)"
+SQL_INSERT_PRICE = "INSERT OR IGNORE INTO price_history (coin_id, date, price) VALUES (?, ?, ?)"
+
+
+class ConnectionManager:
+    """
+    Long-lived SQLite connections shared safely across threads.
+
+    File databases get one connection per thread (SQLite connections must
+    not be used concurrently), opened lazily and reused for the lifetime of
+    the manager. In-memory databases exist only inside a single connection,
+    so they use one shared connection serialized by a lock.
+    """
+
+    # Tuned for a small local, single-user database
+    PRAGMAS = (
+        "PRAGMA journal_mode = WAL",       # readers don't block the writer
+        "PRAGMA synchronous = NORMAL",     # fsync on checkpoint, not every commit
+        "PRAGMA foreign_keys = ON",
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA cache_size = -16000",      # ~16 MB page cache
+        "PRAGMA busy_timeout = 5000",      # wait for other writers instead of failing
+    )
+    STATEMENT_CACHE_SIZE = 256
+
+    def __init__(self, db_path: str):
+        """
+        Initialize the connection manager.
+
+        Args:
+            db_path: SQLite database path (or ':memory:')
+        """
+        self.db_path = db_path
+        self.shared = db_path == ":memory:" or db_path.startswith("file::memory:")
+        self._local = threading.local()
+        self._lock = threading.RLock()
+        self._connections: List[sqlite3.Connection] = []
+        self._shared_conn: Optional[sqlite3.Connection] = None
+        self._generation = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        # Thread confinement is enforced by this manager (thread-local or
+        # lock-serialized); disabling the check lets close_all() close
+        # connections owned by worker threads.
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=self.STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        with self._lock:
+            self._connections.append(conn)
+        logger.debug(
+            f"Opened SQLite connection to {self.db_path} ({threading.current_thread().name})"
+        )
+        return conn
+
+    def get(self) -> sqlite3.Connection:
+        """Return the connection for the calling thread, opening it if needed."""
+        if self.shared:
+            with self._lock:
+                if self._shared_conn is None:
+                    self._shared_conn = self._connect()
+                return self._shared_conn
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "generation", -1) != self._generation:
+            conn = self._connect()
+            self._local.conn = conn
+            self._local.generation = self._generation
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Yield the calling thread's connection inside a transaction.
+
+        Commits on success and rolls back on error; the connection itself
+        stays open. Access to a shared in-memory connection is serialized.
+        """
+        conn = self.get()
+        if self.shared:
+            with self._lock, conn:
+                yield conn
+        else:
+            with conn:
+                yield conn
+
+    def close_all(self) -> None:
+        """Close every connection opened by this manager."""
+        with self._lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error as e:
+                    logger.warning(f"Error closing SQLite connection: {e}")
+            self._connections.clear()
+            self._shared_conn = None
+            # Invalidate thread-local connections held by other threads
+            self._generation += 1
+        logger.info("Database connections closed")
+
+
 class Database:
     """SQLite database manager."""
 
     def __init__(self, db_path: str = DB_FILE):
         """Initialize database connection."""
         self.db_path = db_path
+        self._connections = ConnectionManager(db_path)
         self._init_db()
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
-        return conn
+        """Get the long-lived connection for the calling thread."""
+        return self._connections.get()
+
+    def close(self) -> None:
+        """Close all database connections."""
+        self._connections.close_all()
 
     def _init_db(self) -> None:
         """Initialize database schema."""
         try:
-            with self._get_connection() as conn:
+            with self._connections.connection() as conn:
                 cursor = conn.cursor()
 
-                # Table: Holdings (Current state)
+                # Table: Portfolios (named sub-accounts / client books)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS portfolios (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        name TEXT NOT NULL UNIQUE,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                cursor.execute(
+                    "INSERT OR IGNORE INTO portfolios (id, name) VALUES (?, ?)",
+                    (DEFAULT_PORTFOLIO_ID, DEFAULT_PORTFOLIO_NAME)
+                )
+
+                # Table: Holdings (Current state, one row per portfolio and coin)
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS holdings (
-                        coin_id TEXT PRIMARY KEY,
+                        portfolio_id INTEGER NOT NULL DEFAULT 1,
+                        coin_id TEXT NOT NULL,
                         symbol TEXT NOT NULL,
                         amount REAL NOT NULL,
                         average_buy_price REAL NOT NULL,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (portfolio_id, coin_id)
                     )
                 """)
 
@@ -57,7 +224,87 @@ class Database:
                         amount REAL NOT NULL,
                         price_per_coin REAL NOT NULL,
                         total_value REAL NOT NULL,
-                        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        portfolio_id INTEGER NOT NULL DEFAULT 1
+                    )
+                """)
+
+                self._migrate_portfolios(cursor)
+
+                # Indexes: per-coin history and global history, both in
+                # (timestamp, id) order so keyset pagination is an index scan
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_transactions_coin_time
+                    ON transactions (coin_id, timestamp, id)
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_transactions_time
+                    ON transactions (timestamp, id)
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_transactions_portfolio_time
+                    ON transactions (portfolio_id, timestamp, id)
+                """)
+
+                # Table: Daily closing prices (from market refreshes and history fetches)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS price_history (
+                        coin_id TEXT NOT NULL,
+                        date TEXT NOT NULL,  -- 'YYYY-MM-DD' (UTC)
+                        price REAL NOT NULL,
+                        PRIMARY KEY (coin_id, date)
+                    ) WITHOUT ROWID
+                """)
+
+                # Table: Materialized daily portfolio value
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS portfolio_snapshots (
+                        portfolio_id INTEGER NOT NULL,
+                        date TEXT NOT NULL,  -- 'YYYY-MM-DD' (UTC)
+                        nav REAL NOT NULL,
+                        net_invested REAL NOT NULL,
+                        positions INTEGER NOT NULL,
+                        PRIMARY KEY (portfolio_id, date)
+                    ) WITHOUT ROWID
+                """)
+
+                # Table: Per-coin amount and last price at the end of the
+                # last fully materialized snapshot day (incremental NAV state)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS nav_state (
+                        portfolio_id INTEGER NOT NULL,
+                        coin_id TEXT NOT NULL,
+                        amount REAL NOT NULL,
+                        price REAL,
+                        PRIMARY KEY (portfolio_id, coin_id)
+                    )
+                """)
+
+                # Table: Alert rules; fired alerts keep their trigger time and value
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS alerts (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        coin_id TEXT NOT NULL,
+                        metric TEXT NOT NULL DEFAULT 'price',  -- 'price' or an indicator
+                        condition TEXT NOT NULL,  -- 'above', 'below' or 'move'
+                        threshold REAL NOT NULL,
+                        reference REAL,  -- 'move': price the percentage is measured from
+                        note TEXT,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        triggered_at TIMESTAMP,
+                        triggered_value REAL
+                    )
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_alerts_active
+                    ON alerts (coin_id) WHERE triggered_at IS NULL
+                """)
+
+                # Table: Small key/value store for bookkeeping
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS app_state (
+                        key TEXT PRIMARY KEY,
+                        value TEXT
                     )
                 """)
 
@@ -68,70 +315,307 @@ class Database:
             logger.error(f"Database initialization failed: {e}")
             raise
 
-    def add_transaction(self, coin_id: str, symbol: str, type: str, amount: float, price: float) -> None:
-        """Record a transaction and update holdings."""
+    @staticmethod
+    def _migrate_portfolios(cursor: sqlite3.Cursor) -> None:
+        """Move databases created before portfolios existed into the default portfolio."""
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(transactions)")}
+        if "portfolio_id" not in columns:
+            cursor.execute(
+                "ALTER TABLE transactions ADD COLUMN portfolio_id INTEGER NOT NULL DEFAULT 1"
+            )
+
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(holdings)")}
+        if "portfolio_id" not in columns:
+            # The primary key changes, so the table has to be rebuilt
+            cursor.execute("ALTER TABLE holdings RENAME TO holdings_v1")
+            cursor.execute("""
+                CREATE TABLE holdings (
+                    portfolio_id INTEGER NOT NULL DEFAULT 1,
+                    coin_id TEXT NOT NULL,
+                    symbol TEXT NOT NULL,
+                    amount REAL NOT NULL,
+                    average_buy_price REAL NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (portfolio_id, coin_id)
+                )
+            """)
+            cursor.execute(
+                "INSERT INTO holdings "
+                "(portfolio_id, coin_id, symbol, amount, average_buy_price, updated_at) "
+                "SELECT ?, coin_id, symbol, amount, average_buy_price, updated_at FROM holdings_v1",
+                (DEFAULT_PORTFOLIO_ID,),
+            )
+            cursor.execute("DROP TABLE holdings_v1")
+            logger.info("Migrated holdings to the default portfolio")
+
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(portfolio_snapshots)")}
+        if columns and "portfolio_id" not in columns:
+            # Derived data: drop it and let the NAV engine rebuild it per portfolio
+            cursor.execute("DROP TABLE portfolio_snapshots")
+            cursor.execute("DROP TABLE IF EXISTS nav_state")
+            cursor.execute("DELETE FROM app_state WHERE key LIKE 'nav_%'")
+            logger.info("Portfolio value history will be rebuilt per portfolio")
+
+    def create_portfolio(self, name: str) -> int:
+        """
+        Create a named portfolio.
+
+        Args:
+            name: Unique portfolio name
+
+        Returns:
+            New portfolio id
+
+        Raises:
+            ValidationException: If the name is empty or already taken
+        """
+        name = name.strip()
+        if not name:
+            raise ValidationException("Portfolio name must not be empty")
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
+            with self._connections.connection() as conn:
+                cursor = conn.execute("INSERT INTO portfolios (name) VALUES (?)", (name,))
+                logger.info(f"Created portfolio '{name}'")
+                return cursor.lastrowid
+        except sqlite3.IntegrityError:
+            raise ValidationException("Portfolio already exists", details={"name": name})
 
-                # 1. Record Transaction
-                total = amount * price
-                cursor.execute("""
-                    INSERT INTO transactions (coin_id, symbol, type, amount, price_per_coin, total_value, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (coin_id, symbol, type, amount, price, total, datetime.utcnow()))
-
-                # 2. Update Holdings
-                # Get current holding
-                cursor.execute("SELECT * FROM holdings WHERE coin_id = ?", (coin_id,))
-                current = cursor.fetchone()
-
-                if type == 'BUY':
-                    if current:
-                        # Calculate new weighted average price
-                        new_amount = current['amount'] + amount
-                        total_cost = (current['amount'] * current['average_buy_price']) + (amount * price)
-                        new_avg_price = total_cost / new_amount
-
-                        cursor.execute("""
-                            UPDATE holdings
-                            SET amount = ?, average_buy_price = ?, updated_at = ?
-                            WHERE coin_id = ?
-                        """, (new_amount, new_avg_price, datetime.utcnow(), coin_id))
-                    else:
-                        # New holding
-                        cursor.execute("""
-                            INSERT INTO holdings (coin_id, symbol, amount, average_buy_price)
-                            VALUES (?, ?, ?, ?)
-                        """, (coin_id, symbol, amount, price))
-
-                elif type == 'SELL':
-                    if current:
-                        new_amount = current['amount'] - amount
-                        if new_amount <= 0:
-                            # Sold everything
-                            cursor.execute("DELETE FROM holdings WHERE coin_id = ?", (coin_id,))
-                        else:
-                            # Update amount (avg price doesn't change on sell)
-                            cursor.execute("""
-                                UPDATE holdings
-                                SET amount = ?, updated_at = ?
-                                WHERE coin_id = ?
-                            """, (new_amount, datetime.utcnow(), coin_id))
+    def get_portfolios(self) -> List[Dict[str, Any]]:
+        """Get all portfolios (id, name, created_at) in creation order."""
+        with self._connections.connection() as conn:
+            return [dict(row) for row in conn.execute("SELECT * FROM portfolios ORDER BY id")]
 
-                conn.commit()
+    def get_portfolio_id(self, name: str) -> Optional[int]:
+        """Look up a portfolio id by name."""
+        with self._connections.connection() as conn:
+            row = conn.execute(
+                "SELECT id FROM portfolios WHERE name = ?", (name.strip(),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def add_transaction(
+        self,
+        coin_id: str,
+        symbol: str,
+        type: str,
+        amount: float,
+        price: float,
+        portfolio_id: int = DEFAULT_PORTFOLIO_ID
+    ) -> None:
+        """Record a transaction and update holdings."""
+        try:
+            with self._connections.connection() as conn:
+                self._apply_transaction(
+                    conn.cursor(), coin_id, symbol, type, amount, price, portfolio_id
+                )
                 logger.info(f"Transaction recorded: {type} {amount} {symbol} @ ${price}")
 
         except Exception as e:
             logger.error(f"Transaction failed: {e}")
             raise
 
-    def get_holdings(self) -> List[Dict[str, Any]]:
-        """Get all current holdings."""
+    def add_transactions(self, transactions: List[Tuple]) -> None:
+        """
+        Record several transactions atomically in a single commit.
+
+        Args:
+            transactions: List of (coin_id, symbol, type, amount, price) tuples,
+                          optionally followed by a portfolio id
+        """
+        try:
+            with self._connections.connection() as conn:
+                cursor = conn.cursor()
+                for transaction in transactions:
+                    self._apply_transaction(cursor, *transaction)
+                logger.info(f"Recorded batch of {len(transactions)} transactions")
+
+        except Exception as e:
+            logger.error(f"Transaction batch failed: {e}")
+            raise
+
+    def _apply_transaction(
+        self,
+        cursor: sqlite3.Cursor,
+        coin_id: str,
+        symbol: str,
+        type: str,
+        amount: float,
+        price: float,
+        portfolio_id: int = DEFAULT_PORTFOLIO_ID
+    ) -> None:
+        """Insert a transaction and update its holding (caller owns the commit)."""
+        # 1. Record Transaction
+        total = amount * price
+        cursor.execute(
+            SQL_INSERT_TRANSACTION,
+            (coin_id, symbol, type, amount, price, total, datetime.utcnow(), portfolio_id)
+        )
+
+        # 2. Update Holdings
+        # Get current holding
+        cursor.execute(SQL_SELECT_HOLDING, (portfolio_id, coin_id))
+        current = cursor.fetchone()
+
+        if type == 'BUY':
+            if current:
+                # Calculate new weighted average price
+                new_amount = current['amount'] + amount
+                total_cost = (current['amount'] * current['average_buy_price']) + (amount * price)
+                new_avg_price = total_cost / new_amount
+
+                cursor.execute(
+                    SQL_UPDATE_HOLDING_BUY,
+                    (new_amount, new_avg_price, datetime.utcnow(), portfolio_id, coin_id)
+                )
+            else:
+                # New holding
+                cursor.execute(SQL_INSERT_HOLDING, (portfolio_id, coin_id, symbol, amount, price))
+
+        elif type == 'SELL':
+            if current:
+                new_amount = current['amount'] - amount
+                if new_amount <= 0:
+                    # Sold everything
+                    cursor.execute(SQL_DELETE_HOLDING, (portfolio_id, coin_id))
+                else:
+                    # Update amount (avg price doesn't change on sell)
+                    cursor.execute(
+                        SQL_UPDATE_HOLDING_SELL,
+                        (new_amount, datetime.utcnow(), portfolio_id, coin_id)
+                    )
+
+    def bulk_import_transactions(
+        self, rows: Iterable[Tuple], portfolio_id: int = DEFAULT_PORTFOLIO_ID
+    ) -> int:
+        """
+        Insert many transactions in one transaction and rebuild holdings.
+
+        Rows are streamed into ``executemany`` (no intermediate list), then
+        holdings of the affected coins are recomputed in a single pass.
+
+        Args:
+            rows: Iterable of (coin_id, symbol, type, amount, price, timestamp)
+                  tuples; timestamp is a datetime in UTC
+            portfolio_id: Portfolio the transactions belong to
+
+        Returns:
+            Number of transactions inserted
+        """
+        coin_ids = set()
+        count = 0
+
+        def records():
+            nonlocal count
+            for coin_id, symbol, type, amount, price, timestamp in rows:
+                coin_ids.add(coin_id)
+                count += 1
+                yield (
+                    coin_id, symbol, type, amount, price, amount * price,
+                    timestamp.isoformat(sep=" "), portfolio_id
+                )
+
+        try:
+            with self._connections.connection() as conn:
+                conn.executemany(SQL_INSERT_TRANSACTION, records())
+                self._recompute_holdings(conn, coin_ids)
+            logger.info(f"Bulk imported {count} transactions across {len(coin_ids)} coins")
+            return count
+
+        except Exception as e:
+            logger.error(f"Bulk import failed: {e}")
+            raise
+
+    def recompute_holdings(self, coin_ids: Optional[Iterable[str]] = None) -> None:
+        """
+        Rebuild holdings from the transaction log.
+
+        Args:
+            coin_ids: Coins to rebuild (all coins if None)
+        """
+        with self._connections.connection() as conn:
+            self._recompute_holdings(conn, None if coin_ids is None else set(coin_ids))
+
+    def _recompute_holdings(self, conn: sqlite3.Connection, coin_ids: Optional[set]) -> None:
+        """
+        Replay transactions in order and rewrite holdings in one pass.
+
+        Applies the same rules as add_transaction: BUYs update the weighted
+        average price, SELLs reduce the amount and a position sold down to
+        zero is closed (its average restarts with the next BUY).
+        """
+        if coin_ids is not None and not coin_ids:
+            return
+
+        query = (
+            "SELECT portfolio_id, coin_id, symbol, type, amount, price_per_coin FROM transactions"
+        )
+        if coin_ids is not None:
+            # Use a temp table rather than a huge IN (...) parameter list
+            conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS _recompute_ids (coin_id TEXT PRIMARY KEY)"
+            )
+            conn.execute("DELETE FROM _recompute_ids")
+            conn.executemany(
+                "INSERT OR IGNORE INTO _recompute_ids VALUES (?)", ((c,) for c in coin_ids)
+            )
+            query += " WHERE coin_id IN (SELECT coin_id FROM _recompute_ids)"
+        query += " ORDER BY coin_id, timestamp, id"
+
+        # (portfolio_id, coin_id) -> [symbol, amount, avg_price]
+        holdings: Dict[Tuple[int, str], List] = {}
+        for portfolio_id, coin_id, symbol, type, amount, price in conn.execute(query):
+            key = (portfolio_id, coin_id)
+            current = holdings.get(key)
+            if type == 'BUY':
+                if current:
+                    new_amount = current[1] + amount
+                    current[2] = (current[1] * current[2] + amount * price) / new_amount
+                    current[1] = new_amount
+                else:
+                    holdings[key] = [symbol, amount, price]
+            elif type == 'SELL' and current:
+                current[1] -= amount
+                if current[1] <= 0:
+                    del holdings[key]
+
+        if coin_ids is None:
+            conn.execute("DELETE FROM holdings")
+        else:
+            conn.execute(
+                "DELETE FROM holdings WHERE coin_id IN (SELECT coin_id FROM _recompute_ids)"
+            )
+
+        now = datetime.utcnow()
+        conn.executemany(
+            "INSERT INTO holdings "
+            "(portfolio_id, coin_id, symbol, amount, average_buy_price, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            ((key[0], key[1], h[0], h[1], h[2], now) for key, h in holdings.items()),
+        )
+
+    def get_holdings(
+        self, portfolio_id: Optional[int] = DEFAULT_PORTFOLIO_ID
+    ) -> List[Dict[str, Any]]:
+        """
+        Get current holdings.
+
+        Args:
+            portfolio_id: Portfolio to read (every portfolio if None)
+        """
         try:
-            with self._get_connection() as conn:
+            with self._connections.connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT * FROM holdings ORDER BY amount * average_buy_price DESC")
+                if portfolio_id is None:
+                    cursor.execute(
+                        "SELECT * FROM holdings "
+                        "ORDER BY portfolio_id, amount * average_buy_price DESC"
+                    )
+                else:
+                    cursor.execute(
+                        "SELECT * FROM holdings WHERE portfolio_id = ? "
+                        "ORDER BY amount * average_buy_price DESC",
+                        (portfolio_id,),
+                    )
                 return [dict(row) for row in cursor.fetchall()]
         except Exception as e:
             logger.error(f"Failed to fetch holdings: {e}")
@@ -140,7 +624,7 @@ class Database:
     def get_transactions(self, coin_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get transaction history."""
         try:
-            with self._get_connection() as conn:
+            with self._connections.connection() as conn:
                 cursor = conn.cursor()
                 if coin_id:
                     cursor.execute("SELECT * FROM transactions WHERE coin_id = ? ORDER BY timestamp DESC", (coin_id,))
@@ -150,3 +634,497 @@ class Database:
         except Exception as e:
             logger.error(f"Failed to fetch transactions: {e}")
             return []
+
+    @staticmethod
+    def _format_timestamp(value: Any) -> str:
+        """Convert a datetime (or string) to the stored timestamp text format."""
+        if isinstance(value, datetime):
+            return value.isoformat(sep=" ")
+        return str(value)
+
+    def _transaction_filters(
+        self,
+        coin_id: Optional[str],
+        start: Optional[datetime],
+        end: Optional[datetime]
+    ) -> Tuple[List[str], List[Any]]:
+        """Build WHERE clauses for coin and [start, end) date-range filters."""
+        clauses: List[str] = []
+        params: List[Any] = []
+        if coin_id:
+            clauses.append("coin_id = ?")
+            params.append(coin_id)
+        if start is not None:
+            clauses.append("timestamp >= ?")
+            params.append(self._format_timestamp(start))
+        if end is not None:
+            clauses.append("timestamp < ?")
+            params.append(self._format_timestamp(end))
+        return clauses, params
+
+    def get_transactions_page(
+        self,
+        coin_id: Optional[str] = None,
+        before: Optional[Tuple[str, int]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        page_size: int = TRANSACTION_PAGE_SIZE
+    ) -> List[Dict[str, Any]]:
+        """
+        Get one page of transaction history, newest first.
+
+        Uses keyset pagination on (timestamp, id): pass the ``(timestamp, id)``
+        of the last row of the previous page as ``before`` to get the next
+        page. Cost is independent of how deep into the history the page is.
+
+        Args:
+            coin_id: Optional coin filter
+            before: Keyset cursor from the previous page
+            start: Only transactions at or after this time
+            end: Only transactions before this time
+            page_size: Maximum rows to return
+
+        Returns:
+            List of transaction dictionaries
+        """
+        clauses, params = self._transaction_filters(coin_id, start, end)
+        if before is not None:
+            clauses.append("(timestamp, id) < (?, ?)")
+            params.extend([self._format_timestamp(before[0]), before[1]])
+
+        query = "SELECT * FROM transactions"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY timestamp DESC, id DESC LIMIT ?"
+        params.append(page_size)
+
+        try:
+            with self._connections.connection() as conn:
+                return [dict(row) for row in conn.execute(query, params)]
+        except Exception as e:
+            logger.error(f"Failed to fetch transactions page: {e}")
+            return []
+
+    def iter_transactions(
+        self,
+        coin_id: Optional[str] = None,
+        before: Optional[Tuple[str, int]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        page_size: int = TRANSACTION_PAGE_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate transaction history newest first, one page at a time.
+
+        Only ``page_size`` rows are held in memory at once.
+
+        Args:
+            coin_id: Optional coin filter
+            before: Optional keyset cursor to start after
+            start: Only transactions at or after this time
+            end: Only transactions before this time
+            page_size: Rows fetched per query
+
+        Yields:
+            Transaction dictionaries
+        """
+        cursor = before
+        while True:
+            page = self.get_transactions_page(coin_id, cursor, start, end, page_size)
+            yield from page
+            if len(page) < page_size:
+                return
+            cursor = (page[-1]["timestamp"], page[-1]["id"])
+
+    def get_latest_transaction_id(self) -> int:
+        """
+        Get the id of the newest transaction.
+
+        Returns:
+            Highest transaction id, 0 if there are none
+        """
+        with self._connections.connection() as conn:
+            return conn.execute("SELECT COALESCE(MAX(id), 0) FROM transactions").fetchone()[0]
+
+    def get_transaction_aggregates(
+        self,
+        period: str = "day",
+        coin_id: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregate volume and cost per coin per period in SQL.
+
+        Args:
+            period: 'day', 'week', 'month' or 'year'
+            coin_id: Optional coin filter
+            start: Only transactions at or after this time
+            end: Only transactions before this time
+
+        Returns:
+            List of dictionaries with coin_id, symbol, period, trades,
+            buy_amount, sell_amount, buy_value and sell_value, newest first
+
+        Raises:
+            ValueError: If the period is not supported
+        """
+        if period not in AGGREGATE_PERIODS:
+            raise ValueError(f"Unsupported period: {period}")
+
+        clauses, params = self._transaction_filters(coin_id, start, end)
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        query = f"""
+            SELECT
+                coin_id,
+                MAX(symbol) AS symbol,
+                strftime(?, timestamp) AS period,
+                COUNT(*) AS trades,
+                SUM(CASE WHEN type = 'BUY' THEN amount ELSE 0 END) AS buy_amount,
+                SUM(CASE WHEN type = 'SELL' THEN amount ELSE 0 END) AS sell_amount,
+                SUM(CASE WHEN type = 'BUY' THEN total_value ELSE 0 END) AS buy_value,
+                SUM(CASE WHEN type = 'SELL' THEN total_value ELSE 0 END) AS sell_value
+            FROM transactions{where}
+            GROUP BY coin_id, period
+            ORDER BY period DESC, coin_id
+        """
+
+        try:
+            with self._connections.connection() as conn:
+                rows = conn.execute(query, [AGGREGATE_PERIODS[period], *params])
+                return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Failed to aggregate transactions: {e}")
+            return []
+
+    def upsert_prices(self, rows: Iterable[Tuple[str, str, float]], replace: bool = True) -> int:
+        """
+        Store daily closing prices.
+
+        Args:
+            rows: Iterable of (coin_id, 'YYYY-MM-DD', price) tuples
+            replace: Overwrite existing prices for the same day (otherwise
+                     only missing days are added)
+
+        Returns:
+            Number of rows written
+        """
+        try:
+            with self._connections.connection() as conn:
+                cursor = conn.executemany(SQL_UPSERT_PRICE if replace else SQL_INSERT_PRICE, rows)
+                return cursor.rowcount
+        except Exception as e:
+            logger.error(f"Failed to store price history: {e}")
+            return 0
+
+    def get_price_history(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        coin_ids: Optional[Iterable[str]] = None
+    ) -> List[Tuple[str, str, float]]:
+        """
+        Get stored daily prices in [start, end].
+
+        Args:
+            start: First date ('YYYY-MM-DD'), unbounded if None
+            end: Last date ('YYYY-MM-DD'), unbounded if None
+            coin_ids: Only these coins (all coins if None)
+
+        Returns:
+            List of (coin_id, date, price) tuples ordered by coin and date
+        """
+        query = "SELECT coin_id, date, price FROM price_history WHERE date >= ? AND date <= ?"
+        params: List[Any] = [start or "", end or "9999-12-31"]
+        if coin_ids is not None:
+            coin_ids = list(coin_ids)
+            query += f" AND coin_id IN ({','.join('?' * len(coin_ids))})"
+            params.extend(coin_ids)
+        with self._connections.connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None  # plain tuples; histories can be long
+            return cursor.execute(query + " ORDER BY coin_id, date", params).fetchall()
+
+    def get_transaction_log(
+        self, start: Optional[str] = None, portfolio_id: Optional[int] = None
+    ) -> List[Tuple[int, str, str, str, float, float]]:
+        """
+        Get the raw transaction log in replay order.
+
+        Args:
+            start: Only transactions on or after this date ('YYYY-MM-DD')
+            portfolio_id: Only this portfolio's transactions (all if None)
+
+        Returns:
+            List of (id, coin_id, date, type, amount, price) tuples ordered
+            by coin, timestamp and id
+        """
+        query = (
+            "SELECT id, coin_id, substr(timestamp, 1, 10), type, amount, price_per_coin "
+            "FROM transactions WHERE timestamp >= ?"
+        )
+        params: List[Any] = [start or ""]
+        if portfolio_id is not None:
+            query += " AND portfolio_id = ?"
+            params.append(portfolio_id)
+        with self._connections.connection() as conn:
+            return [
+                tuple(row)
+                for row in conn.execute(query + " ORDER BY coin_id, timestamp, id", params)
+            ]
+
+    def iter_transaction_log(
+        self,
+        batch_size: int = 5000,
+        portfolio_id: Optional[int] = None
+    ) -> Iterator[Tuple[int, str, str, str, float, float, str]]:
+        """
+        Stream the transaction log in chronological order.
+
+        Rows are fetched ``batch_size`` at a time, so memory stays flat
+        regardless of history length.
+
+        Args:
+            batch_size: Rows fetched per round trip
+            portfolio_id: Only this portfolio's transactions (all if None)
+
+        Yields:
+            (id, coin_id, symbol, type, amount, price, timestamp) tuples
+        """
+        conn = self._get_connection()
+        query = (
+            "SELECT id, coin_id, symbol, type, amount, price_per_coin, timestamp FROM transactions"
+        )
+        params: Tuple = ()
+        if portfolio_id is not None:
+            query += " WHERE portfolio_id = ?"
+            params = (portfolio_id,)
+        cursor = conn.execute(query + " ORDER BY timestamp, id", params)
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                for row in rows:
+                    yield tuple(row)
+        finally:
+            cursor.close()
+
+    def get_holdings_version(self) -> Tuple[int, int]:
+        """
+        Cheap token that changes whenever holdings or the set of portfolios may have.
+
+        Returns:
+            (newest transaction id, newest portfolio id)
+        """
+        with self._connections.connection() as conn:
+            return tuple(conn.execute(
+                "SELECT (SELECT COALESCE(MAX(id), 0) FROM transactions), "
+                "(SELECT COALESCE(MAX(id), 0) FROM portfolios)"
+            ).fetchone())
+
+    def get_transaction_watermark(
+        self, after_id: int = 0, portfolio_id: Optional[int] = None
+    ) -> Tuple[int, Optional[str]]:
+        """
+        Summarize transactions added since ``after_id``.
+
+        Args:
+            after_id: Last transaction id already processed
+            portfolio_id: Only consider this portfolio's transactions (all if None)
+
+        Returns:
+            (max id overall, earliest date among transactions with id > after_id)
+        """
+        query = "SELECT MIN(substr(timestamp, 1, 10)) FROM transactions WHERE id > ?"
+        params: List[Any] = [after_id]
+        if portfolio_id is not None:
+            query += " AND portfolio_id = ?"
+            params.append(portfolio_id)
+        with self._connections.connection() as conn:
+            max_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM transactions").fetchone()[0]
+            earliest = conn.execute(query, params).fetchone()[0]
+        return max_id, earliest
+
+    def add_alert(
+        self,
+        coin_id: str,
+        metric: str,
+        condition: str,
+        threshold: float,
+        reference: Optional[float] = None,
+        note: Optional[str] = None
+    ) -> int:
+        """
+        Store an alert rule.
+
+        Args:
+            coin_id: Coin identifier
+            metric: 'price' or an indicator name (see alert_engine.METRICS)
+            condition: 'above', 'below' or 'move'
+            threshold: Level, or percentage for 'move'
+            reference: Price a 'move' is measured from
+            note: Optional text shown when the alert fires
+
+        Returns:
+            New alert id
+
+        Raises:
+            ValidationException: If the rule is invalid
+        """
+        from alert_engine import validate_alert  # avoid a circular import
+
+        if not validate_coin_id(coin_id):
+            raise ValidationException("Invalid coin ID", details={"coin_id": coin_id})
+        validate_alert(metric, condition, threshold, reference)
+        with self._connections.connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO alerts (coin_id, metric, condition, threshold, reference, note) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (coin_id, metric, condition, threshold, reference, note)
+            )
+            logger.info(
+                f"Added alert {cursor.lastrowid}: {coin_id} {metric} {condition} {threshold}"
+            )
+            return cursor.lastrowid
+
+    def get_alerts(self, active_only: bool = True) -> List[Dict[str, Any]]:
+        """
+        Get alert rules in creation order.
+
+        Args:
+            active_only: Leave out alerts that already fired
+
+        Returns:
+            Rows with id, coin_id, metric, condition, threshold, reference
+            and note (plus created_at, triggered_at and triggered_value
+            when ``active_only`` is False)
+        """
+        columns = "id, coin_id, metric, condition, threshold, reference, note"
+        query = f"SELECT {columns} FROM alerts WHERE triggered_at IS NULL ORDER BY id"
+        if not active_only:
+            query = (
+                f"SELECT {columns}, created_at, triggered_at, triggered_value "
+                "FROM alerts ORDER BY id"
+            )
+        with self._connections.connection() as conn:
+            return [dict(row) for row in conn.execute(query)]
+
+    def get_alerts_version(self) -> Tuple[int, int]:
+        """Token that changes whenever active alerts are added, fired or deleted."""
+        with self._connections.connection() as conn:
+            return tuple(conn.execute(
+                "SELECT COUNT(*), COALESCE(MAX(id), 0) FROM alerts WHERE triggered_at IS NULL"
+            ).fetchone())
+
+    def mark_alerts_triggered(self, hits: Iterable[Tuple[int, float, str]]) -> None:
+        """
+        Record fired alerts.
+
+        Args:
+            hits: (alert_id, value, 'YYYY-MM-DD HH:MM:SS' UTC) tuples
+        """
+        with self._connections.connection() as conn:
+            conn.executemany(
+                "UPDATE alerts SET triggered_value = ?, triggered_at = ? "
+                "WHERE id = ? AND triggered_at IS NULL",
+                ((value, timestamp, alert_id) for alert_id, value, timestamp in hits),
+            )
+
+    def delete_alert(self, alert_id: int) -> bool:
+        """Delete an alert; returns False if it doesn't exist."""
+        with self._connections.connection() as conn:
+            return conn.execute("DELETE FROM alerts WHERE id = ?", (alert_id,)).rowcount > 0
+
+    def get_app_state(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Get a bookkeeping value."""
+        with self._connections.connection() as conn:
+            row = conn.execute("SELECT value FROM app_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_app_state(self, key: str, value: Optional[str]) -> None:
+        """Set a bookkeeping value."""
+        with self._connections.connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO app_state (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    def get_nav_state(
+        self, portfolio_id: int = DEFAULT_PORTFOLIO_ID
+    ) -> Dict[str, Tuple[float, Optional[float]]]:
+        """Get per-coin (amount, last price) at the end of the last materialized day."""
+        with self._connections.connection() as conn:
+            return {
+                row[0]: (row[1], row[2])
+                for row in conn.execute(
+                    "SELECT coin_id, amount, price FROM nav_state WHERE portfolio_id = ?",
+                    (portfolio_id,),
+                )
+            }
+
+    def save_portfolio_snapshots(
+        self,
+        snapshots: Iterable[Tuple[str, float, float, int]],
+        from_date: Optional[str],
+        nav_state: Optional[Dict[str, Tuple[float, Optional[float]]]] = None,
+        app_state: Optional[Dict[str, Optional[str]]] = None,
+        portfolio_id: int = DEFAULT_PORTFOLIO_ID
+    ) -> None:
+        """
+        Atomically replace a portfolio's snapshots from ``from_date`` on and its NAV state.
+
+        Args:
+            snapshots: Iterable of (date, nav, net_invested, positions) tuples
+            from_date: Existing snapshots on or after this date are removed
+                       (all snapshots if None)
+            nav_state: New per-coin (amount, price) state; left unchanged if None
+            app_state: Bookkeeping values to store alongside
+            portfolio_id: Portfolio the snapshots belong to
+        """
+        with self._connections.connection() as conn:
+            conn.execute(
+                "DELETE FROM portfolio_snapshots WHERE portfolio_id = ? AND date >= ?",
+                (portfolio_id, from_date or ""),
+            )
+            conn.executemany(
+                "INSERT INTO portfolio_snapshots "
+                "(portfolio_id, date, nav, net_invested, positions) VALUES (?, ?, ?, ?, ?)",
+                ((portfolio_id, *snapshot) for snapshot in snapshots),
+            )
+            if nav_state is not None:
+                conn.execute("DELETE FROM nav_state WHERE portfolio_id = ?", (portfolio_id,))
+                conn.executemany(
+                    "INSERT INTO nav_state (portfolio_id, coin_id, amount, price) "
+                    "VALUES (?, ?, ?, ?)",
+                    (
+                        (portfolio_id, coin_id, amount, price)
+                        for coin_id, (amount, price) in nav_state.items()
+                    ),
+                )
+            if app_state:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO app_state (key, value) VALUES (?, ?)",
+                    app_state.items()
+                )
+
+    def get_portfolio_snapshots(
+        self, start: Optional[str] = None, portfolio_id: int = DEFAULT_PORTFOLIO_ID
+    ) -> List[Dict[str, Any]]:
+        """
+        Get one portfolio's materialized daily values, oldest first.
+
+        Args:
+            start: First date ('YYYY-MM-DD'), all history if None
+            portfolio_id: Portfolio to report
+        """
+        try:
+            with self._connections.connection() as conn:
+                rows = conn.execute(
+                    "SELECT date, nav, net_invested, positions FROM portfolio_snapshots "
+                    "WHERE portfolio_id = ? AND date >= ? ORDER BY date",
+                    (portfolio_id, start or ""),
+                )
+                return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Failed to fetch portfolio snapshots: {e}")
+            return []
@@ -0,0 +1,149 @@
+"""
+Feed registry for TerminalCoin.
+
+Reads the list of news feeds from an OPML export (as produced by most feed
+readers) or a TOML file, falling back to the built-in feeds. A TOML list
+looks like::
+
+    [[feeds]]
+    name = "CoinDesk"
+    url = "https://www.coindesk.com/feed"
+
+    [[feeds]]
+    name = "The Block"
+    url = "https://www.theblock.co/rss.xml"
+    interval = 900  # optional: poll every 15 minutes instead of adapting
+
+In OPML, every ``outline`` with an ``xmlUrl`` is a feed; an optional
+``interval`` attribute (seconds) fixes its polling interval.
+"""
+
+import os
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from config import news_config
+from exceptions import ConfigurationException
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class FeedSpec:
+    """A configured news feed."""
+    name: str
+    url: str
+    interval: Optional[float] = None  # fixed polling interval (seconds); None adapts
+
+
+def _interval(value: Any, url: str) -> Optional[float]:
+    """Parse an optional interval, rejecting non-positive values."""
+    if value in (None, ""):
+        return None
+    try:
+        interval = float(value)
+    except (TypeError, ValueError):
+        interval = 0.0
+    if interval <= 0:
+        raise ConfigurationException("Feed interval must be a positive number of seconds",
+                                     details={"url": url, "interval": value})
+    return interval
+
+
+def _spec(name: Optional[str], url: Optional[str], interval: Any = None) -> FeedSpec:
+    """Validated FeedSpec."""
+    if not url or not url.startswith(("http://", "https://")):
+        raise ConfigurationException("Feed URL must be http(s)", details={"name": name, "url": url})
+    return FeedSpec(name=(name or url).strip(), url=url.strip(), interval=_interval(interval, url))
+
+
+def load_opml(path: str) -> List[FeedSpec]:
+    """
+    Read the feeds of an OPML file.
+
+    Raises:
+        ConfigurationException: If the file can't be parsed
+    """
+    try:
+        root = ET.parse(path).getroot()
+    except (OSError, ET.ParseError) as e:
+        raise ConfigurationException(
+            f"Cannot read OPML feed list: {e}", details={"path": path}
+        ) from e
+    return [
+        _spec(
+            outline.get("title") or outline.get("text"),
+            outline.get("xmlUrl"),
+            outline.get("interval"),
+        )
+        for outline in root.iter("outline")
+        if outline.get("xmlUrl")
+    ]
+
+
+def load_toml(path: str) -> List[FeedSpec]:
+    """
+    Read the ``[[feeds]]`` tables of a TOML file.
+
+    Raises:
+        ConfigurationException: If the file can't be parsed
+    """
+    try:
+        import tomllib  # Python 3.11+
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError as e:
+            raise ConfigurationException(
+                "TOML feed lists need Python 3.11+ or the 'tomli' package"
+            ) from e
+    try:
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError) as e:
+        raise ConfigurationException(
+            f"Cannot read TOML feed list: {e}", details={"path": path}
+        ) from e
+
+    feeds = data.get("feeds", [])
+    if not isinstance(feeds, list) or not all(isinstance(feed, dict) for feed in feeds):
+        raise ConfigurationException(
+            "TOML feed list needs [[feeds]] tables", details={"path": path}
+        )
+    return [_spec(feed.get("name"), feed.get("url"), feed.get("interval")) for feed in feeds]
+
+
+def load_feeds(path: Optional[str] = news_config.FEEDS_FILE) -> List[FeedSpec]:
+    """
+    Configured feeds, without duplicate URLs.
+
+    Args:
+        path: OPML (.opml/.xml) or TOML (.toml) file; None for the built-in feeds
+
+    Returns:
+        FeedSpec list in file order
+
+    Raises:
+        ConfigurationException: If the file is missing, malformed or of an unknown type
+    """
+    if not path:
+        feeds = [FeedSpec(name, url) for name, url in news_config.RSS_FEEDS.items()]
+    else:
+        extension = os.path.splitext(path)[1].lower()
+        if extension in (".opml", ".xml"):
+            feeds = load_opml(path)
+        elif extension == ".toml":
+            feeds = load_toml(path)
+        else:
+            raise ConfigurationException(
+                "Feed list must be an .opml or .toml file", details={"path": path}
+            )
+
+    unique: Dict[str, FeedSpec] = {}
+    for feed in feeds:
+        unique.setdefault(feed.url, feed)
+    if path:
+        logger.info(f"Loaded {len(unique)} feeds from {path}")
+    return list(unique.values())
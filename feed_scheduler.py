@@ -0,0 +1,142 @@
+"""
+Feed polling scheduler for TerminalCoin.
+
+Every feed is polled on its own schedule instead of all feeds together:
+
+- The interval follows how often the feed actually publishes: the rate of
+  new entries per second is tracked as an exponentially weighted average,
+  and the feed is polled about once per new entry, within
+  [MIN_POLL_INTERVAL, MAX_POLL_INTERVAL]. Feeds with a configured interval
+  keep it.
+- A failed poll is retried after the interval times 2**failures, up to
+  MAX_BACKOFF.
+- Every delay is jittered by +/- POLL_JITTER, so feeds that start together
+  drift apart instead of being polled in bursts.
+"""
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from config import news_config
+from feed_registry import FeedSpec
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Weight of the latest poll in the publishing rate average
+RATE_SMOOTHING = 0.3
+# Growth of the interval of a feed that never published anything yet
+IDLE_GROWTH = 2.0
+
+
+@dataclass
+class FeedState:
+    """Polling state of one feed."""
+    spec: FeedSpec
+    interval: float
+    next_due: float
+    failures: int = 0
+    rate: Optional[float] = None          # new entries per second (EWMA)
+    last_polled: Optional[float] = None
+
+
+class FeedScheduler:
+    """Decides which feeds are due and when each is polled next."""
+
+    def __init__(
+        self,
+        min_interval: float = news_config.MIN_POLL_INTERVAL,
+        max_interval: float = news_config.MAX_POLL_INTERVAL,
+        max_backoff: float = news_config.MAX_BACKOFF,
+        jitter: float = news_config.POLL_JITTER,
+        rng: Optional[random.Random] = None
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            min_interval: Shortest adaptive interval (seconds)
+            max_interval: Longest adaptive interval (seconds)
+            max_backoff: Longest delay after repeated failures (seconds)
+            jitter: Relative random spread of every delay
+            rng: Random source (for reproducible tests)
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.rng = rng or random.Random()
+        self.states: Dict[str, FeedState] = {}
+
+    def sync(self, feeds: Iterable[FeedSpec], now: Optional[float] = None) -> None:
+        """Track the given feeds: new ones are due at once, removed ones are dropped."""
+        now = time.time() if now is None else now
+        feeds = {feed.url: feed for feed in feeds}
+        for url in set(self.states) - set(feeds):
+            del self.states[url]
+        for url, feed in feeds.items():
+            state = self.states.get(url)
+            if state is None:
+                self.states[url] = FeedState(feed, feed.interval or self.min_interval, now)
+            elif state.spec != feed:
+                state.spec = feed
+                if feed.interval:
+                    state.interval = feed.interval
+
+    def due(self, now: Optional[float] = None) -> List[FeedSpec]:
+        """Feeds whose next poll is due, most overdue first."""
+        now = time.time() if now is None else now
+        states = sorted((state for state in self.states.values() if state.next_due <= now),
+                        key=lambda state: state.next_due)
+        return [state.spec for state in states]
+
+    def next_due(self) -> Optional[float]:
+        """Time of the next scheduled poll (None without feeds)."""
+        return min((state.next_due for state in self.states.values()), default=None)
+
+    def _jittered(self, delay: float) -> float:
+        return delay * self.rng.uniform(1.0 - self.jitter, 1.0 + self.jitter)
+
+    def record_success(self, url: str, new_entries: int, now: Optional[float] = None) -> None:
+        """
+        Schedule the next poll after a successful one.
+
+        Args:
+            url: Feed URL
+            new_entries: Entries this poll saw for the first time
+            now: Poll time (epoch seconds)
+        """
+        state = self.states.get(url)
+        if state is None:
+            return
+        now = time.time() if now is None else now
+        if state.last_polled is not None and now > state.last_polled:
+            observed = new_entries / (now - state.last_polled)
+            state.rate = observed if state.rate is None else (
+                RATE_SMOOTHING * observed + (1.0 - RATE_SMOOTHING) * state.rate
+            )
+        state.last_polled = now
+        state.failures = 0
+
+        if state.spec.interval:
+            state.interval = state.spec.interval
+        elif state.rate:
+            # About one new entry per poll
+            state.interval = min(max(1.0 / state.rate, self.min_interval), self.max_interval)
+        elif state.rate is not None:
+            state.interval = min(state.interval * IDLE_GROWTH, self.max_interval)
+        state.next_due = now + self._jittered(state.interval)
+
+    def record_failure(self, url: str, now: Optional[float] = None) -> None:
+        """Back off exponentially after a failed poll."""
+        state = self.states.get(url)
+        if state is None:
+            return
+        now = time.time() if now is None else now
+        state.failures += 1
+        # The exponent is capped so a long outage can't overflow the float
+        delay = min(state.interval * 2 ** min(state.failures, 32), self.max_backoff)
+        state.next_due = now + self._jittered(delay)
+        logger.debug(f"{state.spec.name}: failure {state.failures}, next poll in {delay:.0f}s")
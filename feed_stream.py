@@ -0,0 +1,154 @@
+"""
+Streaming RSS/Atom parsing for TerminalCoin.
+
+Feeds are parsed incrementally while they download: the response body is
+fed chunk by chunk into an XML pull parser, every finished ``item``/``entry``
+is turned into a feedparser-style entry and released, and reading stops as
+soon as ``limit`` entries are complete. A multi-megabyte aggregator feed
+therefore costs only the bytes up to its ``limit``-th entry, and no feed is
+read past MAX_FEED_BYTES.
+
+Feeds that aren't well-formed XML (undefined HTML entities are common) fall
+back to feedparser on the bytes read so far, which the cap bounds too.
+ElementTree doesn't fetch external entities, and expat limits entity
+expansion.
+"""
+
+import xml.etree.ElementTree as ET
+from typing import List, Optional
+
+import feedparser
+from feedparser.datetimes import _parse_date as parse_date
+
+from config import news_config
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Local names of the elements that hold one entry (RSS 0.9x/1.0/2.0, Atom)
+ENTRY_TAGS = {"item", "entry"}
+
+
+def _local(tag: str) -> str:
+    """Tag without its namespace."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _text(element: ET.Element) -> str:
+    """All text of an element, including that of nested (XHTML) markup."""
+    return "".join(element.itertext()).strip()
+
+
+def parse_entry(element: ET.Element) -> feedparser.FeedParserDict:
+    """
+    Turn an ``item``/``entry`` element into the fields feedparser would give it.
+
+    Only the fields the news client reads are extracted: title, link, id,
+    summary and the published/updated times.
+    """
+    entry = feedparser.FeedParserDict()
+    content = None
+    for child in element:
+        name = _local(child.tag)
+        if name == "title":
+            entry.setdefault("title", _text(child))
+        elif name == "link":
+            href = child.get("href")
+            if href is None:
+                entry.setdefault("link", _text(child))
+            elif child.get("rel", "alternate") == "alternate":
+                entry.setdefault("link", href)
+        elif name in ("guid", "id"):
+            entry["id"] = _text(child)
+            if name == "guid" and child.get("isPermaLink", "true") != "false":
+                entry.setdefault("permalink", entry["id"])
+        elif name in ("description", "summary"):
+            entry.setdefault("summary", _text(child))
+        elif name in ("content", "encoded"):
+            content = content or _text(child)
+        elif name in ("pubDate", "published", "issued"):
+            entry.setdefault("published_parsed", parse_date(_text(child)))
+        elif name in ("updated", "modified", "date"):
+            entry.setdefault("updated_parsed", parse_date(_text(child)))
+
+    # feedparser's fallbacks: a permalink GUID is the link, content the summary
+    permalink = entry.pop("permalink", None)
+    if "link" not in entry and permalink:
+        entry["link"] = permalink
+    if "summary" not in entry and content:
+        entry["summary"] = content
+    return entry
+
+
+class FeedStreamParser:
+    """Parses a feed from body chunks, up to ``limit`` entries and ``max_bytes``."""
+
+    def __init__(self, limit: int, max_bytes: int = news_config.MAX_FEED_BYTES):
+        """
+        Initialize the parser.
+
+        Args:
+            limit: Entries after which parsing stops
+            max_bytes: Body bytes after which reading stops
+        """
+        self.limit = limit
+        self.max_bytes = max_bytes
+        self.entries: List[feedparser.FeedParserDict] = []
+        self.size = 0
+        self.truncated = False  # the body was cut at max_bytes
+        self.done = False
+        self._parser: Optional[ET.XMLPullParser] = ET.XMLPullParser(events=("end",))
+        # Raw body for the feedparser fallback (bounded by max_bytes)
+        self._body: Optional[bytearray] = bytearray()
+
+    def feed(self, chunk: bytes) -> bool:
+        """
+        Parse the next chunk of the body.
+
+        Returns:
+            True once no more of the body is needed
+        """
+        if self.done:
+            return True
+        if self.size + len(chunk) > self.max_bytes:
+            chunk = chunk[:self.max_bytes - self.size]
+            self.truncated = True
+        self.size += len(chunk)
+        if self._body is not None:
+            self._body += chunk
+
+        if self._parser is not None:
+            try:
+                self._parser.feed(chunk)
+                self._collect()
+            except ET.ParseError as e:
+                logger.debug(f"Feed isn't well-formed XML ({e}), falling back to feedparser")
+                self._parser = None
+                self.entries = []
+
+        self.done = self.truncated or len(self.entries) >= self.limit
+        return self.done
+
+    def _collect(self) -> None:
+        """Convert the entries the pull parser finished."""
+        for _, element in self._parser.read_events():
+            if _local(element.tag) in ENTRY_TAGS and len(self.entries) < self.limit:
+                self.entries.append(parse_entry(element))
+                element.clear()
+                if len(self.entries) >= self.limit:
+                    self._body = None  # done, the fallback can't be needed any more
+
+    def close(self) -> List[feedparser.FeedParserDict]:
+        """
+        Finish parsing.
+
+        Returns:
+            Up to ``limit`` parsed entries
+        """
+        if self.truncated:
+            logger.warning(f"Feed body exceeds {self.max_bytes} bytes, reading stopped there")
+        if self._parser is None:
+            self.entries = feedparser.parse(bytes(self._body or b"")).entries[:self.limit]
+        self._parser = None
+        self._body = None
+        return self.entries
@@ -0,0 +1,54 @@
+"""
+Import Transactions Script.
+
+Bulk loads trade history exported from an exchange (Binance, Coinbase,
+Kraken or a generic CSV/JSON layout) into the TerminalCoin database.
+
+Usage:
+    python import_transactions.py trades.csv [--format binance] [--portfolio "Client A"]
+"""
+
+import argparse
+import logging
+import time
+
+from database import Database, DEFAULT_PORTFOLIO_ID
+from portfolio_manager import PortfolioManager
+from transaction_importer import FORMATS
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def import_file():
+    parser = argparse.ArgumentParser(description="Import exchange trade history")
+    parser.add_argument("path", help="CSV, JSON or JSON Lines export file")
+    parser.add_argument("--format", choices=[f.name for f in FORMATS], help="skip auto-detection")
+    parser.add_argument(
+        "--portfolio", help="portfolio to import into, created if missing (default: main)"
+    )
+    args = parser.parse_args()
+
+    db = Database()
+    manager = PortfolioManager(db)
+
+    portfolio_id = DEFAULT_PORTFOLIO_ID
+    if args.portfolio:
+        portfolio_id = db.get_portfolio_id(args.portfolio) or db.create_portfolio(args.portfolio)
+
+    start = time.perf_counter()
+    result = manager.import_transactions(
+        args.path, format_name=args.format, portfolio_id=portfolio_id
+    )
+    elapsed = time.perf_counter() - start
+
+    logger.info(
+        f"Imported {result.imported} transactions ({result.skipped} skipped) "
+        f"as {result.format} export in {elapsed:.2f}s"
+    )
+    db.close()
+
+
+if __name__ == "__main__":
+    import_file()
@@ -28,6 +28,7 @@ class CoinMarketData(BaseModel):
     current_price: float = Field(..., gt=0, description="Current price in USD")
     market_cap_rank: Optional[int] = Field(None, ge=1, description="Market cap rank")
     market_cap: Optional[float] = Field(None, ge=0, description="Market capitalization")
+    total_volume: Optional[float] = Field(None, ge=0, description="24h trading volume")
     price_change_percentage_24h: Optional[float] = Field(None, description="24h price change %")
     sparkline_in_7d: Optional[Dict[str, List[float]]] = Field(None, description="7d sparkline data")
 
@@ -91,8 +92,15 @@ class NewsItem(BaseModel):
     link: str = Field(..., description="News article URL")
     summary: str = Field(default="", description="News summary")
     sentiment: SentimentType = Field(default=SentimentType.NEUTRAL, description="Sentiment analysis")
+    sentiment_score: Optional[float] = Field(None, ge=-1, le=1, description="VADER compound score")
     assets: List[str] = Field(default_factory=list, description="Related crypto assets")
     published_at: Optional[datetime] = Field(None, description="Publication timestamp")
+    cluster_id: Optional[str] = Field(
+        None, description="Entry id of the first item of the same story"
+    )
+    related_sources: List[str] = Field(
+        default_factory=list, description="Other sources that ran the story"
+    )
 
     @field_validator('link')
     @classmethod
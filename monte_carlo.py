@@ -0,0 +1,236 @@
+"""
+Monte Carlo portfolio simulation for TerminalCoin.
+
+Simulates buy-and-hold outcomes of the current holdings from the stored
+daily returns. Each path tracks the cumulative log return of every coin,
+so a portfolio value at any horizon is ``exp(S) @ values``. Paths are
+produced in chunks to bound memory and can be spread across processes.
+
+Two samplers are available:
+
+- ``bootstrap`` draws whole historical days (all coins of a day together,
+  which keeps their correlation). Short steps add the sampled rows; long
+  ones multiply a (paths x days) count matrix by the log-return panel.
+- ``normal`` draws from a multivariate normal fitted to the daily log
+  returns; a sum of ``n`` daily draws is a single draw with ``n`` times
+  the mean and covariance.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from config import monte_carlo_config
+from exceptions import ValidationException
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bootstrap increments of at most this many days add the sampled rows
+# directly; longer ones go through the count-matrix product
+GATHER_MAX_STEPS = 16
+
+BOOTSTRAP = "bootstrap"
+NORMAL = "normal"
+METHODS = (BOOTSTRAP, NORMAL)
+
+
+@dataclass
+class HorizonOutcome:
+    """Distribution of simulated portfolio value after ``days`` days."""
+    days: int
+    mean: float
+    percentiles: Dict[int, float]  # percentile -> portfolio value
+    prob_loss: float               # share of paths below the initial value
+    var: float                     # initial value minus the (100 - confidence) percentile
+    cvar: float                    # average loss beyond the VaR
+
+
+@dataclass
+class SimulationResult:
+    """Outcome of one simulation run."""
+    method: str
+    paths: int
+    initial_value: float
+    confidence: float
+    outcomes: List[HorizonOutcome]
+
+
+def _cholesky(covariance: np.ndarray) -> np.ndarray:
+    """Cholesky factor, nudging the diagonal if the matrix is only semi-definite."""
+    jitter = 0.0
+    scale = float(np.mean(np.diag(covariance))) or 1.0
+    for _ in range(6):
+        try:
+            return np.linalg.cholesky(covariance + jitter * np.eye(len(covariance)))
+        except np.linalg.LinAlgError:
+            jitter = scale * 1e-10 if jitter == 0.0 else jitter * 100
+    raise ValidationException("Returns covariance is not positive semi-definite")
+
+
+def _simulate_chunk(
+    rng: np.random.Generator,
+    paths: int,
+    method: str,
+    log_returns: np.ndarray,
+    mean: np.ndarray,
+    chol: Optional[np.ndarray],
+    values: np.ndarray,
+    horizons: Sequence[int]
+) -> np.ndarray:
+    """
+    Portfolio values of ``paths`` paths at each horizon.
+
+    Returns:
+        Array of shape (len(horizons), paths)
+    """
+    days, coins = log_returns.shape
+    cumulative = np.zeros((paths, coins))
+    result = np.empty((len(horizons), paths))
+    previous = 0
+    for i, horizon in enumerate(horizons):
+        steps = horizon - previous
+        if steps:
+            if method == BOOTSTRAP:
+                picks = rng.integers(0, days, size=(paths, steps))
+                if steps <= GATHER_MAX_STEPS:
+                    for k in range(steps):
+                        cumulative += log_returns[picks[:, k]]
+                else:
+                    picks += np.arange(paths)[:, None] * days
+                    counts = np.bincount(picks.ravel(), minlength=paths * days).reshape(paths, days)
+                    cumulative += counts @ log_returns
+            else:
+                draws = rng.standard_normal((paths, coins))
+                cumulative += steps * mean + np.sqrt(steps) * draws @ chol.T
+        result[i] = np.exp(cumulative) @ values
+        previous = horizon
+    return result
+
+
+def _simulate_worker(
+    seed: np.random.SeedSequence,
+    paths: int,
+    chunk_size: int,
+    method: str,
+    log_returns: np.ndarray,
+    mean: np.ndarray,
+    chol: Optional[np.ndarray],
+    values: np.ndarray,
+    horizons: Sequence[int]
+) -> np.ndarray:
+    """Simulate ``paths`` paths chunk by chunk (runs in worker processes too)."""
+    rng = np.random.default_rng(seed)
+    chunks = []
+    for start in range(0, paths, chunk_size):
+        size = min(chunk_size, paths - start)
+        chunks.append(_simulate_chunk(rng, size, method, log_returns, mean, chol, values, horizons))
+    return np.concatenate(chunks, axis=1) if chunks else np.empty((len(horizons), 0))
+
+
+class MonteCarloSimulator:
+    """Simulates portfolio value paths from a panel of daily returns."""
+
+    def __init__(self, returns: np.ndarray):
+        """
+        Initialize the simulator.
+
+        Args:
+            returns: Days x coins simple daily returns (e.g. ReturnsPanel.returns)
+        """
+        if len(returns) == 0:
+            raise ValidationException("No return history to simulate from")
+        self.log_returns = np.log1p(np.asarray(returns, dtype=float))
+        self.mean = self.log_returns.mean(axis=0)
+        centered = self.log_returns - self.mean
+        self.covariance = centered.T @ centered / max(len(centered) - 1, 1)
+        self._chol: Optional[np.ndarray] = None
+
+    def simulate(
+        self,
+        values: np.ndarray,
+        horizons: Sequence[int] = monte_carlo_config.HORIZONS,
+        paths: int = monte_carlo_config.PATHS,
+        method: str = monte_carlo_config.METHOD,
+        processes: int = monte_carlo_config.PROCESSES,
+        chunk_size: int = monte_carlo_config.CHUNK_SIZE,
+        confidence: float = monte_carlo_config.CONFIDENCE,
+        seed: Optional[int] = None
+    ) -> SimulationResult:
+        """
+        Simulate the value of a buy-and-hold portfolio.
+
+        Args:
+            values: Current value of each coin position (panel column order)
+            horizons: Days ahead to report on
+            paths: Number of simulated paths
+            method: 'bootstrap' or 'normal'
+            processes: Worker processes (0 or 1 runs in this process)
+            chunk_size: Paths generated at once (bounds memory)
+            confidence: Confidence level for VaR/CVaR
+            seed: Random seed for reproducible results
+
+        Returns:
+            SimulationResult with one outcome per horizon
+
+        Raises:
+            ValidationException: If the parameters are invalid
+        """
+        if method not in METHODS:
+            raise ValidationException("Unknown simulation method", details={"method": method})
+        horizons = sorted({int(h) for h in horizons})
+        if not horizons or horizons[0] < 1 or paths < 1:
+            raise ValidationException("Horizons and paths must be positive")
+        values = np.asarray(values, dtype=float)
+
+        chol = None
+        if method == NORMAL:
+            if self._chol is None:
+                self._chol = _cholesky(self.covariance)
+            chol = self._chol
+
+        workers = max(1, min(processes, -(-paths // chunk_size)))
+        shares = [paths // workers + (1 if i < paths % workers else 0) for i in range(workers)]
+        seeds = np.random.SeedSequence(seed).spawn(workers)
+        args = (chunk_size, method, self.log_returns, self.mean, chol, values, horizons)
+
+        if workers == 1:
+            simulated = _simulate_worker(seeds[0], paths, *args)
+        else:
+            # spawn: the app runs threads, which fork() must not copy
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                futures = [
+                    pool.submit(_simulate_worker, s, n, *args) for s, n in zip(seeds, shares)
+                ]
+                simulated = np.concatenate([f.result() for f in futures], axis=1)
+
+        initial = float(values.sum())
+        outcomes = [
+            self._outcome(days, row, initial, confidence) for days, row in zip(horizons, simulated)
+        ]
+        logger.info(
+            f"Simulated {paths} {method} paths over {horizons[-1]} days with {workers} process(es)"
+        )
+        return SimulationResult(method, paths, initial, confidence, outcomes)
+
+    @staticmethod
+    def _outcome(
+        days: int, finals: np.ndarray, initial: float, confidence: float
+    ) -> HorizonOutcome:
+        """Summarize the simulated values at one horizon."""
+        levels = monte_carlo_config.PERCENTILES
+        percentiles = dict(zip(levels, np.percentile(finals, levels).tolist()))
+        cutoff = float(np.quantile(finals, 1.0 - confidence))
+        tail = finals[finals <= cutoff]
+        return HorizonOutcome(
+            days=days,
+            mean=float(finals.mean()),
+            percentiles=percentiles,
+            prob_loss=float((finals < initial).mean()),
+            var=initial - cutoff,
+            cvar=initial - float(tail.mean()) if tail.size else initial - cutoff,
+        )
@@ -0,0 +1,333 @@
+"""
+Portfolio NAV engine for TerminalCoin.
+
+Materializes the daily value (NAV) of every portfolio into the
+``portfolio_snapshots`` table. The first build replays a portfolio's
+transaction log against the stored price history of its coins in one
+vectorized pandas pass; later updates only recompute the days after the
+last fully materialized day, starting from the saved per-coin state.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from database import Database
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# app_state keys, one set per portfolio (see state_key)
+STATE_DATE_KEY = "nav_state_date"        # last day captured in nav_state
+LAST_TX_KEY = "nav_last_transaction_id"  # newest transaction id seen
+INVESTED_KEY = "nav_net_invested"        # net invested at the end of the state day
+
+
+def state_key(key: str, portfolio_id: int) -> str:
+    """app_state key of one portfolio's NAV bookkeeping value."""
+    return f"{key}:{portfolio_id}"
+
+
+@dataclass
+class NavResult:
+    """Output of one vectorized NAV computation (one row per day)."""
+    snapshots: pd.DataFrame  # columns: nav, net_invested, positions
+    amounts: pd.DataFrame    # end-of-day amount per coin
+    prices: pd.DataFrame     # last known price per coin
+
+    def state_at(self, day: date) -> Tuple[Dict[str, Tuple[float, Optional[float]]], float]:
+        """
+        Per-coin (amount, price) and net invested at the end of ``day``.
+
+        Only open positions are included.
+        """
+        key = pd.Timestamp(day)
+        amounts = self.amounts.loc[key]
+        prices = self.prices.loc[key]
+        state = {
+            coin_id: (float(amount), None if pd.isna(prices[coin_id]) else float(prices[coin_id]))
+            for coin_id, amount in amounts[amounts > 0].items()
+        }
+        return state, float(self.snapshots.at[key, "net_invested"])
+
+
+def _reflected_cumsum(deltas: pd.Series, groups: pd.Series, start: pd.Series) -> pd.Series:
+    """
+    Running per-group balance that is floored at zero after every step.
+
+    Equivalent to replaying ``balance = max(0, balance + delta)`` (a SELL
+    larger than the position closes it, a SELL without a position is
+    ignored) but vectorized: for X = start + cumsum(delta), the floored
+    balance is X - min(0, running_min(X)).
+    """
+    level = start + deltas.groupby(groups, sort=False).cumsum()
+    floor = level.groupby(groups, sort=False).cummin().clip(upper=0.0)
+    return level - floor
+
+
+def _carry_forward(
+    matrix: np.ndarray, initial: np.ndarray, days: pd.DatetimeIndex, coins: pd.Index
+) -> pd.DataFrame:
+    """Forward-fill a day x coin matrix, seeding missing first-day values from ``initial``."""
+    matrix = matrix.astype(float, copy=True)
+    if len(matrix):
+        first = matrix[0]
+        missing = np.isnan(first)
+        first[missing] = initial[missing]
+    return pd.DataFrame(matrix, index=days, columns=coins).ffill()
+
+
+def compute_nav(
+    transactions: Sequence[Tuple],
+    prices: Sequence[Tuple[str, str, float]],
+    start: date,
+    end: date,
+    initial_amounts: Optional[Dict[str, float]] = None,
+    initial_prices: Optional[Dict[str, float]] = None,
+    initial_invested: float = 0.0,
+) -> NavResult:
+    """
+    Compute daily NAV for [start, end] in one vectorized pass.
+
+    Prices come from ``prices`` where available, falling back to the
+    trade price of transactions on the same day, then carried forward.
+
+    Args:
+        transactions: (id, coin_id, date, type, amount, price) tuples dated
+                      within [start, end], ordered by coin, timestamp and id
+        prices: (coin_id, date, price) daily price rows
+        start: First day to compute
+        end: Last day to compute
+        initial_amounts: Per-coin amounts at the end of the day before start
+        initial_prices: Per-coin last known prices before start
+        initial_invested: Net invested amount before start
+
+    Returns:
+        NavResult with one snapshot row per day
+    """
+    days = pd.date_range(start, end, freq="D")
+    initial_amounts = pd.Series(initial_amounts or {}, dtype=float)
+    initial_prices = pd.Series(initial_prices or {}, dtype=float)
+
+    tx = pd.DataFrame.from_records(
+        list(transactions), columns=["id", "coin_id", "date", "type", "amount", "price"]
+    )
+    tx["date"] = pd.to_datetime(tx["date"])
+    tx = tx[(tx["date"] >= days[0]) & (tx["date"] <= days[-1])]
+
+    # Position after every transaction, then the end-of-day position per coin
+    signed = tx["amount"].where(tx["type"] == "BUY", -tx["amount"]).astype(float)
+    opening = tx["coin_id"].map(initial_amounts).fillna(0.0)
+    balance = _reflected_cumsum(signed, tx["coin_id"], opening)
+    previous = balance.groupby(tx["coin_id"], sort=False).shift(1).fillna(opening)
+    cash_flow = (balance - previous) * tx["price"]  # sells beyond the position are clamped
+    tx = tx.assign(balance=balance, cash_flow=cash_flow)
+
+    coins = initial_amounts.index.union(pd.Index(tx["coin_id"].unique()))
+    end_of_day = (
+        tx.groupby(["date", "coin_id"], sort=False)["balance"].last()
+        .unstack("coin_id")
+        .reindex(index=days, columns=coins)
+        .to_numpy()
+    )
+    amounts = _carry_forward(
+        end_of_day, initial_amounts.reindex(coins).fillna(0.0).to_numpy(), days, coins
+    )
+
+    # Daily price matrix: stored history first, same-day trade prices second
+    history = pd.DataFrame.from_records(list(prices), columns=["coin_id", "date", "price"])
+    history["date"] = pd.to_datetime(history["date"])
+    stored = (
+        history.pivot_table(index="date", columns="coin_id", values="price", aggfunc="last")
+        .reindex(index=days, columns=coins)
+        .to_numpy()
+    )
+    traded = (
+        tx.groupby(["date", "coin_id"], sort=False)["price"].last()
+        .unstack("coin_id")
+        .reindex(index=days, columns=coins)
+        .to_numpy()
+    )
+    price_matrix = _carry_forward(
+        np.where(np.isnan(stored), traded, stored),
+        initial_prices.reindex(coins).to_numpy(),
+        days,
+        coins,
+    )
+
+    values = amounts.to_numpy() * np.nan_to_num(price_matrix.to_numpy())
+    invested = initial_invested + (
+        tx.groupby("date")["cash_flow"].sum().reindex(days, fill_value=0.0).cumsum()
+    )
+    snapshots = pd.DataFrame(
+        {
+            "nav": values.sum(axis=1),
+            "net_invested": invested.to_numpy(),
+            "positions": (amounts.to_numpy() > 0).sum(axis=1),
+        },
+        index=days,
+    )
+
+    return NavResult(snapshots=snapshots, amounts=amounts, prices=price_matrix)
+
+
+class NavEngine:
+    """Keeps the ``portfolio_snapshots`` table up to date for every portfolio."""
+
+    def __init__(self, db: Database):
+        """
+        Initialize the engine.
+
+        Args:
+            db: Database holding transactions, prices and snapshots
+        """
+        self.db = db
+
+    def update(self, today: Optional[date] = None, portfolio_id: Optional[int] = None) -> int:
+        """
+        Bring snapshots up to ``today``, recomputing as little as possible.
+
+        Only days after the last materialized state day are recomputed. A
+        full rebuild happens on first run or when a newly added transaction
+        is dated on or before that day (e.g. an imported back-history).
+
+        Args:
+            today: Last day to materialize (defaults to the current UTC date)
+            portfolio_id: Portfolio to update (every portfolio if None)
+
+        Returns:
+            Number of snapshot rows written
+        """
+        today = today or datetime.utcnow().date()
+        return sum(self._update(pid, today) for pid in self._portfolio_ids(portfolio_id))
+
+    def _update(self, portfolio_id: int, today: date) -> int:
+        """Bring one portfolio's snapshots up to ``today``."""
+        state_date = self.db.get_app_state(state_key(STATE_DATE_KEY, portfolio_id))
+        if state_date is None:
+            return self._rebuild(portfolio_id, today)
+
+        last_tx_id = int(self.db.get_app_state(state_key(LAST_TX_KEY, portfolio_id), "0"))
+        max_id, earliest_new = self.db.get_transaction_watermark(last_tx_id, portfolio_id)
+        if earliest_new is not None and earliest_new <= state_date:
+            logger.info(f"Backdated transactions from {earliest_new}; rebuilding NAV history")
+            return self._rebuild(portfolio_id, today)
+
+        start = date.fromisoformat(state_date) + timedelta(days=1)
+        if start > today:
+            return 0
+
+        state = self.db.get_nav_state(portfolio_id)
+        transactions = self.db.get_transaction_log(start.isoformat(), portfolio_id)
+        invested = self.db.get_app_state(state_key(INVESTED_KEY, portfolio_id), "0")
+        result = compute_nav(
+            transactions,
+            self._held_prices(transactions, start, today, state),
+            start,
+            today,
+            initial_amounts={coin_id: amount for coin_id, (amount, _) in state.items()},
+            initial_prices={
+                coin_id: price for coin_id, (_, price) in state.items() if price is not None
+            },
+            initial_invested=float(invested),
+        )
+        return self._save(portfolio_id, result, start, today, max_id)
+
+    def invalidate(self, since: str) -> None:
+        """
+        Mark snapshots from ``since`` on as stale (e.g. back-filled prices).
+
+        The next update rebuilds the history of every portfolio whose saved
+        state covers that day.
+
+        Args:
+            since: First affected date ('YYYY-MM-DD')
+        """
+        for portfolio_id in self._portfolio_ids(None):
+            key = state_key(STATE_DATE_KEY, portfolio_id)
+            state_date = self.db.get_app_state(key)
+            if state_date is not None and since <= state_date:
+                self.db.set_app_state(key, None)
+
+    def rebuild(self, today: Optional[date] = None, portfolio_id: Optional[int] = None) -> int:
+        """
+        Recompute all snapshots from the first transaction to ``today``.
+
+        Args:
+            today: Last day to materialize (defaults to the current UTC date)
+            portfolio_id: Portfolio to rebuild (every portfolio if None)
+
+        Returns:
+            Number of snapshot rows written
+        """
+        today = today or datetime.utcnow().date()
+        return sum(self._rebuild(pid, today) for pid in self._portfolio_ids(portfolio_id))
+
+    def _rebuild(self, portfolio_id: int, today: date) -> int:
+        """Recompute one portfolio's snapshots from its first transaction."""
+        max_id, first_date = self.db.get_transaction_watermark(0, portfolio_id)
+        if first_date is None:
+            self.db.save_portfolio_snapshots(
+                [], None, {}, {state_key(STATE_DATE_KEY, portfolio_id): None}, portfolio_id
+            )
+            return 0
+
+        start = min(date.fromisoformat(first_date), today)
+        transactions = self.db.get_transaction_log(None, portfolio_id)
+        result = compute_nav(
+            transactions, self._held_prices(transactions, start, today), start, today
+        )
+        return self._save(portfolio_id, result, start, today, max_id)
+
+    def _portfolio_ids(self, portfolio_id: Optional[int]) -> List[int]:
+        """The given portfolio, or every portfolio if None."""
+        if portfolio_id is not None:
+            return [portfolio_id]
+        return [portfolio["id"] for portfolio in self.db.get_portfolios()]
+
+    def _held_prices(
+        self,
+        transactions: Sequence[Tuple],
+        start: date,
+        end: date,
+        state: Optional[Dict[str, Tuple[float, Optional[float]]]] = None,
+    ) -> Sequence[Tuple[str, str, float]]:
+        """Stored prices in [start, end] of the coins traded then or held at ``start``."""
+        coin_ids = {tx[1] for tx in transactions} | set(state or ())
+        if not coin_ids:
+            return []
+        return self.db.get_price_history(start.isoformat(), end.isoformat(), coin_ids)
+
+    def _save(
+        self, portfolio_id: int, result: NavResult, start: date, today: date, max_id: int
+    ) -> int:
+        """Persist a portfolio's snapshots from ``start`` and its incremental state."""
+        snapshots = result.snapshots
+        rows = list(zip(
+            snapshots.index.strftime("%Y-%m-%d"),
+            snapshots["nav"].astype(float),
+            snapshots["net_invested"].astype(float),
+            snapshots["positions"].astype(int),
+        ))
+
+        # Today is still moving, so the state is taken from the end of
+        # yesterday and the next update recomputes today. If yesterday is
+        # outside this window the previous state remains valid.
+        app_state = {state_key(LAST_TX_KEY, portfolio_id): str(max_id)}
+        nav_state = None
+        state_day = today - timedelta(days=1)
+        if state_day >= start:
+            nav_state, invested = result.state_at(state_day)
+            app_state[state_key(STATE_DATE_KEY, portfolio_id)] = state_day.isoformat()
+            app_state[state_key(INVESTED_KEY, portfolio_id)] = repr(invested)
+
+        self.db.save_portfolio_snapshots(
+            rows, start.isoformat(), nav_state, app_state, portfolio_id
+        )
+        logger.info(
+            f"Materialized {len(rows)} NAV snapshots of portfolio {portfolio_id} from {start}"
+        )
+        return len(rows)
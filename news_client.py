@@ -2,22 +2,67 @@
 News client for fetching and analyzing cryptocurrency news.
 
 Fetches RSS feeds, performs sentiment analysis, and detects mentioned assets.
+The async path downloads all feeds concurrently over one shared HTTP client
+and processes each feed as soon as it arrives.
+
+With a NewsStore attached, feeds are requested conditionally (ETag /
+Last-Modified): an unchanged feed costs a 304 and is served from the store,
+and of a changed feed only entries that were never seen are analyzed.
+Once the feeds of a refresh are in, their new entries are scored in one
+batch by the sentiment service, which caches scores by text hash.
+Near-duplicates of known stories (see news_dedup) reuse the story's score,
+and a refresh returns one item per story with the other sources that ran it.
+
+Feed bodies are parsed while they download and reading stops after the
+requested number of entries (see feed_stream), so large feeds cost little.
+
+Feeds come from the feed registry (OPML/TOML). Besides full refreshes,
+poll_news_async() polls only the feeds the scheduler says are due, with a
+bounded number of feeds in flight.
 """
 
-from typing import List, Optional, Dict
-import feedparser
+import asyncio
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 import httpx
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
-from config import news_config, CRYPTO_KEYWORDS, SENTIMENT_THRESHOLDS
+from config import api_config, news_config, CRYPTO_KEYWORDS
 from models import NewsItem, SentimentType
 from exceptions import NetworkException, ParsingException
 from logger import get_logger
+from feed_registry import FeedSpec, load_feeds
+from feed_scheduler import FeedScheduler
+from feed_stream import FeedStreamParser
+from news_dedup import Fingerprint, StoryClusterer
+from news_store import NewsStore
+from sentiment_aggregates import SentimentAggregator
+from sentiment_service import SentimentService, classify_sentiment
 from utils import sanitize_text, truncate_list
 
+if TYPE_CHECKING:
+    from models import CoinMarketData
+
 logger = get_logger(__name__)
 
 
+@dataclass
+class _FeedUpdate:
+    """A downloaded feed whose new entries are processed with the rest of its refresh."""
+    source: str
+    url: str
+    entry_ids: List[str] = field(default_factory=list)
+    known: Dict[str, NewsItem] = field(default_factory=dict)  # entries processed before
+    new: List[Tuple[str, Dict]] = field(default_factory=list)  # (entry_id, entry) pairs
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    items: Optional[List[NewsItem]] = None  # set up front for unchanged feeds
+
+
 class SentimentAnalyzer:
     """Handles sentiment analysis for text content."""
 
@@ -47,34 +92,132 @@ class SentimentAnalyzer:
         try:
             # Get polarity scores
             scores = self.analyzer.polarity_scores(text)
-            compound_score = scores.get('compound', 0.0)
-
-            # Classify sentiment
-            if compound_score >= SENTIMENT_THRESHOLDS['bullish']:
-                return SentimentType.BULLISH
-            elif compound_score <= SENTIMENT_THRESHOLDS['bearish']:
-                return SentimentType.BEARISH
-            else:
-                return SentimentType.NEUTRAL
+            return classify_sentiment(scores.get('compound', 0.0))
 
         except Exception as e:
             logger.error(f"Error analyzing sentiment: {e}")
             return SentimentType.NEUTRAL
 
 
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Regex alternation of ``words`` factored into a prefix trie.
+
+    Matching at a position walks at most one branch per character, so the
+    cost does not grow with the number of words.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # A word ending here makes the rest optional (greedy, so longer names win)
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
 class AssetDetector:
-    """Detects cryptocurrency assets mentioned in text."""
+    """
+    Detects cryptocurrency assets mentioned in text.
+
+    All keywords are compiled into one regex, so an article is scanned once
+    regardless of how many coins are known. The built-in coin names match in
+    any case; tickers only as uppercase words or cashtags ("SOL", "$SOL"), so
+    that "sol" in "solution" or "dot" in "dotted" are not mistaken for coins.
+    Names from the market universe match only as spelled there ("Quant",
+    "Optimism"), since many of them are ordinary words.
+    """
+
+    # Shorter tickers and names are too ambiguous to detect
+    MIN_SYMBOL_LENGTH = 2
+    MIN_NAME_LENGTH = 3
 
     def __init__(self, keywords: Optional[Dict[str, str]] = None):
         """
         Initialize asset detector.
 
         Args:
-            keywords: Optional custom keyword mapping
+            keywords: Optional custom keyword mapping (keyword -> symbol)
         """
         self.keywords = keywords or CRYPTO_KEYWORDS
+        self._universe: Optional[int] = None  # hash of the last coin universe
+        self._build(self.keywords)
         logger.info(f"Asset detector initialized with {len(self.keywords)} keywords")
 
+    def _build(self, keywords: Dict[str, str], exact: Optional[Dict[str, str]] = None) -> None:
+        """
+        Compile the matcher.
+
+        Args:
+            keywords: Keyword -> symbol mapping (names match in any case)
+            exact: Name -> symbol mapping of names that match case-sensitively
+        """
+        names: Dict[str, str] = {}
+        symbols: Dict[str, str] = {}
+        for keyword, symbol in keywords.items():
+            symbol = symbol.upper()
+            if keyword.upper() == symbol:
+                if len(symbol) >= self.MIN_SYMBOL_LENGTH:
+                    symbols.setdefault(symbol, symbol)
+            elif len(keyword) >= self.MIN_NAME_LENGTH:
+                names.setdefault(keyword.lower(), symbol)
+
+        exact = {
+            name: symbol.upper() for name, symbol in (exact or {}).items()
+            if len(name) >= self.MIN_NAME_LENGTH and name.lower() not in names
+        }
+
+        # Exact names first: 'Bitcoin Cash' must win over the built-in 'bitcoin'
+        alternatives = []
+        if exact:
+            alternatives.append(_trie_pattern(exact))
+        if names:
+            alternatives.append(f"(?i:{_trie_pattern(names)})")
+        if symbols:
+            alternatives.append(_trie_pattern(symbols))
+        body = "|".join(alternatives) or "(?!)"
+        pattern = re.compile(f"(?<![A-Za-z0-9])(?:{body})(?![A-Za-z0-9])")
+        # Swapped together so concurrent detect() calls see a consistent pair
+        self._matcher = (pattern, names, exact, symbols)
+
+    def update_universe(self, coins: Iterable["CoinMarketData"]) -> bool:
+        """
+        Detect the coins of the market universe by name and ticker.
+
+        The matcher is rebuilt only when the set of coins changed. Coins
+        earlier in ``coins`` (higher market cap) win ambiguous names.
+
+        Args:
+            coins: Market data, e.g. the latest top coins
+
+        Returns:
+            True if the matcher was rebuilt
+        """
+        coins = list(coins)
+        universe = hash(tuple((coin.id, coin.symbol, coin.name) for coin in coins))
+        if universe == self._universe:
+            return False
+
+        keywords = dict(self.keywords)
+        exact: Dict[str, str] = {}
+        for coin in coins:
+            exact.setdefault(coin.name, coin.symbol)
+            keywords.setdefault(coin.symbol.lower(), coin.symbol)
+        self._build(keywords, exact)
+        self._universe = universe
+        logger.info(
+            f"Asset detector rebuilt for {len(coins)} coins ({len(keywords) + len(exact)} keywords)"
+        )
+        return True
+
     def detect(self, text: str) -> List[str]:
         """
         Detect crypto assets mentioned in text.
@@ -88,15 +231,15 @@ class AssetDetector:
         if not text or not isinstance(text, str):
             return []
 
+        pattern, names, exact, symbols = self._matcher
         detected = set()
-        lower_text = text.lower()
-
-        for keyword, asset_symbol in self.keywords.items():
-            # Use word boundaries to avoid partial matches
-            if keyword in lower_text:
-                detected.add(asset_symbol)
+        for match in pattern.finditer(text):
+            word = match.group()
+            symbol = symbols.get(word) or exact.get(word) or names.get(word.lower())
+            if symbol:
+                detected.add(symbol)
 
-        return sorted(list(detected))
+        return sorted(detected)
 
 
 class NewsClient:
@@ -106,48 +249,79 @@ class NewsClient:
     Implements robust error handling, sentiment analysis, and asset detection.
     """
 
-    def __init__(self):
-        """Initialize news client with sentiment analyzer and asset detector."""
-        self.rss_feeds = news_config.RSS_FEEDS
+    def __init__(self, store: Optional[NewsStore] = None, feeds: Optional[List[FeedSpec]] = None):
+        """
+        Initialize news client with sentiment service and asset detector.
+
+        Args:
+            store: Cache of processed entries, feed validators and sentiment scores (optional)
+            feeds: Feeds to fetch (default: the configured feed registry)
+        """
+        self.store = store
+        self.feeds = load_feeds() if feeds is None else feeds
+        self.scheduler = FeedScheduler()
+        # Latest items of every polled feed, combined by poll_news_async()
+        self._latest: Dict[str, List[NewsItem]] = {}
         self.timeout = news_config.REQUEST_TIMEOUT
         self.max_retries = news_config.MAX_RETRIES
 
-        self.sentiment_analyzer = SentimentAnalyzer()
+        self.sentiment = SentimentService(store)
+        self.clusterer = StoryClusterer(store)
+        self.aggregates = SentimentAggregator.from_store(store) if store else SentimentAggregator()
+        # Refreshes may overlap; the final lookup and insert of one's new
+        # entries must not interleave with another's, or duplicates could
+        # miss each other
+        self._store_lock = threading.Lock()
         self.asset_detector = AssetDetector()
 
-        logger.info(f"News client initialized with {len(self.rss_feeds)} RSS feeds")
+        logger.info(f"News client initialized with {len(self.feeds)} RSS feeds")
 
-    def _fetch_feed(self, source: str, url: str) -> List[Dict]:
+    @property
+    def rss_feeds(self) -> Dict[str, str]:
+        """Feeds as a name -> URL dictionary."""
+        return {feed.name: feed.url for feed in self.feeds}
+
+    @rss_feeds.setter
+    def rss_feeds(self, feeds: Dict[str, str]) -> None:
+        self.feeds = [FeedSpec(name, url) for name, url in feeds.items()]
+
+    def close(self) -> None:
+        """Stop sentiment workers and close the store."""
+        self.sentiment.close()
+        if self.store is not None:
+            self.store.close()
+
+    def _fetch_feed(self, source: str, url: str, limit: int) -> Optional[_FeedUpdate]:
         """
-        Fetch and parse a single RSS feed.
+        Fetch a single RSS feed.
 
         Args:
             source: News source name
             url: RSS feed URL
+            limit: Maximum number of news items
 
         Returns:
-            List of parsed feed entries
+            The feed's known and new entries (None if it couldn't be read)
         """
         try:
             logger.debug(f"Fetching feed from {source}: {url}")
 
             # Use httpx for async-ready HTTP requests
-            response = httpx.get(
+            with httpx.stream(
+                "GET",
                 url,
+                headers=self._conditional_headers(url),
                 timeout=self.timeout,
                 follow_redirects=True
-            )
-            response.raise_for_status()
-
-            # Parse feed
-            feed = feedparser.parse(response.text)
-
-            if not feed.entries:
-                logger.warning(f"No entries found in feed from {source}")
-                return []
-
-            logger.info(f"Successfully fetched {len(feed.entries)} entries from {source}")
-            return feed.entries
+            ) as response:
+                if response.status_code == httpx.codes.NOT_MODIFIED:
+                    return self._unchanged_feed(source, url, limit)
+                response.raise_for_status()
+                parser = FeedStreamParser(limit)
+                for chunk in response.iter_bytes():
+                    if parser.feed(chunk):
+                        break
+            return self._read_feed(source, url, parser, response.headers, limit)
 
         except httpx.TimeoutException as e:
             logger.error(f"Timeout fetching feed from {source}: {e}")
@@ -165,51 +339,331 @@ class NewsClient:
 
         except Exception as e:
             logger.error(f"Unexpected error fetching feed from {source}: {e}")
+            return None
+
+    def _parse_feed(self, source: str, parser: FeedStreamParser) -> List[Dict]:
+        """
+        Finish parsing a downloaded feed body.
+
+        Args:
+            source: News source name
+            parser: Parser the body was streamed into
+
+        Returns:
+            List of parsed feed entries
+        """
+        entries = parser.close()
+
+        if not entries:
+            logger.warning(f"No entries found in feed from {source}")
             return []
 
-    def _process_entry(self, entry, source: str) -> Optional[NewsItem]:
+        logger.info(
+            f"Successfully fetched {len(entries)} entries from {source} ({parser.size} bytes read)"
+        )
+        return entries
+
+    async def _fetch_feed_async(
+        self,
+        client: httpx.AsyncClient,
+        source: str,
+        url: str,
+        limit: int
+    ) -> _FeedUpdate:
         """
-        Process a single feed entry into a NewsItem.
+        Stream one feed on the shared client, then sort out its new entries in a thread.
 
         Args:
-            entry: Feed entry object
+            client: Shared async HTTP client
             source: News source name
+            url: RSS feed URL
+            limit: Maximum number of news items
 
         Returns:
-            NewsItem object or None if processing fails
+            The feed's known and new entries
+
+        Raises:
+            NetworkException: On timeouts and HTTP errors
         """
         try:
-            # Extract basic fields with safe defaults
-            title = sanitize_text(getattr(entry, 'title', 'No Title'))
-            link = getattr(entry, 'link', '#')
-            summary = sanitize_text(
-                getattr(entry, 'summary', getattr(entry, 'description', ''))
+            logger.debug(f"Fetching feed from {source}: {url}")
+            headers = await asyncio.to_thread(self._conditional_headers, url) if self.store else {}
+            async with client.stream("GET", url, headers=headers) as response:
+                if response.status_code == httpx.codes.NOT_MODIFIED:
+                    return await asyncio.to_thread(self._unchanged_feed, source, url, limit)
+                response.raise_for_status()
+                # Incremental parsing is cheap per chunk; stop reading once
+                # the entries we need are complete
+                parser = FeedStreamParser(limit)
+                async for chunk in response.aiter_bytes():
+                    if parser.feed(chunk):
+                        break
+
+        except httpx.TimeoutException as e:
+            raise NetworkException(
+                f"Timeout fetching news from {source}",
+                details={"source": source, "error": str(e)}
             )
 
-            # Combine title and summary for analysis
-            full_text = f"{title} {summary}"
+        except httpx.HTTPStatusError as e:
+            raise NetworkException(
+                f"Failed to fetch news from {source}",
+                details={"source": source, "status_code": e.response.status_code}
+            )
 
-            # Analyze sentiment
-            sentiment = self.sentiment_analyzer.analyze(full_text)
+        except httpx.HTTPError as e:
+            raise NetworkException(
+                f"Failed to fetch news from {source}",
+                details={"source": source, "error": str(e)}
+            )
 
-            # Detect mentioned assets
-            assets = self.asset_detector.detect(full_text)
+        # The feedparser fallback is CPU-bound and the lookup hits the store;
+        # keep them off the event loop
+        return await asyncio.to_thread(
+            self._read_feed, source, url, parser, response.headers, limit
+        )
+
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers from the feed's last download."""
+        if self.store is None:
+            return {}
+        etag, last_modified = self.store.get_feed_state(url)
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _unchanged_feed(self, source: str, url: str, limit: int) -> _FeedUpdate:
+        """Stored items of a feed that answered 304 Not Modified."""
+        logger.debug(f"Feed from {source} not modified")
+        items = self.store.get_feed_items(url, limit) if self.store else []
+        return _FeedUpdate(source, url, items=items)
+
+    def _read_feed(
+        self,
+        source: str,
+        url: str,
+        parser: FeedStreamParser,
+        headers: httpx.Headers,
+        limit: int
+    ) -> _FeedUpdate:
+        """
+        Split the first ``limit`` entries of a downloaded feed into known and new ones.
 
-            # Create NewsItem
-            news_item = NewsItem(
-                source=source,
-                title=title,
-                link=link,
-                summary=summary,
-                sentiment=sentiment,
-                assets=assets
+        With a store, entries processed before are taken from it; the new
+        ones are processed with the rest of the refresh (see _finish_feeds).
+        """
+        entries = self._parse_feed(source, parser)[:limit]
+        entry_ids = [self._entry_id(entry) for entry in entries]
+        known = self.store.get_items(entry_ids) if self.store is not None else {}
+        new = [
+            (entry_id, entry)
+            for entry_id, entry in zip(entry_ids, entries)
+            if entry_id not in known
+        ]
+        return _FeedUpdate(
+            source, url, entry_ids, known, new, headers.get("etag"), headers.get("last-modified")
+        )
+
+    def _finish_feeds(self, updates: List[_FeedUpdate]) -> List[List[NewsItem]]:
+        """
+        Process the new entries of a refresh's feeds in one batch.
+
+        Clustering and sentiment scoring run without the store lock; only
+        the final lookup and insert of the new entries hold it. With a
+        store, the feeds' validators are saved.
+
+        Args:
+            updates: Downloaded feeds
+
+        Returns:
+            The items of each feed, in the order of ``updates``
+        """
+        # An entry carried by several feeds (same GUID) is processed once
+        owners: Dict[str, _FeedUpdate] = {}
+        entries = []
+        for update in updates:
+            for entry_id, entry in update.new:
+                if entry_id not in owners:
+                    owners[entry_id] = update
+                    entries.append((update.source, entry))
+        processed, fingerprints = self._build_items(entries, list(owners))
+        fresh = {entry_id: item for entry_id, item in zip(owners, processed) if item}
+
+        if self.store is not None:
+            with self._store_lock:
+                # Entries an overlapping refresh stored meanwhile keep their stored item
+                stored = self.store.get_items(fresh)
+                new_items: Dict[str, List[Tuple[str, NewsItem]]] = {}
+                for entry_id, item in fresh.items():
+                    if entry_id not in stored:
+                        new_items.setdefault(owners[entry_id].url, []).append((entry_id, item))
+                for url, items in new_items.items():
+                    self.store.save_items(url, items, fingerprints)
+                # Each story counts once towards the asset aggregates
+                self.aggregates.add_items(
+                    item
+                    for items in new_items.values()
+                    for entry_id, item in items
+                    if item.cluster_id in (None, entry_id)
+                )
+            fresh.update(stored)
+
+        results = []
+        for update in updates:
+            if update.items is not None:
+                results.append(update.items)
+                continue
+            results.append([
+                update.known.get(entry_id) or fresh[entry_id]
+                for entry_id in update.entry_ids
+                if entry_id in update.known or entry_id in fresh
+            ])
+            if self.store is not None:
+                self.store.save_feed_state(update.url, update.etag, update.last_modified)
+            logger.debug(
+                f"{update.source}: {len(update.new)} new of {len(update.entry_ids)} entries"
             )
+        return results
+
+    @staticmethod
+    def _entry_id(entry) -> str:
+        """Stable identity of a feed entry: its GUID, else its link, else its title."""
+        return entry.get("id") or entry.get("link") or entry.get("title", "")
+
+    def _process_entry(self, entry, source: str) -> Optional[NewsItem]:
+        """
+        Process a single feed entry into a NewsItem.
+
+        Args:
+            entry: Feed entry object
+            source: News source name
 
-            return news_item
+        Returns:
+            NewsItem object or None if processing fails
+        """
+        return self._build_items([(source, entry)])[0][0]
 
+    def _build_items(
+        self,
+        entries: List[Tuple[str, Dict]],
+        entry_ids: Optional[List[str]] = None
+    ) -> Tuple[List[Optional[NewsItem]], Dict[str, Fingerprint]]:
+        """
+        Process feed entries, scoring the sentiment of all new stories in one batch.
+
+        Args:
+            entries: (source name, feed entry) pairs
+            entry_ids: Their entry ids (derived from the entries if omitted)
+
+        Returns:
+            One NewsItem per entry (None where processing failed), and the
+            MinHash fingerprints of the items by entry id
+        """
+        if entry_ids is None:
+            entry_ids = [self._entry_id(entry) for _, entry in entries]
+        fields = []
+        for entry_id, (source, entry) in zip(entry_ids, entries):
+            try:
+                # Extract basic fields with safe defaults
+                title = sanitize_text(getattr(entry, 'title', 'No Title'))
+                link = getattr(entry, 'link', '#')
+                summary = sanitize_text(
+                    getattr(entry, 'summary', getattr(entry, 'description', ''))
+                )
+
+                # Publication time, if the feed provides one
+                parsed = getattr(entry, "published_parsed", None) or getattr(
+                    entry, "updated_parsed", None
+                )
+                published_at = datetime(*parsed[:6], tzinfo=timezone.utc) if parsed else None
+
+                fields.append((source, entry_id, title, link, summary, published_at))
+            except Exception as e:
+                logger.error(f"Error processing news entry: {e}")
+                fields.append(None)
+
+        # Combine title and summary for analysis
+        valid = [f for f in fields if f is not None]
+        texts = [f"{f[2]} {f[4]}" for f in valid]
+
+        # Near-duplicates of known stories take over the story's score
+        clustered = self.clusterer.cluster([f[1] for f in valid], texts)
+        unscored = [
+            text for text, fp in zip(texts, clustered) if fp is None or fp.sentiment_score is None
+        ]
+        try:
+            scores = iter(self.sentiment.score_many(unscored))
         except Exception as e:
-            logger.error(f"Error processing news entry: {e}")
-            return None
+            logger.error(f"Error analyzing sentiment: {e}")
+            scores = iter([0.0] * len(unscored))
+        fingerprints = {fp.entry_id: fp for fp in clustered if fp is not None}
+
+        items: List[Optional[NewsItem]] = []
+        details = iter(zip(texts, clustered))
+        for f in fields:
+            if f is None:
+                items.append(None)
+                continue
+            source, entry_id, title, link, summary, published_at = f
+            text, fingerprint = next(details)
+            if fingerprint is not None and fingerprint.sentiment_score is not None:
+                compound = fingerprint.sentiment_score
+            else:
+                compound = next(scores)
+            try:
+                items.append(NewsItem(
+                    source=source,
+                    title=title,
+                    link=link,
+                    summary=summary,
+                    sentiment=classify_sentiment(compound),
+                    sentiment_score=compound,
+                    assets=self.asset_detector.detect(text),
+                    published_at=published_at,
+                    cluster_id=fingerprint.cluster_id if fingerprint else None
+                ))
+            except Exception as e:
+                logger.error(f"Error processing news entry: {e}")
+                items.append(None)
+        return items, fingerprints
+
+    def _collapse(self, items: List[NewsItem]) -> List[NewsItem]:
+        """
+        Keep the first item of every story and list the other sources that ran it.
+
+        Args:
+            items: News items of a refresh
+
+        Returns:
+            One NewsItem per story cluster
+        """
+        stories: Dict[str, NewsItem] = {}
+        sources: Dict[str, List[str]] = {}
+        for item in items:
+            key = item.cluster_id or item.link
+            stories.setdefault(key, item)
+            if item.source not in sources.setdefault(key, []):
+                sources[key].append(item.source)
+
+        if self.store is not None:
+            stored = self.store.cluster_sources(
+                item.cluster_id for item in stories.values() if item.cluster_id
+            )
+            for key, names in stored.items():
+                sources[key] = names + [name for name in sources.get(key, []) if name not in names]
+
+        collapsed = []
+        for key, item in stories.items():
+            related = [name for name in sources.get(key, []) if name != item.source]
+            collapsed.append(
+                item.model_copy(update={"related_sources": related}) if related else item
+            )
+        if len(collapsed) < len(items):
+            logger.debug(f"Collapsed {len(items)} items into {len(collapsed)} stories")
+        return collapsed
 
     def fetch_news(self, limit: int = 10) -> List[NewsItem]:
         """
@@ -223,19 +677,15 @@ class NewsClient:
         """
         if limit < 1:
             logger.warning(f"Invalid limit {limit}, using default")
-            limit = news_config.DEFAULT_NEWS_LIMIT
+            limit = api_config.DEFAULT_NEWS_LIMIT
 
-        all_news: List[NewsItem] = []
+        updates: List[_FeedUpdate] = []
 
         for source, url in self.rss_feeds.items():
             try:
-                entries = self._fetch_feed(source, url)
-
-                # Process entries
-                for entry in entries[:limit]:
-                    news_item = self._process_entry(entry, source)
-                    if news_item:
-                        all_news.append(news_item)
+                update = self._fetch_feed(source, url, limit)
+                if update is not None:
+                    updates.append(update)
 
             except NetworkException as e:
                 logger.warning(f"Skipping {source} due to network error: {e.message}")
@@ -245,17 +695,165 @@ class NewsClient:
                 logger.error(f"Unexpected error processing {source}: {e}")
                 continue
 
+        all_news = [item for items in self._finish_feeds(updates) for item in items]
         logger.info(f"Fetched total of {len(all_news)} news items")
+        return self._sort_news(self._collapse(all_news))
+
+    async def fetch_news_async(
+        self, limit: int = 10, deadline: Optional[float] = None
+    ) -> List[NewsItem]:
+        """
+        Fetch news from all configured RSS feeds concurrently.
+
+        Every feed has its own request timeout; feeds that have not finished
+        when the overall deadline passes are cancelled and skipped, so one
+        slow feed cannot hold back the others.
+
+        Args:
+            limit: Maximum number of news items per feed
+            deadline: Seconds allowed for the whole refresh (default: FETCH_DEADLINE)
+
+        Returns:
+            List of NewsItem objects
+        """
+        if limit < 1:
+            logger.warning(f"Invalid limit {limit}, using default")
+            limit = api_config.DEFAULT_NEWS_LIMIT
+        self.scheduler.sync(self.feeds)
+        results = await self._fetch_feeds_async(self.feeds, limit, deadline)
+        all_news = [item for items in results.values() for item in items]
+        logger.info(f"Fetched total of {len(all_news)} news items from {len(self.feeds)} feeds")
+        return self._sort_news(await asyncio.to_thread(self._collapse, all_news))
+
+    async def poll_news_async(
+        self,
+        limit: int = 10,
+        deadline: Optional[float] = None,
+        now: Optional[float] = None
+    ) -> Optional[List[NewsItem]]:
+        """
+        Poll the feeds that are due and combine the latest items of all feeds.
+
+        Args:
+            limit: Maximum number of news items per feed
+            deadline: Seconds allowed for this poll (default: FETCH_DEADLINE)
+            now: Current time (epoch seconds, default: now)
+
+        Returns:
+            The most recent DISPLAY_LIMIT items over all feeds, or None if
+            no feed was due
+        """
+        self.scheduler.sync(self.feeds, now)
+        due = self.scheduler.due(now)
+        if not due:
+            return None
+        await self._fetch_feeds_async(due, limit, deadline)
+
+        urls = {feed.url for feed in self.feeds}
+        combined = [item for url, items in self._latest.items() if url in urls for item in items]
+        oldest = datetime.min.replace(tzinfo=timezone.utc)
+        combined.sort(key=lambda item: item.published_at or oldest, reverse=True)
+        collapsed = await asyncio.to_thread(self._collapse, combined)
+        logger.info(f"Polled {len(due)} due feeds of {len(self.feeds)}")
+        return self._sort_news(collapsed[:news_config.DISPLAY_LIMIT])
+
+    async def _fetch_feeds_async(
+        self,
+        feeds: List[FeedSpec],
+        limit: int,
+        deadline: Optional[float] = None
+    ) -> Dict[str, List[NewsItem]]:
+        """
+        Fetch feeds concurrently and report the outcome of each to the scheduler.
+
+        At most MAX_CONCURRENT_FEEDS are fetched at a time. The new entries
+        of all feeds that arrived are processed in one batch at the end.
 
-        # Sort by sentiment (Bullish first, then Bearish, then Neutral)
+        Args:
+            feeds: Feeds to fetch
+            limit: Maximum number of news items per feed
+            deadline: Seconds allowed for all of them (default: FETCH_DEADLINE)
+
+        Returns:
+            Dictionary mapping the URL of every feed that succeeded to its items
+        """
+        deadline = news_config.FETCH_DEADLINE if deadline is None else deadline
+        semaphore = asyncio.Semaphore(news_config.MAX_CONCURRENT_FEEDS)
+        started = set()
+
+        async def fetch(feed: FeedSpec) -> _FeedUpdate:
+            async with semaphore:
+                started.add(feed.url)
+                return await self._fetch_feed_async(client, feed.name, feed.url, limit)
+
+        updates: Dict[str, Tuple[FeedSpec, _FeedUpdate]] = {}
+        async with self._create_async_client() as client:
+            tasks = {asyncio.ensure_future(fetch(feed)): feed for feed in feeds}
+            pending = set(tasks)
+            stop = time.monotonic() + deadline
+            while pending:
+                remaining = stop - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    feed = tasks[task]
+                    try:
+                        updates[feed.url] = (feed, task.result())
+                    except NetworkException as e:
+                        logger.warning(f"Skipping {feed.name} due to network error: {e.message}")
+                        self.scheduler.record_failure(feed.url)
+                    except Exception as e:
+                        logger.error(f"Unexpected error processing {feed.name}: {e}")
+                        self.scheduler.record_failure(feed.url)
+
+            for task in pending:
+                feed = tasks[task]
+                if feed.url in started:
+                    # Feeds still queued behind the limit stay due for the next poll
+                    logger.warning(f"Skipping {feed.name}: no response within {deadline:g}s")
+                    self.scheduler.record_failure(feed.url)
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        try:
+            processed = await asyncio.to_thread(
+                self._finish_feeds, [update for _, update in updates.values()]
+            )
+        except Exception as e:
+            logger.error(f"Unexpected error processing news: {e}")
+            for url in updates:
+                self.scheduler.record_failure(url)
+            return {}
+
+        results: Dict[str, List[NewsItem]] = {}
+        for (feed, _), items in zip(updates.values(), processed):
+            known = {item.link for item in self._latest.get(feed.url, ())}
+            self.scheduler.record_success(
+                feed.url, sum(1 for item in items if item.link not in known)
+            )
+            self._latest[feed.url] = items
+            results[feed.url] = items
+        return results
+
+    def _create_async_client(self) -> httpx.AsyncClient:
+        """HTTP client shared by the feeds of one refresh."""
+        limits = httpx.Limits(max_connections=news_config.MAX_CONNECTIONS)
+        return httpx.AsyncClient(timeout=self.timeout, limits=limits, follow_redirects=True)
+
+    @staticmethod
+    def _sort_news(items: List[NewsItem]) -> List[NewsItem]:
+        """Sort by sentiment (Bullish first, then Bearish, then Neutral)."""
         sentiment_order = {
             SentimentType.BULLISH: 0,
             SentimentType.BEARISH: 1,
             SentimentType.NEUTRAL: 2
         }
-        all_news.sort(key=lambda x: sentiment_order.get(x.sentiment, 3))
-
-        return all_news
+        items.sort(key=lambda x: sentiment_order.get(x.sentiment, 3))
+        return items
 
 
 # Singleton instance for easy import
@@ -271,5 +869,7 @@ def get_news_client() -> NewsClient:
     """
     global _news_client_instance
     if _news_client_instance is None:
-        _news_client_instance = NewsClient()
+        store = NewsStore()
+        store.compact()
+        _news_client_instance = NewsClient(store=store)
     return _news_client_instance
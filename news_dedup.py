@@ -0,0 +1,179 @@
+"""
+Near-duplicate news detection for TerminalCoin.
+
+Syndicated or lightly rewritten stories are grouped into clusters with
+MinHash signatures over word shingles of the title and summary. Signatures
+are split into bands whose hashes are indexed (locality-sensitive hashing),
+so a new item is only compared with the stored items that share a band
+with it, not with the whole corpus.
+
+With ``b`` bands of ``r`` rows, two items of Jaccard similarity ``s``
+become candidates with probability ``1 - (1 - s^r)^b``; the defaults
+(16 x 4) make that an S-curve around 0.5. Candidates are confirmed by the
+similarity their full signatures estimate.
+"""
+
+import hashlib
+import re
+import zlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from config import news_config
+from exceptions import ValidationException
+from logger import get_logger
+
+if TYPE_CHECKING:
+    from news_store import NewsStore
+
+logger = get_logger(__name__)
+
+SHINGLE_SIZE = 3
+# Universal hashing modulo a Mersenne prime; with 32-bit shingle hashes the
+# products stay below 2**63, so uint64 arithmetic doesn't overflow
+_PRIME = (1 << 31) - 1
+_SEED = 20240601  # fixed: signatures are stored and compared across runs
+
+_WORD = re.compile(r"\w+")
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> np.ndarray:
+    """Hashes of the distinct word ``size``-grams of ``text`` (its words if shorter)."""
+    words = _WORD.findall(text.lower())
+    grams = (
+        {" ".join(words[i : i + size]) for i in range(max(len(words) - size + 1, 1))}
+        if words
+        else set()
+    )
+    return np.fromiter(
+        (zlib.crc32(gram.encode("utf-8")) for gram in grams), dtype=np.uint64, count=len(grams)
+    )
+
+
+@dataclass
+class Fingerprint:
+    """MinHash fingerprint of a news item and the cluster it was put in."""
+    entry_id: str
+    signature: np.ndarray                   # uint32 MinHash values
+    keys: List[int]                         # one LSH bucket key per band
+    cluster_id: str                         # entry_id of the cluster's first item
+    sentiment_score: Optional[float] = None  # compound of the matched item, if any
+
+    @property
+    def duplicate(self) -> bool:
+        """Whether the item joined an existing cluster."""
+        return self.cluster_id != self.entry_id
+
+
+class StoryClusterer:
+    """Assigns news items to clusters of near-identical stories."""
+
+    def __init__(
+        self,
+        store: Optional["NewsStore"] = None,
+        permutations: int = news_config.DEDUP_PERMUTATIONS,
+        bands: int = news_config.DEDUP_BANDS,
+        threshold: float = news_config.DEDUP_THRESHOLD
+    ):
+        """
+        Initialize the clusterer.
+
+        Args:
+            store: News store holding the fingerprints of earlier items
+                (without one, only items of the same batch are compared)
+            permutations: MinHash signature length
+            bands: LSH bands (must divide ``permutations``)
+            threshold: Minimum estimated Jaccard similarity of duplicates
+        """
+        if permutations % bands:
+            raise ValidationException(
+                "MinHash permutations must be a multiple of the LSH bands",
+                details={"permutations": permutations, "bands": bands}
+            )
+        self.store = store
+        self.bands = bands
+        self.rows = permutations // bands
+        self.threshold = threshold
+        rng = np.random.default_rng(_SEED)
+        self._a = rng.integers(1, _PRIME, size=(permutations, 1), dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, size=(permutations, 1), dtype=np.uint64)
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash signature of ``text`` (None if it has no words)."""
+        hashes = shingles(text)
+        if not hashes.size:
+            return None
+        return ((self._a * hashes + self._b) % _PRIME).min(axis=1).astype(np.uint32)
+
+    def band_keys(self, signature: np.ndarray) -> List[int]:
+        """Bucket key of every band (signed 64-bit, as SQLite stores integers)."""
+        keys = []
+        for band, rows in enumerate(signature.reshape(self.bands, self.rows)):
+            digest = hashlib.blake2b(
+                rows.tobytes(), digest_size=8, salt=band.to_bytes(2, "little")
+            ).digest()
+            keys.append(int.from_bytes(digest, "little", signed=True))
+        return keys
+
+    def cluster(
+        self, entry_ids: Sequence[str], texts: Sequence[str]
+    ) -> List[Optional[Fingerprint]]:
+        """
+        Fingerprint new items and find the cluster of each.
+
+        An item joins the cluster of its most similar stored (or earlier
+        batch) item if their estimated similarity reaches the threshold;
+        otherwise it starts a cluster of its own.
+
+        Args:
+            entry_ids: Entry ids of the new items
+            texts: Their title and summary
+
+        Returns:
+            One Fingerprint per item (None for items without words)
+        """
+        # Fingerprints of this batch by bucket key, for duplicates within it
+        batch: Dict[int, List[Fingerprint]] = {}
+        fingerprints: List[Optional[Fingerprint]] = []
+        for entry_id, text in zip(entry_ids, texts):
+            signature = self.signature(text)
+            if signature is None:
+                fingerprints.append(None)
+                continue
+            keys = self.band_keys(signature)
+            fingerprint = Fingerprint(entry_id, signature, keys, entry_id)
+
+            candidates = []
+            if self.store is not None:
+                candidates = [
+                    Fingerprint(
+                        row_id, np.frombuffer(blob, dtype=np.uint32), [], cluster_id, compound
+                    )
+                    for row_id, cluster_id, compound, blob in self.store.find_fingerprints(keys)
+                ]
+            seen = set()
+            for key in keys:
+                for other in batch.get(key, ()):
+                    if other.entry_id not in seen:
+                        seen.add(other.entry_id)
+                        candidates.append(other)
+
+            best, best_similarity = None, self.threshold
+            for other in candidates:
+                similarity = float(np.mean(other.signature == signature))
+                if similarity >= best_similarity:
+                    best, best_similarity = other, similarity
+            if best is not None:
+                fingerprint.cluster_id = best.cluster_id
+                fingerprint.sentiment_score = best.sentiment_score
+
+            for key in keys:
+                batch.setdefault(key, []).append(fingerprint)
+            fingerprints.append(fingerprint)
+
+        duplicates = sum(1 for fingerprint in fingerprints if fingerprint and fingerprint.duplicate)
+        if duplicates:
+            logger.debug(f"{duplicates} of {len(fingerprints)} new items repeat known stories")
+        return fingerprints
@@ -0,0 +1,472 @@
+"""
+News store for TerminalCoin.
+
+Keeps processed news items (keyed by the feed entry's GUID or link) and the
+HTTP validators (ETag / Last-Modified) of every feed in a local SQLite
+file. Feeds are requested conditionally, an unchanged feed is answered from
+the store, and only entries never seen before are analyzed. It also
+persists the sentiment service's score cache.
+
+Every stored item is indexed by an FTS5 table over its title, summary and
+assets, so months of headlines can be searched without fetching anything.
+Items also keep their MinHash fingerprint and story cluster, with the LSH
+band keys indexed for near-duplicate lookups (see news_dedup).
+"""
+
+import json
+import re
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from config import news_config
+from database import ConnectionManager
+from logger import get_logger
+from models import NewsItem, SentimentType
+
+if TYPE_CHECKING:
+    from news_dedup import Fingerprint
+
+logger = get_logger(__name__)
+
+ITEM_COLUMNS = (
+    "entry_id, source, title, link, summary, sentiment, compound, assets, published_at, cluster_id"
+)
+# Columns added after the first release of the store
+ADDED_COLUMNS = (("compound", "REAL"), ("cluster_id", "TEXT"), ("signature", "BLOB"))
+
+
+class NewsStore:
+    """Persistent cache of processed feed entries and feed validators."""
+
+    def __init__(self, path: str = news_config.STORE_FILE):
+        """
+        Initialize the store, creating the file if needed.
+
+        Args:
+            path: SQLite file path (or ':memory:')
+        """
+        self.path = path
+        self._connections = ConnectionManager(path)
+        with self._connections.connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS feed_state (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    checked_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS news_items (
+                    entry_id TEXT PRIMARY KEY,  -- feed GUID, or the link if there is none
+                    feed_url TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    link TEXT NOT NULL,
+                    summary TEXT NOT NULL,
+                    sentiment TEXT NOT NULL,
+                    compound REAL,  -- VADER compound score
+                    assets TEXT NOT NULL,  -- JSON list of symbols
+                    published_at TEXT,  -- ISO 8601 (UTC) if the feed has one
+                    fetched_at REAL NOT NULL,
+                    cluster_id TEXT,  -- entry_id of the first item of the same story
+                    signature BLOB  -- MinHash signature (uint32 array)
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_news_items_feed
+                ON news_items (feed_url, published_at)
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_news_items_fetched ON news_items (fetched_at)"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(news_items)")}
+            for name, kind in ADDED_COLUMNS:
+                if name not in columns:
+                    conn.execute(f"ALTER TABLE news_items ADD COLUMN {name} {kind}")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_news_items_cluster ON news_items (cluster_id)"
+            )
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS news_lsh (
+                    bucket INTEGER NOT NULL,  -- hash of one band of the signature
+                    entry_id TEXT NOT NULL,
+                    PRIMARY KEY (bucket, entry_id)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sentiment_cache (
+                    hash TEXT PRIMARY KEY,  -- blake2b of the scored text
+                    compound REAL NOT NULL,
+                    scored_at REAL NOT NULL
+                )
+            """)
+            self._create_search_index(conn)
+
+    @staticmethod
+    def _create_search_index(conn) -> None:
+        """Full-text index over news_items, kept in sync by triggers."""
+        exists = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'news_fts'").fetchone()
+        # External content: the index stores no copy of the text. Rows are
+        # matched by rowid, which is why items are never REPLACEd or VACUUMed.
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5(
+                title, summary, assets, content='news_items', content_rowid='rowid'
+            )
+        """)
+        conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS news_fts_vocab USING fts5vocab(news_fts, 'col')"
+        )
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS news_items_fts_insert AFTER INSERT ON news_items BEGIN
+                INSERT INTO news_fts (rowid, title, summary, assets)
+                VALUES (new.rowid, new.title, new.summary, new.assets);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS news_items_fts_delete AFTER DELETE ON news_items BEGIN
+                INSERT INTO news_fts (news_fts, rowid, title, summary, assets)
+                VALUES ('delete', old.rowid, old.title, old.summary, old.assets);
+            END
+        """)
+        if not exists:
+            # Index items stored before search existed
+            conn.execute("INSERT INTO news_fts (news_fts) VALUES ('rebuild')")
+
+    def close(self) -> None:
+        """Close all connections."""
+        self._connections.close_all()
+
+    def get_feed_state(self, url: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Validators from the last successful download of a feed.
+
+        Returns:
+            (etag, last_modified), both None if the feed was never fetched
+        """
+        with self._connections.connection() as conn:
+            row = conn.execute(
+                "SELECT etag, last_modified FROM feed_state WHERE url = ?", (url,)
+            ).fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+    def save_feed_state(self, url: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+        """Remember a feed's validators for the next conditional request."""
+        with self._connections.connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO feed_state (url, etag, last_modified, checked_at) "
+                "VALUES (?, ?, ?, ?)",
+                (url, etag, last_modified, time.time()),
+            )
+
+    @staticmethod
+    def _to_item(row) -> NewsItem:
+        """Rebuild a NewsItem from a stored row."""
+        return NewsItem(
+            source=row["source"],
+            title=row["title"],
+            link=row["link"],
+            summary=row["summary"],
+            sentiment=row["sentiment"],
+            sentiment_score=row["compound"],
+            assets=json.loads(row["assets"]),
+            published_at=row["published_at"],
+            cluster_id=row["cluster_id"],
+        )
+
+    def get_items(self, entry_ids: Iterable[str]) -> Dict[str, NewsItem]:
+        """
+        Look up processed entries.
+
+        Args:
+            entry_ids: Entry GUIDs/links
+
+        Returns:
+            Dictionary mapping the known entry ids to their NewsItem
+        """
+        entry_ids = list(entry_ids)
+        if not entry_ids:
+            return {}
+        placeholders = ",".join("?" * len(entry_ids))
+        with self._connections.connection() as conn:
+            rows = conn.execute(
+                f"SELECT {ITEM_COLUMNS} FROM news_items WHERE entry_id IN ({placeholders})",
+                entry_ids,
+            ).fetchall()
+        return {row["entry_id"]: self._to_item(row) for row in rows}
+
+    def get_feed_items(self, feed_url: str, limit: int) -> List[NewsItem]:
+        """
+        Latest stored items of a feed (for feeds that didn't change).
+
+        Args:
+            feed_url: Feed URL
+            limit: Maximum number of items
+
+        Returns:
+            NewsItems, newest first
+        """
+        with self._connections.connection() as conn:
+            rows = conn.execute(
+                f"SELECT {ITEM_COLUMNS} FROM news_items WHERE feed_url = ? "
+                "ORDER BY published_at IS NULL, published_at DESC, fetched_at DESC LIMIT ?",
+                (feed_url, limit)
+            ).fetchall()
+        return [self._to_item(row) for row in rows]
+
+    def save_items(
+        self,
+        feed_url: str,
+        items: Iterable[Tuple[str, NewsItem]],
+        fingerprints: Optional[Dict[str, "Fingerprint"]] = None
+    ) -> None:
+        """
+        Store newly processed entries.
+
+        Args:
+            feed_url: Feed the entries came from
+            items: (entry_id, NewsItem) pairs
+            fingerprints: MinHash fingerprints by entry_id, for near-duplicate lookups
+        """
+        now = time.time()
+        fingerprints = fingerprints or {}
+        # Oldest first, so that newer items get higher rowids (search order)
+        items = sorted(
+            items, key=lambda pair: pair[1].published_at.timestamp() if pair[1].published_at else 0
+        )
+        rows = []
+        buckets = []
+        for entry_id, item in items:
+            fingerprint = fingerprints.get(entry_id)
+            rows.append((
+                entry_id, feed_url, item.source, item.title, item.link, item.summary,
+                item.sentiment.value, item.sentiment_score, json.dumps(sorted(item.assets)),
+                item.published_at.isoformat() if item.published_at else None, now,
+                item.cluster_id, fingerprint.signature.tobytes() if fingerprint else None,
+            ))
+            if fingerprint:
+                buckets.extend((key, entry_id) for key in fingerprint.keys)
+        if not rows:
+            return
+        with self._connections.connection() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO news_items (entry_id, feed_url, source, title, link, "
+                "summary, sentiment, compound, assets, published_at, fetched_at, cluster_id, "
+                "signature) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO news_lsh (bucket, entry_id) VALUES (?, ?)", buckets
+            )
+        logger.debug(f"Stored {len(rows)} new items from {feed_url}")
+
+    def find_fingerprints(
+        self, keys: Sequence[int]
+    ) -> List[Tuple[str, str, Optional[float], bytes]]:
+        """
+        Stored items sharing at least one LSH bucket.
+
+        Args:
+            keys: Band keys of a signature
+
+        Returns:
+            (entry_id, cluster_id, compound, signature) of each candidate
+        """
+        if not keys:
+            return []
+        placeholders = ",".join("?" * len(keys))
+        with self._connections.connection() as conn:
+            rows = conn.execute(
+                "SELECT entry_id, cluster_id, compound, signature FROM news_items "
+                "WHERE entry_id IN "
+                f"(SELECT entry_id FROM news_lsh WHERE bucket IN ({placeholders})) "
+                "AND signature IS NOT NULL",
+                list(keys),
+            ).fetchall()
+        return [(row[0], row[1] or row[0], row[2], row[3]) for row in rows]
+
+    def cluster_sources(self, cluster_ids: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Sources that ran each story.
+
+        Args:
+            cluster_ids: Story cluster ids
+
+        Returns:
+            Dictionary mapping cluster_id to its sources, most items first
+        """
+        cluster_ids = list(set(cluster_ids))
+        if not cluster_ids:
+            return {}
+        placeholders = ",".join("?" * len(cluster_ids))
+        with self._connections.connection() as conn:
+            rows = conn.execute(
+                "SELECT cluster_id, source, COUNT(*) AS items FROM news_items "
+                f"WHERE cluster_id IN ({placeholders}) "
+                "GROUP BY cluster_id, source ORDER BY cluster_id, items DESC, source",
+                cluster_ids,
+            ).fetchall()
+        sources: Dict[str, List[str]] = {}
+        for row in rows:
+            sources.setdefault(row[0], []).append(row[1])
+        return sources
+
+    def search(
+        self,
+        query: str = "",
+        asset: Optional[str] = None,
+        limit: int = news_config.SEARCH_LIMIT
+    ) -> List[NewsItem]:
+        """
+        Search all stored news.
+
+        Every word of ``query`` must appear in the title or summary (as a
+        word prefix, case-insensitive).
+
+        Args:
+            query: Words to search for (empty matches everything)
+            asset: Only items mentioning this symbol, e.g. 'BTC'
+            limit: Maximum number of items
+
+        Returns:
+            Matching NewsItems, most recently stored first
+        """
+        terms = [f'"{word}"*' for word in re.findall(r"\w+", query)]
+        if terms:
+            terms = ["{title summary}: (" + " ".join(terms) + ")"]
+        if asset:
+            terms += [f'assets: "{word}"' for word in re.findall(r"\w+", asset)]
+
+        with self._connections.connection() as conn:
+            if terms:
+                rows = conn.execute(
+                    f"SELECT {ITEM_COLUMNS} FROM news_items WHERE rowid IN "
+                    "(SELECT rowid FROM news_fts WHERE news_fts MATCH ? "
+                    "ORDER BY rowid DESC LIMIT ?) "
+                    "ORDER BY rowid DESC",
+                    (" AND ".join(terms), limit),
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    f"SELECT {ITEM_COLUMNS} FROM news_items ORDER BY rowid DESC LIMIT ?", (limit,)
+                ).fetchall()
+        return [self._to_item(row) for row in rows]
+
+    def top_assets(self, limit: int = 50) -> List[Tuple[str, int]]:
+        """
+        Symbols mentioned by the most stored items.
+
+        Returns:
+            (symbol, item count) pairs, most mentioned first
+        """
+        with self._connections.connection() as conn:
+            rows = conn.execute(
+                "SELECT term, doc FROM news_fts_vocab WHERE col = 'assets' "
+                "ORDER BY doc DESC, term LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [(row[0].upper(), row[1]) for row in rows]
+
+    def get_recent_sentiment(
+        self, since: float
+    ) -> List[Tuple[List[str], float, SentimentType, float]]:
+        """
+        Scored stories stored since ``since`` that mention assets (one per cluster).
+
+        Args:
+            since: Epoch seconds
+
+        Returns:
+            (assets, compound, sentiment, timestamp) tuples, where the
+            timestamp is the publication time if known, else the fetch time
+        """
+        with self._connections.connection() as conn:
+            rows = conn.execute(
+                "SELECT assets, compound, sentiment, published_at, fetched_at FROM news_items "
+                "WHERE fetched_at >= ? AND compound IS NOT NULL AND assets != '[]' "
+                "AND (cluster_id IS NULL OR cluster_id = entry_id)",
+                (since,)
+            ).fetchall()
+        stories = []
+        for row in rows:
+            timestamp = row["fetched_at"]
+            if row["published_at"]:
+                timestamp = min(timestamp, datetime.fromisoformat(row["published_at"]).timestamp())
+            stories.append(
+                (
+                    json.loads(row["assets"]),
+                    row["compound"],
+                    SentimentType(row["sentiment"]),
+                    timestamp,
+                )
+            )
+        return stories
+
+    def compact(self, retention_days: int = news_config.RETENTION_DAYS) -> int:
+        """
+        Delete items stored more than ``retention_days`` ago and merge the search index.
+
+        Freed pages are reused by later inserts, so the file stops growing
+        once retention kicks in; it isn't VACUUMed because that may renumber
+        the rowids the search index refers to.
+
+        Returns:
+            Number of deleted items
+        """
+        cutoff = time.time() - retention_days * 86400
+        with self._connections.connection() as conn:
+            deleted = conn.execute(
+                "DELETE FROM news_items WHERE fetched_at < ?", (cutoff,)
+            ).rowcount
+            if deleted:
+                conn.execute(
+                    "DELETE FROM news_lsh WHERE entry_id NOT IN (SELECT entry_id FROM news_items)"
+                )
+            conn.execute("DELETE FROM feed_state WHERE checked_at < ?", (cutoff,))
+            conn.execute("INSERT INTO news_fts (news_fts) VALUES ('optimize')")
+        if deleted:
+            logger.info(f"Removed {deleted} news items older than {retention_days} days")
+        return deleted
+
+    def load_sentiment_cache(self, limit: int) -> List[Tuple[str, float]]:
+        """
+        Most recently scored texts, dropping older ones beyond ``limit``.
+
+        Args:
+            limit: Maximum number of scores to keep
+
+        Returns:
+            (hash, compound) pairs, newest first
+        """
+        with self._connections.connection() as conn:
+            rows = conn.execute(
+                "SELECT hash, compound FROM sentiment_cache ORDER BY scored_at DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+            if len(rows) == limit:
+                conn.execute(
+                    "DELETE FROM sentiment_cache WHERE hash NOT IN "
+                    "(SELECT hash FROM sentiment_cache ORDER BY scored_at DESC LIMIT ?)",
+                    (limit,)
+                )
+        return [(row[0], row[1]) for row in rows]
+
+    def save_sentiment_scores(self, scores: Iterable[Tuple[str, float]]) -> None:
+        """
+        Persist newly computed sentiment scores.
+
+        Args:
+            scores: (hash, compound) pairs
+        """
+        now = time.time()
+        rows = [(key, compound, now) for key, compound in scores]
+        if not rows:
+            return
+        with self._connections.connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO sentiment_cache (hash, compound, scored_at) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
@@ -5,13 +5,23 @@ Handles business logic for portfolio tracking, P&L calculations,
 and interaction with the database.
 """
 
-from typing import List, Dict, Any, Optional
+import asyncio
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
+from datetime import datetime
 
-from database import Database
+from database import Database, DEFAULT_PORTFOLIO_ID
+from async_database import AsyncDatabase
 from api_client import CoinGeckoClient
+from transaction_importer import TransactionImporter, ImportResult
+from tax_lots import CostBasisMethod, LotSummary, LotTracker
 from logger import get_logger
 
+if TYPE_CHECKING:
+    from monte_carlo import SimulationResult
+    from risk_analytics import RiskModel, RiskReport
+    from valuation_engine import PortfolioValuation, PositionValuation, ValuationEngine
+
 logger = get_logger(__name__)
 
 
@@ -26,6 +36,17 @@ class PortfolioItem:
     current_value: float = 0.0
     pnl: float = 0.0
     pnl_percent: float = 0.0
+    weight: float = 0.0  # share of the portfolio's value
+
+
+@dataclass
+class PortfolioChanges:
+    """Holdings of one portfolio that changed since a given valuation tick."""
+    tick: int                  # pass back as ``since`` on the next call
+    reset: bool                # True: ``items`` is the full portfolio, not a delta
+    items: List[PortfolioItem]
+    total_value: float
+    total_cost: float
 
 
 class PortfolioManager:
@@ -34,9 +55,42 @@ class PortfolioManager:
     def __init__(self, db: Database = None):
         """Initialize portfolio manager."""
         self.db = db or Database()
+        # Non-blocking access for the UI; shares the same database
+        self.async_db = AsyncDatabase(self.db)
+        self._nav_engine = None  # created on first use (imports pandas)
+        self._valuation_engine = None  # created on first use (imports numpy)
+        self._risk_model = None  # created on first use (imports numpy)
         logger.info("Portfolio Manager initialized")
 
-    def add_transaction(self, coin_id: str, symbol: str, type: str, amount: float, price: float) -> bool:
+    def close(self) -> None:
+        """Flush queued writes and close the database."""
+        self.async_db.close()
+
+    def create_portfolio(self, name: str) -> int:
+        """
+        Create a named portfolio (sub-account).
+
+        Returns:
+            New portfolio id
+
+        Raises:
+            ValidationException: If the name is empty or already taken
+        """
+        return self.db.create_portfolio(name)
+
+    def get_portfolios(self) -> List[Dict[str, Any]]:
+        """Get all portfolios (id, name, created_at)."""
+        return self.db.get_portfolios()
+
+    def add_transaction(
+        self,
+        coin_id: str,
+        symbol: str,
+        type: str,
+        amount: float,
+        price: float,
+        portfolio_id: int = DEFAULT_PORTFOLIO_ID
+    ) -> bool:
         """
         Add a new transaction (Buy/Sell).
 
@@ -46,6 +100,7 @@ class PortfolioManager:
             type: 'BUY' or 'SELL'
             amount: Amount of coins
             price: Price per coin in USD
+            portfolio_id: Portfolio to record the transaction in
 
         Returns:
             True if successful, False otherwise
@@ -56,56 +111,452 @@ class PortfolioManager:
                 symbol=symbol.upper(),
                 type=type.upper(),
                 amount=amount,
-                price=price
+                price=price,
+                portfolio_id=portfolio_id
             )
             return True
         except Exception as e:
             logger.error(f"Failed to add transaction: {e}")
             return False
 
-    def get_portfolio_summary(self, current_prices: Dict[str, float]) -> List[PortfolioItem]:
+    async def add_transaction_async(
+        self,
+        coin_id: str,
+        symbol: str,
+        type: str,
+        amount: float,
+        price: float,
+        portfolio_id: int = DEFAULT_PORTFOLIO_ID
+    ) -> bool:
+        """
+        Add a transaction without blocking the event loop.
+
+        Writes issued close together are committed as one batch.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            await self.async_db.add_transaction(
+                coin_id=coin_id,
+                symbol=symbol.upper(),
+                type=type.upper(),
+                amount=amount,
+                price=price,
+                portfolio_id=portfolio_id
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to add transaction: {e}")
+            return False
+
+    def import_transactions(
+        self,
+        path: str,
+        format_name: Optional[str] = None,
+        coin_ids: Optional[Dict[str, str]] = None,
+        portfolio_id: int = DEFAULT_PORTFOLIO_ID
+    ) -> ImportResult:
+        """
+        Bulk import an exchange export (CSV/JSON) in a single transaction.
+
+        Args:
+            path: Export file path
+            format_name: Optional explicit format ('binance', 'coinbase', 'kraken', 'generic')
+            coin_ids: Optional symbol -> coin_id mapping for unknown symbols
+            portfolio_id: Portfolio to import into
+
+        Returns:
+            ImportResult with imported/skipped counts
+
+        Raises:
+            TerminalCoinException: If the file format cannot be recognized
+        """
+        importer = TransactionImporter(coin_ids)
+        imported = self.db.bulk_import_transactions(
+            (fill.as_row() for fill in importer.iter_fills(path, format_name)),
+            portfolio_id
+        )
+        result = ImportResult(
+            format=importer.format_name, imported=imported, skipped=importer.skipped
+        )
+        logger.info(
+            f"Imported {result.imported} transactions from {path} ({result.skipped} skipped)"
+        )
+        return result
+
+    def get_portfolio_summary(
+        self,
+        current_prices: Dict[str, float],
+        portfolio_id: int = DEFAULT_PORTFOLIO_ID
+    ) -> List[PortfolioItem]:
         """
         Get portfolio holdings with calculated P&L based on current prices.
 
         Args:
             current_prices: Dictionary mapping coin_id to current price
+            portfolio_id: Portfolio to report
 
         Returns:
             List of PortfolioItem objects
         """
-        holdings = self.db.get_holdings()
-        summary = []
+        engine = self._sync_valuation_engine()
+        engine.update_prices(current_prices)
+        return self._build_summary(engine.positions(portfolio_id))
 
-        for holding in holdings:
-            coin_id = holding['coin_id']
-            amount = holding['amount']
-            avg_price = holding['average_buy_price']
+    async def get_portfolio_summary_async(
+        self,
+        current_prices: Dict[str, float],
+        portfolio_id: int = DEFAULT_PORTFOLIO_ID
+    ) -> List[PortfolioItem]:
+        """
+        Get portfolio holdings with P&L, reading the database off the event loop.
 
-            # Get current price (default to buy price if not available to avoid scary numbers)
-            current_price = current_prices.get(coin_id, avg_price)
+        Args:
+            current_prices: Dictionary mapping coin_id to current price
+            portfolio_id: Portfolio to report
 
-            # Calculate metrics
-            current_value = amount * current_price
-            cost_basis = amount * avg_price
-            pnl = current_value - cost_basis
+        Returns:
+            List of PortfolioItem objects
+        """
+        engine = await self.async_db.run(self._sync_valuation_engine)
+        engine.update_prices(current_prices)
+        return self._build_summary(engine.positions(portfolio_id))
+
+    def get_portfolio_changes(
+        self,
+        current_prices: Dict[str, float],
+        portfolio_id: int = DEFAULT_PORTFOLIO_ID,
+        since: Optional[int] = None
+    ) -> PortfolioChanges:
+        """
+        Apply a price tick and return only the holdings it changed.
+
+        Holdings are reread only after new transactions; otherwise just the
+        positions of coins whose price moved are revalued and returned.
 
-            pnl_percent = 0.0
-            if cost_basis > 0:
-                pnl_percent = (pnl / cost_basis) * 100
+        Args:
+            current_prices: Dictionary mapping coin_id to current price
+            portfolio_id: Portfolio to report
+            since: Tick returned by the previous call for this portfolio
+                   (None for the full portfolio)
 
-            item = PortfolioItem(
+        Returns:
+            PortfolioChanges with the changed items and the portfolio totals
+        """
+        return self._collect_changes(
+            self._sync_valuation_engine(), current_prices, portfolio_id, since
+        )
+
+    async def get_portfolio_changes_async(
+        self,
+        current_prices: Dict[str, float],
+        portfolio_id: int = DEFAULT_PORTFOLIO_ID,
+        since: Optional[int] = None
+    ) -> PortfolioChanges:
+        """Apply a price tick and return the changed holdings, reading the database off the loop."""
+        engine = await self.async_db.run(self._sync_valuation_engine)
+        return self._collect_changes(engine, current_prices, portfolio_id, since)
+
+    def _collect_changes(
+        self,
+        engine: "ValuationEngine",
+        current_prices: Dict[str, float],
+        portfolio_id: int,
+        since: Optional[int]
+    ) -> PortfolioChanges:
+        """Update prices on the engine and gather the rows changed after ``since``."""
+        engine.update_prices(current_prices)
+        tick = engine.tick
+        reset = since is None or since < engine.load_tick
+        positions = engine.positions(portfolio_id, None if reset else since)
+        total_value, total_cost = engine.totals(portfolio_id)
+        return PortfolioChanges(
+            tick, reset, self._build_summary(positions), total_value, total_cost
+        )
+
+    def get_portfolio_valuations(
+        self, current_prices: Dict[str, float]
+    ) -> List["PortfolioValuation"]:
+        """
+        Value, cost basis, P&L and weight of every portfolio.
+
+        Args:
+            current_prices: Dictionary mapping coin_id to current price
+
+        Returns:
+            List of PortfolioValuation objects, one per portfolio
+        """
+        engine = self._sync_valuation_engine()
+        engine.update_prices(current_prices)
+        return engine.valuations()
+
+    async def get_portfolio_valuations_async(
+        self, current_prices: Dict[str, float]
+    ) -> List["PortfolioValuation"]:
+        """Value every portfolio, reading the database off the event loop."""
+        engine = await self.async_db.run(self._sync_valuation_engine)
+        engine.update_prices(current_prices)
+        return engine.valuations()
+
+    def get_risk_report(
+        self,
+        current_prices: Dict[str, float],
+        portfolio_id: int = DEFAULT_PORTFOLIO_ID
+    ) -> Optional["RiskReport"]:
+        """
+        Volatility, VaR/CVaR, Sharpe/Sortino, beta and drawdown of a portfolio.
+
+        Uses stored daily closes and the current weights of the holdings.
+
+        Args:
+            current_prices: Dictionary mapping coin_id to current price
+            portfolio_id: Portfolio to analyze
+
+        Returns:
+            RiskReport, or None if the portfolio is empty or history too short
+        """
+        engine = self._sync_valuation_engine()
+        engine.update_prices(current_prices)
+        positions = engine.positions(portfolio_id)
+        return self._get_risk_model().report(
+            dict(zip(positions.coin_ids, positions.values.tolist()))
+        )
+
+    async def get_risk_report_async(
+        self,
+        current_prices: Dict[str, float],
+        portfolio_id: int = DEFAULT_PORTFOLIO_ID
+    ) -> Optional["RiskReport"]:
+        """Compute portfolio risk on the database thread."""
+        return await self.async_db.run(self.get_risk_report, current_prices, portfolio_id)
+
+    def simulate_portfolio(
+        self,
+        current_prices: Dict[str, float],
+        portfolio_id: int = DEFAULT_PORTFOLIO_ID,
+        **options: Any
+    ) -> Optional["SimulationResult"]:
+        """
+        Monte Carlo outcomes of holding the portfolio unchanged.
+
+        Paths are drawn from the same daily returns panel as the risk report.
+
+        Args:
+            current_prices: Dictionary mapping coin_id to current price
+            portfolio_id: Portfolio to simulate
+            **options: Passed to MonteCarloSimulator.simulate (horizons,
+                       paths, method, processes, seed, ...)
+
+        Returns:
+            SimulationResult, or None if the portfolio is empty or has no history
+        """
+        from monte_carlo import MonteCarloSimulator  # deferred: pulls in numpy
+
+        inputs = self._simulation_inputs(current_prices, portfolio_id)
+        if inputs is None:
+            return None
+        returns, values = inputs
+        return MonteCarloSimulator(returns).simulate(values, **options)
+
+    async def simulate_portfolio_async(
+        self,
+        current_prices: Dict[str, float],
+        portfolio_id: int = DEFAULT_PORTFOLIO_ID,
+        **options: Any
+    ) -> Optional["SimulationResult"]:
+        """
+        Simulate the portfolio without blocking the event loop.
+
+        Positions and the returns panel are read on the database thread like
+        every other engine access; only the simulation itself runs in a
+        worker thread (or its process pool).
+        """
+        from monte_carlo import MonteCarloSimulator  # deferred: pulls in numpy
+
+        inputs = await self.async_db.run(self._simulation_inputs, current_prices, portfolio_id)
+        if inputs is None:
+            return None
+        returns, values = inputs
+        return await asyncio.to_thread(MonteCarloSimulator(returns).simulate, values, **options)
+
+    def _simulation_inputs(
+        self,
+        current_prices: Dict[str, float],
+        portfolio_id: int
+    ) -> Optional[Tuple[Any, List[float]]]:
+        """
+        Daily returns panel and current value per coin of a portfolio.
+
+        Returns:
+            (returns, values) aligned by coin, or None if the portfolio is
+            empty or has no history
+        """
+        engine = self._sync_valuation_engine()
+        engine.update_prices(current_prices)
+        positions = engine.positions(portfolio_id)
+        if not len(positions) or positions.values.sum() <= 0:
+            return None
+
+        panel = self._get_risk_model().get_panel(positions.coin_ids)
+        if not len(panel.returns):
+            return None
+        index = {coin_id: i for i, coin_id in enumerate(panel.coins)}
+        values = [0.0] * len(panel.coins)
+        for coin_id, value in zip(positions.coin_ids, positions.values.tolist()):
+            values[index[coin_id]] += value
+        return panel.returns, values
+
+    def _get_risk_model(self) -> "RiskModel":
+        """Create the risk model on first use."""
+        if self._risk_model is None:
+            from risk_analytics import RiskModel  # deferred: pulls in numpy
+            self._risk_model = RiskModel(self.db)
+        return self._risk_model
+
+    def _sync_valuation_engine(self) -> "ValuationEngine":
+        """
+        Return the valuation engine, reloading holdings if they changed.
+
+        A price tick without new transactions costs one tiny query instead
+        of re-reading every holding.
+        """
+        if self._valuation_engine is None:
+            from valuation_engine import ValuationEngine  # deferred: pulls in numpy
+            self._valuation_engine = ValuationEngine()
+
+        engine = self._valuation_engine
+        version = self.db.get_holdings_version()
+        if engine.version != version:
+            engine.load(self.db.get_holdings(None), self.db.get_portfolios(), version)
+        return engine
+
+    @staticmethod
+    def _build_summary(positions: "PositionValuation") -> List[PortfolioItem]:
+        """Turn one portfolio's valuation columns into PortfolioItems."""
+        return [
+            PortfolioItem(
                 coin_id=coin_id,
-                symbol=holding['symbol'],
+                symbol=symbol,
                 amount=amount,
                 avg_buy_price=avg_price,
-                current_price=current_price,
-                current_value=current_value,
+                current_price=price,
+                current_value=value,
                 pnl=pnl,
-                pnl_percent=pnl_percent
+                pnl_percent=pnl_percent,
+                weight=weight
             )
-            summary.append(item)
+            for coin_id, symbol, amount, avg_price, price, value, pnl, pnl_percent, weight in zip(
+                positions.coin_ids,
+                positions.symbols,
+                positions.amounts.tolist(),
+                positions.avg_prices.tolist(),
+                positions.prices.tolist(),
+                positions.values.tolist(),
+                positions.pnl.tolist(),
+                positions.pnl_percent.tolist(),
+                positions.weights.tolist(),
+            )
+        ]
+
+    def get_lot_summary(
+        self,
+        current_prices: Dict[str, float],
+        method: CostBasisMethod = CostBasisMethod.FIFO,
+        portfolio_id: int = DEFAULT_PORTFOLIO_ID
+    ) -> List[LotSummary]:
+        """
+        Realized and unrealized P&L per coin from lot-level cost basis.
+
+        Args:
+            current_prices: Dictionary mapping coin_id to current price
+            method: Cost-basis method used to match sells to buys
+            portfolio_id: Portfolio whose lots are matched
+
+        Returns:
+            List of LotSummary objects
+        """
+        tracker = LotTracker(method)
+        tracker.consume(self.db.iter_transaction_log(portfolio_id=portfolio_id))
+        return tracker.summary(current_prices)
+
+    def record_prices(self, current_prices: Dict[str, float], day: Optional[str] = None) -> None:
+        """
+        Store current prices as the closing prices of the day (latest wins).
+
+        Args:
+            current_prices: Dictionary mapping coin_id to current price
+            day: 'YYYY-MM-DD' date (defaults to today, UTC)
+        """
+        day = day or datetime.utcnow().date().isoformat()
+        self.db.upsert_prices(
+            (coin_id, day, price) for coin_id, price in current_prices.items() if price is not None
+        )
+
+    def record_price_history(self, coin_id: str, prices: List[List[float]]) -> None:
+        """
+        Back-fill daily closes from a market chart (``[[timestamp_ms, price], ...]``).
+
+        Days that already have a price are kept. If older days were added,
+        the affected part of the portfolio value history is recomputed on
+        the next update.
+
+        Args:
+            coin_id: Coin identifier
+            prices: CoinGecko market_chart ``prices`` series, oldest first
+        """
+        closes: Dict[str, float] = {}
+        for timestamp_ms, price in prices:
+            closes[datetime.utcfromtimestamp(timestamp_ms / 1000).date().isoformat()] = price
+        if not closes:
+            return
+
+        added = self.db.upsert_prices(
+            ((coin_id, day, price) for day, price in closes.items()), replace=False
+        )
+        if added:
+            self._get_nav_engine().invalidate(min(closes))
+            if self._risk_model is not None:
+                self._risk_model.invalidate()
+
+    def update_nav_history(
+        self, portfolio_id: int = DEFAULT_PORTFOLIO_ID
+    ) -> List[Dict[str, Any]]:
+        """
+        Materialize the daily value of every portfolio up to today and return one.
+
+        Only new days (and today, whose value is still moving) are
+        recomputed unless back-dated transactions were added.
+
+        Args:
+            portfolio_id: Portfolio whose history is returned
+
+        Returns:
+            List of snapshot dictionaries (date, nav, net_invested, positions), oldest first
+        """
+        self._get_nav_engine().update()
+        return self.db.get_portfolio_snapshots(portfolio_id=portfolio_id)
+
+    def _get_nav_engine(self):
+        """Create the NAV engine on first use."""
+        if self._nav_engine is None:
+            from nav_engine import NavEngine  # deferred: pulls in pandas
+            self._nav_engine = NavEngine(self.db)
+        return self._nav_engine
+
+    async def update_nav_history_async(
+        self, portfolio_id: int = DEFAULT_PORTFOLIO_ID
+    ) -> List[Dict[str, Any]]:
+        """Materialize daily portfolio values on the database thread and return one history."""
+        return await self.async_db.run(self.update_nav_history, portfolio_id)
 
-        return summary
+    async def get_nav_history_async(
+        self, portfolio_id: int = DEFAULT_PORTFOLIO_ID
+    ) -> List[Dict[str, Any]]:
+        """Get one portfolio's materialized daily values without updating them."""
+        return await self.async_db.run(
+            self.db.get_portfolio_snapshots, portfolio_id=portfolio_id
+        )
 
     def get_total_balance(self, items: List[PortfolioItem]) -> float:
         """Calculate total portfolio balance."""
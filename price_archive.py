@@ -0,0 +1,247 @@
+"""
+Columnar price archive for TerminalCoin.
+
+Stores each coin's history as two append-only NumPy ``.npy`` columns
+(``timestamps.npy`` as int64 epoch milliseconds and ``prices.npy`` as
+float64) in its own directory. Reads memory-map the files, so a time-range
+query is two binary searches and returns zero-copy array views: no Python
+floats are created no matter how long the history is.
+"""
+
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config import archive_config
+from exceptions import ValidationException
+from logger import get_logger
+from utils import validate_coin_id
+
+logger = get_logger(__name__)
+
+TIMESTAMPS_FILE = "timestamps.npy"
+PRICES_FILE = "prices.npy"
+
+# Fixed .npy header size, large enough for any shape so appends only
+# rewrite the shape in place (NumPy pads headers to a multiple of 64)
+HEADER_SIZE = 128
+NPY_MAGIC = b"\x93NUMPY\x01\x00"
+
+
+@dataclass
+class PriceSeries:
+    """A (usually memory-mapped) slice of one coin's price history."""
+    coin_id: str
+    timestamps: np.ndarray  # int64 epoch milliseconds, ascending
+    prices: np.ndarray      # float64
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def downsample(self, max_points: int) -> "PriceSeries":
+        """
+        Return an evenly strided view with at most ``max_points`` points.
+
+        The last point is always kept so charts end at the latest price.
+        """
+        if max_points <= 0 or len(self) <= max_points:
+            return self
+        step = -(-len(self) // max_points)  # ceil division
+        offset = (len(self) - 1) % step
+        return PriceSeries(self.coin_id, self.timestamps[offset::step], self.prices[offset::step])
+
+    def dates(self, fmt: str = "%d/%m/%Y") -> List[str]:
+        """Format timestamps as date strings (e.g. for chart axes)."""
+        return [datetime.fromtimestamp(ts / 1000).strftime(fmt) for ts in self.timestamps.tolist()]
+
+
+def _header(dtype: np.dtype, length: int) -> bytes:
+    """Build a fixed-size .npy v1.0 header for a 1-D array."""
+    header = repr(
+        {"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": (length,)}
+    )
+    padding = HEADER_SIZE - len(NPY_MAGIC) - 2 - len(header) - 1
+    return NPY_MAGIC + (HEADER_SIZE - len(NPY_MAGIC) - 2).to_bytes(2, "little") + \
+        header.encode("latin1") + b" " * padding + b"\n"
+
+
+class PriceArchive:
+    """Append-only, memory-mapped per-coin price columns."""
+
+    def __init__(self, root: str = archive_config.DIRECTORY):
+        """
+        Initialize the archive.
+
+        Args:
+            root: Directory holding one sub-directory per coin
+        """
+        self.root = Path(root)
+        self._lock = threading.RLock()
+        # coin_id -> (timestamps, prices) memory maps; dropped on append
+        self._maps: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def _coin_dir(self, coin_id: str) -> Path:
+        """Directory for one coin (coin ids are validated to be path-safe)."""
+        if not validate_coin_id(coin_id):
+            raise ValidationException("Invalid coin ID", details={"coin_id": coin_id})
+        return self.root / coin_id
+
+    def coins(self) -> List[str]:
+        """Coins that have archived history."""
+        if not self.root.is_dir():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if (p / PRICES_FILE).exists())
+
+    def _open(self, coin_id: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Memory-map a coin's columns (cached until the next append)."""
+        with self._lock:
+            cached = self._maps.get(coin_id)
+            if cached is not None:
+                return cached
+
+            directory = self._coin_dir(coin_id)
+            if not (directory / PRICES_FILE).exists():
+                return None
+
+            timestamps = self._map_column(directory / TIMESTAMPS_FILE, np.int64)
+            prices = self._map_column(directory / PRICES_FILE, np.float64)
+            # Guard against a crash between the two column appends
+            length = min(len(timestamps), len(prices))
+            maps = (timestamps[:length], prices[:length])
+            self._maps[coin_id] = maps
+            return maps
+
+    @staticmethod
+    def _map_column(path: Path, dtype: type) -> np.ndarray:
+        """
+        Memory-map a column written by this archive.
+
+        The header has a fixed size, so the data offset is known and the
+        length follows from the file size (the files stay valid .npy for
+        ``np.load`` as well).
+        """
+        count = (path.stat().st_size - HEADER_SIZE) // np.dtype(dtype).itemsize
+        if count <= 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r", offset=HEADER_SIZE, shape=(count,))
+
+    def get_series(
+        self,
+        coin_id: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None
+    ) -> PriceSeries:
+        """
+        Get a zero-copy view of a coin's history in [start, end).
+
+        Args:
+            coin_id: Coin identifier
+            start: First timestamp (epoch ms), unbounded if None
+            end: Timestamp (epoch ms) to stop before, unbounded if None
+
+        Returns:
+            PriceSeries backed by the memory-mapped files (empty if unknown)
+        """
+        maps = self._open(coin_id)
+        if maps is None:
+            return PriceSeries(coin_id, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64))
+
+        timestamps, prices = maps
+        lo = 0 if start is None else int(np.searchsorted(timestamps, start, side="left"))
+        hi = len(timestamps) if end is None else int(np.searchsorted(timestamps, end, side="left"))
+        return PriceSeries(coin_id, timestamps[lo:hi], prices[lo:hi])
+
+    def last_timestamp(self, coin_id: str) -> Optional[int]:
+        """Newest archived timestamp (epoch ms) for a coin."""
+        maps = self._open(coin_id)
+        if maps is None or not len(maps[0]):
+            return None
+        return int(maps[0][-1])
+
+    def append(self, coin_id: str, timestamps: Sequence[int], prices: Sequence[float]) -> int:
+        """
+        Append points newer than the archived history.
+
+        Points at or before the last archived timestamp are ignored, so
+        overlapping fetches can be appended repeatedly.
+
+        Args:
+            coin_id: Coin identifier
+            timestamps: Epoch milliseconds
+            prices: Prices matching ``timestamps``
+
+        Returns:
+            Number of points written
+        """
+        ts = np.asarray(timestamps, dtype=np.int64)
+        px = np.asarray(prices, dtype=np.float64)
+        if ts.shape != px.shape:
+            raise ValidationException(
+                "Timestamps and prices differ in length", details={"coin_id": coin_id}
+            )
+
+        # Sort and keep the last price of duplicate timestamps
+        order = np.argsort(ts, kind="stable")
+        ts, px = ts[order], px[order]
+        if len(ts):
+            keep = np.append(ts[1:] != ts[:-1], True)
+            ts, px = ts[keep], px[keep]
+
+        directory = self._coin_dir(coin_id)
+        with self._lock:
+            # Filter under the lock, so concurrent appends of the same points
+            # (e.g. from an abandoned worker thread) can't both write them
+            last = self.last_timestamp(coin_id)
+            if last is not None:
+                newer = ts > last
+                ts, px = ts[newer], px[newer]
+            if not len(ts):
+                return 0
+
+            # Release the read maps before growing the files
+            self._maps.pop(coin_id, None)
+            directory.mkdir(parents=True, exist_ok=True)
+            # Both columns continue from their common length, which also
+            # discards a half-finished append interrupted by a crash
+            length = min(
+                self._rows(directory / TIMESTAMPS_FILE), self._rows(directory / PRICES_FILE)
+            )
+            self._append_column(directory / TIMESTAMPS_FILE, ts, length)
+            self._append_column(directory / PRICES_FILE, px, length)
+
+        logger.debug(f"Archived {len(ts)} prices for {coin_id}")
+        return len(ts)
+
+    def append_market_chart(self, coin_id: str, points: Iterable[Sequence[float]]) -> int:
+        """
+        Append a CoinGecko market chart series (``[[timestamp_ms, price], ...]``).
+
+        Returns:
+            Number of points written
+        """
+        pairs = np.asarray(list(points), dtype=np.float64).reshape(-1, 2)
+        return self.append(coin_id, pairs[:, 0].astype(np.int64), pairs[:, 1])
+
+    @staticmethod
+    def _rows(path: Path) -> int:
+        """Complete rows stored in a column file (0 if missing)."""
+        if not path.exists():
+            return 0
+        size = path.stat().st_size - HEADER_SIZE
+        return max(size, 0) // 8  # both columns are 8-byte types
+
+    @staticmethod
+    def _append_column(path: Path, values: np.ndarray, length: int) -> None:
+        """Write values after the first ``length`` rows and update the header in place."""
+        mode = "r+b" if path.exists() else "wb"
+        with open(path, mode) as f:
+            f.truncate(HEADER_SIZE + length * values.dtype.itemsize)
+            f.seek(0, os.SEEK_END)
+            f.write(values.tobytes())
+            f.seek(0)
+            f.write(_header(values.dtype, length + len(values)))
@@ -0,0 +1,278 @@
+"""
+Portfolio risk analytics for TerminalCoin.
+
+Builds a day x coin panel of daily returns from the stored closing prices
+and derives portfolio risk from it with matrix operations: volatility,
+historical and parametric VaR/CVaR, Sharpe and Sortino ratios, beta to a
+benchmark coin and maximum drawdown. The returns panel and its covariance
+matrix only depend on which coins are held and on the last complete day,
+so they are cached and every refresh just applies the current weights.
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from statistics import NormalDist
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config import risk_config
+from database import Database
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class RiskReport:
+    """
+    Risk of one portfolio.
+
+    VaR and CVaR are one-day losses as positive fractions of portfolio
+    value; volatility and the ratios are annualized.
+    """
+    observations: int          # daily returns used
+    confidence: float
+    volatility: float
+    var: float                 # historical
+    cvar: float                # historical (expected shortfall)
+    parametric_var: float      # normal
+    parametric_cvar: float     # normal
+    sharpe: float
+    sortino: float
+    beta: Optional[float]      # None without benchmark history
+    max_drawdown: float        # negative fraction, e.g. -0.45
+    coverage: float            # share of portfolio value with enough price history
+
+
+@dataclass
+class ReturnsPanel:
+    """Daily returns of a fixed set of coins and their moments."""
+    coins: List[str]
+    start: date                # date of the first return
+    end: date                  # date of the last return
+    returns: np.ndarray        # days x coins, 0 where a coin had no price yet
+    observed: np.ndarray       # per coin: number of real returns
+    mean: np.ndarray           # per coin
+    covariance: np.ndarray     # coins x coins
+
+
+def build_price_panel(
+    rows: Sequence[Tuple[str, str, float]],
+    coins: Sequence[str],
+    start: date,
+    end: date
+) -> np.ndarray:
+    """
+    Day x coin matrix of closing prices over [start, end].
+
+    Missing days carry the previous close forward; days before a coin's
+    first close stay NaN.
+
+    Args:
+        rows: (coin_id, 'YYYY-MM-DD', price) tuples
+        coins: Column order
+        start: First day (row 0)
+        end: Last day
+    """
+    days = (end - start).days + 1
+    column = {coin_id: i for i, coin_id in enumerate(coins)}
+    panel = np.full((days, len(coins)), np.nan)
+    if rows:
+        cols = np.array([column.get(row[0], -1) for row in rows], dtype=np.intp)
+        offsets = np.array([row[1] for row in rows], dtype="datetime64[D]") - np.datetime64(
+            start, "D"
+        )
+        offsets = offsets.astype(np.intp)
+        prices = np.array([row[2] for row in rows], dtype=float)
+        inside = (cols >= 0) & (offsets >= 0) & (offsets < days)
+        panel[offsets[inside], cols[inside]] = prices[inside]
+
+    # Forward fill: index of the last observed row at or before each row
+    last = np.where(np.isnan(panel), 0, np.arange(days)[:, None])
+    np.maximum.accumulate(last, axis=0, out=last)
+    return panel[last, np.arange(len(coins))]
+
+
+def compute_returns_panel(prices: np.ndarray, coins: List[str], start: date) -> ReturnsPanel:
+    """
+    Simple daily returns, their means and covariance.
+
+    Days before a coin has two closes count as zero return, so new coins
+    dilute rather than drop the history of the others.
+
+    Args:
+        prices: Day x coin closes from build_price_panel
+        coins: Column order
+        start: Date of the first price row
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = prices[1:] / prices[:-1] - 1.0
+    valid = np.isfinite(returns)
+    returns = np.where(valid, returns, 0.0)
+
+    count = len(returns)
+    mean = returns.mean(axis=0) if count else np.zeros(len(coins))
+    centered = returns - mean
+    covariance = centered.T @ centered / max(count - 1, 1)
+    return ReturnsPanel(
+        coins=list(coins),
+        start=start + timedelta(days=1),
+        end=start + timedelta(days=count),
+        returns=returns,
+        observed=valid.sum(axis=0),
+        mean=mean,
+        covariance=covariance,
+    )
+
+
+def portfolio_risk(
+    panel: ReturnsPanel,
+    weights: np.ndarray,
+    benchmark: Optional[int] = None,
+    confidence: float = risk_config.CONFIDENCE,
+    risk_free_rate: float = risk_config.RISK_FREE_RATE,
+    periods_per_year: int = risk_config.PERIODS_PER_YEAR,
+    min_observations: int = risk_config.MIN_OBSERVATIONS
+) -> Optional[RiskReport]:
+    """
+    Risk metrics of a weighted portfolio over a returns panel.
+
+    Args:
+        panel: Returns panel
+        weights: Portfolio weight per panel coin (summing to 1)
+        benchmark: Panel column of the benchmark coin, if present
+        confidence: VaR/CVaR confidence level
+        risk_free_rate: Annual risk-free rate
+        periods_per_year: Return periods per year (for annualizing)
+        min_observations: Minimum number of daily returns
+
+    Returns:
+        RiskReport, or None if the history is too short
+    """
+    count = len(panel.returns)
+    if count < min_observations:
+        return None
+
+    series = panel.returns @ weights
+    sigma_w = panel.covariance @ weights
+    variance = float(weights @ sigma_w)
+    sigma = np.sqrt(max(variance, 0.0))
+    mu = float(panel.mean @ weights)
+
+    # Historical VaR/CVaR from the realized portfolio returns
+    alpha = 1.0 - confidence
+    cutoff = float(np.quantile(series, alpha))
+    tail = series[series <= cutoff]
+    var = -cutoff
+    cvar = -float(tail.mean()) if tail.size else var
+
+    # Parametric (normal) VaR/CVaR from the covariance
+    normal = NormalDist()
+    z = normal.inv_cdf(confidence)
+    parametric_var = -(mu - z * sigma)
+    parametric_cvar = -(mu - sigma * normal.pdf(z) / alpha)
+
+    rf = risk_free_rate / periods_per_year
+    excess = series - rf
+    annualize = np.sqrt(periods_per_year)
+    sharpe = float(excess.mean() / sigma * annualize) if sigma > 0 else 0.0
+    downside = float(np.sqrt(np.mean(np.minimum(excess, 0.0) ** 2)))
+    sortino = float(excess.mean() / downside * annualize) if downside > 0 else 0.0
+
+    beta = None
+    if benchmark is not None and panel.covariance[benchmark, benchmark] > 0:
+        beta = float(sigma_w[benchmark] / panel.covariance[benchmark, benchmark])
+
+    wealth = np.cumprod(1.0 + series)
+    drawdown = wealth / np.maximum.accumulate(np.maximum(wealth, 1.0)) - 1.0
+
+    covered = panel.observed >= min_observations
+    return RiskReport(
+        observations=count,
+        confidence=confidence,
+        volatility=float(sigma * annualize),
+        var=var,
+        cvar=cvar,
+        parametric_var=parametric_var,
+        parametric_cvar=parametric_cvar,
+        sharpe=sharpe,
+        sortino=sortino,
+        beta=beta,
+        max_drawdown=float(min(drawdown.min(), 0.0)),
+        coverage=float(weights[covered].sum()),
+    )
+
+
+class RiskModel:
+    """Computes portfolio risk from stored prices, caching the returns panel."""
+
+    def __init__(self, db: Database, benchmark: str = risk_config.BENCHMARK_COIN):
+        """
+        Initialize the model.
+
+        Args:
+            db: Database holding daily price history
+            benchmark: Coin that beta is measured against
+        """
+        self.db = db
+        self.benchmark = benchmark
+        self._lock = threading.Lock()
+        self._panel: Optional[ReturnsPanel] = None
+
+    def invalidate(self) -> None:
+        """Drop the cached panel (e.g. after older prices were back-filled)."""
+        with self._lock:
+            self._panel = None
+
+    def get_panel(self, coins: Sequence[str], end: Optional[date] = None) -> ReturnsPanel:
+        """
+        Returns panel of ``coins`` (plus the benchmark) up to ``end``.
+
+        Reused as long as the coins and the end day are unchanged.
+
+        Args:
+            coins: Coins to include
+            end: Last day (defaults to yesterday, the last complete UTC day)
+        """
+        end = end or datetime.utcnow().date() - timedelta(days=1)
+        columns = sorted(set(coins) | {self.benchmark})
+        with self._lock:
+            panel = self._panel
+            if panel is not None and panel.coins == columns and panel.end == end:
+                return panel
+
+            start = end - timedelta(days=risk_config.LOOKBACK_DAYS)
+            rows = self.db.get_price_history(start.isoformat(), end.isoformat(), columns)
+            if rows:
+                # Don't count the days before any history was recorded
+                start = max(start, date.fromisoformat(min(row[1] for row in rows)))
+            panel = compute_returns_panel(
+                build_price_panel(rows, columns, start, end), columns, start
+            )
+            self._panel = panel
+            logger.debug(f"Built returns panel: {len(panel.returns)} days x {len(columns)} coins")
+            return panel
+
+    def report(self, values: Dict[str, float], end: Optional[date] = None) -> Optional[RiskReport]:
+        """
+        Risk of a portfolio given the current value of each holding.
+
+        Args:
+            values: Dictionary mapping coin_id to position value
+            end: Last day of history to use (defaults to yesterday)
+
+        Returns:
+            RiskReport, or None if the portfolio is empty or history too short
+        """
+        total = sum(values.values())
+        if total <= 0:
+            return None
+
+        panel = self.get_panel(list(values), end)
+        index = {coin_id: i for i, coin_id in enumerate(panel.coins)}
+        weights = np.zeros(len(panel.coins))
+        for coin_id, value in values.items():
+            weights[index[coin_id]] += value / total
+        return portfolio_risk(panel, weights, index.get(self.benchmark))
@@ -0,0 +1,48 @@
+"""
+Run the TerminalCoin benchmark suite against stored baselines.
+
+Usage:
+    python scripts/run_benchmarks.py              # compare with latest baseline
+    python scripts/run_benchmarks.py --save       # record a new baseline
+    python scripts/run_benchmarks.py -k sparkline # extra args go to pytest
+
+Requires: pip install pytest-benchmark
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Baselines are stored per machine/interpreter under this directory
+STORAGE_DIR = Path("benchmarks/.baselines")
+STORAGE = f"file://{STORAGE_DIR}"
+
+# A run fails if any benchmark's median regresses beyond these limits
+# (median is far less sensitive to scheduler noise than mean)
+REGRESSION_THRESHOLDS = ["median:25%"]
+
+
+def main(argv):
+    """Invoke pytest on the benchmarks package with baseline handling."""
+    args = [
+        "benchmarks",
+        f"--benchmark-storage={STORAGE}",
+        "--benchmark-columns=min,mean,median,max,rounds",
+        "--benchmark-sort=fullname",
+    ]
+
+    if "--save" in argv:
+        argv = [a for a in argv if a != "--save"]
+        args.append("--benchmark-autosave")
+    elif not any(STORAGE_DIR.rglob("*.json")):
+        print("No stored baseline found; run with --save to record one.")
+    else:
+        args.append("--benchmark-compare")
+        args.extend(f"--benchmark-compare-fail={expr}" for expr in REGRESSION_THRESHOLDS)
+
+    return pytest.main(args + list(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,205 @@
+"""
+Per-asset news sentiment aggregates for TerminalCoin.
+
+Keeps, for every asset mentioned in the news, the number of stories, the
+mean compound score and the bullish/bearish split over rolling windows
+(1 hour, 24 hours and 7 days by default).
+
+Stories are counted in hourly buckets. Each window keeps running totals:
+a new story is added to the totals of the windows it falls in, and when
+the clock passes an hour boundary only the buckets that drop out of a
+window are subtracted. Neither costs more as the news store grows.
+Syndicated copies of a story (see news_dedup) are counted once.
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence
+
+from config import news_config
+from exceptions import ValidationException
+from models import SentimentType
+from logger import get_logger
+
+if TYPE_CHECKING:
+    from models import NewsItem
+    from news_store import NewsStore
+
+logger = get_logger(__name__)
+
+BUCKET_SECONDS = 3600
+
+# Positions in a bucket / running total
+_COUNT, _SUM, _BULLISH, _BEARISH = range(4)
+
+
+def window_label(hours: int) -> str:
+    """Short window name, e.g. '1h', '24h' or '7d'."""
+    return f"{hours // 24}d" if hours > 24 and hours % 24 == 0 else f"{hours}h"
+
+
+@dataclass
+class AssetSentiment:
+    """News sentiment of one asset over one window."""
+    asset: str
+    hours: int
+    count: int
+    mean: float  # mean compound score (-1..1)
+    bullish: int
+    bearish: int
+
+    @property
+    def bullish_ratio(self) -> Optional[float]:
+        """Bullish share of the stories that weren't neutral (None if all were)."""
+        polar = self.bullish + self.bearish
+        return self.bullish / polar if polar else None
+
+
+class SentimentAggregator:
+    """Rolling per-asset sentiment, updated incrementally."""
+
+    def __init__(self, windows: Sequence[int] = news_config.SENTIMENT_WINDOWS):
+        """
+        Initialize the aggregator.
+
+        Args:
+            windows: Window lengths in hours
+        """
+        self.windows = sorted({int(hours) for hours in windows if hours > 0})
+        self._span = self.windows[-1] if self.windows else 0
+        # asset -> hour -> [count, sum, bullish, bearish]
+        self._buckets: Dict[str, Dict[int, List[float]]] = {}
+        # window -> asset -> [count, sum, bullish, bearish] over the window
+        self._totals: Dict[int, Dict[str, List[float]]] = {hours: {} for hours in self.windows}
+        self._hour: Optional[int] = None  # current hour; windows end with it
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_store(
+        cls,
+        store: "NewsStore",
+        windows: Sequence[int] = news_config.SENTIMENT_WINDOWS,
+        now: Optional[float] = None
+    ) -> "SentimentAggregator":
+        """Aggregator seeded with the stored stories of the longest window."""
+        aggregator = cls(windows)
+        now = datetime.now(timezone.utc).timestamp() if now is None else now
+        aggregator.advance(now)
+        rows = store.get_recent_sentiment(now - aggregator._span * BUCKET_SECONDS)
+        with aggregator._lock:
+            for assets, compound, sentiment, timestamp in rows:
+                aggregator._add(assets, compound, sentiment, timestamp)
+        logger.debug(f"Loaded news sentiment of {len(rows)} stories")
+        return aggregator
+
+    def add_items(self, items: Iterable["NewsItem"], now: Optional[float] = None) -> None:
+        """
+        Count new stories.
+
+        Args:
+            items: Newly processed items (each story once)
+            now: Current time (epoch seconds, default: now)
+        """
+        now = datetime.now(timezone.utc).timestamp() if now is None else now
+        self.advance(now)
+        with self._lock:
+            for item in items:
+                if item.sentiment_score is None or not item.assets:
+                    continue
+                timestamp = item.published_at.timestamp() if item.published_at else now
+                self._add(item.assets, item.sentiment_score, item.sentiment, min(timestamp, now))
+
+    def _add(
+        self, assets: Iterable[str], compound: float, sentiment: SentimentType, timestamp: float
+    ) -> None:
+        """Add one story to its bucket and to the totals of the windows it falls in."""
+        hour = min(int(timestamp // BUCKET_SECONDS), self._hour)
+        age = self._hour - hour
+        if age >= self._span:
+            return
+        values = (
+            1,
+            compound,
+            sentiment == SentimentType.BULLISH,
+            sentiment == SentimentType.BEARISH,
+        )
+        for asset in assets:
+            bucket = self._buckets.setdefault(asset, {}).setdefault(hour, [0, 0.0, 0, 0])
+            targets = [bucket] + [
+                self._totals[hours].setdefault(asset, [0, 0.0, 0, 0])
+                for hours in self.windows
+                if age < hours
+            ]
+            for target in targets:
+                for i, value in enumerate(values):
+                    target[i] += value
+
+    def advance(self, now: float) -> None:
+        """Move the windows forward to ``now``, dropping the hours that fell out."""
+        hour = int(now // BUCKET_SECONDS)
+        with self._lock:
+            if self._hour is None:
+                self._hour = hour
+                return
+            if hour <= self._hour:
+                return
+            previous, self._hour = self._hour, hour
+            for hours, totals in self._totals.items():
+                # Hours in (previous - hours, hour - hours] just left this window
+                leaving = range(previous - hours + 1, hour - hours + 1)
+                for asset, buckets in self._buckets.items():
+                    total = totals.get(asset)
+                    if total is None:
+                        continue
+                    if len(leaving) <= len(buckets):
+                        dropped = [buckets[h] for h in leaving if h in buckets]
+                    else:
+                        dropped = [bucket for h, bucket in buckets.items() if h in leaving]
+                    for bucket in dropped:
+                        for i in range(4):
+                            total[i] -= bucket[i]
+                    if total[_COUNT] <= 0:
+                        del totals[asset]  # also resets floating point drift
+
+            # Buckets older than the longest window are no longer needed
+            horizon = hour - self._span
+            for asset in list(self._buckets):
+                buckets = self._buckets[asset]
+                for bucket_hour in [h for h in buckets if h <= horizon]:
+                    del buckets[bucket_hour]
+                if not buckets:
+                    del self._buckets[asset]
+
+    def get(self, asset: str, hours: int, now: Optional[float] = None) -> Optional[AssetSentiment]:
+        """Sentiment of one asset over a window (None without stories)."""
+        return self.snapshot(hours, now).get(asset.upper())
+
+    def snapshot(self, hours: int, now: Optional[float] = None) -> Dict[str, AssetSentiment]:
+        """
+        Sentiment of every asset over a window.
+
+        Args:
+            hours: One of the configured windows
+            now: Current time (epoch seconds, default: now)
+
+        Returns:
+            Dictionary mapping asset symbol to AssetSentiment
+
+        Raises:
+            ValidationException: If ``hours`` isn't a configured window
+        """
+        if hours not in self._totals:
+            raise ValidationException(
+                "Unknown sentiment window", details={"hours": hours, "windows": self.windows}
+            )
+        self.advance(datetime.now(timezone.utc).timestamp() if now is None else now)
+        with self._lock:
+            totals = self._totals[hours]
+            return {
+                asset: AssetSentiment(
+                    asset, hours, int(total[_COUNT]), total[_SUM] / total[_COUNT],
+                    int(total[_BULLISH]), int(total[_BEARISH]),
+                )
+                for asset, total in totals.items()
+            }
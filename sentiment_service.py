@@ -0,0 +1,151 @@
+"""
+Sentiment scoring service for TerminalCoin.
+
+Scores texts with VADER in batches and remembers every compound score by
+a hash of the text, in an in-memory LRU that is persisted to the news
+store, so a headline is scored once no matter how often feeds repeat it.
+Large batches of new texts can be scored in worker processes, which keeps
+VADER from competing with the UI thread for the GIL.
+"""
+
+import hashlib
+import math
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+from config import news_config, SENTIMENT_THRESHOLDS
+from models import SentimentType
+from logger import get_logger
+
+if TYPE_CHECKING:
+    from news_store import NewsStore
+
+logger = get_logger(__name__)
+
+# VADER instance of this process (created on first use, also in workers)
+_analyzer = None
+
+
+def _score_texts(texts: Sequence[str]) -> List[float]:
+    """Compound VADER scores of ``texts`` (runs in worker processes too)."""
+    global _analyzer
+    if _analyzer is None:
+        from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+        _analyzer = SentimentIntensityAnalyzer()
+    return [_analyzer.polarity_scores(text).get("compound", 0.0) for text in texts]
+
+
+def classify_sentiment(compound: float) -> SentimentType:
+    """Bucket a compound score into Bullish, Bearish or Neutral."""
+    if compound >= SENTIMENT_THRESHOLDS["bullish"]:
+        return SentimentType.BULLISH
+    if compound <= SENTIMENT_THRESHOLDS["bearish"]:
+        return SentimentType.BEARISH
+    return SentimentType.NEUTRAL
+
+
+def text_hash(text: str) -> str:
+    """Cache key of a text."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class SentimentService:
+    """Batch VADER scoring with a persistent content-hash cache."""
+
+    def __init__(
+        self,
+        store: Optional["NewsStore"] = None,
+        cache_size: int = news_config.SENTIMENT_CACHE_SIZE,
+        processes: int = news_config.SENTIMENT_PROCESSES,
+        parallel_min: int = news_config.SENTIMENT_PARALLEL_MIN
+    ):
+        """
+        Initialize the service, loading cached scores from the store.
+
+        Args:
+            store: News store that persists the cache (memory only if None)
+            cache_size: Maximum number of remembered scores
+            processes: Worker processes for large batches (0 or 1 scores in-process)
+            parallel_min: Smallest batch of uncached texts sent to workers
+        """
+        self.store = store
+        self.cache_size = cache_size
+        self.processes = processes
+        self.parallel_min = parallel_min
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[str, float]" = OrderedDict()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.hits = 0
+        self.misses = 0
+
+        if store is not None:
+            # Oldest first, so the most recent end up at the LRU's fresh end
+            for key, compound in reversed(store.load_sentiment_cache(cache_size)):
+                self._cache[key] = compound
+            logger.debug(f"Loaded {len(self._cache)} cached sentiment scores")
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def score(self, text: str) -> float:
+        """Compound score (-1..1) of one text."""
+        return self.score_many([text])[0]
+
+    def score_many(self, texts: Sequence[str]) -> List[float]:
+        """
+        Compound scores of many texts, scoring only those not seen before.
+
+        Args:
+            texts: Texts to score
+
+        Returns:
+            Compound scores in the order of ``texts``
+        """
+        keys = [text_hash(text) for text in texts]
+        scores: Dict[str, float] = {}
+        missing: Dict[str, str] = {}
+        with self._lock:
+            for key, text in zip(keys, texts):
+                compound = self._cache.get(key)
+                if compound is None:
+                    missing.setdefault(key, text)
+                else:
+                    self._cache.move_to_end(key)
+                    scores[key] = compound
+            self.hits += len(texts) - len(missing)
+            self.misses += len(missing)
+
+        if missing:
+            fresh = dict(zip(missing, self._score(list(missing.values()))))
+            scores.update(fresh)
+            with self._lock:
+                self._cache.update(fresh)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+            if self.store is not None:
+                self.store.save_sentiment_scores(fresh.items())
+
+        return [scores[key] for key in keys]
+
+    def _score(self, texts: List[str]) -> List[float]:
+        """Run VADER, in worker processes when the batch is large enough."""
+        if self.processes <= 1 or len(texts) < self.parallel_min:
+            return _score_texts(texts)
+
+        if self._pool is None:
+            # spawn: the app runs threads, which fork() must not copy
+            context = multiprocessing.get_context("spawn")
+            self._pool = ProcessPoolExecutor(max_workers=self.processes, mp_context=context)
+        size = math.ceil(len(texts) / self.processes)
+        chunks = [texts[i:i + size] for i in range(0, len(texts), size)]
+        return [compound for chunk in self._pool.map(_score_texts, chunks) for compound in chunk]
+
+    def analyze(self, text: str) -> SentimentType:
+        """Sentiment bucket of one text."""
+        return classify_sentiment(self.score(text))
@@ -0,0 +1,160 @@
+"""
+Snapshot store for TerminalCoin.
+
+Persists the last successful market, coin detail/history and news fetches
+to a small SQLite file as zlib-compressed JSON, so the next launch can
+render the last known state immediately (and work without a network).
+"""
+
+import json
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from config import snapshot_config
+from database import ConnectionManager
+from logger import get_logger
+from models import CoinDetailData, CoinMarketData, NewsItem
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Snapshot kinds
+MARKET = "market"
+DETAIL = "detail"
+NEWS = "news"
+
+
+@dataclass
+class Snapshot(Generic[T]):
+    """A stored payload and when it was fetched."""
+    data: T
+    fetched_at: float  # unix timestamp
+
+    @property
+    def age(self) -> float:
+        """Seconds since the data was fetched."""
+        return time.time() - self.fetched_at
+
+
+class SnapshotStore:
+    """Key/value store of the most recent API payloads."""
+
+    def __init__(self, path: str = snapshot_config.FILE):
+        """
+        Initialize the store, creating the file if needed.
+
+        Args:
+            path: SQLite file path (or ':memory:')
+        """
+        self.path = path
+        self._connections = ConnectionManager(path)
+        with self._connections.connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS snapshots (
+                    kind TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    payload BLOB NOT NULL,
+                    PRIMARY KEY (kind, key)
+                )
+            """)
+
+    def close(self) -> None:
+        """Close all connections."""
+        self._connections.close_all()
+
+    def save(self, kind: str, key: str, payload: Any) -> None:
+        """
+        Store a JSON-serializable payload, replacing the previous one.
+
+        Args:
+            kind: Snapshot kind (MARKET, DETAIL or NEWS)
+            key: Key within the kind (e.g. coin id)
+            payload: JSON-serializable data
+        """
+        blob = zlib.compress(
+            json.dumps(payload, separators=(",", ":")).encode("utf-8"),
+            snapshot_config.COMPRESSION_LEVEL,
+        )
+        try:
+            with self._connections.connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO snapshots (kind, key, fetched_at, payload) "
+                    "VALUES (?, ?, ?, ?)",
+                    (kind, key, time.time(), blob),
+                )
+                if kind == DETAIL:
+                    # Keep only the most recently fetched coin details
+                    conn.execute(
+                        "DELETE FROM snapshots WHERE kind = ? AND key NOT IN ("
+                        "SELECT key FROM snapshots WHERE kind = ? "
+                        "ORDER BY fetched_at DESC LIMIT ?)",
+                        (DETAIL, DETAIL, snapshot_config.MAX_DETAILS),
+                    )
+        except Exception as e:
+            logger.error(f"Failed to save {kind} snapshot: {e}")
+
+    def load(self, kind: str, key: str) -> Optional[Snapshot[Any]]:
+        """
+        Load a stored payload.
+
+        Args:
+            kind: Snapshot kind
+            key: Key within the kind
+
+        Returns:
+            Snapshot with the decoded payload, or None if missing or unreadable
+        """
+        try:
+            with self._connections.connection() as conn:
+                row = conn.execute(
+                    "SELECT fetched_at, payload FROM snapshots WHERE kind = ? AND key = ?",
+                    (kind, key),
+                ).fetchone()
+            if row is None:
+                return None
+            return Snapshot(json.loads(zlib.decompress(row[1])), row[0])
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable {kind} snapshot: {e}")
+            return None
+
+    def save_market(self, coins: List[CoinMarketData]) -> None:
+        """Store the market list."""
+        self.save(MARKET, "top", [coin.model_dump(mode="json") for coin in coins])
+
+    def load_market(self) -> Optional[Snapshot[List[CoinMarketData]]]:
+        """Load the last market list."""
+        snapshot = self.load(MARKET, "top")
+        if snapshot is None:
+            return None
+        return Snapshot(
+            [CoinMarketData.model_validate(c) for c in snapshot.data], snapshot.fetched_at
+        )
+
+    def save_detail(self, data: CoinDetailData, history: Dict[str, Any]) -> None:
+        """Store a coin's details and price history."""
+        self.save(DETAIL, data.id, {"detail": data.model_dump(mode="json"), "history": history})
+
+    def load_detail(
+        self, coin_id: str
+    ) -> Optional[Snapshot[Tuple[CoinDetailData, Dict[str, Any]]]]:
+        """Load a coin's last details and price history."""
+        snapshot = self.load(DETAIL, coin_id)
+        if snapshot is None:
+            return None
+        detail = CoinDetailData.model_validate(snapshot.data["detail"])
+        return Snapshot((detail, snapshot.data["history"]), snapshot.fetched_at)
+
+    def save_news(self, items: List[NewsItem]) -> None:
+        """Store the news feed."""
+        self.save(NEWS, "latest", [item.model_dump(mode="json") for item in items])
+
+    def load_news(self) -> Optional[Snapshot[List[NewsItem]]]:
+        """Load the last news feed."""
+        snapshot = self.load(NEWS, "latest")
+        if snapshot is None:
+            return None
+        return Snapshot([NewsItem.model_validate(n) for n in snapshot.data], snapshot.fetched_at)
@@ -0,0 +1,174 @@
+"""
+Startup profiling utilities for TerminalCoin.
+
+Records time spent importing modules and running initialization steps so
+``--profile-startup`` can print a report after the application exits.
+
+Only depends on the standard library so it can be imported before
+anything else in ``app.py``. Import timing is switched on at import time
+when ``--profile-startup`` is present on the command line.
+"""
+
+import builtins
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+
+@dataclass
+class TimingRecord:
+    """A single timed import or startup step."""
+    name: str
+    seconds: float
+    depth: int = 0
+    started_at: float = 0.0  # seconds since profiler creation
+
+
+class StartupProfiler:
+    """Collects import and init-step timings during application startup."""
+
+    def __init__(self):
+        """Initialize the profiler and start the startup clock."""
+        self.t0 = time.perf_counter()
+        self.imports: List[TimingRecord] = []
+        self.steps: List[TimingRecord] = []
+        self.marks: List[TimingRecord] = []
+        self._original_import = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def elapsed(self) -> float:
+        """Seconds since the profiler was created."""
+        return time.perf_counter() - self.t0
+
+    def enable_import_timing(self) -> None:
+        """Start timing first-time imports by wrapping ``__import__``."""
+        if self._original_import is not None:
+            return
+
+        original = builtins.__import__
+        self._original_import = original
+
+        def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            # Only first-time absolute imports are interesting
+            if level or name in sys.modules:
+                return original(name, globals, locals, fromlist, level)
+
+            depth = getattr(self._local, "depth", 0)
+            self._local.depth = depth + 1
+            start = time.perf_counter()
+            try:
+                return original(name, globals, locals, fromlist, level)
+            finally:
+                self._local.depth = depth
+                record = TimingRecord(
+                    name=name,
+                    seconds=time.perf_counter() - start,
+                    depth=depth,
+                    started_at=start - self.t0,
+                )
+                with self._lock:
+                    self.imports.append(record)
+
+        builtins.__import__ = timed_import
+
+    def disable_import_timing(self) -> None:
+        """Restore the original ``__import__``."""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """
+        Time an initialization step.
+
+        Args:
+            name: Human-readable step name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record = TimingRecord(
+                name=name,
+                seconds=time.perf_counter() - start,
+                started_at=start - self.t0,
+            )
+            with self._lock:
+                self.steps.append(record)
+
+    def mark(self, name: str) -> None:
+        """
+        Record a point in time (e.g. first frame rendered).
+
+        Args:
+            name: Milestone name
+        """
+        elapsed = self.elapsed()
+        with self._lock:
+            self.marks.append(TimingRecord(name=name, seconds=elapsed, started_at=elapsed))
+
+    def report(self, min_seconds: float = 0.001, max_depth: int = 1) -> str:
+        """
+        Build a human-readable timing report.
+
+        Args:
+            min_seconds: Hide imports faster than this
+            max_depth: Deepest nesting level of imports to show
+
+        Returns:
+            Multi-line report string
+        """
+        lines = ["", "=== TerminalCoin startup profile ===", "", "Imports (inclusive):"]
+
+        shown = [
+            r for r in self.imports
+            if r.depth <= max_depth and r.seconds >= min_seconds
+        ]
+        shown.sort(key=lambda r: r.started_at)
+        for record in shown:
+            indent = "  " * record.depth
+            lines.append(f"  {record.seconds * 1000:8.1f} ms  {indent}{record.name}")
+        if not shown:
+            lines.append("  (import timing disabled)")
+
+        lines.append("")
+        lines.append("Init steps:")
+        for record in sorted(self.steps, key=lambda r: r.started_at):
+            lines.append(
+                f"  {record.seconds * 1000:8.1f} ms  {record.name} "
+                f"(at +{record.started_at * 1000:.0f} ms)"
+            )
+
+        lines.append("")
+        lines.append("Milestones:")
+        for record in self.marks:
+            lines.append(f"  +{record.seconds * 1000:7.0f} ms  {record.name}")
+
+        return "\n".join(lines)
+
+
+# Singleton instance for easy import
+_startup_profiler: Optional[StartupProfiler] = None
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """
+    Get or create the singleton StartupProfiler instance.
+
+    Returns:
+        StartupProfiler instance
+    """
+    global _startup_profiler
+    if _startup_profiler is None:
+        _startup_profiler = StartupProfiler()
+    return _startup_profiler
+
+
+# Start timing as early as possible when profiling was requested
+if "--profile-startup" in sys.argv:
+    get_startup_profiler().enable_import_timing()
@@ -0,0 +1,317 @@
+"""
+Tax-lot engine for TerminalCoin.
+
+Replays the transaction log once, keeping every BUY as an open lot and
+matching each SELL against lots by a cost-basis method (FIFO, LIFO, HIFO
+or average cost). Produces realized P&L per disposal, which can be
+streamed straight to a report, and unrealized P&L for what is still held.
+"""
+
+import csv
+import heapq
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Remaining lot amounts below this are treated as fully consumed
+DUST = 1e-12
+
+# Disposals of lots held longer than this are long-term
+LONG_TERM_DAYS = 365
+
+
+class CostBasisMethod(str, Enum):
+    """Lot selection order used when a SELL consumes lots."""
+    FIFO = "fifo"        # oldest lots first
+    LIFO = "lifo"        # newest lots first
+    HIFO = "hifo"        # most expensive lots first
+    AVERAGE = "average"  # one pooled lot at the weighted average cost
+
+
+class Lot:
+    """An open position acquired by a single BUY (or the pooled average)."""
+
+    __slots__ = ("transaction_id", "acquired_at", "amount", "price")
+
+    def __init__(self, transaction_id: int, acquired_at: datetime, amount: float, price: float):
+        self.transaction_id = transaction_id
+        self.acquired_at = acquired_at
+        self.amount = amount
+        self.price = price
+
+    @property
+    def cost_basis(self) -> float:
+        """Cost of the remaining amount."""
+        return self.amount * self.price
+
+
+@dataclass
+class Disposal:
+    """Part of a SELL matched against one lot."""
+    coin_id: str
+    symbol: str
+    sell_transaction_id: int
+    buy_transaction_id: int
+    acquired_at: datetime
+    disposed_at: datetime
+    amount: float
+    proceeds: float
+    cost_basis: float
+
+    @property
+    def realized_pnl(self) -> float:
+        """Gain (or loss) realized by this disposal."""
+        return self.proceeds - self.cost_basis
+
+    @property
+    def holding_days(self) -> int:
+        """Days between acquisition and disposal."""
+        return (self.disposed_at - self.acquired_at).days
+
+    @property
+    def term(self) -> str:
+        """'long' if held longer than LONG_TERM_DAYS, otherwise 'short'."""
+        return "long" if self.holding_days > LONG_TERM_DAYS else "short"
+
+
+@dataclass
+class LotSummary:
+    """Per-coin cost basis and P&L."""
+    coin_id: str
+    symbol: str
+    amount: float
+    cost_basis: float
+    realized_pnl: float
+    unrealized_pnl: float = 0.0
+    open_lots: int = 0
+    unmatched: float = 0.0  # amount sold that no lot covered
+
+
+class _LotBook:
+    """Open lots of one coin in the order the cost-basis method consumes them."""
+
+    __slots__ = ("method", "symbol", "lots", "realized_pnl", "unmatched", "_seq")
+
+    def __init__(self, method: CostBasisMethod, symbol: str):
+        self.method = method
+        self.symbol = symbol
+        # deque for FIFO/LIFO/AVERAGE, heap of (-price, seq, lot) for HIFO
+        self.lots = [] if method is CostBasisMethod.HIFO else deque()
+        self.realized_pnl = 0.0
+        self.unmatched = 0.0  # amount sold without a matching lot
+        self._seq = 0
+
+    def add(self, lot: Lot) -> None:
+        """Open a new lot (or grow the pooled lot)."""
+        if self.method is CostBasisMethod.HIFO:
+            self._seq += 1
+            heapq.heappush(self.lots, (-lot.price, self._seq, lot))
+        elif self.method is CostBasisMethod.AVERAGE and self.lots:
+            pooled = self.lots[0]
+            total = pooled.amount + lot.amount
+            pooled.price = (pooled.cost_basis + lot.cost_basis) / total
+            pooled.amount = total
+        else:
+            self.lots.append(lot)
+
+    def _next(self) -> Lot:
+        """Lot the next SELL draws from."""
+        if self.method is CostBasisMethod.HIFO:
+            return self.lots[0][2]
+        if self.method is CostBasisMethod.LIFO:
+            return self.lots[-1]
+        return self.lots[0]
+
+    def _pop(self) -> None:
+        """Remove the lot returned by _next()."""
+        if self.method is CostBasisMethod.HIFO:
+            heapq.heappop(self.lots)
+        elif self.method is CostBasisMethod.LIFO:
+            self.lots.pop()
+        else:
+            self.lots.popleft()
+
+    def iter_lots(self) -> Iterator[Lot]:
+        """Iterate open lots (HIFO lots in heap order)."""
+        if self.method is CostBasisMethod.HIFO:
+            return (entry[2] for entry in self.lots)
+        return iter(self.lots)
+
+    def sell(
+        self,
+        coin_id: str,
+        transaction_id: int,
+        disposed_at: datetime,
+        amount: float,
+        price: float
+    ) -> Iterator[Disposal]:
+        """Consume lots for a SELL, yielding one Disposal per lot touched."""
+        remaining = amount
+        while remaining > DUST and self.lots:
+            lot = self._next()
+            matched = min(lot.amount, remaining)
+            disposal = Disposal(
+                coin_id=coin_id,
+                symbol=self.symbol,
+                sell_transaction_id=transaction_id,
+                buy_transaction_id=lot.transaction_id,
+                acquired_at=lot.acquired_at,
+                disposed_at=disposed_at,
+                amount=matched,
+                proceeds=matched * price,
+                cost_basis=matched * lot.price,
+            )
+            self.realized_pnl += disposal.realized_pnl
+            lot.amount -= matched
+            remaining -= matched
+            if lot.amount <= DUST:
+                self._pop()
+            yield disposal
+
+        if remaining > DUST:
+            # Same rule as holdings: selling more than is held closes the position
+            self.unmatched += remaining
+
+
+class LotTracker:
+    """
+    Maintains open lots per coin while consuming the transaction log.
+
+    Each BUY is O(1) (O(log n) for HIFO) and each SELL costs one step per
+    lot it consumes, so a year of fills is processed in a single pass.
+    """
+
+    def __init__(self, method: CostBasisMethod = CostBasisMethod.FIFO):
+        """
+        Initialize the tracker.
+
+        Args:
+            method: Cost-basis method used to match SELLs to lots
+        """
+        self.method = CostBasisMethod(method)
+        self._books: Dict[str, _LotBook] = {}
+
+    def process(self, transactions: Iterable[Tuple]) -> Iterator[Disposal]:
+        """
+        Consume transactions in chronological order, yielding disposals.
+
+        The generator must be exhausted for the tracker state to be complete.
+
+        Args:
+            transactions: (id, coin_id, symbol, type, amount, price, timestamp)
+                          tuples, oldest first; timestamp is a datetime or
+                          an ISO string as stored by the database
+
+        Yields:
+            Disposal for every lot (part) consumed by a SELL
+        """
+        books = self._books
+        for transaction_id, coin_id, symbol, type, amount, price, timestamp in transactions:
+            if isinstance(timestamp, str):
+                timestamp = datetime.fromisoformat(timestamp)
+
+            book = books.get(coin_id)
+            if book is None:
+                book = books[coin_id] = _LotBook(self.method, symbol)
+
+            if type == 'BUY':
+                book.add(Lot(transaction_id, timestamp, amount, price))
+            elif type == 'SELL':
+                yield from book.sell(coin_id, transaction_id, timestamp, amount, price)
+
+    def consume(self, transactions: Iterable[Tuple]) -> None:
+        """Consume transactions without collecting disposals."""
+        for _ in self.process(transactions):
+            pass
+
+    def open_lots(self, coin_id: str) -> List[Lot]:
+        """Open lots of a coin in the order they would be sold."""
+        book = self._books.get(coin_id)
+        if book is None:
+            return []
+        lots = list(book.iter_lots())
+        if self.method is CostBasisMethod.HIFO:
+            lots.sort(key=lambda lot: -lot.price)
+        elif self.method is CostBasisMethod.LIFO:
+            lots.reverse()
+        return lots
+
+    def realized_pnl(self) -> Dict[str, float]:
+        """Realized P&L per coin so far."""
+        return {coin_id: book.realized_pnl for coin_id, book in self._books.items()}
+
+    def summary(self, current_prices: Optional[Dict[str, float]] = None) -> List[LotSummary]:
+        """
+        Per-coin cost basis, realized and unrealized P&L.
+
+        Args:
+            current_prices: Dictionary mapping coin_id to current price; coins
+                            without a price report zero unrealized P&L
+
+        Returns:
+            List of LotSummary, largest cost basis first
+        """
+        current_prices = current_prices or {}
+        result = []
+        for coin_id, book in self._books.items():
+            amount = 0.0
+            cost_basis = 0.0
+            open_lots = 0
+            for lot in book.iter_lots():
+                amount += lot.amount
+                cost_basis += lot.cost_basis
+                open_lots += 1
+
+            price = current_prices.get(coin_id)
+            unrealized = amount * price - cost_basis if price is not None else 0.0
+            result.append(LotSummary(
+                coin_id=coin_id,
+                symbol=book.symbol,
+                amount=amount,
+                cost_basis=cost_basis,
+                realized_pnl=book.realized_pnl,
+                unrealized_pnl=unrealized,
+                open_lots=open_lots,
+                unmatched=book.unmatched,
+            ))
+
+        result.sort(key=lambda s: s.cost_basis, reverse=True)
+        return result
+
+
+REPORT_COLUMNS = [
+    "coin_id", "symbol", "amount", "acquired_at", "disposed_at", "holding_days", "term",
+    "proceeds", "cost_basis", "realized_pnl", "buy_transaction_id", "sell_transaction_id",
+]
+
+
+def write_disposal_report(disposals: Iterable[Disposal], out: TextIO) -> int:
+    """
+    Stream disposals to CSV without holding them in memory.
+
+    Args:
+        disposals: Disposals, e.g. from LotTracker.process()
+        out: Text stream to write to
+
+    Returns:
+        Number of rows written
+    """
+    writer = csv.writer(out)
+    writer.writerow(REPORT_COLUMNS)
+    count = 0
+    for d in disposals:
+        writer.writerow([
+            d.coin_id, d.symbol, f"{d.amount:.8f}",
+            d.acquired_at.isoformat(sep=" "), d.disposed_at.isoformat(sep=" "),
+            d.holding_days, d.term,
+            f"{d.proceeds:.2f}", f"{d.cost_basis:.2f}", f"{d.realized_pnl:.2f}",
+            d.buy_transaction_id, d.sell_transaction_id,
+        ])
+        count += 1
+    return count
@@ -0,0 +1,78 @@
+"""
+Tax Report Script.
+
+Replays the TerminalCoin transaction log with a cost-basis method and
+writes one CSV row per disposal (the part of a SELL matched to one lot).
+
+Usage:
+    python tax_report.py [--method fifo] [--year 2024] [--portfolio NAME] [-o disposals.csv]
+"""
+
+import argparse
+import logging
+import sys
+import time
+
+from database import Database
+from tax_lots import CostBasisMethod, LotTracker, write_disposal_report
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def generate_report():
+    parser = argparse.ArgumentParser(description="Write a per-disposal realized P&L report")
+    parser.add_argument("--method", choices=[m.value for m in CostBasisMethod], default="fifo",
+                        help="lot matching order (default: fifo)")
+    parser.add_argument("--year", type=int, help="only report disposals in this year")
+    parser.add_argument("--portfolio", help="only report this portfolio (default: every portfolio)")
+    parser.add_argument("-o", "--output", help="CSV file to write (default: stdout)")
+    args = parser.parse_args()
+
+    db = Database()
+    method = CostBasisMethod(args.method)
+
+    portfolio_ids = [p["id"] for p in db.get_portfolios()]
+    if args.portfolio:
+        portfolio_id = db.get_portfolio_id(args.portfolio)
+        if portfolio_id is None:
+            parser.error(f"unknown portfolio: {args.portfolio}")
+        portfolio_ids = [portfolio_id]
+
+    def replay():
+        # Each portfolio has its own lots; lots from earlier years are
+        # still needed, so the whole log is replayed
+        for portfolio_id in portfolio_ids:
+            tracker = LotTracker(method)
+            yield from tracker.process(db.iter_transaction_log(portfolio_id=portfolio_id))
+
+    disposals = replay()
+    if args.year:
+        disposals = (d for d in disposals if d.disposed_at.year == args.year)
+
+    realized = 0.0
+
+    def tally(items):
+        nonlocal realized
+        for disposal in items:
+            realized += disposal.realized_pnl
+            yield disposal
+
+    start = time.perf_counter()
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as out:
+            count = write_disposal_report(tally(disposals), out)
+    else:
+        count = write_disposal_report(tally(disposals), sys.stdout)
+    elapsed = time.perf_counter() - start
+
+    logger.info(
+        f"Wrote {count} disposals ({args.method.upper()}) in {elapsed:.2f}s; "
+        f"realized P&L ${realized:,.2f}"
+    )
+    db.close()
+
+
+if __name__ == "__main__":
+    generate_report()
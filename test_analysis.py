@@ -8,6 +8,9 @@ import sys
 import logging
 from api_client import CoinGeckoClient
 from analysis_engine import AnalysisEngine
+from config import news_config
+from news_store import NewsStore
+from sentiment_aggregates import SentimentAggregator, window_label
 
 # Configure logging to console
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -58,8 +61,17 @@ def test_analysis():
         print(f"BB Upper:      ${indicators.bb_upper:,.2f}")
         print(f"BB Lower:      ${indicators.bb_lower:,.2f}")
 
+        # News sentiment (from stories stored by the TUI)
+        store = NewsStore()
+        window = news_config.SENTIMENT_COLUMN_WINDOW
+        sentiment = SentimentAggregator.from_store(store).get("BTC", window)
+        store.close()
+        if sentiment:
+            label = window_label(window)
+            print(f"News ({label}):   {sentiment.mean:+.2f} over {sentiment.count} stories")
+
         # Signal
-        signal = engine.get_signal(indicators)
+        signal = engine.get_signal(indicators, sentiment)
         print(f"\nSIGNAL:        {signal}")
         print("="*40 + "\n")
 
@@ -0,0 +1,143 @@
+"""
+Unit tests for the price alert engine.
+
+Run with: pytest tests/
+"""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+from alert_engine import Alert, AlertEngine, AlertIndex
+from database import Database
+from exceptions import ValidationException
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Fresh database."""
+    database = Database(str(tmp_path / "test.db"))
+    yield database
+    database.close()
+
+
+class TestAlertIndex:
+    """Tests for crossing evaluation."""
+
+    def test_only_crossed_levels_fire(self):
+        """Test rising and falling crossings fire once and in crossing order."""
+        index = AlertIndex([
+            Alert(1, "bitcoin", "price", "above", 110.0),
+            Alert(2, "bitcoin", "price", "above", 105.0),
+            Alert(3, "bitcoin", "price", "above", 130.0),
+            Alert(4, "bitcoin", "price", "below", 90.0),
+            Alert(5, "bitcoin", "price", "below", 95.0),
+        ])
+        assert index.evaluate({"bitcoin": 100.0}) == []
+        assert [h.alert.id for h in index.evaluate({"bitcoin": 112.0})] == [2, 1]
+        assert index.evaluate({"bitcoin": 100.0}) == []
+        assert [h.alert.id for h in index.evaluate({"bitcoin": 89.0})] == [5, 4]
+        assert len(index) == 1
+
+    def test_first_observation_fires_satisfied_alerts(self):
+        """Test alerts already met when the coin is first seen fire immediately."""
+        index = AlertIndex(
+            [Alert(1, "eth", "price", "above", 10.0), Alert(2, "eth", "price", "below", 5.0)]
+        )
+        hits = index.evaluate({"eth": 12.0})
+        assert [h.alert.id for h in hits] == [1]
+        assert hits[0].previous is None
+
+    def test_percent_move_fires_once_either_way(self):
+        """Test a move alert fires on the first side reached and retires both levels."""
+        index = AlertIndex([Alert(1, "sol", "price", "move", 10.0, reference=100.0)])
+        index.evaluate({"sol": 100.0})
+        assert index.evaluate({"sol": 105.0}) == []
+        assert [h.alert.id for h in index.evaluate({"sol": 89.0})] == [1]
+        assert index.evaluate({"sol": 200.0}) == []
+        assert len(index) == 0
+
+    def test_indicator_metric(self):
+        """Test indicator alerts are evaluated on their own series."""
+        index = AlertIndex([Alert(1, "bitcoin", "rsi", "above", 70.0)])
+        assert index.evaluate({"bitcoin": 80.0}) == []
+        index.evaluate({"bitcoin": 60.0}, "rsi")
+        assert [h.alert.id for h in index.evaluate({"bitcoin": 72.0}, "rsi")] == [1]
+
+    def test_matches_brute_force(self):
+        """Test random walks fire exactly the alerts a full scan would."""
+        rng = random.Random(11)
+        alerts = [
+            Alert(i, f"c{i % 5}", "price", rng.choice(["above", "below"]), rng.uniform(50, 150))
+            for i in range(2000)
+        ]
+        index = AlertIndex(alerts)
+        prices = {f"c{i}": 100.0 for i in range(5)}
+        index.evaluate(prices)
+        active = {a.id: a for a in alerts if not (a.condition == "above" and a.threshold <= 100.0)
+                  and not (a.condition == "below" and a.threshold >= 100.0)}
+        for _ in range(200):
+            new = {c: max(1.0, p + rng.uniform(-8, 8)) for c, p in prices.items()}
+            expected = {
+                a.id for a in active.values()
+                if (a.condition == "above" and prices[a.coin_id] < a.threshold <= new[a.coin_id])
+                or (a.condition == "below" and new[a.coin_id] <= a.threshold < prices[a.coin_id])
+            }
+            assert {h.alert.id for h in index.evaluate(new)} == expected
+            for alert_id in expected:
+                del active[alert_id]
+            prices = new
+
+
+class TestAlertEngine:
+    """Tests for persistence."""
+
+    def test_hits_are_persisted(self, db):
+        """Test fired alerts are marked in the database and not reloaded."""
+        engine = AlertEngine(db)
+        engine.add_alert("bitcoin", "above", 100.0, note="sell")
+        db.add_alert("bitcoin", "price", "below", 50.0)  # e.g. from the CLI
+
+        assert engine.check({"bitcoin": 90.0}) == []
+        hits = engine.check({"bitcoin": 101.0})
+        assert [h.message for h in hits] == ["bitcoin price above 100 (now 101): sell"]
+
+        rows = db.get_alerts(active_only=False)
+        assert rows[0]["triggered_value"] == 101.0 and rows[0]["triggered_at"]
+        assert [a["condition"] for a in db.get_alerts()] == ["below"]
+
+        fresh = AlertEngine(db)
+        assert fresh.check({"bitcoin": 120.0}) == []
+        assert len(fresh.index) == 1
+
+    def test_market_refresh_syncs_once(self, db, monkeypatch):
+        """Test a refresh reads the alerts version once and its own hits don't force a reload."""
+        engine = AlertEngine(db)
+        engine.add_alert("bitcoin", "above", 100.0)
+        engine.add_alert("bitcoin", "above", 200.0)
+        coins = [SimpleNamespace(id="bitcoin", current_price=150.0, sparkline_7d=None)]
+        assert len(engine.check_market(coins)) == 1
+
+        reads = []
+        get_alerts_version = db.get_alerts_version
+        monkeypatch.setattr(
+            db, "get_alerts_version", lambda: reads.append(1) or get_alerts_version()
+        )
+        monkeypatch.setattr(db, "get_alerts", lambda *args: pytest.fail("index reloaded"))
+        assert engine.check_market(coins) == []
+        assert len(reads) == 1
+
+    def test_invalid_rules_rejected(self, db):
+        """Test bad metrics, conditions and move alerts without a reference."""
+        with pytest.raises(ValidationException):
+            db.add_alert("bitcoin", "volume", "above", 1.0)
+        with pytest.raises(ValidationException):
+            db.add_alert("bitcoin", "price", "crosses", 1.0)
+        with pytest.raises(ValidationException):
+            db.add_alert("bitcoin", "price", "move", 5.0)
+        with pytest.raises(ValidationException):
+            db.add_alert("bitcoin", "rsi", "move", 5.0, reference=50.0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,101 @@
+"""
+Unit tests for the streaming anomaly detector.
+
+Run with: pytest tests/
+"""
+
+import statistics
+
+import pytest
+from anomaly_detector import RunningStats, AnomalyDetector
+from models import CoinMarketData
+
+
+def make_coin(
+    price: float, volume: float = 1_000_000.0, coin_id: str = "bitcoin"
+) -> CoinMarketData:
+    """Build a minimal market data record."""
+    return CoinMarketData(
+        id=coin_id,
+        symbol=coin_id[:3],
+        name=coin_id.capitalize(),
+        current_price=price,
+        total_volume=volume,
+    )
+
+
+class TestRunningStats:
+    """Tests for Welford running statistics."""
+
+    def test_matches_population_stats_within_window(self):
+        """Test mean/variance match the exact values before decay starts."""
+        values = [1.0, 4.0, 2.5, -3.0, 7.25, 0.5]
+        stats = RunningStats(window=100)
+        for v in values:
+            stats.update(v)
+        assert stats.count == len(values)
+        assert stats.mean == pytest.approx(statistics.fmean(values))
+        assert stats.variance == pytest.approx(statistics.pvariance(values))
+
+    def test_zscore_none_without_variance(self):
+        """Test z-score is undefined for constant input."""
+        stats = RunningStats()
+        for _ in range(5):
+            stats.update(2.0)
+        assert stats.zscore(3.0) is None
+
+    def test_window_forgets_old_regime(self):
+        """Test statistics follow recent data after the window."""
+        stats = RunningStats(window=10)
+        for _ in range(100):
+            stats.update(100.0)
+        for _ in range(200):
+            stats.update(0.0)
+        assert stats.mean == pytest.approx(0.0, abs=1e-3)
+
+
+class TestAnomalyDetector:
+    """Tests for mover detection across refreshes."""
+
+    def test_first_refresh_only_seeds_state(self):
+        """Test the first snapshot never produces events."""
+        detector = AnomalyDetector(min_samples=1)
+        assert detector.update([make_coin(100.0)]) == []
+        assert len(detector) == 1
+
+    def test_flags_price_spike(self):
+        """Test a large jump after calm refreshes is flagged."""
+        detector = AnomalyDetector(min_samples=5, price_threshold=3.0, volume_threshold=100.0)
+        price = 100.0
+        for i in range(20):
+            price *= 1.001 if i % 2 else 0.999
+            assert detector.update([make_coin(price)]) == []
+
+        events = detector.update([make_coin(price * 1.10)])
+        assert len(events) == 1
+        assert events[0].metric == "price"
+        assert events[0].direction == "up"
+        assert events[0].zscore > 3.0
+
+    def test_flags_volume_spike(self):
+        """Test a volume surge is flagged independently of price."""
+        detector = AnomalyDetector(min_samples=5, price_threshold=100.0, volume_threshold=3.0)
+        volume = 1_000_000.0
+        for i in range(20):
+            volume *= 1.01 if i % 2 else 0.99
+            detector.update([make_coin(100.0, volume)])
+
+        events = detector.update([make_coin(100.0, volume * 5)])
+        assert [e.metric for e in events] == ["volume"]
+
+    def test_respects_min_samples(self):
+        """Test coins are not flagged before enough history exists."""
+        detector = AnomalyDetector(min_samples=50)
+        detector.update([make_coin(100.0)])
+        detector.update([make_coin(101.0)])
+        detector.update([make_coin(100.0)])
+        assert detector.update([make_coin(200.0)]) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,135 @@
+"""
+Unit tests for the async database facade.
+
+Run with: pytest tests/
+"""
+
+import asyncio
+import threading
+
+import pytest
+from async_database import AsyncDatabase
+from database import Database
+from portfolio_manager import PortfolioManager
+
+
+@pytest.fixture
+def async_db(tmp_path):
+    """Async facade over a fresh database."""
+    facade = AsyncDatabase(Database(str(tmp_path / "test.db")))
+    yield facade
+    facade.close()
+
+
+class TestAsyncDatabase:
+    """Tests for off-loop reads and batched writes."""
+
+    def test_concurrent_writes_are_batched(self, async_db, monkeypatch):
+        """Test writes issued together are committed in one batch."""
+        batches = []
+        original = async_db.db.add_transactions
+
+        def recording(transactions):
+            batches.append(len(transactions))
+            return original(transactions)
+
+        monkeypatch.setattr(async_db.db, "add_transactions", recording)
+
+        async def run():
+            await asyncio.gather(*(
+                async_db.add_transaction("bitcoin", "BTC", "BUY", 1.0, 100.0 + i)
+                for i in range(20)
+            ))
+            return await async_db.get_holdings()
+
+        holdings = asyncio.run(run())
+        assert batches == [20]
+        assert holdings[0]["amount"] == pytest.approx(20.0)
+
+    def test_bad_row_fails_only_its_caller(self, async_db):
+        """Test a failing transaction doesn't fail the rest of its batch."""
+        async def run():
+            results = await asyncio.gather(
+                async_db.add_transaction("bitcoin", "BTC", "BUY", 1.0, 100.0),
+                async_db.add_transaction(None, "BAD", "BUY", 1.0, 1.0),
+                async_db.add_transaction("bitcoin", "BTC", "BUY", 2.0, 100.0),
+                return_exceptions=True,
+            )
+            return results, await async_db.get_holdings()
+
+        results, holdings = asyncio.run(run())
+        assert results[0] is None and results[2] is None
+        assert isinstance(results[1], Exception)
+        assert holdings[0]["amount"] == pytest.approx(3.0)
+
+    def test_cancelled_batch_cancels_waiters(self, async_db, monkeypatch):
+        """Test waiters are released if the batch's executor future is cancelled."""
+        async def run():
+            loop = asyncio.get_running_loop()
+            cancelled = loop.create_future()
+            cancelled.cancel()
+            monkeypatch.setattr(loop, "run_in_executor", lambda *args: cancelled)
+            write = async_db.add_transaction("bitcoin", "BTC", "BUY", 1.0, 100.0)
+            return await asyncio.wait_for(asyncio.gather(write, return_exceptions=True), 1)
+
+        (result,) = asyncio.run(run())
+        assert isinstance(result, asyncio.CancelledError)
+
+    def test_read_sees_queued_write(self, async_db):
+        """Test a read issued right after a queued write observes it."""
+        async def run():
+            write = asyncio.ensure_future(
+                async_db.add_transaction("ethereum", "ETH", "BUY", 2.0, 10.0)
+            )
+            await asyncio.sleep(0)  # let the write get queued
+            holdings = await async_db.get_holdings()
+            await write
+            return holdings
+
+        holdings = asyncio.run(run())
+        assert [h["coin_id"] for h in holdings] == ["ethereum"]
+
+    def test_calls_run_off_the_event_loop_thread(self, async_db):
+        """Test database work happens on the dedicated DB thread."""
+        async def run():
+            return await async_db.run(lambda: threading.current_thread().name)
+
+        assert asyncio.run(run()).startswith("terminalcoin-db")
+
+    def test_close_writes_queued_transactions(self, tmp_path):
+        """Test closing flushes writes whose batch timer has not fired."""
+        path = str(tmp_path / "close.db")
+        facade = AsyncDatabase(Database(path))
+
+        async def queue_only():
+            task = asyncio.ensure_future(facade.add_transaction("solana", "SOL", "BUY", 3.0, 5.0))
+            await asyncio.sleep(0)
+            task.cancel()
+
+        asyncio.run(queue_only())
+        facade.close()
+
+        reopened = Database(path)
+        assert reopened.get_holdings()[0]["amount"] == pytest.approx(3.0)
+        reopened.close()
+
+
+class TestPortfolioManagerAsync:
+    """Tests for the async PortfolioManager entry points."""
+
+    def test_summary_async_matches_sync(self, tmp_path):
+        """Test async and sync summaries agree."""
+        manager = PortfolioManager(Database(str(tmp_path / "pm.db")))
+
+        async def run():
+            assert await manager.add_transaction_async("bitcoin", "btc", "buy", 0.5, 40000.0)
+            return await manager.get_portfolio_summary_async({"bitcoin": 50000.0})
+
+        items = asyncio.run(run())
+        assert items == manager.get_portfolio_summary({"bitcoin": 50000.0})
+        assert items[0].pnl == pytest.approx(5000.0)
+        manager.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,173 @@
+"""
+Unit tests for the SQLite database layer.
+
+Run with: pytest tests/
+"""
+
+import threading
+
+import pytest
+from database import Database
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Fresh file-backed database."""
+    database = Database(str(tmp_path / "test.db"))
+    yield database
+    database.close()
+
+
+class TestConnectionManager:
+    """Tests for long-lived connection handling."""
+
+    def test_connection_reused_within_thread(self, db):
+        """Test the same connection is returned for repeated calls."""
+        assert db._get_connection() is db._get_connection()
+
+    def test_wal_enabled(self, db):
+        """Test WAL journaling is enabled on file databases."""
+        mode = db._get_connection().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode.lower() == "wal"
+
+    def test_separate_connection_per_thread(self, db):
+        """Test worker threads get their own connection."""
+        main_conn = db._get_connection()
+        result = {}
+
+        def worker():
+            result["conn"] = db._get_connection()
+            result["holdings"] = db.get_holdings()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert result["conn"] is not main_conn
+        assert result["holdings"] == []
+
+    def test_concurrent_writes_from_threads(self, db):
+        """Test writes from several threads are all recorded."""
+        def worker(n):
+            for _ in range(25):
+                db.add_transaction(f"coin-{n}", f"C{n}", "BUY", 1.0, 10.0)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(db.get_transactions()) == 100
+        assert {h["amount"] for h in db.get_holdings()} == {25.0}
+
+    def test_reopens_after_close(self, db):
+        """Test the database is usable again after close()."""
+        db.add_transaction("bitcoin", "BTC", "BUY", 1.0, 100.0)
+        db.close()
+        assert len(db.get_holdings()) == 1
+
+    def test_in_memory_database_shared(self):
+        """Test ':memory:' uses a single shared connection across threads."""
+        database = Database(":memory:")
+        database.add_transaction("bitcoin", "BTC", "BUY", 1.0, 100.0)
+        result = {}
+
+        thread = threading.Thread(target=lambda: result.update(h=database.get_holdings()))
+        thread.start()
+        thread.join()
+
+        assert len(result["h"]) == 1
+        database.close()
+
+
+class TestHoldings:
+    """Tests for holdings bookkeeping."""
+
+    def test_buy_updates_average_price(self, db):
+        """Test weighted average buy price across buys."""
+        db.add_transaction("bitcoin", "BTC", "BUY", 1.0, 100.0)
+        db.add_transaction("bitcoin", "BTC", "BUY", 1.0, 200.0)
+        holding = db.get_holdings()[0]
+        assert holding["amount"] == pytest.approx(2.0)
+        assert holding["average_buy_price"] == pytest.approx(150.0)
+
+    def test_sell_everything_removes_holding(self, db):
+        """Test selling the full amount deletes the holding."""
+        db.add_transaction("bitcoin", "BTC", "BUY", 1.0, 100.0)
+        db.add_transaction("bitcoin", "BTC", "SELL", 1.0, 120.0)
+        assert db.get_holdings() == []
+        assert len(db.get_transactions("bitcoin")) == 2
+
+
+class TestTransactionQueries:
+    """Tests for paginated and aggregated transaction queries."""
+
+    @pytest.fixture
+    def history(self, db):
+        """Database with 25 trades, one every 5 hours, alternating two coins."""
+        from datetime import datetime, timedelta
+
+        base = datetime(2024, 1, 1)
+        rows = []
+        for i in range(25):
+            coin = ("bitcoin", "BTC") if i % 2 == 0 else ("ethereum", "ETH")
+            side = "SELL" if i % 5 == 4 else "BUY"
+            rows.append((*coin, side, 1.0, 10.0 + i, base + timedelta(hours=5 * i)))
+        db.bulk_import_transactions(rows)
+        return db
+
+    def test_keyset_pages_cover_history_once(self, history):
+        """Test paging returns every row exactly once, newest first."""
+        seen = list(history.iter_transactions(page_size=7))
+        assert len(seen) == 25
+        assert len({tx["id"] for tx in seen}) == 25
+        keys = [(tx["timestamp"], tx["id"]) for tx in seen]
+        assert keys == sorted(keys, reverse=True)
+
+    def test_page_cursor_and_coin_filter(self, history):
+        """Test the before-cursor continues where the previous page ended."""
+        first = history.get_transactions_page(coin_id="bitcoin", page_size=5)
+        cursor = (first[-1]["timestamp"], first[-1]["id"])
+        second = history.get_transactions_page(coin_id="bitcoin", before=cursor, page_size=5)
+        assert all(tx["coin_id"] == "bitcoin" for tx in first + second)
+        assert second[0]["timestamp"] < first[-1]["timestamp"]
+
+    def test_date_range_filter(self, history):
+        """Test [start, end) filtering."""
+        from datetime import datetime
+
+        rows = list(history.iter_transactions(start=datetime(2024, 1, 2), end=datetime(2024, 1, 3)))
+        assert rows and all(tx["timestamp"].startswith("2024-01-02") for tx in rows)
+
+    def test_daily_aggregates(self, history):
+        """Test per-coin daily volume and value sums."""
+        aggregates = history.get_transaction_aggregates(period="day")
+        assert sum(a["trades"] for a in aggregates) == 25
+        total_buy_value = sum(a["buy_value"] for a in aggregates)
+        expected = sum(10.0 + i for i in range(25) if i % 5 != 4)
+        assert total_buy_value == pytest.approx(expected)
+        assert {a["period"] for a in aggregates} == {f"2024-01-0{d}" for d in range(1, 7)}
+
+    def test_latest_transaction_id(self, db):
+        """Test the newest id changes when trades are added."""
+        assert db.get_latest_transaction_id() == 0
+        db.add_transaction("bitcoin", "BTC", "BUY", 1.0, 100.0)
+        first = db.get_latest_transaction_id()
+        db.add_transaction("bitcoin", "BTC", "SELL", 0.5, 120.0)
+        assert db.get_latest_transaction_id() > first > 0
+
+    def test_history_query_uses_index(self, history):
+        """Test paginated per-coin queries are served by an index."""
+        plan = history._get_connection().execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM transactions WHERE coin_id = ? "
+            "AND (timestamp, id) < (?, ?) ORDER BY timestamp DESC, id DESC LIMIT 10",
+            ("bitcoin", "2024-01-03", 10)
+        ).fetchall()
+        details = " ".join(row[-1] for row in plan)
+        assert "idx_transactions_coin_time" in details
+        assert "TEMP B-TREE" not in details
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,84 @@
+"""
+Unit tests for the feed registry.
+
+Run with: pytest tests/
+"""
+
+import sys
+
+import pytest
+from config import news_config
+from exceptions import ConfigurationException
+from feed_registry import FeedSpec, load_feeds
+
+
+OPML = """<?xml version="1.0"?>
+<opml version="2.0">
+  <head><title>Crypto</title></head>
+  <body>
+    <outline text="News">
+      <outline text="CoinDesk" type="rss" xmlUrl="https://www.coindesk.com/feed"/>
+      <outline title="The Block" text="block" type="rss"
+               xmlUrl="https://www.theblock.co/rss.xml" interval="900"/>
+      <outline text="Again" type="rss" xmlUrl="https://www.coindesk.com/feed"/>
+    </outline>
+  </body>
+</opml>
+"""
+
+TOML = """
+[[feeds]]
+name = "CoinDesk"
+url = "https://www.coindesk.com/feed"
+
+[[feeds]]
+url = "https://www.theblock.co/rss.xml"
+interval = 900
+"""
+
+
+class TestLoadFeeds:
+    """Tests for reading feed lists."""
+
+    def test_default_feeds(self):
+        """Test without a file the built-in feeds are used."""
+        feeds = load_feeds(None)
+        assert [feed.name for feed in feeds] == list(news_config.RSS_FEEDS)
+        assert all(feed.interval is None for feed in feeds)
+
+    def test_opml(self, tmp_path):
+        """Test nested outlines are read, titles win over text and URLs are deduplicated."""
+        path = tmp_path / "feeds.opml"
+        path.write_text(OPML)
+        assert load_feeds(str(path)) == [
+            FeedSpec("CoinDesk", "https://www.coindesk.com/feed"),
+            FeedSpec("The Block", "https://www.theblock.co/rss.xml", 900.0),
+        ]
+
+    @pytest.mark.skipif(sys.version_info < (3, 11), reason="needs tomllib")
+    def test_toml(self, tmp_path):
+        """Test [[feeds]] tables are read and a missing name defaults to the URL."""
+        path = tmp_path / "feeds.toml"
+        path.write_text(TOML)
+        assert load_feeds(str(path)) == [
+            FeedSpec("CoinDesk", "https://www.coindesk.com/feed"),
+            FeedSpec("https://www.theblock.co/rss.xml", "https://www.theblock.co/rss.xml", 900.0),
+        ]
+
+    @pytest.mark.parametrize("name, content", [
+        ("feeds.opml", '<opml><body><outline xmlUrl="ftp://example.com/rss"/></body></opml>'),
+        ("feeds.opml", '<opml><body><outline xmlUrl="https://a.test" interval="0"/></body></opml>'),
+        ("feeds.opml", "<opml><body>"),
+        ("feeds.json", "{}"),
+    ])
+    def test_invalid_lists(self, tmp_path, name, content):
+        """Test bad URLs, intervals, syntax and file types raise ConfigurationException."""
+        path = tmp_path / name
+        path.write_text(content)
+        with pytest.raises(ConfigurationException):
+            load_feeds(str(path))
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing file raises ConfigurationException."""
+        with pytest.raises(ConfigurationException):
+            load_feeds(str(tmp_path / "missing.opml"))
@@ -0,0 +1,87 @@
+"""
+Unit tests for the feed scheduler.
+
+Run with: pytest tests/
+"""
+
+import random
+
+import pytest
+from feed_registry import FeedSpec
+from feed_scheduler import FeedScheduler
+
+
+FAST = FeedSpec("Fast", "https://fast.test/rss")
+SLOW = FeedSpec("Slow", "https://slow.test/rss")
+FIXED = FeedSpec("Fixed", "https://fixed.test/rss", interval=900)
+
+
+def make_scheduler(jitter: float = 0.0) -> FeedScheduler:
+    """Scheduler with round test bounds."""
+    return FeedScheduler(min_interval=60, max_interval=3600, max_backoff=7200,
+                         jitter=jitter, rng=random.Random(1))
+
+
+class TestFeedScheduler:
+    """Tests for per-feed polling intervals."""
+
+    def test_new_feeds_are_due_at_once(self):
+        """Test new feeds are due immediately and polled ones only after their interval."""
+        scheduler = make_scheduler()
+        scheduler.sync([FAST, SLOW], now=0)
+        assert scheduler.due(0) == [FAST, SLOW]
+
+        scheduler.record_success(FAST.url, 3, now=0)
+        assert scheduler.due(30) == [SLOW]
+        assert scheduler.next_due() == 0
+
+        scheduler.sync([FAST], now=30)
+        assert set(scheduler.states) == {FAST.url}
+
+    def test_interval_follows_publishing_rate(self):
+        """Test busy feeds are polled often, quiet ones rarely, fixed ones on schedule."""
+        scheduler = make_scheduler()
+        scheduler.sync([FAST, SLOW, FIXED], now=0)
+        for url in scheduler.states:
+            scheduler.record_success(url, 10, now=0)
+
+        for now in range(600, 6000, 600):
+            scheduler.record_success(FAST.url, 5, now=now)     # one entry every 2 minutes
+            scheduler.record_success(SLOW.url, 0, now=now)
+            scheduler.record_success(FIXED.url, 5, now=now)
+
+        states = scheduler.states
+        assert states[FAST.url].interval == pytest.approx(120)
+        assert states[SLOW.url].interval == 3600
+        assert states[FIXED.url].interval == 900
+
+    def test_failures_back_off_exponentially(self):
+        """Test each failure doubles the delay up to the cap and a success resets it."""
+        scheduler = make_scheduler()
+        scheduler.sync([FAST], now=0)
+        delays = []
+        for _ in range(8):
+            scheduler.record_failure(FAST.url, now=0)
+            delays.append(scheduler.states[FAST.url].next_due)
+        assert delays[:4] == [120, 240, 480, 960]
+        assert delays[-1] == 7200
+
+        # A feed that has been failing for ages stays at the cap
+        scheduler.states[FAST.url].failures = 5000
+        scheduler.record_failure(FAST.url, now=0)
+        assert scheduler.states[FAST.url].next_due == 7200
+
+        scheduler.record_success(FAST.url, 1, now=0)
+        assert scheduler.states[FAST.url].failures == 0
+        assert scheduler.states[FAST.url].next_due == 60
+
+    def test_jitter_spreads_feeds(self):
+        """Test jittered delays stay within bounds and differ between feeds."""
+        scheduler = make_scheduler(jitter=0.1)
+        feeds = [FeedSpec(f"Feed {i}", f"https://feed{i}.test/rss") for i in range(50)]
+        scheduler.sync(feeds, now=0)
+        for feed in feeds:
+            scheduler.record_success(feed.url, 1, now=0)
+        due = [state.next_due for state in scheduler.states.values()]
+        assert all(54 <= value <= 66 for value in due)
+        assert len(set(due)) == len(due)
@@ -0,0 +1,76 @@
+"""
+Unit tests for streaming feed parsing.
+
+Run with: pytest tests/
+"""
+
+import feedparser
+import pytest
+from feed_stream import FeedStreamParser
+
+
+RSS = b"""<?xml version='1.0'?>
+<rss version='2.0' xmlns:content="http://purl.org/rss/1.0/modules/content/"
+     xmlns:dc="http://purl.org/dc/elements/1.1/">
+<channel><title>Feed</title>
+<item><title>A &amp; B</title><link>https://example.com/1</link><guid isPermaLink="false">g1</guid>
+<description><![CDATA[<p>Hello <b>world</b></p>]]></description>
+<pubDate>Tue, 10 Jun 2025 04:00:00 +0200</pubDate></item>
+<item><title>C</title><guid>https://example.com/2</guid><content:encoded>Full text</content:encoded>
+<dc:date>2025-06-10T04:00:00Z</dc:date></item>
+<item><title>D</title><link>https://example.com/3</link></item>
+</channel></rss>"""
+
+ATOM = b"""<?xml version='1.0'?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Feed</title>
+<entry><title>E</title>
+<link rel="self" href="https://example.com/self"/><link href="https://example.com/e"/>
+<id>urn:e</id><updated>2025-06-10T04:00:00.123Z</updated>
+<content type="html">&lt;p&gt;Body&lt;/p&gt;</content></entry>
+</feed>"""
+
+FIELDS = ("title", "link", "id", "summary", "published_parsed", "updated_parsed")
+
+
+def stream(body: bytes, limit: int = 10, chunk: int = 7, **kwargs) -> FeedStreamParser:
+    """Parser fed ``body`` in small chunks until it is done."""
+    parser = FeedStreamParser(limit, **kwargs)
+    for i in range(0, len(body), chunk):
+        if parser.feed(body[i:i + chunk]):
+            break
+    return parser
+
+
+class TestFeedStreamParser:
+    """Tests for incremental RSS/Atom parsing."""
+
+    @pytest.mark.parametrize("body", [RSS, ATOM])
+    def test_matches_feedparser(self, body):
+        """Test entries carry the same fields feedparser gives them."""
+        # dict.get skips feedparser's deprecated updated -> published mapping
+        expected = [
+            {key: dict.get(entry, key) for key in FIELDS}
+            for entry in feedparser.parse(body).entries
+        ]
+        entries = stream(body).close()
+        assert [{key: dict.get(entry, key) for key in FIELDS} for entry in entries] == expected
+
+    def test_stops_after_limit(self):
+        """Test reading stops once ``limit`` entries are complete."""
+        parser = stream(RSS, limit=1)
+        assert parser.done and parser.size < RSS.index(b"<title>C")
+        assert [entry.title for entry in parser.close()] == ["A & B"]
+
+    def test_body_is_capped(self):
+        """Test reading stops at max_bytes, keeping the entries parsed so far."""
+        big = b"<item><title>Big</title><description>" + b"x" * 100_000 + b"</description></item>"
+        body = RSS.replace(b"</channel>", big + b"</channel>")
+        parser = stream(body, chunk=4096, max_bytes=len(RSS))
+        assert parser.truncated and parser.size == len(RSS)
+        assert [entry.title for entry in parser.close()] == ["A & B", "C", "D"]
+
+    def test_malformed_feed_falls_back_to_feedparser(self):
+        """Test HTML entities that aren't valid XML still parse."""
+        body = RSS.replace(b"A &amp; B", b"A&nbsp;B")
+        entries = stream(body).close()
+        assert [entry.title for entry in entries] == ["A\xa0B", "C", "D"]
@@ -0,0 +1,114 @@
+"""
+Unit tests for Monte Carlo portfolio simulation.
+
+Run with: pytest tests/
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from database import Database
+from exceptions import ValidationException
+from monte_carlo import MonteCarloSimulator
+from portfolio_manager import PortfolioManager
+
+
+def sample_returns(days=500, coins=3, seed=7):
+    """Correlated daily returns with a small positive drift."""
+    rng = np.random.default_rng(seed)
+    common = rng.normal(0.0, 0.02, (days, 1))
+    return 0.001 + common + rng.normal(0.0, 0.01, (days, coins))
+
+
+class TestMonteCarloSimulator:
+    """Tests for the simulator."""
+
+    @pytest.mark.parametrize("method", ["bootstrap", "normal"])
+    def test_seed_is_reproducible_across_chunk_sizes(self, method):
+        """Test a seed fixes the result and chunking doesn't change the distribution."""
+        simulator = MonteCarloSimulator(sample_returns())
+        values = [100.0, 50.0, 25.0]
+        first = simulator.simulate(values, horizons=[1, 30], paths=4000, method=method, seed=1)
+        again = simulator.simulate(values, horizons=[1, 30], paths=4000, method=method, seed=1)
+        chunked = simulator.simulate(
+            values, horizons=[1, 30], paths=4000, method=method, chunk_size=300, seed=1
+        )
+
+        assert first.outcomes[1].percentiles == again.outcomes[1].percentiles
+        assert first.initial_value == 175.0
+        assert chunked.outcomes[1].mean == pytest.approx(first.outcomes[1].mean, rel=0.02)
+
+    @pytest.mark.parametrize("method", ["bootstrap", "normal"])
+    def test_expected_growth(self, method):
+        """Test the mean outcome matches the compounded mean daily return."""
+        returns = sample_returns()
+        simulator = MonteCarloSimulator(returns)
+        result = simulator.simulate(
+            [100.0, 0.0, 0.0], horizons=[7, 90], paths=20000, method=method, seed=3
+        )
+
+        growth = np.exp(np.log1p(returns[:, 0]).mean() * 90)
+        long = result.outcomes[1]
+        assert [o.days for o in result.outcomes] == [7, 90]
+        assert long.percentiles[50] == pytest.approx(100.0 * growth, rel=0.05)
+        assert long.percentiles[5] < long.percentiles[50] < long.percentiles[95]
+        assert 0.0 < long.prob_loss < 1.0
+        assert long.cvar >= long.var > 0.0
+        # Uncertainty grows with the horizon
+        assert result.outcomes[0].var < long.var
+
+    def test_single_day_bootstrap_uses_history(self):
+        """Test one-day bootstrap outcomes are exactly the historical days."""
+        returns = np.array([[0.1], [-0.1]])
+        result = MonteCarloSimulator(returns).simulate([100.0], horizons=[1], paths=1000, seed=5)
+        outcome = result.outcomes[0]
+        assert outcome.percentiles[5] == pytest.approx(90.0)
+        assert outcome.percentiles[95] == pytest.approx(110.0)
+
+    def test_invalid_parameters(self):
+        """Test unknown methods and empty horizons are rejected."""
+        simulator = MonteCarloSimulator(sample_returns())
+        with pytest.raises(ValidationException):
+            simulator.simulate([1.0, 1.0, 1.0], method="garch")
+        with pytest.raises(ValidationException):
+            simulator.simulate([1.0, 1.0, 1.0], horizons=[0])
+        with pytest.raises(ValidationException):
+            MonteCarloSimulator(np.empty((0, 2)))
+
+
+class TestSimulatePortfolio:
+    """Tests for simulating stored holdings."""
+
+    def test_simulate_holdings(self, tmp_path):
+        """Test the manager simulates the current positions from price history."""
+        manager = PortfolioManager(Database(str(tmp_path / "test.db")))
+        try:
+            assert manager.simulate_portfolio({"bitcoin": 100.0}) is None
+
+            manager.add_transaction("bitcoin", "btc", "BUY", 2.0, 100.0)
+            end = datetime.utcnow().date() - timedelta(days=1)
+            closes = 100.0 * np.cumprod(1.0 + sample_returns(days=120, coins=1)[:, 0])
+            days = [(end - timedelta(days=119 - i)).isoformat() for i in range(120)]
+            manager.db.upsert_prices(zip(["bitcoin"] * 120, days, closes.tolist()))
+
+            result = manager.simulate_portfolio(
+                {"bitcoin": 150.0}, horizons=[30], paths=2000, seed=1
+            )
+            assert result.initial_value == pytest.approx(300.0)
+            assert result.outcomes[0].days == 30
+
+            # The async path reads on the database thread and gives the same outcome
+            async_result = asyncio.run(
+                manager.simulate_portfolio_async(
+                    {"bitcoin": 150.0}, horizons=[30], paths=2000, seed=1
+                )
+            )
+            assert async_result.outcomes[0].percentiles == result.outcomes[0].percentiles
+        finally:
+            manager.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
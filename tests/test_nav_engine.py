@@ -0,0 +1,201 @@
+"""
+Unit tests for the portfolio NAV engine.
+
+Run with: pytest tests/
+"""
+
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+from database import Database
+from database import DEFAULT_PORTFOLIO_ID
+from nav_engine import NavEngine, compute_nav, state_key, STATE_DATE_KEY
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Fresh database."""
+    database = Database(str(tmp_path / "test.db"))
+    yield database
+    database.close()
+
+
+def trade(coin_id, type, amount, price, day, hour=12):
+    """Bulk-import row for a trade on the given day."""
+    return (
+        coin_id,
+        coin_id[:3].upper(),
+        type,
+        amount,
+        price,
+        datetime.combine(day, datetime.min.time()) + timedelta(hours=hour),
+    )
+
+
+def snapshots(db, portfolio_id=DEFAULT_PORTFOLIO_ID):
+    """Snapshot rows of one portfolio as comparable tuples."""
+    return [
+        (s["date"], round(s["nav"], 6), round(s["net_invested"], 6), s["positions"])
+        for s in db.get_portfolio_snapshots(portfolio_id=portfolio_id)
+    ]
+
+
+class TestComputeNav:
+    """Tests for the vectorized computation."""
+
+    def test_matches_sequential_replay(self):
+        """Test positions, sells beyond the position and price carry-forward."""
+        rng = random.Random(7)
+        start = date(2024, 1, 1)
+        transactions = []
+        for i in range(400):
+            coin_id = rng.choice(["bitcoin", "ethereum"])
+            day = start + timedelta(days=rng.randint(0, 59))
+            transactions.append(
+                (
+                    i,
+                    coin_id,
+                    day.isoformat(),
+                    rng.choice(["BUY", "SELL"]),
+                    rng.random() * 2,
+                    100.0 + i,
+                )
+            )
+        transactions.sort(key=lambda t: (t[1], t[2], t[0]))
+        prices = [
+            ("bitcoin", (start + timedelta(days=d)).isoformat(), 1000.0 + d)
+            for d in range(0, 60, 7)
+        ]
+
+        result = compute_nav(transactions, prices, start, start + timedelta(days=59))
+
+        # Reference: replay day by day
+        amounts, last_price, invested = {}, {}, 0.0
+        stored = {(c, d): p for c, d, p in prices}
+        for offset in range(60):
+            day = (start + timedelta(days=offset)).isoformat()
+            for _, coin_id, tx_day, type, amount, price in transactions:
+                if tx_day != day:
+                    continue
+                held = amounts.get(coin_id, 0.0)
+                new = held + amount if type == "BUY" else max(0.0, held - amount)
+                invested += (new - held) * price
+                amounts[coin_id] = new
+                last_price[coin_id] = price
+            # A same-day stored price wins over trade prices
+            for coin_id in amounts:
+                last_price[coin_id] = stored.get((coin_id, day), last_price.get(coin_id))
+            nav = sum(amount * last_price[c] for c, amount in amounts.items())
+            row = result.snapshots.iloc[offset]
+            assert row["nav"] == pytest.approx(nav)
+            assert row["net_invested"] == pytest.approx(invested)
+            assert row["positions"] == sum(1 for a in amounts.values() if a > 0)
+
+    def test_no_transactions(self):
+        """Test an empty log yields zero-valued days."""
+        result = compute_nav([], [], date(2024, 1, 1), date(2024, 1, 3))
+        assert list(result.snapshots["nav"]) == [0.0, 0.0, 0.0]
+
+
+class TestNavEngine:
+    """Tests for materialization and incremental updates."""
+
+    def test_incremental_update_matches_rebuild(self, db):
+        """Test appending days and transactions equals a full rebuild."""
+        start = date(2024, 1, 1)
+        db.bulk_import_transactions([
+            trade("bitcoin", "BUY", 1.0, 100.0, start),
+            trade("ethereum", "BUY", 5.0, 10.0, start + timedelta(days=2)),
+            trade("bitcoin", "SELL", 0.5, 150.0, start + timedelta(days=5)),
+        ])
+        db.upsert_prices(
+            [("bitcoin", (start + timedelta(days=d)).isoformat(), 100.0 + d) for d in range(20)]
+        )
+
+        engine = NavEngine(db)
+        assert engine.update(start + timedelta(days=9)) == 10
+        db.bulk_import_transactions([trade("solana", "BUY", 3.0, 20.0, start + timedelta(days=12))])
+        # Only the days after the saved state (yesterday) are recomputed
+        assert engine.update(start + timedelta(days=14)) == 6
+        incremental = snapshots(db)
+
+        engine.rebuild(start + timedelta(days=14))
+        assert snapshots(db) == incremental
+        assert len(incremental) == 15
+        assert incremental[-1][3] == 3
+
+    def test_backdated_transaction_triggers_rebuild(self, db):
+        """Test a transaction dated before the saved state is included."""
+        start = date(2024, 1, 1)
+        db.bulk_import_transactions([trade("bitcoin", "BUY", 1.0, 100.0, start)])
+        engine = NavEngine(db)
+        engine.update(start + timedelta(days=9))
+
+        db.bulk_import_transactions(
+            [trade("bitcoin", "BUY", 1.0, 100.0, start + timedelta(days=3))]
+        )
+        engine.update(start + timedelta(days=9))
+        navs = [s[1] for s in snapshots(db)]
+        assert navs[2] == pytest.approx(100.0)
+        assert navs[3] == pytest.approx(200.0)
+
+    def test_invalidate_forces_rebuild(self, db):
+        """Test back-filled prices invalidate the saved state."""
+        start = date(2024, 1, 1)
+        db.bulk_import_transactions([trade("bitcoin", "BUY", 1.0, 100.0, start)])
+        engine = NavEngine(db)
+        engine.update(start + timedelta(days=9))
+
+        db.upsert_prices([("bitcoin", (start + timedelta(days=4)).isoformat(), 300.0)])
+        engine.invalidate((start + timedelta(days=4)).isoformat())
+        assert db.get_app_state(state_key(STATE_DATE_KEY, DEFAULT_PORTFOLIO_ID)) is None
+
+        engine.update(start + timedelta(days=9))
+        assert snapshots(db)[-1][1] == pytest.approx(300.0)
+
+    def test_reads_prices_of_held_coins_only(self, db, monkeypatch):
+        """Test price history is only read for coins in the portfolio."""
+        start = date(2024, 1, 1)
+        db.bulk_import_transactions([trade("bitcoin", "BUY", 1.0, 100.0, start)])
+        db.upsert_prices([
+            (coin_id, (start + timedelta(days=d)).isoformat(), 1.0)
+            for coin_id in ("bitcoin", "dogecoin") for d in range(10)
+        ])
+        requested = []
+        original = db.get_price_history
+
+        def recording(start=None, end=None, coin_ids=None):
+            requested.append(set(coin_ids))
+            return original(start, end, coin_ids)
+
+        monkeypatch.setattr(db, "get_price_history", recording)
+        engine = NavEngine(db)
+        engine.update(start + timedelta(days=5))
+        engine.update(start + timedelta(days=9))
+        assert requested == [{"bitcoin"}, {"bitcoin"}]
+
+    def test_history_is_kept_per_portfolio(self, db):
+        """Test each portfolio gets its own value history."""
+        start = date(2024, 1, 1)
+        client = db.create_portfolio("Client A")
+        db.bulk_import_transactions([trade("bitcoin", "BUY", 1.0, 100.0, start)])
+        db.bulk_import_transactions(
+            [trade("ethereum", "BUY", 2.0, 10.0, start + timedelta(days=2))], portfolio_id=client
+        )
+        engine = NavEngine(db)
+        engine.update(start + timedelta(days=4))
+
+        assert [s[1] for s in snapshots(db)] == [100.0] * 5
+        assert [s[1] for s in snapshots(db, client)] == [20.0] * 3
+
+        # A back-dated trade in one portfolio only rebuilds that portfolio
+        db.bulk_import_transactions(
+            [trade("ethereum", "BUY", 1.0, 10.0, start + timedelta(days=1))], portfolio_id=client
+        )
+        assert engine.update(start + timedelta(days=4)) == 1 + 4
+        assert [s[1] for s in snapshots(db, client)] == [10.0, 30.0, 30.0, 30.0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
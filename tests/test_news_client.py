@@ -0,0 +1,244 @@
+"""
+Unit tests for the news client.
+
+Run with: pytest tests/
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from models import CoinMarketData
+from news_client import AssetDetector, NewsClient
+from news_store import NewsStore
+
+
+STORIES = [
+    "Bitcoin rallies on strong demand from funds",
+    "Miners report record hashrate after the difficulty adjustment",
+    "Regulators publish new guidance for exchanges in Europe",
+    "Developers ship a long awaited wallet upgrade",
+]
+
+
+def rss(title: str, count: int = 3, stories=STORIES) -> str:
+    """Minimal RSS document with ``count`` items."""
+    items = "".join(
+        f"<item><title>{title} {i}</title><link>https://example.com/{title}/{i}</link>"
+        f"<description>{stories[i % len(stories)]}</description></item>"
+        for i in range(count)
+    )
+    return (
+        f"<?xml version='1.0'?><rss version='2.0'><channel><title>{title}</title>"
+        f"{items}</channel></rss>"
+    )
+
+
+def make_client(feeds, handler, store=None) -> NewsClient:
+    """News client whose HTTP requests are answered by ``handler``."""
+    client = NewsClient(store)
+    client.rss_feeds = feeds
+    client._create_async_client = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestFetchNewsAsync:
+    """Tests for concurrent feed fetching."""
+
+    def test_feeds_are_fetched_concurrently(self):
+        """Test total latency is the slowest feed, not the sum."""
+        async def handler(request):
+            await asyncio.sleep(0.3)
+            return httpx.Response(200, text=rss(request.url.host))
+
+        feeds = {f"Feed {i}": f"https://feed{i}.test/rss" for i in range(10)}
+        client = make_client(feeds, handler)
+        start = time.perf_counter()
+        items = asyncio.run(client.fetch_news_async(limit=2))
+        assert time.perf_counter() - start < 2.0
+        # Every feed runs the same two stories, which collapse into one item each
+        assert len(items) == 2
+        assert {name for item in items for name in [item.source, *item.related_sources]} == set(
+            feeds
+        )
+        assert items[0].assets == ["BTC"]
+
+    def test_slow_and_failing_feeds_are_skipped(self):
+        """Test the deadline drops slow feeds and HTTP errors don't affect the others."""
+        async def handler(request):
+            if request.url.host == "slow.test":
+                await asyncio.sleep(5)
+            if request.url.host == "broken.test":
+                return httpx.Response(503)
+            return httpx.Response(200, text=rss("ok"))
+
+        feeds = {
+            "Slow": "https://slow.test/rss",
+            "Broken": "https://broken.test/rss",
+            "Good": "https://good.test/rss",
+        }
+        client = make_client(feeds, handler)
+        start = time.perf_counter()
+        items = asyncio.run(client.fetch_news_async(limit=5, deadline=0.5))
+        assert time.perf_counter() - start < 2.0
+        assert [item.source for item in items] == ["Good"] * 3
+
+    def test_poll_fetches_only_due_feeds(self):
+        """Test a poll skips feeds that aren't due and still shows their latest items."""
+        requested = []
+
+        def handler(request):
+            requested.append(request.url.host)
+            name = request.url.host.split(".")[0]
+            # Different stories per feed, so they don't collapse into one
+            return httpx.Response(200, text=rss(name, stories=STORIES[(name == "b") * 2:]))
+
+        client = make_client({"A": "https://a.test/rss", "B": "https://b.test/rss"}, handler)
+        assert len(asyncio.run(client.poll_news_async(limit=2, now=0))) == 4
+        assert sorted(requested) == ["a.test", "b.test"]
+
+        assert asyncio.run(client.poll_news_async(limit=2, now=1)) is None
+        client.scheduler.states["https://b.test/rss"].next_due = 1
+        items = asyncio.run(client.poll_news_async(limit=2, now=1))
+        assert requested[2:] == ["b.test"]
+        assert {item.source for item in items} == {"A", "B"}
+
+    def test_large_feed_is_read_only_up_to_limit(self):
+        """Test a multi-megabyte feed is streamed and abandoned after ``limit`` entries."""
+        document = rss("big", 20_000).encode()
+        sent = []
+
+        async def body():
+            for i in range(0, len(document), 16384):
+                sent.append(i)
+                yield document[i:i + 16384]
+
+        client = make_client(
+            {"Big": "https://big.test/rss"}, lambda request: httpx.Response(200, content=body())
+        )
+        items = asyncio.run(client.fetch_news_async(limit=4))
+        assert len(items) == 4
+        assert len(document) > 2_000_000 and len(sent) == 1
+
+
+class TestConditionalFetch:
+    """Tests for ETag handling and the entry cache."""
+
+    def test_unchanged_feed_and_known_entries_are_not_reprocessed(self, tmp_path, monkeypatch):
+        """Test a 304 is served from the store and only new entries are analyzed."""
+        body = {"text": rss("first", 2), "etag": '"v1"'}
+        requests = []
+
+        def handler(request):
+            requests.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match") == body["etag"]:
+                return httpx.Response(304)
+            return httpx.Response(200, text=body["text"], headers={"ETag": body["etag"]})
+
+        store = NewsStore(str(tmp_path / "news.db"))
+        client = make_client({"Feed": "https://feed.test/rss"}, handler, store)
+        analyzed = []
+        score = client.sentiment._score
+        monkeypatch.setattr(
+            client.sentiment, "_score", lambda texts: analyzed.extend(texts) or score(texts)
+        )
+
+        first = asyncio.run(client.fetch_news_async(limit=10))
+        assert len(first) == 2 and len(analyzed) == 2
+
+        cached = asyncio.run(client.fetch_news_async(limit=10))
+        assert requests[-1] == '"v1"'
+        assert {item.link for item in cached} == {item.link for item in first}
+        assert len(analyzed) == 2
+
+        # A changed feed with one new entry analyzes just that entry
+        body.update(text=rss("first", 3), etag='"v2"')
+        changed = asyncio.run(client.fetch_news_async(limit=10))
+        assert len(changed) == 3 and len(analyzed) == 3
+        store.close()
+
+
+class TestSentimentBatching:
+    """Tests for scoring a refresh's new entries together."""
+
+    def test_refresh_scores_new_entries_in_one_batch(self, tmp_path, monkeypatch):
+        """Test the new entries of all feeds are scored in one call, outside the store lock."""
+        store = NewsStore(str(tmp_path / "news.db"))
+        client = make_client(
+            {name: f"https://{name}.test/rss" for name in ("a", "b", "c")},
+            lambda request: httpx.Response(200, text=rss(request.url.host.split(".")[0])),
+            store,
+        )
+        batches = []
+        score = client.sentiment._score
+
+        def spy(texts):
+            assert not client._store_lock.locked()
+            batches.append(len(texts))
+            return score(texts)
+
+        monkeypatch.setattr(client.sentiment, "_score", spy)
+        asyncio.run(client.fetch_news_async(limit=3))
+        assert batches == [9]
+
+        asyncio.run(client.fetch_news_async(limit=3))
+        assert batches == [9]
+        links = [f"https://example.com/{name}/{i}" for name in "abc" for i in range(3)]
+        assert len(store.get_items(links)) == 9
+        store.close()
+
+
+class TestAssetDetector:
+    """Tests for asset detection."""
+
+    def test_word_boundaries(self):
+        """Test names match in any case and tickers only as whole uppercase words."""
+        detector = AssetDetector()
+        assert detector.detect("A new solution for dotted lines") == []
+        assert detector.detect("SOL and $ETH rally while Bitcoin, cardano lag") == [
+            "ADA",
+            "BTC",
+            "ETH",
+            "SOL",
+        ]
+        assert detector.detect("DOTS and XRP-based tokens") == ["XRP"]
+
+    def test_universe_is_detected_and_rebuilt_only_on_change(self):
+        """Test coins from the market list are detected and an unchanged list is a no-op."""
+        detector = AssetDetector()
+        coins = [
+            CoinMarketData(id="pepe", symbol="pepe", name="Pepe", current_price=1e-5),
+            CoinMarketData(
+                id="bitcoin-cash", symbol="bch", name="Bitcoin Cash", current_price=400.0
+            ),
+            CoinMarketData(id="the-graph", symbol="grt", name="The Graph", current_price=0.2),
+        ]
+        assert detector.update_universe(coins)
+        assert not detector.update_universe(coins)
+
+        assert detector.detect("Traders pile into PEPE and The Graph") == ["GRT", "PEPE"]
+        assert detector.detect("Bitcoin Cash breaks out") == ["BCH"]
+        assert detector.detect("pepper prices") == []
+        # The built-in keywords stay
+        assert detector.detect("Ethereum upgrade") == ["ETH"]
+
+    def test_universe_names_that_are_common_words(self):
+        """Test market-list names match only as spelled, not as ordinary lowercase words."""
+        detector = AssetDetector()
+        detector.update_universe([
+            CoinMarketData(id="story-2", symbol="ip", name="Story", current_price=5.0),
+            CoinMarketData(id="quant-network", symbol="qnt", name="Quant", current_price=100.0),
+            CoinMarketData(id="immutable-x", symbol="imx", name="Immutable", current_price=1.5),
+            CoinMarketData(id="optimism", symbol="op", name="Optimism", current_price=2.0),
+        ])
+        text = (
+            "This story explains why quant funds value immutable ledgers, "
+            "with optimism near year end."
+        )
+        assert detector.detect(text) == []
+        assert detector.detect("Quant and Optimism lead, IMX follows") == ["IMX", "OP", "QNT"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,79 @@
+"""
+Unit tests for near-duplicate news clustering.
+
+Run with: pytest tests/
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from exceptions import ValidationException
+from news_dedup import StoryClusterer
+from news_store import NewsStore
+from tests.test_news_client import make_client, rss
+
+STORY = (
+    "SEC approves spot Bitcoin ETF applications from several asset managers, "
+    "opening the door for trading to begin as soon as Thursday"
+)
+REWRITE = (
+    "Breaking: SEC approves spot Bitcoin ETF applications from several asset managers, "
+    "opening the door for trading to begin as soon as Thursday morning"
+)
+OTHER = "Ethereum developers schedule the next network upgrade for the spring after testnet delays"
+
+
+class TestStoryClusterer:
+    """Tests for MinHash signatures and clustering."""
+
+    def test_rewrites_cluster_and_other_stories_dont(self):
+        """Test a lightly edited story joins the first one's cluster."""
+        clusterer = StoryClusterer()
+        first, rewrite, other, empty = clusterer.cluster(
+            ["a", "b", "c", "d"], [STORY, REWRITE, OTHER, "..."]
+        )
+        assert first.cluster_id == "a" and not first.duplicate
+        assert rewrite.cluster_id == "a" and rewrite.duplicate
+        assert other.cluster_id == "c"
+        assert empty is None
+
+    def test_signatures_are_stable(self):
+        """Test signatures don't depend on the instance (they are stored)."""
+        assert (StoryClusterer().signature(STORY) == StoryClusterer().signature(STORY)).all()
+
+    def test_bands_must_divide_permutations(self):
+        """Test an impossible banding is rejected."""
+        with pytest.raises(ValidationException):
+            StoryClusterer(permutations=64, bands=10)
+
+
+class TestStoryDedup:
+    """Tests for clustering stories across feeds and refreshes."""
+
+    def test_syndicated_story_is_collapsed_with_source_count(self, tmp_path, monkeypatch):
+        """Test the second feed's copy isn't scored and the story is shown once."""
+        stories = {"one.test": [STORY, OTHER], "two.test": [REWRITE]}
+
+        def handler(request):
+            return httpx.Response(200, text=rss(request.url.host, len(stories[request.url.host]),
+                                                stories[request.url.host]))
+
+        store = NewsStore(str(tmp_path / "news.db"))
+        client = make_client({"One": "https://one.test/rss"}, handler, store)
+        scored = []
+        score = client.sentiment._score
+        monkeypatch.setattr(
+            client.sentiment, "_score", lambda texts: scored.extend(texts) or score(texts)
+        )
+        assert len(asyncio.run(client.fetch_news_async(limit=10))) == 2
+
+        # A second feed running the same story later
+        client.rss_feeds = {"One": "https://one.test/rss", "Two": "https://two.test/rss"}
+        items = asyncio.run(client.fetch_news_async(limit=10))
+        assert len(scored) == 2
+        assert len(items) == 2
+        story = next(item for item in items if item.cluster_id == "https://example.com/one.test/0")
+        assert story.related_sources == (["Two"] if story.source == "One" else ["One"])
+        assert store.cluster_sources([story.cluster_id]) == {story.cluster_id: ["One", "Two"]}
+        store.close()
@@ -0,0 +1,103 @@
+"""
+Unit tests for the news store.
+
+Run with: pytest tests/
+"""
+
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+
+from models import NewsItem, SentimentType
+from news_store import NewsStore
+
+FEED = "https://feed.test/rss"
+
+
+def item(title: str, assets=(), hours_ago: int = 0, summary: str = "") -> NewsItem:
+    """NewsItem published ``hours_ago`` hours ago."""
+    return NewsItem(
+        source="Feed",
+        title=title,
+        link=f"https://feed.test/{title.replace(' ', '-')}",
+        summary=summary,
+        sentiment=SentimentType.BULLISH,
+        sentiment_score=0.6,
+        assets=list(assets),
+        published_at=datetime.now(timezone.utc) - timedelta(hours=hours_ago),
+    )
+
+
+def fill(store: NewsStore) -> None:
+    items = [
+        item("Bitcoin breaks resistance", ["BTC"], hours_ago=5),
+        item(
+            "Ethereum upgrade ships",
+            ["ETH"],
+            hours_ago=4,
+            summary="Validators cheer the Bitcoin-style fee burn",
+        ),
+        item("Bitcoin and Ether ETFs see inflows", ["BTC", "ETH"], hours_ago=1),
+        item("Regulators meet exchanges", hours_ago=3),
+    ]
+    store.save_items(FEED, [(entry.link, entry) for entry in items])
+
+
+class TestNewsSearch:
+    """Tests for full-text search over stored news."""
+
+    def test_search_by_words_and_asset(self, tmp_path):
+        """Test word prefixes, asset filters and newest-first order."""
+        store = NewsStore(str(tmp_path / "news.db"))
+        fill(store)
+
+        titles = [entry.title for entry in store.search("bitc")]
+        assert titles == [
+            "Bitcoin and Ether ETFs see inflows",
+            "Ethereum upgrade ships",
+            "Bitcoin breaks resistance",
+        ]
+        assert [entry.title for entry in store.search("bitcoin", asset="ETH")] == [
+            "Bitcoin and Ether ETFs see inflows", "Ethereum upgrade ships"
+        ]
+        assert [entry.title for entry in store.search(asset="btc", limit=1)] == [
+            "Bitcoin and Ether ETFs see inflows"
+        ]
+        assert len(store.search()) == 4
+        assert store.search('"; DROP TABLE news_items; --') == []
+
+        found = store.search("ETFs")[0]
+        assert sorted(found.assets) == ["BTC", "ETH"] and found.sentiment_score == 0.6
+        assert store.top_assets() == [("BTC", 2), ("ETH", 2)]
+        store.close()
+
+    def test_existing_items_are_indexed(self, tmp_path):
+        """Test a store created before search existed gets its items indexed."""
+        path = str(tmp_path / "news.db")
+        store = NewsStore(path)
+        fill(store)
+        store.close()
+        conn = sqlite3.connect(path)
+        conn.execute("DROP TABLE news_fts")
+        conn.execute("DROP TABLE news_fts_vocab")
+        conn.commit()
+        conn.close()
+
+        store = NewsStore(path)
+        assert len(store.search("regulators")) == 1
+        store.close()
+
+    def test_compact_removes_expired_items_from_the_index(self, tmp_path):
+        """Test retention deletes old items and their search entries."""
+        store = NewsStore(str(tmp_path / "news.db"))
+        fill(store)
+        with store._connections.connection() as conn:
+            conn.execute(
+                "UPDATE news_items SET fetched_at = ? WHERE title LIKE 'Bitcoin%'",
+                (time.time() - 40 * 86400,),
+            )
+
+        assert store.compact(retention_days=30) == 2
+        assert [entry.title for entry in store.search("bitcoin")] == ["Ethereum upgrade ships"]
+        assert store.top_assets() == [("ETH", 1)]
+        store.close()
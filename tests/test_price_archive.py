@@ -0,0 +1,105 @@
+"""
+Unit tests for the memory-mapped price archive.
+
+Run with: pytest tests/
+"""
+
+import threading
+
+import numpy as np
+import pytest
+from exceptions import ValidationException
+from price_archive import PRICES_FILE, TIMESTAMPS_FILE, PriceArchive
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """Archive in a fresh directory."""
+    return PriceArchive(str(tmp_path / "archive"))
+
+
+class TestPriceArchive:
+    """Tests for appending and range reads."""
+
+    def test_append_sorts_dedupes_and_skips_overlap(self, archive):
+        """Test only points newer than the archive are appended."""
+        assert archive.append("bitcoin", [3, 1, 2, 2], [30.0, 10.0, 20.0, 21.0]) == 3
+        assert archive.append("bitcoin", [2, 3, 4], [0.0, 0.0, 40.0]) == 1
+
+        series = archive.get_series("bitcoin")
+        assert series.timestamps.tolist() == [1, 2, 3, 4]
+        assert series.prices.tolist() == [10.0, 21.0, 30.0, 40.0]
+        assert archive.last_timestamp("bitcoin") == 4
+
+    def test_concurrent_appends_write_points_once(self, archive, monkeypatch):
+        """Test two appends of the same points can't both pass the overlap filter."""
+        archive.append("bitcoin", [1], [10.0])
+        barrier = threading.Barrier(2, timeout=0.5)
+        last_timestamp = archive.last_timestamp
+
+        def synchronized(coin_id):
+            # Without the lock both threads read the last timestamp before either writes
+            last = last_timestamp(coin_id)
+            try:
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                pass
+            return last
+
+        monkeypatch.setattr(archive, "last_timestamp", synchronized)
+        threads = [
+            threading.Thread(target=archive.append, args=("bitcoin", [2, 3], [20.0, 30.0]))
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert archive.get_series("bitcoin").timestamps.tolist() == [1, 2, 3]
+
+    def test_range_slices_are_memory_mapped_views(self, archive):
+        """Test time-range reads return views of the mapped file."""
+        archive.append("bitcoin", np.arange(100) * 1000, np.arange(100, dtype=float))
+        series = archive.get_series("bitcoin", start=10_000, end=20_000)
+
+        assert series.prices.tolist() == [float(i) for i in range(10, 20)]
+        assert isinstance(series.prices.base, np.memmap) or isinstance(series.prices, np.memmap)
+        assert not series.prices.flags.owndata
+
+    def test_files_are_valid_npy(self, archive, tmp_path):
+        """Test columns stay loadable with np.load after appends."""
+        archive.append_market_chart("ethereum", [[1000, 1.5], [2000, 2.5]])
+        archive.append_market_chart("ethereum", [[3000, 3.5]])
+        directory = tmp_path / "archive" / "ethereum"
+        assert np.load(directory / TIMESTAMPS_FILE).tolist() == [1000, 2000, 3000]
+        assert np.load(directory / PRICES_FILE).tolist() == [1.5, 2.5, 3.5]
+        assert archive.coins() == ["ethereum"]
+
+    def test_recovers_from_interrupted_append(self, archive, tmp_path):
+        """Test a column left longer by a crash is realigned on the next append."""
+        archive.append("bitcoin", [1, 2], [10.0, 20.0])
+        with open(tmp_path / "archive" / "bitcoin" / TIMESTAMPS_FILE, "ab") as f:
+            f.write(np.int64(99).tobytes())
+
+        reopened = PriceArchive(str(tmp_path / "archive"))
+        assert len(reopened.get_series("bitcoin")) == 2
+        reopened.append("bitcoin", [3], [30.0])
+        assert reopened.get_series("bitcoin").timestamps.tolist() == [1, 2, 3]
+
+    def test_downsample_keeps_last_point(self, archive):
+        """Test strided chart views end at the latest price."""
+        archive.append("bitcoin", np.arange(1000), np.arange(1000, dtype=float))
+        sampled = archive.get_series("bitcoin").downsample(100)
+        assert len(sampled) <= 100
+        assert sampled.prices[-1] == 999.0
+
+    def test_unknown_and_invalid_coins(self, archive):
+        """Test unknown coins are empty and unsafe ids are rejected."""
+        assert len(archive.get_series("nothing-here")) == 0
+        with pytest.raises(ValidationException):
+            archive.append("../etc", [1], [1.0])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
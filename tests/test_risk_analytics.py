@@ -0,0 +1,115 @@
+"""
+Unit tests for portfolio risk analytics.
+
+Run with: pytest tests/
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+from database import Database
+from risk_analytics import RiskModel, build_price_panel, compute_returns_panel, portfolio_risk
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Fresh database."""
+    database = Database(str(tmp_path / "test.db"))
+    yield database
+    database.close()
+
+
+def random_walk(rng, days, drift=0.0005, vol=0.03):
+    """Daily closes of a geometric random walk."""
+    return 100.0 * np.cumprod(1.0 + rng.normal(drift, vol, days))
+
+
+class TestPricePanel:
+    """Tests for panel construction."""
+
+    def test_forward_fill_and_leading_gaps(self):
+        """Test gaps carry the last close and days before the first stay NaN."""
+        start = date(2024, 1, 1)
+        rows = [
+            ("a", "2024-01-01", 1.0),
+            ("a", "2024-01-03", 3.0),
+            ("b", "2024-01-02", 5.0),
+            ("x", "2024-01-02", 9.0),
+        ]
+        panel = build_price_panel(rows, ["a", "b"], start, start + timedelta(days=3))
+        assert panel[:, 0].tolist() == [1.0, 1.0, 3.0, 3.0]
+        assert np.isnan(panel[0, 1])
+        assert panel[1:, 1].tolist() == [5.0, 5.0, 5.0]
+
+        returns = compute_returns_panel(panel, ["a", "b"], start)
+        assert returns.returns[:, 1].tolist() == [0.0, 0.0, 0.0]
+        assert returns.observed.tolist() == [3, 2]
+
+
+class TestPortfolioRisk:
+    """Tests for the risk metrics."""
+
+    def test_matches_reference_statistics(self):
+        """Test metrics agree with straightforward per-series computations."""
+        rng = np.random.default_rng(11)
+        days = 500
+        prices = np.column_stack([random_walk(rng, days) for _ in range(3)])
+        panel = compute_returns_panel(prices, ["bitcoin", "b", "c"], date(2023, 1, 1))
+        weights = np.array([0.5, 0.3, 0.2])
+
+        report = portfolio_risk(panel, weights, benchmark=0, confidence=0.95)
+
+        series = (prices[1:] / prices[:-1] - 1.0) @ weights
+        assert report.observations == days - 1
+        assert report.volatility == pytest.approx(series.std(ddof=1) * np.sqrt(365))
+        assert report.var == pytest.approx(-np.quantile(series, 0.05))
+        assert report.cvar >= report.var
+        assert report.parametric_cvar >= report.parametric_var
+        btc = prices[1:, 0] / prices[:-1, 0] - 1.0
+        assert report.beta == pytest.approx(np.cov(series, btc)[0, 1] / btc.var(ddof=1))
+        assert report.sharpe == pytest.approx(series.mean() / series.std(ddof=1) * np.sqrt(365))
+        assert report.coverage == pytest.approx(1.0)
+
+    def test_max_drawdown(self):
+        """Test drawdown is measured from the running peak."""
+        prices = np.array([[100.0], [120.0], [60.0], [90.0], [130.0], [65.0]])
+        panel = compute_returns_panel(prices, ["a"], date(2024, 1, 1))
+        report = portfolio_risk(panel, np.array([1.0]), min_observations=1)
+        assert report.max_drawdown == pytest.approx(-0.5)
+
+    def test_short_history(self):
+        """Test too few observations produce no report."""
+        panel = compute_returns_panel(np.ones((10, 1)), ["a"], date(2024, 1, 1))
+        assert portfolio_risk(panel, np.array([1.0])) is None
+
+
+class TestRiskModel:
+    """Tests for the cached model."""
+
+    def test_panel_cached_until_invalidated(self, db):
+        """Test weights change without rebuilding the panel."""
+        rng = np.random.default_rng(5)
+        end = date(2024, 6, 30)
+        for coin_id in ("bitcoin", "ethereum"):
+            closes = random_walk(rng, 200)
+            db.upsert_prices(
+                (coin_id, (end - timedelta(days=199 - i)).isoformat(), float(p))
+                for i, p in enumerate(closes)
+            )
+
+        model = RiskModel(db)
+        first = model.report({"bitcoin": 100.0, "ethereum": 300.0}, end)
+        panel = model.get_panel(["ethereum"], end)
+        second = model.report({"bitcoin": 300.0, "ethereum": 100.0}, end)
+        assert model.get_panel(["ethereum"], end) is panel
+        assert first.observations == second.observations == 199
+        assert first.beta != second.beta
+
+        model.invalidate()
+        assert model.get_panel(["ethereum"], end) is not panel
+        assert model.report({}, end) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,112 @@
+"""
+Unit tests for rolling news sentiment aggregates.
+
+Run with: pytest tests/
+"""
+
+import random
+from datetime import datetime, timezone
+
+import pytest
+from models import NewsItem
+from news_store import NewsStore
+from sentiment_aggregates import BUCKET_SECONDS, AssetSentiment, SentimentAggregator
+from sentiment_service import classify_sentiment
+
+HOUR = BUCKET_SECONDS
+START = 1_700_000_000.0 - 1_700_000_000.0 % HOUR  # an hour boundary
+
+
+def story(
+    compound: float, timestamp: float, assets=("BTC",), link: str = "https://feed.test/1"
+) -> NewsItem:
+    """Scored NewsItem published at ``timestamp``."""
+    return NewsItem(
+        source="Feed", title="Story", link=link, assets=list(assets),
+        sentiment=classify_sentiment(compound), sentiment_score=compound,
+        published_at=datetime.fromtimestamp(timestamp, timezone.utc),
+    )
+
+
+class TestSentimentAggregator:
+    """Tests for the rolling windows."""
+
+    def test_windows_roll_forward(self):
+        """Test stories count in the windows they fall in until they age out."""
+        aggregator = SentimentAggregator(windows=(1, 24))
+        now = START + 0.5 * HOUR
+        aggregator.add_items([
+            story(0.6, now - 2 * HOUR, ["BTC", "ETH"]),
+            story(-0.4, now - 0.1 * HOUR),
+            story(0.0, now),
+        ], now=now)
+
+        btc = aggregator.snapshot(24, now=now)["BTC"]
+        assert (btc.count, btc.bullish, btc.bearish, btc.bullish_ratio) == (3, 1, 1, 0.5)
+        assert btc.mean == pytest.approx(0.2 / 3)
+        assert aggregator.get("btc", 1, now=now).count == 2
+
+        assert aggregator.get("BTC", 1, now=now + HOUR) is None
+        assert aggregator.get("ETH", 24, now=now + 21.4 * HOUR).count == 1
+        assert aggregator.snapshot(24, now=now + 23 * HOUR) == {
+            "BTC": AssetSentiment("BTC", 24, 2, -0.2, 0, 1)
+        }
+        assert aggregator.snapshot(24, now=now + 30 * HOUR) == {}
+
+    def test_incremental_totals_match_recomputation(self):
+        """Test the running totals equal a full recount at every hour."""
+        rng = random.Random(3)
+        aggregator = SentimentAggregator(windows=(1, 6, 48))
+        history = []
+        for step in range(200):
+            now = START + step * HOUR / 2
+            batch = [
+                (
+                    rng.choice(["BTC", "ETH", "SOL"]),
+                    round(rng.uniform(-1, 1), 3),
+                    now - rng.uniform(0, 10 * HOUR),
+                )
+                for _ in range(rng.randrange(4))
+            ]
+            aggregator.add_items([story(c, t, [a]) for a, c, t in batch], now=now)
+            history.extend(batch)
+
+            for hours in aggregator.windows:
+                first_hour = int(now // HOUR) - hours + 1
+                expected = {}
+                for asset, compound, timestamp in history:
+                    if int(timestamp // HOUR) >= first_hour:
+                        expected.setdefault(asset, []).append(compound)
+                snapshot = aggregator.snapshot(hours, now=now)
+                assert {asset: s.count for asset, s in snapshot.items()} == {
+                    a: len(c) for a, c in expected.items()
+                }
+                for asset, compounds in expected.items():
+                    assert snapshot[asset].mean == pytest.approx(sum(compounds) / len(compounds))
+
+    def test_loaded_from_store_once_per_story(self, tmp_path):
+        """Test stored stories seed the aggregates and syndicated copies are skipped."""
+        store = NewsStore(str(tmp_path / "news.db"))
+        now = datetime.now(timezone.utc).timestamp()
+        head = story(0.5, now - HOUR, link="https://feed.test/a").model_copy(
+            update={"cluster_id": "a"}
+        )
+        copy = story(0.5, now - HOUR, link="https://feed.test/b").model_copy(
+            update={"cluster_id": "a"}
+        )
+        other = story(-0.5, now - 2 * HOUR, ["ETH"], link="https://feed.test/c")
+        store.save_items("https://feed.test/rss", [("a", head), ("b", copy), ("c", other)])
+
+        aggregator = SentimentAggregator.from_store(store, windows=(24,), now=now)
+        assert aggregator.get("BTC", 24, now=now).count == 1
+        assert aggregator.get("ETH", 24, now=now).bearish == 1
+        store.close()
+
+    def test_news_sentiment_sways_signal(self):
+        """Test enough bullish or bearish news tips a neutral technical signal."""
+        analysis_engine = pytest.importorskip("analysis_engine")
+        engine = analysis_engine.AnalysisEngine()
+        neutral = analysis_engine.TechnicalIndicators(rsi=50.0)
+        assert engine.get_signal(neutral, AssetSentiment("BTC", 24, 5, 0.4, 4, 0)) == "BUY"
+        assert engine.get_signal(neutral, AssetSentiment("BTC", 24, 5, -0.4, 0, 4)) == "SELL"
+        assert engine.get_signal(neutral, AssetSentiment("BTC", 24, 1, 0.9, 1, 0)) == "NEUTRAL"
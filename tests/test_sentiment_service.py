@@ -0,0 +1,56 @@
+"""
+Unit tests for the sentiment service.
+
+Run with: pytest tests/
+"""
+
+from models import SentimentType
+from news_store import NewsStore
+from sentiment_service import SentimentService, classify_sentiment
+
+TEXTS = [
+    "Great news: bitcoin gains strongly and investors are happy",
+    "Exchange hacked, investors fear massive losses",
+    "The network upgrade is scheduled for Tuesday",
+]
+
+
+class TestSentimentService:
+    """Tests for batch scoring and the score cache."""
+
+    def test_scores_are_cached_and_duplicates_scored_once(self, monkeypatch):
+        """Test repeated texts hit the cache, also within one batch."""
+        service = SentimentService()
+        scored = []
+        score = service._score
+        monkeypatch.setattr(service, "_score", lambda texts: scored.extend(texts) or score(texts))
+
+        first = service.score_many(TEXTS + TEXTS[:1])
+        assert first[0] == first[3] and first[0] > 0 > first[1]
+        assert service.score_many(TEXTS) == first[:3]
+        assert scored == TEXTS
+        assert [classify_sentiment(c) for c in first[:3]] == [
+            SentimentType.BULLISH, SentimentType.BEARISH, SentimentType.NEUTRAL
+        ]
+
+    def test_cache_is_bounded_and_persisted(self, tmp_path):
+        """Test the LRU keeps the newest scores and they survive a restart."""
+        store = NewsStore(str(tmp_path / "news.db"))
+        service = SentimentService(store, cache_size=2)
+        expected = service.score_many(TEXTS[:1]) + service.score_many(TEXTS[1:])
+        assert len(service._cache) == 2
+
+        restarted = SentimentService(store, cache_size=2)
+        assert len(restarted._cache) == 2
+        assert restarted.score_many(TEXTS[1:]) == expected[1:]
+        assert restarted.misses == 0
+        store.close()
+
+    def test_process_pool_matches_inline_scores(self):
+        """Test scoring in worker processes gives the same results."""
+        texts = [f"{text} #{i}" for i in range(20) for text in TEXTS]
+        service = SentimentService(processes=2, parallel_min=10)
+        try:
+            assert service.score_many(texts) == SentimentService().score_many(texts)
+        finally:
+            service.close()
@@ -0,0 +1,87 @@
+"""
+Unit tests for the warm-start snapshot store.
+
+Run with: pytest tests/
+"""
+
+import pytest
+from models import CoinDetailData, CoinMarketData, NewsItem
+from snapshot_store import DETAIL, SnapshotStore
+import snapshot_store
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Snapshot store on a fresh file."""
+    snapshots = SnapshotStore(str(tmp_path / "snapshot.db"))
+    yield snapshots
+    snapshots.close()
+
+
+def coin(i):
+    """Market entry for a test coin."""
+    return CoinMarketData(
+        id=f"coin-{i}", symbol=f"c{i}", name=f"Coin {i}", current_price=1.0 + i,
+        market_cap_rank=i + 1, sparkline_in_7d={"price": [1.0, 2.0, 3.0]},
+    )
+
+
+class TestSnapshotStore:
+    """Tests for saving and restoring snapshots."""
+
+    def test_missing(self, store):
+        """Test nothing is returned before the first save."""
+        assert store.load_market() is None
+        assert store.load_detail("bitcoin") is None
+
+    def test_market_and_news_round_trip(self, store):
+        """Test models survive a save/load cycle."""
+        coins = [coin(i) for i in range(3)]
+        news = [
+            NewsItem(
+                source="Feed", title="Bitcoin rallies", link="https://example.com/a", assets=["btc"]
+            )
+        ]
+        store.save_market(coins)
+        store.save_news(news)
+
+        market = store.load_market()
+        assert market.data == coins
+        assert market.age >= 0
+        assert store.load_news().data == news
+
+    def test_latest_save_wins(self, store):
+        """Test a new save replaces the previous payload."""
+        store.save_market([coin(1)])
+        store.save_market([coin(2), coin(3)])
+        assert [c.id for c in store.load_market().data] == ["coin-2", "coin-3"]
+
+    def test_detail_entries_are_bounded(self, store, monkeypatch):
+        """Test only the most recently fetched coin details are kept."""
+        monkeypatch.setattr(snapshot_store, "snapshot_config", type("C", (), {
+            "MAX_DETAILS": 2, "COMPRESSION_LEVEL": 1,
+        }))
+        clock = iter(range(100))
+        monkeypatch.setattr(snapshot_store.time, "time", lambda: float(next(clock)))
+
+        for coin_id in ["a", "b", "c"]:
+            detail = CoinDetailData(id=coin_id, symbol=coin_id, name=coin_id, market_data={})
+            store.save_detail(detail, {"prices": [[0, 1.0]]})
+
+        assert store.load_detail("a") is None
+        data, history = store.load_detail("c").data
+        assert data.id == "c"
+        assert history == {"prices": [[0, 1.0]]}
+
+    def test_corrupt_payload_is_ignored(self, store):
+        """Test an unreadable blob is treated as missing."""
+        with store._connections.connection() as conn:
+            conn.execute(
+                "INSERT INTO snapshots (kind, key, fetched_at, payload) VALUES (?, ?, ?, ?)",
+                (DETAIL, "bitcoin", 0.0, b"not zlib"),
+            )
+        assert store.load_detail("bitcoin") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,110 @@
+"""
+Unit tests for the tax-lot engine.
+
+Run with: pytest tests/
+"""
+
+import io
+from datetime import datetime
+
+import pytest
+from database import Database
+from portfolio_manager import PortfolioManager
+from tax_lots import CostBasisMethod, LotTracker, write_disposal_report
+
+
+def log(*trades):
+    """Build transaction tuples from (type, amount, price, 'YYYY-MM-DD') trades."""
+    return [
+        (i + 1, "bitcoin", "BTC", type, amount, price, f"{day} 00:00:00")
+        for i, (type, amount, price, day) in enumerate(trades)
+    ]
+
+
+TRADES = log(
+    ("BUY", 1.0, 100.0, "2023-01-01"),
+    ("BUY", 1.0, 300.0, "2023-06-01"),
+    ("BUY", 1.0, 200.0, "2024-03-01"),
+    ("SELL", 1.5, 400.0, "2024-04-01"),
+)
+
+
+class TestLotTracker:
+    """Tests for lot matching per cost-basis method."""
+
+    @pytest.mark.parametrize("method, realized, remaining_cost", [
+        (CostBasisMethod.FIFO, 600.0 - 250.0, 350.0),   # 1 @ 100 + 0.5 @ 300
+        (CostBasisMethod.LIFO, 600.0 - 350.0, 250.0),   # 1 @ 200 + 0.5 @ 300
+        (CostBasisMethod.HIFO, 600.0 - 400.0, 200.0),   # 1 @ 300 + 0.5 @ 200
+        (CostBasisMethod.AVERAGE, 600.0 - 300.0, 300.0),  # 1.5 @ 200
+    ])
+    def test_methods(self, method, realized, remaining_cost):
+        """Test realized P&L and remaining cost basis per method."""
+        tracker = LotTracker(method)
+        disposals = list(tracker.process(TRADES))
+
+        assert sum(d.amount for d in disposals) == pytest.approx(1.5)
+        assert tracker.realized_pnl()["bitcoin"] == pytest.approx(realized)
+
+        summary = tracker.summary({"bitcoin": 500.0})[0]
+        assert summary.amount == pytest.approx(1.5)
+        assert summary.cost_basis == pytest.approx(remaining_cost)
+        assert summary.unrealized_pnl == pytest.approx(750.0 - remaining_cost)
+
+    def test_disposal_details(self):
+        """Test FIFO disposals record lots and holding periods."""
+        disposals = list(LotTracker(CostBasisMethod.FIFO).process(TRADES))
+        assert [d.buy_transaction_id for d in disposals] == [1, 2]
+        assert [d.term for d in disposals] == ["long", "short"]
+        assert all(d.sell_transaction_id == 4 for d in disposals)
+
+    def test_oversell_is_unmatched(self):
+        """Test selling more than held closes the position."""
+        tracker = LotTracker()
+        tracker.consume(log(("BUY", 1.0, 100.0, "2024-01-01"), ("SELL", 3.0, 150.0, "2024-01-02")))
+        summary = tracker.summary()[0]
+        assert summary.amount == 0.0
+        assert summary.unmatched == pytest.approx(2.0)
+        assert summary.realized_pnl == pytest.approx(50.0)
+
+    def test_open_lots_in_sell_order(self):
+        """Test open lots are listed in the order they would be sold."""
+        tracker = LotTracker(CostBasisMethod.HIFO)
+        tracker.consume(TRADES[:3])
+        assert [lot.price for lot in tracker.open_lots("bitcoin")] == [300.0, 200.0, 100.0]
+
+    def test_report(self):
+        """Test the CSV report has one row per disposal."""
+        out = io.StringIO()
+        count = write_disposal_report(LotTracker().process(TRADES), out)
+        lines = out.getvalue().strip().splitlines()
+        assert count == 2
+        assert len(lines) == 3
+        assert lines[1].startswith("bitcoin,BTC,1.00000000,2023-01-01 00:00:00")
+
+
+def test_average_matches_holdings(tmp_path):
+    """Test AVERAGE cost basis agrees with the holdings table."""
+    db = Database(str(tmp_path / "test.db"))
+    rows = [
+        ("bitcoin", "BTC", "BUY", 1.0, 100.0, datetime(2024, 1, 1)),
+        ("bitcoin", "BTC", "BUY", 1.0, 200.0, datetime(2024, 1, 2)),
+        ("bitcoin", "BTC", "SELL", 0.5, 300.0, datetime(2024, 1, 3)),
+        ("ethereum", "ETH", "BUY", 2.0, 10.0, datetime(2024, 1, 1)),
+        ("ethereum", "ETH", "SELL", 2.0, 12.0, datetime(2024, 1, 2)),
+    ]
+    db.bulk_import_transactions(rows)
+    manager = PortfolioManager(db)
+
+    summary = {s.coin_id: s for s in manager.get_lot_summary({}, CostBasisMethod.AVERAGE)}
+    holding = db.get_holdings()[0]
+    assert summary["bitcoin"].amount == pytest.approx(holding["amount"])
+    assert summary["bitcoin"].cost_basis == pytest.approx(
+        holding["amount"] * holding["average_buy_price"]
+    )
+    assert summary["ethereum"].realized_pnl == pytest.approx(4.0)
+    manager.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,189 @@
+"""
+Unit tests for bulk transaction import.
+
+Run with: pytest tests/
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+from database import Database
+from portfolio_manager import PortfolioManager
+from transaction_importer import (
+    TransactionImporter,
+    parse_timestamp,
+    split_pair,
+)
+from exceptions import ParsingException
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Portfolio manager on a fresh database."""
+    db = Database(str(tmp_path / "test.db"))
+    yield PortfolioManager(db)
+    db.close()
+
+
+def write(tmp_path, name, content):
+    """Write a fixture export file and return its path."""
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+class TestParsing:
+    """Tests for field parsing helpers."""
+
+    def test_parse_timestamp_formats(self):
+        """Test ISO strings, Z suffix, offsets and epoch values."""
+        expected = datetime(2024, 1, 2, 3, 4, 5)
+        assert parse_timestamp("2024-01-02 03:04:05") == expected
+        assert parse_timestamp("2024-01-02T03:04:05Z") == expected
+        assert parse_timestamp("2024-01-02T05:04:05+02:00") == expected
+        assert parse_timestamp("1704164645") == expected
+        assert parse_timestamp(1704164645000) == expected
+        assert parse_timestamp("2024-01-02 03:04:05.1234").microsecond == 123400
+
+    def test_split_pair(self):
+        """Test splitting pairs quoted in USD-like currencies."""
+        assert split_pair("BTCUSDT") == ("BTC", "USDT")
+        assert split_pair("ETH-USD") == ("ETH", "USD")
+        assert split_pair("XXBTZUSD") == ("XXBT", "ZUSD")
+        assert split_pair("ETHBTC") == ("ETHBTC", "")
+
+    def test_split_pair_prefers_known_base(self):
+        """Test 'USD' pairs of assets ending in T aren't split as 'TUSD' pairs."""
+        assert split_pair("DOTUSD") == ("DOT", "USD")
+        assert split_pair("GRTUSD") == ("GRT", "USD")
+        assert split_pair("USDTUSD") == ("USDT", "USD")
+        assert split_pair("BTCTUSD") == ("BTC", "TUSD")
+        assert split_pair("XETHZUSD") == ("XETH", "ZUSD")
+        # Unknown bases fall back to the longest quote unless the caller knows them
+        assert split_pair("ABCTUSD") == ("ABC", "TUSD")
+        assert split_pair("ABCTUSD", {"ABCT"}) == ("ABCT", "USD")
+
+
+class TestFormats:
+    """Tests for exchange format detection."""
+
+    def test_binance_csv(self, tmp_path):
+        """Test Binance trade history with unit-suffixed amounts."""
+        path = write(tmp_path, "binance.csv", (
+            "Date(UTC),Pair,Side,Price,Executed,Amount,Fee\n"
+            "2024-01-02 03:04:05,BTCUSDT,BUY,42000,0.5BTC,21000USDT,0.0005BTC\n"
+            "2024-01-03 03:04:05,ETHBTC,BUY,0.05,1ETH,0.05BTC,0.001ETH\n"
+        ))
+        importer = TransactionImporter()
+        fills = list(importer.iter_fills(path))
+        assert importer.format_name == "binance"
+        assert importer.skipped == 1  # non-USD quote
+        assert fills[0].coin_id == "bitcoin"
+        assert fills[0].amount == pytest.approx(0.5)
+
+    def test_coinbase_csv_with_preamble(self, tmp_path):
+        """Test Coinbase reports with leading description lines."""
+        path = write(tmp_path, "coinbase.csv", (
+            "You can use this transaction report to inform your tax preparation.\n"
+            "\n"
+            "Timestamp,Transaction Type,Asset,Quantity Transacted,Spot Price Currency,"
+            "Spot Price at Transaction,Subtotal\n"
+            "2024-01-02T03:04:05Z,Buy,ETH,2,USD,\"$2,300.00\",4600\n"
+            "2024-01-05T03:04:05Z,Send,ETH,1,USD,2400,2400\n"
+            "2024-01-06T03:04:05Z,Advanced Trade Sell,ETH,0.5,USD,2500,1250\n"
+        ))
+        importer = TransactionImporter()
+        fills = list(importer.iter_fills(path))
+        assert importer.format_name == "coinbase"
+        assert [f.type for f in fills] == ["BUY", "SELL"]
+        assert fills[0].price == pytest.approx(2300.0)
+
+    def test_kraken_csv(self, tmp_path):
+        """Test Kraken legacy asset codes are mapped."""
+        path = write(tmp_path, "kraken.csv", (
+            "txid,ordertxid,pair,time,type,ordertype,price,cost,fee,vol\n"
+            "T1,O1,XXBTZUSD,2024-01-02 03:04:05.1234,buy,limit,40000,4000,1,0.1\n"
+        ))
+        fills = list(TransactionImporter().iter_fills(path))
+        assert fills[0].symbol == "BTC"
+        assert fills[0].coin_id == "bitcoin"
+
+    def test_kraken_usd_pairs_of_assets_ending_in_t(self, tmp_path):
+        """Test DOTUSD, USDTUSD and pairs of market-list symbols aren't read as TUSD pairs."""
+        path = write(tmp_path, "kraken.csv", (
+            "txid,ordertxid,pair,time,type,ordertype,price,cost,fee,vol\n"
+            "T1,O1,DOTUSD,2024-01-02 03:04:05,buy,limit,7,70,0.1,10\n"
+            "T2,O2,USDTUSD,2024-01-02 03:04:05,sell,limit,1,100,0.1,100\n"
+            "T3,O3,ANTUSD,2024-01-02 03:04:05,buy,limit,5,50,0.1,10\n"
+        ))
+        fills = list(TransactionImporter(coin_ids={"ANT": "aragon"}).iter_fills(path))
+        assert [(f.symbol, f.coin_id) for f in fills] == [
+            ("DOT", "polkadot"), ("USDT", "tether"), ("ANT", "aragon"),
+        ]
+
+    def test_generic_jsonl_with_custom_ids(self, tmp_path):
+        """Test generic JSON Lines with a caller-provided coin id map."""
+        lines = [
+            {
+                "symbol": "pepe",
+                "side": "buy",
+                "quantity": 1000,
+                "price": 0.001,
+                "date": "2024-01-02",
+            },
+            {"symbol": "pepe", "side": "hold", "quantity": 1, "price": 1, "date": "2024-01-02"},
+        ]
+        path = write(tmp_path, "trades.jsonl", "\n".join(json.dumps(line) for line in lines))
+        importer = TransactionImporter(coin_ids={"PEPE": "pepe-token"})
+        fills = list(importer.iter_fills(path))
+        assert [f.coin_id for f in fills] == ["pepe-token"]
+        assert importer.skipped == 1
+
+    def test_unrecognized_format(self, tmp_path):
+        """Test unknown headers raise a parsing error."""
+        path = write(tmp_path, "bad.csv", "foo,bar\n1,2\n")
+        with pytest.raises(ParsingException):
+            list(TransactionImporter().iter_fills(path))
+
+
+class TestBulkImport:
+    """Tests for database bulk import and holdings recomputation."""
+
+    def test_matches_sequential_add_transaction(self, tmp_path, manager):
+        """Test bulk import yields the same holdings as one-by-one inserts."""
+        trades = [
+            ("BTC", "BUY", 1.0, 100.0), ("BTC", "BUY", 1.0, 200.0), ("BTC", "SELL", 0.5, 300.0),
+            ("ETH", "BUY", 2.0, 10.0), ("ETH", "SELL", 2.0, 12.0), ("ETH", "BUY", 1.0, 20.0),
+            ("SOL", "SELL", 1.0, 5.0),
+        ]
+        rows = ["symbol,side,amount,price,timestamp"]
+        for i, (symbol, side, amount, price) in enumerate(trades):
+            rows.append(f"{symbol},{side},{amount},{price},2024-01-01 00:00:{i:02d}")
+        path = write(tmp_path, "trades.csv", "\n".join(rows) + "\n")
+
+        result = manager.import_transactions(path)
+        assert result.imported == len(trades)
+
+        reference = Database(str(tmp_path / "reference.db"))
+        for symbol, side, amount, price in trades:
+            coin_id = {"BTC": "bitcoin", "ETH": "ethereum", "SOL": "solana"}[symbol]
+            reference.add_transaction(coin_id, symbol, side, amount, price)
+
+        def snapshot(db):
+            return sorted((h["coin_id"], round(h["amount"], 9), round(h["average_buy_price"], 9))
+                          for h in db.get_holdings())
+
+        assert snapshot(manager.db) == snapshot(reference)
+        reference.close()
+
+    def test_failed_import_rolls_back(self, tmp_path, manager):
+        """Test nothing is written when the file cannot be parsed."""
+        path = write(tmp_path, "bad.csv", "foo,bar\n1,2\n")
+        with pytest.raises(ParsingException):
+            manager.import_transactions(path)
+        assert manager.db.get_transactions() == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
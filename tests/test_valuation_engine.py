@@ -0,0 +1,190 @@
+"""
+Unit tests for multi-portfolio valuation.
+
+Run with: pytest tests/
+"""
+
+import random
+import sqlite3
+
+import pytest
+from database import Database, DEFAULT_PORTFOLIO_ID
+from portfolio_manager import PortfolioManager
+from valuation_engine import ValuationEngine
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Portfolio manager on a fresh database."""
+    manager = PortfolioManager(Database(str(tmp_path / "test.db")))
+    yield manager
+    manager.close()
+
+
+def holding(portfolio_id, coin_id, amount, avg):
+    """Holding row as returned by Database.get_holdings."""
+    return {"portfolio_id": portfolio_id, "coin_id": coin_id, "symbol": coin_id[:3].upper(),
+            "amount": amount, "average_buy_price": avg}
+
+
+class TestValuationEngine:
+    """Tests for the vectorized engine."""
+
+    def test_incremental_updates_match_full_revaluation(self):
+        """Test many partial price ticks agree with valuing from scratch."""
+        rng = random.Random(3)
+        portfolios = [{"id": i, "name": f"Book {i}"} for i in range(1, 31)]
+        coins = [f"coin-{i}" for i in range(200)]
+        holdings = [
+            holding(p["id"], coin_id, rng.uniform(0.1, 10), rng.uniform(1, 1000))
+            for p in portfolios for coin_id in rng.sample(coins, 40)
+        ]
+        engine = ValuationEngine()
+        engine.load(holdings, portfolios)
+
+        prices = {coin_id: rng.uniform(1, 1000) for coin_id in coins}
+        engine.update_prices(prices)
+        for _ in range(50):
+            for coin_id in rng.sample(coins, 10):
+                prices[coin_id] = rng.uniform(1, 1000)
+            assert engine.update_prices(prices) == 10
+
+        fresh = ValuationEngine()
+        fresh.load(holdings, portfolios)
+        fresh.update_prices(prices)
+        for got, expected in zip(engine.valuations(), fresh.valuations()):
+            assert got.value == pytest.approx(expected.value)
+            assert got.cost_basis == pytest.approx(expected.cost_basis)
+
+        book = next(v for v in engine.valuations() if v.portfolio_id == 7)
+        rows = [h for h in holdings if h["portfolio_id"] == 7]
+        assert book.value == pytest.approx(sum(h["amount"] * prices[h["coin_id"]] for h in rows))
+        assert book.positions == 40
+        assert sum(v.weight for v in engine.valuations()) == pytest.approx(1.0)
+        assert engine.positions(7).weights.sum() == pytest.approx(1.0)
+
+    def test_unchanged_prices_are_skipped(self):
+        """Test a tick without changes recomputes nothing."""
+        engine = ValuationEngine()
+        engine.load([holding(1, "bitcoin", 1.0, 100.0)], [{"id": 1, "name": "Main"}])
+        assert engine.update_prices({"bitcoin": 150.0}) == 1
+        assert engine.update_prices({"bitcoin": 150.0, "unheld": 5.0}) == 0
+        assert engine.valuations()[0].pnl == pytest.approx(50.0)
+
+    def test_missing_price_falls_back_to_average(self):
+        """Test coins without a price are valued at their buy price."""
+        engine = ValuationEngine()
+        engine.load([holding(1, "bitcoin", 2.0, 100.0)], [{"id": 1, "name": "Main"}])
+        engine.update_prices({"bitcoin": None})
+        positions = engine.positions(1)
+        assert positions.values.tolist() == [200.0]
+        assert positions.pnl_percent.tolist() == [0.0]
+        assert len(engine.positions(99)) == 0
+
+    def test_positions_since_tick(self):
+        """Test only rows touched after a tick are returned."""
+        engine = ValuationEngine()
+        engine.load(
+            [
+                holding(1, "bitcoin", 1.0, 100.0),
+                holding(1, "ethereum", 2.0, 10.0),
+                holding(2, "bitcoin", 3.0, 50.0),
+            ],
+            [{"id": 1, "name": "Main"}, {"id": 2, "name": "Other"}],
+        )
+        engine.update_prices({"bitcoin": 200.0, "ethereum": 20.0})
+        tick = engine.tick
+
+        engine.update_prices({"bitcoin": 200.0, "ethereum": 30.0})
+        changed = engine.positions(1, since=tick)
+        assert changed.coin_ids == ["ethereum"]
+        assert changed.values.tolist() == [60.0]
+        assert changed.weights.tolist() == [pytest.approx(60.0 / 260.0)]
+        assert len(engine.positions(2, since=tick)) == 0
+        assert len(engine.positions(1, since=engine.tick)) == 0
+        assert engine.totals(1) == (pytest.approx(260.0), pytest.approx(120.0))
+
+
+class TestPortfolios:
+    """Tests for named portfolios through the manager."""
+
+    def test_portfolios_are_valued_separately(self, manager):
+        """Test the same coin in two portfolios keeps separate positions."""
+        client = manager.create_portfolio("Client A")
+        manager.add_transaction("bitcoin", "btc", "BUY", 1.0, 100.0)
+        manager.add_transaction("bitcoin", "btc", "BUY", 3.0, 200.0, portfolio_id=client)
+        manager.add_transaction("bitcoin", "btc", "SELL", 5.0, 200.0, portfolio_id=client)
+
+        assert [i.amount for i in manager.get_portfolio_summary({"bitcoin": 300.0})] == [1.0]
+        assert manager.get_portfolio_summary({"bitcoin": 300.0}, client) == []
+
+        manager.add_transaction("ethereum", "eth", "BUY", 2.0, 10.0, portfolio_id=client)
+        valuations = {
+            v.name: v
+            for v in manager.get_portfolio_valuations({"bitcoin": 300.0, "ethereum": 20.0})
+        }
+        assert valuations["Main"].value == pytest.approx(300.0)
+        assert valuations["Client A"].value == pytest.approx(40.0)
+        assert valuations["Client A"].pnl == pytest.approx(20.0)
+
+    def test_changes_are_incremental(self, manager):
+        """Test price ticks report changed holdings and transactions force a reset."""
+        manager.add_transaction("bitcoin", "btc", "BUY", 1.0, 100.0)
+        manager.add_transaction("ethereum", "eth", "BUY", 2.0, 10.0)
+
+        first = manager.get_portfolio_changes({"bitcoin": 100.0, "ethereum": 10.0})
+        assert first.reset and len(first.items) == 2
+
+        second = manager.get_portfolio_changes(
+            {"bitcoin": 150.0, "ethereum": 10.0}, since=first.tick
+        )
+        assert not second.reset
+        assert [(i.coin_id, i.pnl) for i in second.items] == [("bitcoin", 50.0)]
+        assert second.total_value == pytest.approx(170.0)
+        assert second.total_cost == pytest.approx(120.0)
+
+        idle = manager.get_portfolio_changes(
+            {"bitcoin": 150.0, "ethereum": 10.0}, since=second.tick
+        )
+        assert idle.items == [] and idle.tick == second.tick
+
+        manager.add_transaction("bitcoin", "btc", "BUY", 1.0, 150.0)
+        third = manager.get_portfolio_changes({"bitcoin": 150.0, "ethereum": 10.0}, since=idle.tick)
+        assert third.reset and len(third.items) == 2
+
+    def test_duplicate_name_rejected(self, manager):
+        """Test portfolio names are unique."""
+        manager.create_portfolio("Client A")
+        with pytest.raises(Exception, match="already exists"):
+            manager.create_portfolio("Client A")
+
+    def test_legacy_database_migrated(self, tmp_path):
+        """Test a single-portfolio database moves into the default portfolio."""
+        path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(path)
+        conn.executescript("""
+            CREATE TABLE holdings (coin_id TEXT PRIMARY KEY, symbol TEXT NOT NULL,
+                amount REAL NOT NULL, average_buy_price REAL NOT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+            CREATE TABLE transactions (id INTEGER PRIMARY KEY AUTOINCREMENT, coin_id TEXT NOT NULL,
+                symbol TEXT NOT NULL, type TEXT NOT NULL, amount REAL NOT NULL,
+                price_per_coin REAL NOT NULL, total_value REAL NOT NULL,
+                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+            INSERT INTO holdings (coin_id, symbol, amount, average_buy_price)
+                VALUES ('bitcoin', 'BTC', 1.5, 100.0);
+            INSERT INTO transactions (coin_id, symbol, type, amount, price_per_coin, total_value)
+                VALUES ('bitcoin', 'BTC', 'BUY', 1.5, 100.0, 150.0);
+        """)
+        conn.close()
+
+        db = Database(path)
+        try:
+            assert db.get_holdings()[0]["portfolio_id"] == DEFAULT_PORTFOLIO_ID
+            db.add_transaction("bitcoin", "BTC", "BUY", 0.5, 200.0)
+            assert db.get_holdings()[0]["amount"] == pytest.approx(2.0)
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,459 @@
+"""
+Transaction importer for TerminalCoin.
+
+Streams trade history exported from exchanges (CSV, JSON or JSON Lines)
+into normalized fills that can be bulk inserted into the database.
+
+Supported formats are detected from the header row: Binance trade history,
+Coinbase transaction reports, Kraken trades and a generic
+symbol/side/amount/price/timestamp layout.
+"""
+
+import csv
+import json
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Container, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from exceptions import ParsingException, ValidationException
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Quote currencies treated as USD (prices are stored in USD)
+USD_QUOTES = ("USDT", "USDC", "BUSD", "FDUSD", "TUSD", "DAI", "ZUSD", "USD")
+
+# Symbol -> CoinGecko id for common assets; pass a mapping built from the
+# live market universe to TransactionImporter for anything else.
+DEFAULT_COIN_IDS: Dict[str, str] = {
+    "BTC": "bitcoin",
+    "ETH": "ethereum",
+    "SOL": "solana",
+    "BNB": "binancecoin",
+    "XRP": "ripple",
+    "ADA": "cardano",
+    "DOGE": "dogecoin",
+    "SHIB": "shiba-inu",
+    "DOT": "polkadot",
+    "AVAX": "avalanche-2",
+    "LTC": "litecoin",
+    "LINK": "chainlink",
+    "TRX": "tron",
+    "MATIC": "matic-network",
+    "ATOM": "cosmos",
+    "XMR": "monero",
+    # Symbols ending in T, whose USD pairs also end in 'TUSD'
+    "BAT": "basic-attention-token",
+    "BNT": "bancor",
+    "FET": "fetch-ai",
+    "GRT": "the-graph",
+    "LPT": "livepeer",
+    # Stablecoins, which are quotes too but can be held and traded
+    "USDT": "tether",
+    "USDC": "usd-coin",
+    "DAI": "dai",
+    "BUSD": "binance-usd",
+    "FDUSD": "first-digital-usd",
+    "TUSD": "true-usd",
+}
+
+# Kraken legacy asset codes
+KRAKEN_ASSETS: Dict[str, str] = {"XBT": "BTC", "XXBT": "BTC", "XDG": "DOGE", "XXDG": "DOGE"}
+
+# Lines scanned for a header row (Coinbase reports start with a preamble)
+MAX_PREAMBLE_LINES = 50
+
+_AMOUNT_WITH_UNIT = re.compile(
+    r"^\s*([-+]?[0-9][0-9,]*\.?[0-9]*(?:[eE][-+]?[0-9]+)?)\s*([A-Za-z]*)\s*$"
+)
+_FRACTION = re.compile(r"\.(\d+)")
+
+
+@dataclass(frozen=True)
+class ImportedFill:
+    """A normalized trade ready to be stored."""
+    coin_id: str
+    symbol: str
+    type: str  # 'BUY' or 'SELL'
+    amount: float
+    price: float
+    timestamp: datetime  # naive UTC
+
+    def as_row(self) -> Tuple[str, str, str, float, float, datetime]:
+        """Return the tuple expected by Database.bulk_import_transactions."""
+        return (self.coin_id, self.symbol, self.type, self.amount, self.price, self.timestamp)
+
+
+@dataclass
+class ImportResult:
+    """Summary of a completed import."""
+    format: str
+    imported: int = 0
+    skipped: int = 0
+
+
+def parse_number(value: Any) -> float:
+    """
+    Parse a numeric field, tolerating currency symbols and thousands separators.
+
+    Args:
+        value: Raw field value
+
+    Returns:
+        Parsed float
+
+    Raises:
+        ValueError: If the value is not numeric
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    cleaned = str(value).strip().replace("$", "").replace(",", "")
+    return float(cleaned)
+
+
+def parse_amount_with_unit(value: str) -> Tuple[float, str]:
+    """
+    Parse values like '0.0015BTC' into (amount, unit).
+
+    Args:
+        value: Raw field value
+
+    Returns:
+        Tuple of (amount, unit) where unit may be empty
+    """
+    match = _AMOUNT_WITH_UNIT.match(str(value))
+    if not match:
+        raise ValueError(f"Invalid amount: {value!r}")
+    return float(match.group(1).replace(",", "")), match.group(2).upper()
+
+
+def parse_timestamp(value: Any) -> datetime:
+    """
+    Parse ISO-8601 strings or epoch seconds/milliseconds into naive UTC.
+
+    Args:
+        value: Raw timestamp
+
+    Returns:
+        Naive datetime in UTC
+    """
+    if isinstance(value, (int, float)) or re.fullmatch(r"\s*\d+(\.\d+)?\s*", str(value)):
+        seconds = float(value)
+        if seconds > 1e11:  # milliseconds
+            seconds /= 1000.0
+        return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(tzinfo=None)
+
+    text = str(value).strip()
+    for suffix in (" UTC", "UTC"):
+        if text.endswith(suffix):
+            text = text[: -len(suffix)].strip()
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    # fromisoformat on older Pythons only accepts 3 or 6 fractional digits
+    text = _FRACTION.sub(lambda m: "." + m.group(1)[:6].ljust(6, "0"), text, count=1)
+
+    parsed = datetime.fromisoformat(text)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def is_known_asset(symbol: str, assets: Container[str] = ()) -> bool:
+    """Return True if ``symbol`` (or its Kraken X-prefixed form) is a known asset."""
+    if len(symbol) == 4 and symbol[0] in "XZ" and symbol not in KRAKEN_ASSETS:
+        return is_known_asset(symbol[1:], assets) or symbol in assets
+    return symbol in DEFAULT_COIN_IDS or symbol in KRAKEN_ASSETS or symbol in assets
+
+
+def split_pair(pair: str, assets: Container[str] = ()) -> Tuple[str, str]:
+    """
+    Split a trading pair like 'BTCUSDT', 'ETH-USD' or 'XXBTZUSD' into (base, quote).
+
+    Several quotes can match ('DOTUSD' ends in both 'TUSD' and 'USD'); the
+    split whose base is a known asset wins, else the one with the longest
+    quote.
+
+    Args:
+        pair: Exchange pair string
+        assets: Additional known base symbols (e.g. from the market list)
+
+    Returns:
+        Tuple of (base, quote); quote is empty if not recognized
+    """
+    pair = pair.upper().replace("/", "").replace("-", "").replace("_", "")
+    splits = sorted(
+        ((pair[: -len(quote)], quote) for quote in USD_QUOTES
+         if pair.endswith(quote) and len(pair) > len(quote)),
+        key=lambda split: -len(split[1]),
+    )
+    for base, quote in splits:
+        if is_known_asset(base, assets):
+            return base, quote
+    return splits[0] if splits else (pair, "")
+
+
+class ExportFormat:
+    """Base class for an exchange export layout."""
+
+    name = "base"
+    # Normalized (lowercase) header names that identify the format
+    signature: Tuple[str, ...] = ()
+
+    def matches(self, headers: Iterable[str]) -> bool:
+        """Return True if the normalized headers identify this format."""
+        present = set(headers)
+        return all(h in present for h in self.signature)
+
+    def parse(
+        self, row: Dict[str, Any], assets: Container[str] = ()
+    ) -> Optional[Tuple[str, str, float, float, datetime]]:
+        """
+        Parse a normalized row.
+
+        Args:
+            row: Row with normalized (lowercase) headers
+            assets: Known symbols besides the built-in ones, for splitting pairs
+
+        Returns:
+            (symbol, type, amount, price, timestamp) or None to skip the row
+        """
+        raise NotImplementedError
+
+
+class BinanceFormat(ExportFormat):
+    """Binance spot 'Trade History' export."""
+
+    name = "binance"
+    signature = ("date(utc)", "pair", "side", "price", "executed")
+
+    def parse(self, row, assets=()):
+        base, quote = split_pair(row["pair"], assets)
+        if not quote:
+            return None
+        amount, unit = parse_amount_with_unit(row["executed"])
+        return (unit or base, row["side"], amount, parse_number(row["price"]),
+                parse_timestamp(row["date(utc)"]))
+
+
+class CoinbaseFormat(ExportFormat):
+    """Coinbase transaction history report."""
+
+    name = "coinbase"
+    signature = ("timestamp", "transaction type", "asset", "quantity transacted")
+
+    def parse(self, row, assets=()):
+        kind = str(row["transaction type"]).strip().lower()
+        if kind.endswith("buy"):
+            side = "BUY"
+        elif kind.endswith("sell"):
+            side = "SELL"
+        else:
+            return None  # sends, receives, rewards, conversions...
+
+        currency = str(row.get("spot price currency") or row.get("price currency") or "USD").upper()
+        if currency not in USD_QUOTES:
+            return None
+
+        price = row.get("spot price at transaction") or row.get("price at transaction")
+        return (row["asset"], side, abs(parse_number(row["quantity transacted"])),
+                parse_number(price), parse_timestamp(row["timestamp"]))
+
+
+class KrakenFormat(ExportFormat):
+    """Kraken 'trades' ledger export."""
+
+    name = "kraken"
+    signature = ("txid", "pair", "time", "type", "price", "vol")
+
+    def parse(self, row, assets=()):
+        base, quote = split_pair(row["pair"], assets)
+        if not quote:
+            return None
+        if len(base) == 4 and base[0] in "XZ" and base not in KRAKEN_ASSETS:
+            base = base[1:]
+        base = KRAKEN_ASSETS.get(base, base)
+        return (base, row["type"], parse_number(row["vol"]), parse_number(row["price"]),
+                parse_timestamp(row["time"]))
+
+
+class GenericFormat(ExportFormat):
+    """Generic layout: symbol, side/type, amount, price, timestamp (+ optional coin_id)."""
+
+    name = "generic"
+    aliases = {
+        "symbol": ("symbol", "asset", "coin", "currency"),
+        "type": ("type", "side", "action"),
+        "amount": ("amount", "quantity", "qty", "volume", "vol"),
+        "price": ("price", "price_per_coin", "price_usd", "unit_price"),
+        "timestamp": ("timestamp", "date", "time", "datetime"),
+    }
+
+    def _field(self, row: Dict[str, Any], field: str) -> Any:
+        for alias in self.aliases[field]:
+            if alias in row and row[alias] not in (None, ""):
+                return row[alias]
+        raise KeyError(field)
+
+    def matches(self, headers):
+        present = set(headers)
+        return all(any(a in present for a in names) for names in self.aliases.values())
+
+    def parse(self, row, assets=()):
+        return (self._field(row, "symbol"), self._field(row, "type"),
+                parse_number(self._field(row, "amount")), parse_number(self._field(row, "price")),
+                parse_timestamp(self._field(row, "timestamp")))
+
+
+# Most specific first; generic is the fallback
+FORMATS: List[ExportFormat] = [BinanceFormat(), CoinbaseFormat(), KrakenFormat(), GenericFormat()]
+
+
+def _normalize(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Lowercase and strip keys (and string values) of a raw row."""
+    return {
+        str(k).strip().lower(): (v.strip() if isinstance(v, str) else v)
+        for k, v in row.items() if k is not None
+    }
+
+
+class TransactionImporter:
+    """Streams exchange exports into ImportedFill records."""
+
+    def __init__(self, coin_ids: Optional[Dict[str, str]] = None):
+        """
+        Initialize the importer.
+
+        Args:
+            coin_ids: Optional symbol -> coin_id mapping (e.g. from the market list)
+        """
+        self.coin_ids = dict(DEFAULT_COIN_IDS)
+        if coin_ids:
+            self.coin_ids.update({k.upper(): v for k, v in coin_ids.items()})
+        self.skipped = 0
+        self.format_name = ""
+
+    def detect_format(self, headers: Iterable[str], name: Optional[str] = None) -> ExportFormat:
+        """
+        Pick the export format for a header row.
+
+        Args:
+            headers: Normalized header names
+            name: Optional explicit format name
+
+        Raises:
+            ValidationException: If the format name is unknown
+            ParsingException: If no format matches
+        """
+        headers = list(headers)
+        if name:
+            for fmt in FORMATS:
+                if fmt.name == name:
+                    return fmt
+            raise ValidationException(
+                f"Unknown import format: {name}",
+                details={"formats": [f.name for f in FORMATS]}
+            )
+        for fmt in FORMATS:
+            if fmt.matches(headers):
+                return fmt
+        raise ParsingException(
+            "Unrecognized transaction export format", details={"headers": headers}
+        )
+
+    def _rows_from_csv(self, handle) -> Tuple[List[str], Iterator[Dict[str, Any]]]:
+        """Locate the header row (skipping any preamble) and stream dict rows."""
+        for _ in range(MAX_PREAMBLE_LINES):
+            line = handle.readline()
+            if not line:
+                break
+            header = [h.strip().lower() for h in next(csv.reader([line]), [])]
+            if any(fmt.matches(header) for fmt in FORMATS):
+                reader = csv.DictReader(handle, fieldnames=header)
+                return header, (_normalize(row) for row in reader)
+        raise ParsingException("No recognizable header row found in CSV export")
+
+    def _rows_from_json(self, handle, lines: bool) -> Tuple[List[str], Iterator[Dict[str, Any]]]:
+        """Stream dict rows from JSON Lines, or load a JSON array/object."""
+        if lines:
+            records: Iterator[Dict[str, Any]] = (
+                json.loads(line) for line in handle if line.strip()
+            )
+        else:
+            data = json.load(handle)
+            if isinstance(data, dict):
+                for key in ("transactions", "trades", "fills", "data"):
+                    if isinstance(data.get(key), list):
+                        data = data[key]
+                        break
+            if not isinstance(data, list):
+                raise ParsingException("JSON export must contain a list of transactions")
+            records = iter(data)
+
+        first = next(records, None)
+        if first is None:
+            return [], iter(())
+
+        def chained():
+            yield _normalize(first)
+            for record in records:
+                yield _normalize(record)
+
+        return list(_normalize(first).keys()), chained()
+
+    def iter_fills(self, path: str, format_name: Optional[str] = None) -> Iterator[ImportedFill]:
+        """
+        Stream normalized fills from an export file.
+
+        Invalid or unsupported rows (non-USD quotes, transfers, ...) are
+        counted in ``self.skipped`` and logged.
+
+        Args:
+            path: Path to a .csv, .json, .jsonl or .ndjson file
+            format_name: Optional explicit format ('binance', 'coinbase', 'kraken', 'generic')
+
+        Yields:
+            ImportedFill records in file order
+        """
+        file_path = Path(path)
+        suffix = file_path.suffix.lower()
+        self.skipped = 0
+
+        with open(file_path, newline="", encoding="utf-8-sig") as handle:
+            if suffix in (".json", ".jsonl", ".ndjson"):
+                headers, rows = self._rows_from_json(handle, lines=suffix != ".json")
+            else:
+                headers, rows = self._rows_from_csv(handle)
+
+            if not headers:
+                return
+            fmt = self.detect_format(headers, format_name)
+            self.format_name = fmt.name
+            logger.info(f"Importing {file_path.name} as {fmt.name} export")
+
+            for line_no, row in enumerate(rows, start=1):
+                try:
+                    parsed = fmt.parse(row, self.coin_ids)
+                    if parsed is None:
+                        self.skipped += 1
+                        continue
+
+                    symbol, side, amount, price, timestamp = parsed
+                    symbol = str(symbol).upper()
+                    side = str(side).strip().upper()
+                    if side not in ("BUY", "SELL") or amount <= 0 or price < 0:
+                        raise ValueError(f"invalid trade ({side} {amount} @ {price})")
+
+                    yield ImportedFill(
+                        coin_id=self.coin_ids.get(symbol, symbol.lower()),
+                        symbol=symbol,
+                        type=side,
+                        amount=amount,
+                        price=price,
+                        timestamp=timestamp,
+                    )
+                except (KeyError, ValueError, TypeError) as e:
+                    self.skipped += 1
+                    if self.skipped <= 10:
+                        logger.warning(f"Skipping row {line_no} of {file_path.name}: {e}")
@@ -0,0 +1,271 @@
+"""
+Vectorized portfolio valuation for TerminalCoin.
+
+Holds the positions of every portfolio as flat NumPy columns (one row per
+portfolio and coin) and values them all against a single price vector.
+Row values and per-portfolio totals are cached, and a price update only
+recomputes the rows of coins whose price actually changed, adjusting the
+totals by the difference. Every update bumps a tick counter and stamps the
+rows it touched, so readers can fetch just the positions that changed since
+the tick they last saw.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PortfolioValuation:
+    """Aggregate value of one portfolio."""
+    portfolio_id: int
+    name: str
+    value: float
+    cost_basis: float
+    positions: int
+    weight: float = 0.0  # share of the combined value of all portfolios
+
+    @property
+    def pnl(self) -> float:
+        """Unrealized P&L."""
+        return self.value - self.cost_basis
+
+    @property
+    def pnl_percent(self) -> float:
+        """Unrealized P&L as a percentage of cost basis."""
+        return self.pnl / self.cost_basis * 100 if self.cost_basis > 0 else 0.0
+
+
+@dataclass
+class PositionValuation:
+    """Column-wise valuation of one portfolio's holdings."""
+    coin_ids: List[str]
+    symbols: List[str]
+    amounts: np.ndarray
+    avg_prices: np.ndarray
+    prices: np.ndarray
+    values: np.ndarray
+    cost_basis: np.ndarray
+    pnl: np.ndarray
+    pnl_percent: np.ndarray
+    weights: np.ndarray  # share of the portfolio's value
+
+    def __len__(self) -> int:
+        return len(self.coin_ids)
+
+
+class ValuationEngine:
+    """
+    Values all portfolios at once and keeps the aggregates up to date.
+
+    Call ``load`` whenever holdings change and ``update_prices`` on every
+    price tick; reads never touch the database.
+    """
+
+    def __init__(self):
+        """Initialize an empty engine."""
+        self._lock = threading.Lock()
+        # Token of the holdings that were loaded (see Database.get_holdings_version)
+        self.version: Optional[Hashable] = None
+        # Incremented by every load and every price update that changed something
+        self.tick = 0
+        # Tick of the last load; changes since an older tick need a full reread
+        self.load_tick = 0
+        self._coins: List[str] = []
+        self._quotes = np.empty(0)
+        self.load([], [])
+
+    def load(
+        self,
+        holdings: List[Dict[str, Any]],
+        portfolios: List[Dict[str, Any]],
+        version: Optional[Hashable] = None
+    ) -> None:
+        """
+        Replace all positions and value them at the last known prices.
+
+        Args:
+            holdings: Holding rows of every portfolio (portfolio_id, coin_id,
+                      symbol, amount, average_buy_price)
+            portfolios: Portfolio rows (id, name)
+            version: Token identifying this state of the holdings
+        """
+        portfolio_ids = [p["id"] for p in portfolios]
+        index = {pid: i for i, pid in enumerate(portfolio_ids)}
+        # Holdings of a portfolio missing from ``portfolios`` get their own entry
+        for h in holdings:
+            if h["portfolio_id"] not in index:
+                index[h["portfolio_id"]] = len(portfolio_ids)
+                portfolio_ids.append(h["portfolio_id"])
+        names = {p["id"]: p["name"] for p in portfolios}
+
+        coins = sorted({h["coin_id"] for h in holdings})
+        coin_index = {coin_id: i for i, coin_id in enumerate(coins)}
+
+        # Rows grouped by portfolio (stable, so the incoming order is kept)
+        row_portfolio = np.fromiter(
+            (index[h["portfolio_id"]] for h in holdings), dtype=np.intp, count=len(holdings)
+        )
+        order = np.argsort(row_portfolio, kind="stable")
+        holdings = [holdings[i] for i in order.tolist()]
+
+        with self._lock:
+            previous = dict(zip(self._coins, self._quotes.tolist()))
+
+            self._portfolio_ids = portfolio_ids
+            self._names = [names.get(pid, str(pid)) for pid in portfolio_ids]
+            self._coins = coins
+            self._coin_ids = [h["coin_id"] for h in holdings]
+            self._symbols = [h["symbol"] for h in holdings]
+            self._row_portfolio = row_portfolio[order]
+            self._row_coin = np.fromiter(
+                (coin_index[c] for c in self._coin_ids), dtype=np.intp, count=len(holdings)
+            )
+            self._amount = np.fromiter(
+                (h["amount"] for h in holdings), dtype=float, count=len(holdings)
+            )
+            self._avg = np.fromiter(
+                (h["average_buy_price"] for h in holdings), dtype=float, count=len(holdings)
+            )
+            self._cost = self._amount * self._avg
+            # Row range of each portfolio
+            self._bounds = np.searchsorted(self._row_portfolio, np.arange(len(portfolio_ids) + 1))
+
+            # Carry over prices already seen for coins still held
+            self._quotes = np.array([previous.get(c, np.nan) for c in coins], dtype=float)
+            self._price = self._row_prices(np.arange(len(holdings)))
+            self._value = self._amount * self._price
+            self.tick += 1
+            self.load_tick = self.tick
+            self._row_tick = np.full(len(holdings), self.tick, dtype=np.int64)
+
+            count = len(portfolio_ids)
+            self._total_value = np.bincount(
+                self._row_portfolio, weights=self._value, minlength=count
+            )
+            self._total_cost = np.bincount(self._row_portfolio, weights=self._cost, minlength=count)
+            self._positions = np.bincount(self._row_portfolio, minlength=count)
+            self.version = version
+
+        logger.debug(f"Loaded {len(holdings)} positions in {len(portfolio_ids)} portfolios")
+
+    def _row_prices(self, rows: np.ndarray) -> np.ndarray:
+        """Current price per row, falling back to the average buy price when unknown."""
+        quotes = self._quotes[self._row_coin[rows]]
+        return np.where(np.isnan(quotes), self._avg[rows], quotes)
+
+    def update_prices(self, prices: Dict[str, Optional[float]]) -> int:
+        """
+        Apply a price tick.
+
+        Coins missing from ``prices`` are valued at their average buy price.
+        Only rows of coins whose price changed are recomputed.
+
+        Args:
+            prices: Dictionary mapping coin_id to current price
+
+        Returns:
+            Number of coins whose price changed
+        """
+        with self._lock:
+            quotes = np.array(
+                [np.nan if prices.get(c) is None else prices[c] for c in self._coins],
+                dtype=float,
+            )
+            changed = (quotes != self._quotes) & ~(np.isnan(quotes) & np.isnan(self._quotes))
+            if not changed.any():
+                return 0
+
+            self._quotes = quotes
+            rows = np.flatnonzero(changed[self._row_coin])
+            price = self._row_prices(rows)
+            value = self._amount[rows] * price
+            self._total_value += np.bincount(
+                self._row_portfolio[rows],
+                weights=value - self._value[rows],
+                minlength=len(self._portfolio_ids),
+            )
+            self._price[rows] = price
+            self._value[rows] = value
+            self.tick += 1
+            self._row_tick[rows] = self.tick
+            return int(changed.sum())
+
+    def valuations(self) -> List[PortfolioValuation]:
+        """Aggregates of every portfolio, in portfolio order."""
+        with self._lock:
+            grand_total = self._total_value.sum()
+            weights = (
+                self._total_value / grand_total
+                if grand_total > 0
+                else np.zeros_like(self._total_value)
+            )
+            return [
+                PortfolioValuation(pid, name, value, cost, positions, weight)
+                for pid, name, value, cost, positions, weight in zip(
+                    self._portfolio_ids,
+                    self._names,
+                    self._total_value.tolist(),
+                    self._total_cost.tolist(),
+                    self._positions.tolist(),
+                    weights.tolist(),
+                )
+            ]
+
+    def _portfolio_slice(self, portfolio_id: int) -> Tuple[int, int, int]:
+        """Index and row range of a portfolio (-1 and an empty range if unknown)."""
+        try:
+            i = self._portfolio_ids.index(portfolio_id)
+        except ValueError:
+            return -1, 0, 0
+        return i, int(self._bounds[i]), int(self._bounds[i + 1])
+
+    def totals(self, portfolio_id: int) -> Tuple[float, float]:
+        """Value and cost basis of one portfolio (zeros if unknown)."""
+        with self._lock:
+            i, _, _ = self._portfolio_slice(portfolio_id)
+            if i < 0:
+                return 0.0, 0.0
+            return float(self._total_value[i]), float(self._total_cost[i])
+
+    def positions(self, portfolio_id: int, since: Optional[int] = None) -> PositionValuation:
+        """
+        Per-holding valuation of one portfolio.
+
+        Args:
+            portfolio_id: Portfolio to read (empty result if unknown)
+            since: Only return rows changed after this tick (all rows if None)
+        """
+        with self._lock:
+            i, lo, hi = self._portfolio_slice(portfolio_id)
+            total = self._total_value[i] if i >= 0 else 0.0
+
+            rows = np.arange(lo, hi)
+            if since is not None:
+                rows = rows[self._row_tick[lo:hi] > since]
+
+            values = self._value[rows]
+            cost = self._cost[rows]
+            pnl = values - cost
+            with np.errstate(divide="ignore", invalid="ignore"):
+                pnl_percent = np.where(cost > 0, pnl / cost * 100, 0.0)
+            weights = values / total if total > 0 else np.zeros_like(values)
+            indices = rows.tolist()
+            return PositionValuation(
+                coin_ids=[self._coin_ids[r] for r in indices],
+                symbols=[self._symbols[r] for r in indices],
+                amounts=self._amount[rows],
+                avg_prices=self._avg[rows],
+                prices=self._price[rows],
+                values=values,
+                cost_basis=cost,
+                pnl=pnl,
+                pnl_percent=pnl_percent,
+                weights=weights,
+            )
@@ -1,5 +1,14 @@
 """Widgets package."""
-from .chart import CryptoChart
 from .portfolio import PortfolioTable
+from .movers import MoversPanel
+from .transactions import TransactionHistory
 
-__all__ = ["CryptoChart", "PortfolioTable"]
+__all__ = ["CryptoChart", "PortfolioTable", "MoversPanel", "TransactionHistory"]
+
+
+def __getattr__(name):
+    """Import CryptoChart lazily: plotext is only needed once a chart is shown."""
+    if name == "CryptoChart":
+        from .chart import CryptoChart
+        return CryptoChart
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,13 +5,18 @@ Renders interactive price charts using textual-plotext.
 Supports Candlestick and Line charts with technical indicators.
 """
 
-from typing import List, Optional
-from textual.widgets import Static
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Optional
 from textual.reactive import reactive
 from textual_plotext import PlotextPlot
 
 from logger import get_logger
-from analysis_engine import TechnicalIndicators
+
+if TYPE_CHECKING:
+    # Imported for typing only: analysis_engine pulls in pandas/pandas_ta
+    from analysis_engine import TechnicalIndicators
+    from price_archive import PriceSeries
 
 logger = get_logger(__name__)
 
@@ -48,6 +53,24 @@ class CryptoChart(PlotextPlot):
         self._data_ready = True
         self.replot()
 
+    def clear(self) -> None:
+        """Remove the plotted data."""
+        self._data_ready = False
+        self.prices = []
+        self.dates = []
+        self.plt.clear_data()
+        self.refresh()
+
+    def update_series(self, series: PriceSeries, title: str = "", max_points: int = 500) -> None:
+        """
+        Plot an archived price series.
+
+        Long series are strided down to ``max_points`` (a view, not a copy)
+        before the values are handed to plotext.
+        """
+        series = series.downsample(max_points)
+        self.update_data(series.prices.tolist(), series.dates(), title=title)
+
     def replot(self) -> None:
         """Redraw the chart with current data."""
         if not self._data_ready or not self.prices:
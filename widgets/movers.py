@@ -0,0 +1,56 @@
+"""
+Movers Widget for TerminalCoin.
+
+Displays unusual price and volume moves flagged by the anomaly detector.
+"""
+
+from typing import List
+from textual.widgets import Static, DataTable, Label
+from textual.reactive import reactive
+from rich.text import Text
+
+from anomaly_detector import MoverEvent
+from config import anomaly_config
+from utils import format_currency, format_percentage
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class MoversPanel(Static):
+    """Widget displaying the most recent unusual market moves."""
+
+    events: reactive[List[MoverEvent]] = reactive([])
+
+    def compose(self):
+        yield Label("Unusual Movers", id="movers-title")
+        yield DataTable(id="movers-table")
+
+    def on_mount(self):
+        """Initialize table columns."""
+        table = self.query_one(DataTable)
+        table.cursor_type = "row"
+        table.add_columns("Time", "Symbol", "Metric", "Change", "Z-Score", "Price")
+
+    def add_events(self, new_events: List[MoverEvent]) -> None:
+        """Prepend newly detected events, keeping the list bounded."""
+        if new_events:
+            self.events = (new_events + self.events)[:anomaly_config.MAX_MOVERS]
+
+    def watch_events(self, events: List[MoverEvent]) -> None:
+        """Update table when events change."""
+        table = self.query_one(DataTable)
+        table.clear()
+
+        for event in events:
+            color = "green" if event.change_pct >= 0 else "red"
+            table.add_row(
+                event.detected_at.strftime("%H:%M:%S"),
+                event.symbol,
+                event.metric.capitalize(),
+                Text(format_percentage(event.change_pct), style=color),
+                f"{event.zscore:+.1f}",
+                format_currency(event.price),
+            )
+
+        logger.debug(f"Updated movers panel with {len(events)} events")
@@ -1,54 +1,183 @@
 """
 Portfolio Widget for TerminalCoin.
 
-Displays portfolio holdings and performance metrics in a table.
+Displays portfolio holdings and performance metrics in a table, with a
+chart of daily portfolio value (NAV) below it. When there is more than one
+portfolio, a table of all portfolios (books) is shown above the holdings;
+selecting a book shows its holdings.
+
+Price ticks arrive as PortfolioChanges; only the cells of changed holdings
+(and weights whose displayed value moved) are rewritten instead of
+rebuilding the table.
 """
 
-from typing import List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from textual.message import Message
 from textual.widgets import Static, DataTable, Label
 from textual.containers import Container
 from textual.reactive import reactive
 from rich.text import Text
 
-from portfolio_manager import PortfolioItem
+from database import DEFAULT_PORTFOLIO_ID
+from portfolio_manager import PortfolioChanges, PortfolioItem
 from utils import format_currency, format_percentage
 from logger import get_logger
 
+if TYPE_CHECKING:
+    from monte_carlo import SimulationResult
+    from risk_analytics import RiskReport
+    from valuation_engine import PortfolioValuation
+
 logger = get_logger(__name__)
 
+# (label, key) of the holdings table columns
+HOLDING_COLUMNS = [
+    ("Symbol", "symbol"),
+    ("Amount", "amount"),
+    ("Avg Price", "avg_price"),
+    ("Current Price", "price"),
+    ("Value", "value"),
+    ("P&L", "pnl"),
+    ("P&L %", "pnl_percent"),
+    ("Weight", "weight"),
+]
+
 
 class PortfolioTable(Static):
     """Widget displaying portfolio holdings."""
 
     items: reactive[List[PortfolioItem]] = reactive([])
+    books: reactive[List["PortfolioValuation"]] = reactive([])
+
+    class PortfolioSelected(Message):
+        """Posted when a different portfolio is selected in the books table."""
+
+        def __init__(self, portfolio_id: int) -> None:
+            self.portfolio_id = portfolio_id
+            super().__init__()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._chart = None
+        self._pending_nav: Optional[List[Dict[str, Any]]] = None
+        self.portfolio_id = DEFAULT_PORTFOLIO_ID  # portfolio whose holdings are shown
+        self._total_value = 0.0
+        self.tick: Optional[int] = None  # valuation tick of the shown rows (see PortfolioChanges)
+        self._rows: Dict[str, PortfolioItem] = {}  # coin_id -> displayed item
+        self._weights: Dict[str, str] = {}         # coin_id -> displayed weight text
 
     def compose(self):
         yield Label("My Portfolio", id="portfolio-title")
+        yield DataTable(id="portfolio-books")
         yield DataTable(id="portfolio-table")
         yield Container(
             Label("Total Balance: $0.00", id="total-balance"),
             Label("Total P&L: $0.00 (0.00%)", id="total-pnl"),
+            Label("", id="portfolio-risk"),
+            Label("", id="portfolio-simulation"),
             id="portfolio-summary"
         )
+        # Placeholder until the chart widget is loaded by the warmup task
+        yield Label("Loading chart...", id="nav-chart")
+
+    async def install_chart(self, chart_cls: type) -> None:
+        """
+        Replace the NAV chart placeholder with a real chart widget.
+
+        Args:
+            chart_cls: CryptoChart class (imported lazily after first paint)
+        """
+        await self.query_one("#nav-chart").remove()
+        chart = chart_cls(id="nav-chart")
+        await self.mount(chart)
+        self._chart = chart
+
+        if self._pending_nav is not None:
+            snapshots, self._pending_nav = self._pending_nav, None
+            self.update_nav(snapshots)
+
+    def update_nav(self, snapshots: List[Dict[str, Any]]) -> None:
+        """
+        Plot the daily value of the selected portfolio.
+
+        Args:
+            snapshots: Snapshot dictionaries with 'date' ('YYYY-MM-DD') and 'nav', oldest first
+        """
+        if self._chart is None:
+            # Chart not loaded yet; draw it as soon as it is installed
+            self._pending_nav = snapshots
+            return
+        if not snapshots:
+            self._chart.clear()
+            return
+
+        try:
+            # CryptoChart expects d/m/Y dates
+            dates = [f"{s['date'][8:10]}/{s['date'][5:7]}/{s['date'][:4]}" for s in snapshots]
+            self._chart.update_data([s["nav"] for s in snapshots], dates, title="Portfolio Value")
+        except Exception as e:
+            logger.error(f"Error updating NAV chart: {e}")
 
     def on_mount(self):
         """Initialize table columns."""
-        table = self.query_one(DataTable)
+        table = self.query_one("#portfolio-table", DataTable)
         table.cursor_type = "row"
-        table.add_columns(
-            "Symbol",
-            "Amount",
-            "Avg Price",
-            "Current Price",
-            "Value",
-            "P&L",
-            "P&L %"
-        )
+        for label, key in HOLDING_COLUMNS:
+            table.add_column(label, key=key)
+
+        books = self.query_one("#portfolio-books", DataTable)
+        books.cursor_type = "row"
+        books.add_columns("Portfolio", "Holdings", "Value", "Cost Basis", "P&L", "P&L %", "Weight")
+        books.display = False  # only useful once there are several portfolios
+
+    def watch_books(self, new_books: List["PortfolioValuation"]):
+        """Update the books table when portfolio aggregates change."""
+        books = self.query_one("#portfolio-books", DataTable)
+        books.display = len(new_books) > 1
+        books.clear()
+
+        for book in new_books:
+            pnl_color = "green" if book.pnl >= 0 else "red"
+            books.add_row(
+                book.name,
+                str(book.positions),
+                format_currency(book.value),
+                format_currency(book.cost_basis),
+                Text(format_currency(book.pnl), style=pnl_color),
+                Text(format_percentage(book.pnl_percent), style=pnl_color),
+                f"{book.weight * 100:.1f}%",
+                key=str(book.portfolio_id),
+            )
+
+        self._update_title()
+
+    def _update_title(self) -> None:
+        """Name the shown portfolio once there are several."""
+        title = "My Portfolio"
+        if len(self.books) > 1:
+            name = next((b.name for b in self.books if b.portfolio_id == self.portfolio_id), None)
+            if name:
+                title = f"My Portfolio: {name}"
+        self.query_one("#portfolio-title", Label).update(title)
+
+    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
+        """Show the holdings of the portfolio picked in the books table."""
+        if event.data_table.id != "portfolio-books" or event.row_key.value is None:
+            return
+        event.stop()
+        portfolio_id = int(event.row_key.value)
+        if portfolio_id != self.portfolio_id:
+            self.portfolio_id = portfolio_id
+            self.tick = None  # next refresh loads the full portfolio
+            self._update_title()
+            self.post_message(self.PortfolioSelected(portfolio_id))
 
     def watch_items(self, new_items: List[PortfolioItem]):
-        """Update table when items change."""
-        table = self.query_one(DataTable)
+        """Rebuild the table when the whole item list is replaced."""
+        table = self.query_one("#portfolio-table", DataTable)
         table.clear()
+        self._rows = {}
+        self._weights = {}
 
         total_value = 0.0
         total_cost = 0.0
@@ -61,6 +190,7 @@ class PortfolioTable(Static):
             pnl_color = "green" if item.pnl >= 0 else "red"
             pnl_text = Text(format_currency(item.pnl), style=pnl_color)
             pnl_pct_text = Text(format_percentage(item.pnl_percent), style=pnl_color)
+            weight = f"{item.weight * 100:.1f}%"
 
             table.add_row(
                 item.symbol,
@@ -69,10 +199,58 @@ class PortfolioTable(Static):
                 format_currency(item.current_price),
                 format_currency(item.current_value),
                 pnl_text,
-                pnl_pct_text
+                pnl_pct_text,
+                weight,
+                key=item.coin_id
             )
+            self._rows[item.coin_id] = item
+            self._weights[item.coin_id] = weight
+
+        self._update_totals(total_value, total_cost)
+
+    def apply_changes(self, changes: PortfolioChanges) -> None:
+        """
+        Show a price tick, touching only the cells that changed.
+
+        Args:
+            changes: Changed holdings from PortfolioManager.get_portfolio_changes
+        """
+        self.tick = changes.tick
+        if changes.reset:
+            self.items = changes.items
+            # Equal lists don't trigger watch_items; make sure totals are current
+            self._update_totals(changes.total_value, changes.total_cost)
+            return
+
+        table = self.query_one("#portfolio-table", DataTable)
+        for item in changes.items:
+            if item.coin_id not in self._rows:
+                continue
+            self._rows[item.coin_id] = item
+            pnl_color = "green" if item.pnl >= 0 else "red"
+            table.update_cell(item.coin_id, "price", format_currency(item.current_price))
+            table.update_cell(item.coin_id, "value", format_currency(item.current_value))
+            table.update_cell(item.coin_id, "pnl", Text(format_currency(item.pnl), style=pnl_color))
+            table.update_cell(
+                item.coin_id,
+                "pnl_percent",
+                Text(format_percentage(item.pnl_percent), style=pnl_color),
+            )
+
+        # A new total shifts every weight; rewrite only those whose text moved
+        if changes.items:
+            total = changes.total_value
+            for coin_id, item in self._rows.items():
+                weight = f"{item.current_value / total * 100 if total > 0 else 0.0:.1f}%"
+                if weight != self._weights[coin_id]:
+                    self._weights[coin_id] = weight
+                    table.update_cell(coin_id, "weight", weight)
 
-        # Update Summary
+        self._update_totals(changes.total_value, changes.total_cost)
+
+    def _update_totals(self, total_value: float, total_cost: float) -> None:
+        """Update the balance and P&L summary."""
+        self._total_value = total_value
         total_pnl = total_value - total_cost
         total_pnl_pct = (total_pnl / total_cost * 100) if total_cost > 0 else 0.0
 
@@ -82,3 +260,53 @@ class PortfolioTable(Static):
         self.query_one("#total-pnl").update(
             f"Total P&L: [{pnl_color}]{format_currency(total_pnl)} ({format_percentage(total_pnl_pct)})[/{pnl_color}]"
         )
+
+    def update_risk(self, report: Optional["RiskReport"]) -> None:
+        """
+        Show the risk metrics of the displayed portfolio.
+
+        Args:
+            report: Risk report, or None if there is not enough price history
+        """
+        label = self.query_one("#portfolio-risk", Label)
+        if report is None:
+            label.update("Risk: not enough price history" if self._total_value > 0 else "")
+            return
+
+        confidence = f"{report.confidence * 100:.0f}%"
+        beta = f"{report.beta:.2f}" if report.beta is not None else "n/a"
+        label.update(
+            f"1-day VaR {confidence}: {format_currency(report.var * self._total_value)} "
+            f"({report.var * 100:.1f}%)  CVaR: {format_currency(report.cvar * self._total_value)}  "
+            f"Parametric: {report.parametric_var * 100:.1f}% / "
+            f"{report.parametric_cvar * 100:.1f}%\n"
+            f"Volatility: {report.volatility * 100:.1f}%  Sharpe: {report.sharpe:.2f}  "
+            f"Sortino: {report.sortino:.2f}  Beta: {beta}  "
+            f"Max Drawdown: {report.max_drawdown * 100:.1f}%"
+        )
+
+    def update_simulation(self, result: Optional["SimulationResult"]) -> None:
+        """
+        Show the simulated value distribution per horizon.
+
+        Args:
+            result: Monte Carlo result, or None to clear the panel
+        """
+        label = self.query_one("#portfolio-simulation", Label)
+        if result is None:
+            label.update("")
+            return
+
+        confidence = f"{result.confidence * 100:.0f}%"
+        lines = [f"Monte Carlo ({result.paths:,} {result.method} paths)"]
+        for outcome in result.outcomes:
+            low, high = min(outcome.percentiles), max(outcome.percentiles)
+            lines.append(
+                f"{outcome.days:>4}d  "
+                f"median {format_currency(outcome.percentiles.get(50, outcome.mean))}  "
+                f"P{low}-P{high}: {format_currency(outcome.percentiles[low])} - "
+                f"{format_currency(outcome.percentiles[high])}  "
+                f"P(loss) {outcome.prob_loss * 100:.0f}%  "
+                f"VaR {confidence}: {format_currency(outcome.var)}"
+            )
+        label.update("\n".join(lines))
@@ -0,0 +1,142 @@
+"""
+Transaction History Widget for TerminalCoin.
+
+Displays the transaction log page by page, loading more rows on demand
+as the cursor approaches the end of the table.
+"""
+
+from typing import Optional, Tuple
+from textual.widgets import Static, DataTable, Label, Input
+from rich.text import Text
+
+from async_database import AsyncDatabase
+from database import TRANSACTION_PAGE_SIZE
+from utils import format_currency
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Start fetching the next page when the cursor is this close to the end
+PREFETCH_ROWS = 20
+
+
+class TransactionHistory(Static):
+    """Widget displaying keyset-paginated transaction history."""
+
+    def __init__(self, db: AsyncDatabase, **kwargs):
+        super().__init__(**kwargs)
+        self.db = db
+        self.coin_filter: Optional[str] = None
+        self._cursor: Optional[Tuple[str, int]] = None
+        self._exhausted = False
+        self._loading = False
+        self._generation = 0  # bumped on reload to discard in-flight pages
+        self._latest_id: Optional[int] = None  # newest transaction when last loaded
+
+    def compose(self):
+        yield Label("Transaction History", id="history-title")
+        yield Input(placeholder="Filter by coin id (e.g. bitcoin)...", id="history-filter")
+        yield DataTable(id="history-table")
+
+    def on_mount(self):
+        """Initialize table columns and load the first page."""
+        table = self.query_one(DataTable)
+        table.cursor_type = "row"
+        table.add_columns("Date", "Type", "Symbol", "Amount", "Price", "Total")
+        # Mouse-wheel scrolling doesn't move the cursor, so watch the scroll position too
+        self.watch(table, "scroll_y", self._on_table_scroll, init=False)
+        self.reload_if_changed()
+
+    def _on_table_scroll(self, scroll_y: float) -> None:
+        """Prefetch the next page when scrolled close to the bottom."""
+        table = self.query_one(DataTable)
+        if table.max_scroll_y - scroll_y <= PREFETCH_ROWS:
+            self.load_more()
+
+    def reload(self) -> None:
+        """Clear the table and load the first page again."""
+        self.query_one(DataTable).clear()
+        self._cursor = None
+        self._exhausted = False
+        self._generation += 1
+        self.load_more()
+
+    def reload_if_changed(self) -> None:
+        """Reload in a worker if transactions were added since the table was loaded."""
+        self.run_worker(self._check_latest(), group="history-check", exclusive=True)
+
+    async def _check_latest(self) -> None:
+        """Compare the newest transaction id with the one last loaded."""
+        try:
+            latest = await self.db.get_latest_transaction_id()
+        except Exception as e:
+            logger.error(f"Error checking for new transactions: {e}")
+            return
+        if latest != self._latest_id:
+            self._latest_id = latest
+            self.reload()
+
+    def load_more(self) -> None:
+        """Fetch the next page in a worker unless one is already loading."""
+        if self._loading or self._exhausted:
+            return
+        self._loading = True
+        self.run_worker(self._load_page(), group="history")
+
+    async def _load_page(self) -> None:
+        """Load one page off the event loop and append it to the table."""
+        generation = self._generation
+        stale = False
+        try:
+            page = await self.db.get_transactions_page(
+                coin_id=self.coin_filter,
+                before=self._cursor,
+                page_size=TRANSACTION_PAGE_SIZE,
+            )
+            if generation != self._generation:
+                # Filter changed while loading; start over from the first page
+                stale = True
+                return
+
+            table = self.query_one(DataTable)
+            for tx in page:
+                color = "green" if tx["type"] == "BUY" else "red"
+                table.add_row(
+                    str(tx["timestamp"])[:19],
+                    Text(tx["type"], style=color),
+                    tx["symbol"],
+                    f"{tx['amount']:.6f}",
+                    format_currency(tx["price_per_coin"]),
+                    format_currency(tx["total_value"]),
+                    key=str(tx["id"]),
+                )
+
+            if page:
+                self._cursor = (page[-1]["timestamp"], page[-1]["id"])
+            if len(page) < TRANSACTION_PAGE_SIZE:
+                self._exhausted = True
+            logger.debug(f"Loaded {len(page)} transactions ({table.row_count} shown)")
+
+        except Exception as e:
+            logger.error(f"Error loading transaction history: {e}")
+        finally:
+            self._loading = False
+            if stale:
+                self.load_more()
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """Apply the coin filter."""
+        event.stop()
+        self.coin_filter = event.value.strip().lower() or None
+        self.reload()
+
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Prefetch the next page when nearing the end of loaded rows."""
+        event.stop()
+        table = self.query_one(DataTable)
+        if event.cursor_row >= table.row_count - PREFETCH_ROWS:
+            self.load_more()
+
+    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
+        """Keep history row selection from reaching the coin detail handler."""
+        event.stop()